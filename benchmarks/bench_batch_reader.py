@@ -0,0 +1,86 @@
+"""
+Benchmark do comando batch: leitura em texto vs. arquivo mapeado em bytes
+
+Compara o CNPJValidatorCLI.iter_batch_validate anterior (arquivo aberto em
+modo texto, cada linha decodificada e passada a CNPJValidator.iter_validate)
+com a leitura por mmap de batch_io.iter_lines + scanner.scan_bytes.
+
+Uso:
+    python benchmarks/bench_batch_reader.py [--lines N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJValidator
+from src.cnpj_validator.cli import CNPJValidatorCLI
+
+
+# =============================================================================
+# Implementação original (referência)
+# =============================================================================
+
+def legacy_iter_batch_validate(validator: CNPJValidator, file_path: str):
+    with open(file_path, 'r') as f:
+        cnpjs = (cnpj for cnpj in map(str.strip, f) if cnpj)
+        for result in validator.iter_validate(cnpjs):
+            yield {
+                'valid': result.valid,
+                'cnpj': result.cnpj_formatted,
+                'errors': result.errors
+            }
+
+
+# =============================================================================
+# Execução
+# =============================================================================
+
+SAMPLES = [
+    "11.222.333/0001-81", "11222333000181", "34.028.316/0001-03",
+    "11.222.333/0001-82", "11111111111111", " 11.222.333/0001-81 ",
+]
+
+
+def _consume(results) -> int:
+    return sum(1 for _ in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--lines', '-n', type=int, default=500_000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        for _ in range(args.lines):
+            f.write(random.choice(SAMPLES) + '\n')
+    path = f.name
+
+    try:
+        validator = CNPJValidator()
+        cli = CNPJValidatorCLI()
+
+        start = time.perf_counter()
+        _consume(legacy_iter_batch_validate(validator, path))
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _consume(cli.iter_batch_validate(path))
+        new = time.perf_counter() - start
+    finally:
+        os.unlink(path)
+
+    print(f"{'Leitura':<22}{'linhas/s':>14}")
+    print(f"{'texto (legado)':<22}{args.lines / legacy:>14,.0f}")
+    print(f"{'mmap + bytes':<22}{args.lines / new:>14,.0f}")
+    print(f"speedup: {legacy / new:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
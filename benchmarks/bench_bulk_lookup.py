@@ -0,0 +1,62 @@
+"""
+Benchmark da consulta em lote (ReceitaFederalAPI.consultar_many)
+
+Simula dois provedores com cota e latência (escala reduzida: a cota de
+3 por minuto vira 3 por --period segundos) e mede a vazão de consultar
+em sequência (só a api_preferida) vs. consultar_many (todos os
+provedores, cada um na própria cota).
+
+Uso:
+    python benchmarks/bench_bulk_lookup.py [--cnpjs N] [--period S] [--latency S]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import ReceitaFederalAPI, SharedRateLimiter
+from src.cnpj_validator.generator import iter_generate
+
+
+def make_api(period: float, latency: float) -> ReceitaFederalAPI:
+    limiter = SharedRateLimiter(limits={"brasilapi": (3, period), "receitaws": (3, period)})
+    api = ReceitaFederalAPI(rate_limiter=limiter)
+
+    def fake_request(url: str) -> dict:
+        time.sleep(latency)
+        return {"cnpj": url.rsplit("/", 1)[-1], "razao_social": "EMPRESA TESTE LTDA",
+                "nome": "EMPRESA TESTE LTDA", "descricao_situacao_cadastral": "ATIVA"}
+
+    api._fazer_requisicao = fake_request
+    return api
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cnpjs', '-n', type=int, default=30)
+    parser.add_argument('--period', type=float, default=0.6)
+    parser.add_argument('--latency', type=float, default=0.05)
+    args = parser.parse_args()
+    cnpjs = list(iter_generate(args.cnpjs, seed=1, formatted=False))
+
+    api = make_api(args.period, args.latency)
+    start = time.perf_counter()
+    for cnpj in cnpjs:
+        api.consultar(cnpj)
+    sequential = time.perf_counter() - start
+
+    api = make_api(args.period, args.latency)
+    start = time.perf_counter()
+    results = list(api.consultar_many(cnpjs))
+    bulk = time.perf_counter() - start
+    assert len(results) == len(cnpjs)
+
+    print(f"consultar em sequência  {args.cnpjs / sequential:>8.1f} CNPJs/s")
+    print(f"consultar_many          {args.cnpjs / bulk:>8.1f} CNPJs/s  ({sequential / bulk:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
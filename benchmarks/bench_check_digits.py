@@ -0,0 +1,127 @@
+"""
+Benchmark do motor de dígitos verificadores baseado em tabelas
+
+Compara a implementação original de NumericCNPJValidator (int() por
+caractere, listas de pesos recriadas a cada chamada e fatiamento duplo)
+com o motor pré-calculado de check_digits, e o cálculo original do CNPJ
+alfanumérico (upper() + dict por caractere, DV2 recalculando as 12
+posições) com o motor alfanumérico.
+
+Uso:
+    python benchmarks/bench_check_digits.py [--number N]
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.validators.check_digits import ALPHANUMERIC_ENGINE, NUMERIC_ENGINE
+from src.cnpj_validator.validators.new_alphanumeric_validator import NewAlphanumericCNPJValidator
+from src.cnpj_validator.validators.numeric_validator import NumericCNPJValidator
+
+
+# =============================================================================
+# Implementação original (referência)
+# =============================================================================
+
+def legacy_first_digit(cnpj: str) -> int:
+    weights = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+    sum_result = sum(int(cnpj[i]) * weights[i] for i in range(12))
+    remainder = sum_result % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def legacy_second_digit(cnpj: str) -> int:
+    weights = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+    sum_result = sum(int(cnpj[i]) * weights[i] for i in range(13))
+    remainder = sum_result % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def legacy_check_digits(cnpj: str) -> bool:
+    if len(cnpj) != 14:
+        return False
+    first_digit = legacy_first_digit(cnpj[:12])
+    second_digit = legacy_second_digit(cnpj[:13])
+    return int(cnpj[12]) == first_digit and int(cnpj[13]) == second_digit
+
+
+def legacy_validate(cnpj: str) -> dict:
+    if not cnpj:
+        return {'valid': False, 'cnpj_clean': '', 'errors': ["CNPJ não pode ser vazio"]}
+    cnpj_clean = re.sub(r'[^0-9]', '', cnpj)
+    if not cnpj_clean.isdigit():
+        return {'valid': False, 'cnpj_clean': cnpj_clean, 'errors': ["..."]}
+    if len(cnpj_clean) != 14:
+        return {'valid': False, 'cnpj_clean': cnpj_clean, 'errors': ["..."]}
+    if len(set(cnpj_clean)) <= 1:
+        return {'valid': False, 'cnpj_clean': cnpj_clean, 'errors': ["..."]}
+    if not legacy_check_digits(cnpj_clean):
+        return {'valid': False, 'cnpj_clean': cnpj_clean, 'errors': ["..."]}
+    return {'valid': True, 'cnpj_clean': cnpj_clean, 'errors': []}
+
+
+CHAR_VALUES = {chr(i): i - 55 for i in range(65, 91)}
+CHAR_VALUES.update({str(i): i for i in range(10)})
+
+
+def legacy_alphanumeric_digit(cnpj: str, weights: list) -> int:
+    total = 0
+    for i, char in enumerate(cnpj[:len(weights)]):
+        total += CHAR_VALUES.get(char.upper(), 0) * weights[i]
+    remainder = total % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def legacy_alphanumeric_check_digits(cnpj: str) -> bool:
+    first = legacy_alphanumeric_digit(cnpj[:12], [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+    second = legacy_alphanumeric_digit(
+        cnpj[:12] + str(first), [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+    return f"{first}{second}" == cnpj[12:14]
+
+
+ALPHANUMERIC = NewAlphanumericCNPJValidator.generate_valid_cnpj("12ABC345").replace(
+    '.', '').replace('/', '').replace('-', '')
+
+
+# =============================================================================
+# Execução
+# =============================================================================
+
+CASES = [
+    ("DVs (legado)", lambda: legacy_check_digits("11222333000181")),
+    ("DVs (tabelas)", lambda: NUMERIC_ENGINE.is_valid("11222333000181")),
+    ("validate limpo (legado)", lambda: legacy_validate("11222333000181")),
+    ("validate limpo (novo)", lambda: NumericCNPJValidator.validate("11222333000181")),
+    ("validate formatado (legado)", lambda: legacy_validate("11.222.333/0001-81")),
+    ("validate formatado (novo)", lambda: NumericCNPJValidator.validate("11.222.333/0001-81")),
+    ("DVs alfanumérico (legado)", lambda: legacy_alphanumeric_check_digits(ALPHANUMERIC)),
+    ("DVs alfanumérico (tabelas)", lambda: ALPHANUMERIC_ENGINE.is_valid(ALPHANUMERIC)),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', '-n', type=int, default=200_000)
+    args = parser.parse_args()
+
+    timings = {}
+    print(f"{'Caso':<32}{'ns/chamada':>12}")
+    for name, func in CASES:
+        best = min(timeit.repeat(func, number=args.number, repeat=5)) / args.number
+        timings[name] = best
+        print(f"{name:<32}{best * 1e9:>12.0f}")
+
+    print()
+    for label in ("DVs", "validate limpo", "validate formatado", "DVs alfanumérico"):
+        legacy = timings[f"{label} (legado)"]
+        new = timings[f"{label} (tabelas)"] if f"{label} (tabelas)" in timings else timings[f"{label} (novo)"]
+        print(f"Speedup {label}: {legacy / new:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
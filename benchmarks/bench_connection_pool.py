@@ -0,0 +1,107 @@
+"""
+Benchmark do pool de conexões keep-alive (HTTPConnectionPool)
+
+Mede o tempo por requisição contra um servidor HTTPS local que imita a
+BrasilAPI: urlopen com contexto SSL novo e handshake TCP + TLS a cada
+requisição (transporte anterior de ReceitaFederalAPI) vs.
+ReceitaFederalAPI._fazer_requisicao sobre o pool (conexão e contexto SSL
+reaproveitados). O certificado autoassinado é gerado com o openssl.
+
+Uso:
+    python benchmarks/bench_connection_pool.py [--requests N]
+"""
+
+import argparse
+import json
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.request import Request, urlopen
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import ReceitaFederalAPI, SharedRateLimiter
+
+PAYLOAD = json.dumps({
+    "cnpj": "11222333000181",
+    "razao_social": "EMPRESA TESTE LTDA",
+    "descricao_situacao_cadastral": "ATIVA",
+    "qsa": [{"nome_socio": "SOCIO", "qualificacao_socio": "Sócio-Administrador"}] * 5,
+}).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Cabeçalhos e corpo saem em escritas separadas: sem TCP_NODELAY, o Nagle
+    # somado ao ACK atrasado do cliente custaria ~40 ms por resposta em keep-alive
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+
+def urlopen_per_request(url: str) -> dict:
+    """Transporte anterior: contexto SSL e conexão novos por requisição."""
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    request = Request(url, headers={"User-Agent": "CNPJ-Validator/1.0 (Python)",
+                                    "Accept": "application/json"})
+    with urlopen(request, timeout=30, context=ctx) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', '-n', type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = os.path.join(directory, 'cert.pem'), os.path.join(directory, 'key.pem')
+        subprocess.run(
+            ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+             '-subj', '/CN=localhost', '-keyout', key, '-out', cert],
+            check=True, capture_output=True,
+        )
+        server_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_ctx.load_cert_chain(cert, key)
+
+        httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        httpd.daemon_threads = True
+        httpd.socket = server_ctx.wrap_socket(httpd.socket, server_side=True)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        url = f"https://localhost:{httpd.server_address[1]}/api/cnpj/v1/11222333000181"
+
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            urlopen_per_request(url)
+        baseline = (time.perf_counter() - start) / args.requests
+
+        with ReceitaFederalAPI(rate_limiter=SharedRateLimiter(limits={}, default_limit=None)) as api:
+            start = time.perf_counter()
+            for _ in range(args.requests):
+                api._fazer_requisicao(url)
+            pooled = (time.perf_counter() - start) / args.requests
+            stats = api._conexoes().stats()
+
+        httpd.shutdown()
+
+    print(f"urlopen (conexão nova)   {baseline * 1e3:>8.2f} ms/requisição")
+    print(f"pool keep-alive          {pooled * 1e3:>8.2f} ms/requisição  ({baseline / pooled:.1f}x)")
+    print(stats)
+
+
+if __name__ == '__main__':
+    main()
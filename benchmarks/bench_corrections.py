@@ -0,0 +1,64 @@
+"""
+Benchmark da sugestão de correções (suggest_corrections)
+
+Compara a busca exaustiva (montar e validar cada candidato a uma digitação
+de distância) com suggest_corrections, que resolve as congruências módulo
+11 por posição.
+
+Uso:
+    python benchmarks/bench_corrections.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.validators.new_alphanumeric_validator import (
+    NewAlphanumericCNPJValidator
+)
+
+DIGITS = "0123456789"
+ROOT_CHARS = DIGITS + "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def brute_force(clean: str) -> list:
+    """Valida todos os candidatos com NewAlphanumericCNPJValidator.validate."""
+    found = []
+    for position in range(13):
+        candidate = clean[:position] + clean[position + 1] + clean[position] + clean[position + 2:]
+        if NewAlphanumericCNPJValidator.validate(candidate)['valid']:
+            found.append(candidate)
+    for position in range(14):
+        alphabet = ROOT_CHARS if position < 8 and not clean[:8].isdigit() else DIGITS
+        for char in alphabet:
+            candidate = clean[:position] + char + clean[position + 1:]
+            if char != clean[position] and NewAlphanumericCNPJValidator.validate(candidate)['valid']:
+                found.append(candidate)
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', '-n', type=int, default=200)
+    args = parser.parse_args()
+
+    for cnpj in ("11222333000182", "11222333000118", "ABCDE123000199"):
+        start = time.perf_counter()
+        for _ in range(max(1, args.repeat // 50)):
+            brute_force(cnpj)
+        brute = (time.perf_counter() - start) / max(1, args.repeat // 50)
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            NewAlphanumericCNPJValidator.suggest_corrections(cnpj, 1000)
+        fast = (time.perf_counter() - start) / args.repeat
+
+        print(f"{cnpj}: busca exaustiva {brute * 1e6:>8.0f} us   "
+              f"suggest_corrections {fast * 1e6:>6.1f} us   ({brute / fast:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark da geração de CNPJs em lote (generate_many)
+
+Compara NewAlphanumericCNPJValidator.generate_valid_cnpj (um por chamada)
+com vectorized.generate_many e com generator.iter_generate (strings em fluxo),
+e as enumerações incrementais (enumerate_establishments, RootRange) com o
+cálculo completo dos DVs por ordem/raiz.
+
+Uso:
+    python benchmarks/bench_generate.py [--rows N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.generator import RootRange, enumerate_establishments, iter_generate
+from src.cnpj_validator.validators.new_alphanumeric_validator import (
+    NewAlphanumericCNPJValidator
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', '-n', type=int, default=5_000_000)
+    args = parser.parse_args()
+
+    sample = 50_000
+    start = time.perf_counter()
+    for _ in range(sample):
+        NewAlphanumericCNPJValidator.generate_valid_cnpj()
+    per_row = (time.perf_counter() - start) / sample
+    print(f"generate_valid_cnpj (um por chamada):     {per_row * 1e9:>8.0f} ns/CNPJ")
+
+    for alphanumeric in (False, True):
+        start = time.perf_counter()
+        NewAlphanumericCNPJValidator.generate_many(args.rows, seed=1, alphanumeric=alphanumeric)
+        elapsed = time.perf_counter() - start
+        label = f"generate_many (alphanumeric={alphanumeric})"
+        print(f"{label:<42}{elapsed / args.rows * 1e9:>8.0f} ns/CNPJ "
+              f"({args.rows / elapsed / 1e6:.1f} M CNPJs/s)")
+
+    start = time.perf_counter()
+    for _ in iter_generate(args.rows, seed=1):
+        pass
+    elapsed = time.perf_counter() - start
+    print(f"{'iter_generate (str, em fluxo)':<42}{elapsed / args.rows * 1e9:>8.0f} ns/CNPJ "
+          f"({args.rows / elapsed / 1e6:.1f} M CNPJs/s)")
+
+
+    start = time.perf_counter()
+    for order in range(1, 10_000):
+        base = f"11222333{order:04d}"
+        first = NewAlphanumericCNPJValidator.calculate_first_digit(base)
+        NewAlphanumericCNPJValidator.calculate_second_digit(base + str(first))
+    per_order = (time.perf_counter() - start) / 9999
+    print(f"\n{'DVs do zero por ordem (9999 ordens)':<42}{per_order * 1e9:>8.0f} ns/CNPJ")
+
+    start = time.perf_counter()
+    for _ in enumerate_establishments("11222333"):
+        pass
+    per_order = (time.perf_counter() - start) / 9999
+    print(f"{'enumerate_establishments (9999 ordens)':<42}{per_order * 1e9:>8.0f} ns/CNPJ")
+
+    roots = RootRange.with_prefix("112")
+    start = time.perf_counter()
+    for root in range(roots.start, roots.start + 100_000):
+        base = f"{root:08d}0001"
+        first = NewAlphanumericCNPJValidator.calculate_first_digit(base)
+        NewAlphanumericCNPJValidator.calculate_second_digit(base + str(first))
+    per_root = (time.perf_counter() - start) / 100_000
+    print(f"\n{'DVs do zero por raiz (100.000 raízes)':<42}{per_root * 1e9:>8.0f} ns/CNPJ")
+
+    start = time.perf_counter()
+    for _ in roots.shard(0, len(roots) // 100_000):
+        pass
+    per_root = (time.perf_counter() - start) / 100_000
+    print(f"{'RootRange (100.000 raízes)':<42}{per_root * 1e9:>8.0f} ns/CNPJ")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark do roteamento adaptativo e do hedge (ReceitaFederalAPI)
+
+Simula dois provedores com cauda de latência (a maioria das respostas
+rápida, --tail delas lenta) em que a api_preferida é o mais lento, e
+mede média e percentis de consultar com a ordem fixa de provedores, com
+o roteamento adaptativo (provider_stats) e com roteamento + hedge.
+
+Uso:
+    python benchmarks/bench_hedging.py [--requests N] [--tail F]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import ProviderStats, ReceitaFederalAPI, SharedRateLimiter
+
+# Latência típica de cada provedor simulado (segundos) e da cauda
+LATENCIES = {"brasilapi": 0.040, "receitaws": 0.015}
+TAIL_LATENCY = 0.300
+
+
+def make_api(tail: float, seed: int, **kwargs) -> ReceitaFederalAPI:
+    api = ReceitaFederalAPI(
+        rate_limiter=SharedRateLimiter(limits={}, default_limit=None),
+        provider_stats=ProviderStats(),
+        **kwargs,
+    )
+    rng = random.Random(seed)
+
+    def fake_request(url: str) -> dict:
+        provider = "receitaws" if "receitaws" in url else "brasilapi"
+        time.sleep(TAIL_LATENCY if rng.random() < tail else LATENCIES[provider])
+        return {"cnpj": url.rsplit("/", 1)[-1], "razao_social": "EMPRESA TESTE LTDA",
+                "nome": "EMPRESA TESTE LTDA", "descricao_situacao_cadastral": "ATIVA",
+                "situacao": "ATIVA"}
+
+    api._fazer_requisicao = fake_request
+    return api
+
+
+def measure(api: ReceitaFederalAPI, requests: int) -> list:
+    durations = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        api.consultar("11222333000181")
+        durations.append(time.perf_counter() - start)
+    return sorted(durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', '-n', type=int, default=300)
+    parser.add_argument('--tail', type=float, default=0.02)
+    args = parser.parse_args()
+
+    scenarios = [
+        ("ordem fixa (api_preferida)", dict(adaptive_routing=False)),
+        ("roteamento adaptativo", dict()),
+        ("roteamento + hedge", dict(hedge=True)),
+    ]
+    baseline = None
+    for name, kwargs in scenarios:
+        api = make_api(args.tail, seed=1, **kwargs)
+        durations = measure(api, args.requests)
+        mean = sum(durations) / len(durations)
+        p95 = durations[int(0.95 * len(durations))]
+        p99 = durations[min(len(durations) - 1, int(0.99 * len(durations)))]
+        baseline = baseline or mean
+        print(f"{name:<28} média {mean * 1e3:>7.1f} ms  p95 {p95 * 1e3:>7.1f} ms  "
+              f"p99 {p99 * 1e3:>7.1f} ms  ({baseline / mean:.1f}x)")
+        if kwargs.get("hedge"):
+            stats = api.routing_stats()
+            print(f"{'':<28} hedges {stats['hedges']}, vencidos pelo hedge {stats['hedge_wins']}")
+
+
+if __name__ == '__main__':
+    main()
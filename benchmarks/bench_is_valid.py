@@ -0,0 +1,82 @@
+"""
+Benchmark da validação booleana rápida (is_valid / is_valid_many)
+
+Compara o CNPJValidator.is_valid original (instancia um CNPJValidator e
+monta o resultado completo a cada chamada) com o atalho de módulo, que
+retorna na primeira falha sem alocar validadores nem resultados.
+
+Uso:
+    python benchmarks/bench_is_valid.py [--number N] [--rows N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJValidator, is_valid, is_valid_many
+from src.cnpj_validator.validators.check_digits import NUMERIC_ENGINE
+
+
+# =============================================================================
+# Implementação original (referência)
+# =============================================================================
+
+def legacy_is_valid(cnpj: str) -> bool:
+    validator = CNPJValidator()
+    result = validator.validate(cnpj, validate_format=False)
+    return result['valid']
+
+
+# =============================================================================
+# Execução
+# =============================================================================
+
+INPUTS = {
+    "limpo válido": "11222333000181",
+    "formatado válido": "11.222.333/0001-81",
+    "DV inválido": "11.222.333/0001-82",
+    "vazio": "",
+}
+
+
+def _random_batch(rows: int) -> list:
+    """Lote com 50% de CNPJs válidos, metade deles formatados."""
+    rng = random.Random(42)
+    batch = []
+    for _ in range(rows):
+        base = ''.join(rng.choice('0123456789') for _ in range(12))
+        dv1, dv2 = NUMERIC_ENGINE.compute(base)
+        cnpj = f"{base}{dv1}{dv2 if rng.random() < 0.5 else (dv2 + 1) % 10}"
+        if rng.random() < 0.5:
+            cnpj = f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
+        batch.append(cnpj)
+    return batch
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', '-n', type=int, default=100_000)
+    parser.add_argument('--rows', type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'Caso':<24}{'legado (ns)':>14}{'novo (ns)':>12}{'speedup':>10}")
+    for name, cnpj in INPUTS.items():
+        legacy = min(timeit.repeat(lambda: legacy_is_valid(cnpj), number=args.number, repeat=5))
+        new = min(timeit.repeat(lambda: is_valid(cnpj), number=args.number, repeat=5))
+        print(f"{name:<24}{legacy / args.number * 1e9:>14.0f}"
+              f"{new / args.number * 1e9:>12.0f}{legacy / new:>9.1f}x")
+
+    batch = _random_batch(args.rows)
+    legacy = min(timeit.repeat(lambda: [legacy_is_valid(c) for c in batch], number=1, repeat=3))
+    new = min(timeit.repeat(lambda: is_valid_many(batch), number=1, repeat=3))
+    print()
+    print(f"Lote de {args.rows} CNPJs: legado {legacy:.3f}s, "
+          f"is_valid_many {new:.3f}s ({legacy / new:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
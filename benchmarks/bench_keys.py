@@ -0,0 +1,69 @@
+"""
+Benchmark da chave inteira compacta (CNPJKey)
+
+Mede a memória de um conjunto de CNPJs como str, como int (CNPJKey.encode)
+e como array NumPy uint64 (CNPJKey.encode_many), e a vazão de
+encode_many/decode_many.
+
+Uso:
+    python benchmarks/bench_keys.py [--rows N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJKey
+from src.cnpj_validator.validators.vectorized import generate_many
+
+
+def _set_memory(build) -> int:
+    """Memória alocada (bytes) para montar o conjunto."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', '-n', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    values = generate_many(args.rows, seed=1, alphanumeric=True, filial_ratio=0.3, formatted=False)
+    strings = values.astype(str).tolist()
+    keys = CNPJKey.encode_many(values)
+    ints = keys.tolist()
+
+    memory_str = _set_memory(lambda: set(strings)) + sum(map(sys.getsizeof, strings))
+    memory_int = _set_memory(lambda: set(ints)) + sum(map(sys.getsizeof, ints))
+    print(f"set[str]      {memory_str / args.rows:>6.0f} bytes/CNPJ")
+    print(f"set[int]      {memory_int / args.rows:>6.0f} bytes/CNPJ")
+    print(f"numpy.uint64  {keys.nbytes / args.rows:>6.0f} bytes/CNPJ")
+
+    start = time.perf_counter()
+    CNPJKey.encode_many(values)
+    elapsed = time.perf_counter() - start
+    print(f"\nencode_many   {elapsed / args.rows * 1e9:>6.0f} ns/CNPJ")
+
+    start = time.perf_counter()
+    CNPJKey.decode_many(keys)
+    elapsed = time.perf_counter() - start
+    print(f"decode_many   {elapsed / args.rows * 1e9:>6.0f} ns/CNPJ")
+
+    sample = strings[:100_000]
+    start = time.perf_counter()
+    for cnpj in sample:
+        CNPJKey.encode(cnpj)
+    elapsed = time.perf_counter() - start
+    print(f"encode        {elapsed / len(sample) * 1e9:>6.0f} ns/CNPJ")
+
+
+if __name__ == '__main__':
+    main()
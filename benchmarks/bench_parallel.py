@@ -0,0 +1,89 @@
+"""
+Benchmark de escalabilidade de validate_parallel
+
+Valida o mesmo lote com 1, 2, 4, ... processos (até os.cpu_count()) e
+reporta o tempo e o speedup de cada configuração em relação à validação
+sequencial (CNPJValidator.iter_validate), entregando ValidationResult
+(ordenado e sem ordem) e no modo compact (1 byte por linha).
+
+Uso:
+    python benchmarks/bench_parallel.py [--rows N] [--chunk-size N] [--max-workers N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJValidator, validate_parallel
+from src.cnpj_validator.validators.check_digits import NUMERIC_ENGINE
+
+
+def _random_batch(rows: int) -> list:
+    """Lote com 50% de CNPJs válidos, metade deles formatados."""
+    rng = random.Random(42)
+    batch = []
+    for _ in range(rows):
+        base = ''.join(rng.choice('0123456789') for _ in range(12))
+        dv1, dv2 = NUMERIC_ENGINE.compute(base)
+        cnpj = f"{base}{dv1}{dv2 if rng.random() < 0.5 else (dv2 + 1) % 10}"
+        if rng.random() < 0.5:
+            cnpj = f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
+        batch.append(cnpj)
+    return batch
+
+
+def _consume(results) -> float:
+    """Consome os resultados (acessando .valid) e retorna o tempo gasto."""
+    start = time.perf_counter()
+    for result in results:
+        result.valid
+    return time.perf_counter() - start
+
+
+def _consume_compact(results) -> float:
+    """Consome as tuplas (entrada, código) do modo compact e retorna o tempo gasto."""
+    start = time.perf_counter()
+    for _, code in results:
+        pass
+    return time.perf_counter() - start
+
+
+def _worker_counts(max_workers: int) -> list:
+    counts = []
+    workers = 1
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    return counts + [max_workers]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunk-size', type=int, default=20_000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    batch = _random_batch(args.rows)
+    baseline = _consume(CNPJValidator().iter_validate(batch))
+    print(f"{args.rows} CNPJs, {os.cpu_count()} CPUs, blocos de {args.chunk_size}")
+    print(f"Sequencial (iter_validate): {baseline:.2f}s ({args.rows / baseline:,.0f} CNPJs/s)")
+    print()
+    print(f"{'Processos':>10}{'ordenado':>18}{'sem ordem':>18}{'compact':>18}")
+
+    for workers in _worker_counts(args.max_workers):
+        timings = [
+            _consume(validate_parallel(batch, workers, args.chunk_size, ordered=True)),
+            _consume(validate_parallel(batch, workers, args.chunk_size, ordered=False)),
+            _consume_compact(validate_parallel(batch, workers, args.chunk_size, compact=True)),
+        ]
+        print(f"{workers:>10}" + ''.join(
+            f"{elapsed:>10.2f}s {baseline / elapsed:>5.2f}x" for elapsed in timings))
+
+
+if __name__ == '__main__':
+    main()
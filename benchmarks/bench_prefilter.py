@@ -0,0 +1,64 @@
+"""
+Benchmark do pré-filtro de CNPJs registrados (BloomFilter)
+
+Mede a construção, o tamanho em bytes por CNPJ, a taxa de falsos
+positivos medida contra a configurada e o tempo de consulta (CNPJKey e
+CNPJ em texto, com validação) do filtro mapeado de arquivo.
+
+Uso:
+    python benchmarks/bench_prefilter.py [--rows N] [--fp-rate P]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import BloomFilter, CNPJKey
+from src.cnpj_validator.validators.vectorized import generate_many
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', '-n', type=int, default=1_000_000)
+    parser.add_argument('--fp-rate', type=float, default=0.01)
+    parser.add_argument('--lookups', type=int, default=100_000)
+    args = parser.parse_args()
+
+    registered = generate_many(args.rows, seed=1, alphanumeric=True, filial_ratio=0.3, formatted=False)
+    absent = generate_many(args.lookups, seed=2, alphanumeric=True, filial_ratio=0.3, formatted=False)
+    absent_strings = absent.astype(str).tolist()
+    absent_keys = CNPJKey.encode_many(absent).tolist()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'cnpjs.txt')
+        with open(source, 'wb') as file:
+            file.write(b'\n'.join(registered.tolist()) + b'\n')
+
+        start = time.perf_counter()
+        bloom = BloomFilter.build([source], fp_rate=args.fp_rate)
+        elapsed = time.perf_counter() - start
+        print(f"build             {args.rows / elapsed:>12,.0f} CNPJs/s")
+        print(f"tamanho           {bloom.size_bytes * 8 / args.rows:>12.1f} bits/CNPJ (k={bloom.k})")
+
+        path = os.path.join(directory, 'cnpjs.bloom')
+        bloom.save(path)
+        with BloomFilter.open(path) as mapped:
+            start = time.perf_counter()
+            hits = sum(map(mapped.contains_key, absent_keys))
+            elapsed = time.perf_counter() - start
+            print(f"falsos positivos  {hits / args.lookups:>12.4%} (configurado: {args.fp_rate:.4%})")
+            print(f"contains_key      {elapsed / args.lookups * 1e6:>12.2f} µs/consulta")
+
+            start = time.perf_counter()
+            for cnpj in absent_strings:
+                cnpj in mapped
+            elapsed = time.perf_counter() - start
+            print(f"cnpj in filtro    {elapsed / args.lookups * 1e6:>12.2f} µs/consulta (com validação)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark do cache persistente de consultas (SQLiteResponseCache)
+
+Mede o tempo de ReceitaFederalAPI.consultar servido pelo cache em disco
+(SQLite, modo WAL) em consultas repetidas, contra o intervalo mínimo
+entre requisições que o cliente respeita na API pública (20 s).
+
+Uso:
+    python benchmarks/bench_response_cache.py [--cnpjs N] [--rounds N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJData, ReceitaFederalAPI, SQLiteResponseCache
+from src.cnpj_validator.generator import iter_generate
+from src.cnpj_validator.rate_limit import DEFAULT_LIMITS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cnpjs', '-n', type=int, default=1000)
+    parser.add_argument('--rounds', '-r', type=int, default=5)
+    args = parser.parse_args()
+
+    cnpjs = list(iter_generate(args.cnpjs, seed=1, formatted=False))
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = SQLiteResponseCache(os.path.join(directory, 'consultas.sqlite3'))
+        for cnpj in cnpjs:
+            raw = {"cnpj": cnpj, "razao_social": "EMPRESA TESTE LTDA", "qsa": [{"nome_socio": "X"}] * 5}
+            cache.set(cnpj, CNPJData(cnpj=cnpj, razao_social=raw["razao_social"],
+                                     situacao_cadastral="ATIVA", raw_data=raw))
+
+        api = ReceitaFederalAPI(cache=cache)
+        requests, period = DEFAULT_LIMITS[api.api_preferida]
+        interval = period / requests
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for cnpj in cnpjs:
+                api.consultar(cnpj)
+        elapsed = time.perf_counter() - start
+        lookups = args.cnpjs * args.rounds
+
+        print(f"consultar (cache)  {elapsed / lookups * 1e3:>8.3f} ms/consulta")
+        print(f"consultar (rede)   {interval * 1e3:>8.0f} ms/consulta (intervalo do rate limit)")
+        print(f"{lookups} consultas: {elapsed:.2f} s com cache, "
+              f"{lookups * interval / 60:,.0f} min sem cache")
+        print(api.cache_stats())
+
+
+if __name__ == '__main__':
+    main()
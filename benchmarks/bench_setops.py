@@ -0,0 +1,72 @@
+"""
+Benchmark das operações de conjunto em memória externa (setops)
+
+Gera um arquivo de CNPJs com repetições e inválidos e compara a
+deduplicação em memória externa (set_operation('dedupe'), com 1 e N
+processos) com um set de str montado em memória, validando cada linha
+com NewAlphanumericCNPJValidator.validate.
+
+Uso:
+    python benchmarks/bench_setops.py [--rows N] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.batch_io import iter_lines
+from src.cnpj_validator.setops import set_operation
+from src.cnpj_validator.validators.new_alphanumeric_validator import NewAlphanumericCNPJValidator
+from src.cnpj_validator.validators.vectorized import generate_many
+
+
+def _write_input(path: str, rows: int) -> None:
+    """Metade dos CNPJs repetida, com formatado e não formatado misturados."""
+    clean = generate_many(rows // 2, seed=1, alphanumeric=True, filial_ratio=0.3, formatted=False)
+    formatted = generate_many(rows // 2, seed=1, alphanumeric=True, filial_ratio=0.3)
+    with open(path, 'wb') as file:
+        file.write(b'\n'.join(clean.tolist() + formatted.tolist()) + b'\n')
+
+
+def _in_memory(path: str) -> int:
+    unique = set()
+    for line in iter_lines(path):
+        result = NewAlphanumericCNPJValidator.validate(bytes(line).decode())
+        if result['valid']:
+            unique.add(result['cnpj_clean'])
+    return len(sorted(unique))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', '-n', type=int, default=1_000_000)
+    parser.add_argument('--workers', '-w', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--run-size', type=int, default=250_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'cnpjs.txt')
+        _write_input(path, args.rows)
+
+        start = time.perf_counter()
+        expected = _in_memory(path)
+        baseline = time.perf_counter() - start
+        print(f"set + validate        {args.rows / baseline:>12,.0f} linhas/s")
+
+        for workers in sorted({1, args.workers}):
+            start = time.perf_counter()
+            total = sum(1 for _ in set_operation(
+                'dedupe', [path], workers=workers, run_size=args.run_size, temp_dir=directory
+            ))
+            elapsed = time.perf_counter() - start
+            assert total == expected
+            print(f"dedupe ({workers} processo(s)) {args.rows / elapsed:>12,.0f} linhas/s "
+                  f"({baseline / elapsed:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark de CNPJValidator.validate (validate_format=True)
+
+Compara a validação original (NumericCNPJValidator.validate, format_cnpj e
+AlphanumericCNPJValidator.validate, com CNPJ_PATTERN avaliado três vezes)
+com a varredura única de validators/scanner.py.
+
+Uso:
+    python benchmarks/bench_validate.py [--number N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJValidator
+from src.cnpj_validator.validators.alphanumeric_validator import AlphanumericCNPJValidator
+from src.cnpj_validator.validators.numeric_validator import NumericCNPJValidator
+
+
+# =============================================================================
+# Implementação original (referência)
+# =============================================================================
+
+def legacy_validate(cnpj: str, validate_format: bool = True) -> dict:
+    result = {
+        'valid': False,
+        'cnpj_input': cnpj,
+        'cnpj_clean': '',
+        'cnpj_formatted': '',
+        'numeric_validation': {},
+        'alphanumeric_validation': {},
+        'errors': [],
+        'warnings': [],
+    }
+
+    numeric_result = NumericCNPJValidator.validate(cnpj)
+    result['numeric_validation'] = numeric_result
+    result['cnpj_clean'] = numeric_result.get('cnpj_clean', '')
+
+    if not numeric_result['valid']:
+        result['errors'].extend(numeric_result['errors'])
+        return result
+
+    cnpj_formatted = NumericCNPJValidator.format_cnpj(cnpj)
+    result['cnpj_formatted'] = cnpj_formatted
+
+    if validate_format:
+        if '.' in cnpj or '/' in cnpj or '-' in cnpj:
+            alphanumeric_result = AlphanumericCNPJValidator.validate(cnpj)
+        else:
+            alphanumeric_result = AlphanumericCNPJValidator.validate(cnpj_formatted)
+            result['warnings'].append("CNPJ fornecido sem formatação")
+
+        result['alphanumeric_validation'] = alphanumeric_result
+        if not alphanumeric_result['valid']:
+            result['errors'].extend(alphanumeric_result['errors'])
+        result['warnings'].extend(alphanumeric_result.get('warnings', []))
+
+    result['valid'] = len(result['errors']) == 0
+    return result
+
+
+# =============================================================================
+# Execução
+# =============================================================================
+
+INPUTS = {
+    "formatado válido": "11.222.333/0001-81",
+    "limpo válido": "11222333000181",
+    "DV inválido": "11.222.333/0001-82",
+    "com espaços": " 11.222.333/0001-81 ",
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', '-n', type=int, default=50_000)
+    args = parser.parse_args()
+
+    validator = CNPJValidator()
+
+    print(f"{'Caso':<24}{'legado (ns)':>14}{'novo (ns)':>12}{'speedup':>10}")
+    for name, cnpj in INPUTS.items():
+        legacy = min(timeit.repeat(lambda: legacy_validate(cnpj), number=args.number, repeat=5))
+        new = min(timeit.repeat(lambda: validator.validate(cnpj), number=args.number, repeat=5))
+        print(f"{name:<24}{legacy / args.number * 1e9:>14.0f}"
+              f"{new / args.number * 1e9:>12.0f}{legacy / new:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark da validação vetorizada em lote (validate_many)
+
+Compara CNPJValidator.validate linha a linha com
+NumericCNPJValidator.validate_many / NewAlphanumericCNPJValidator.validate_many
+e com validate_mixed_many (roteamento por classe de linha).
+
+Uso:
+    python benchmarks/bench_validate_many.py [--rows N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJValidator
+from src.cnpj_validator.validators.numeric_validator import NumericCNPJValidator
+from src.cnpj_validator.validators.new_alphanumeric_validator import (
+    NewAlphanumericCNPJValidator
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', '-n', type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    pool = [b"11.222.333/0001-81", b"11222333000181", b"11.222.333/0001-82",
+            b"AB.CDE.123/0001-45", b"11111111111111", b"5I.P2X.AIJ/0001-84",
+            b"5IP2XAIJ000184", b" 11.222.333/0001-81"]
+    values = np.array(pool * (args.rows // len(pool)), dtype="S18")
+    sample = [v.decode() for v in values[:50_000]]
+
+    validator = CNPJValidator()
+    start = time.perf_counter()
+    for cnpj in sample:
+        validator.validate(cnpj)
+    per_row = (time.perf_counter() - start) / len(sample)
+    print(f"CNPJValidator.validate (por linha):        {per_row * 1e9:>8.0f} ns/linha")
+
+    for name, func in (
+        ("NumericCNPJValidator.validate_many", NumericCNPJValidator.validate_many),
+        ("NewAlphanumeric...validate_many", NewAlphanumericCNPJValidator.validate_many),
+        ("NewAlphanumeric...validate_mixed_many", NewAlphanumericCNPJValidator.validate_mixed_many),
+    ):
+        start = time.perf_counter()
+        mask = func(values)[0]
+        elapsed = time.perf_counter() - start
+        print(f"{name:<42}{elapsed / len(values) * 1e9:>8.0f} ns/linha "
+              f"({len(values):,} linhas em {elapsed:.2f}s, {int(mask.sum()):,} válidos)")
+
+    print(f"\nEstimativa para 60M linhas: {per_row * 60e6 / 3600:.1f} h linha a linha")
+
+
+if __name__ == '__main__':
+    main()
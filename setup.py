@@ -58,6 +58,9 @@ setup(
             "fastapi>=0.100.0",
             "uvicorn>=0.22.0",
         ],
+        "fast": [
+            "numpy>=1.20.0",
+        ],
     },
     entry_points={
         "console_scripts": [
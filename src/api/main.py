@@ -13,11 +13,18 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from cnpj_validator.validators.new_alphanumeric_validator import NewAlphanumericCNPJValidator
 from cnpj_validator.validators.numeric_validator import NumericCNPJValidator
+from cnpj_validator.validators.check_digits import NUMERIC_ENGINE
+from cnpj_validator.generator import enumerate_establishments, iter_generate
 from cnpj_validator.validators.alphanumeric_validator import AlphanumericCNPJValidator
-from cnpj_validator import CNPJValidator, ReceitaFederalAPI, ReceitaFederalAPIError
+from cnpj_validator import (
+    AsyncReceitaFederalAPI, BloomFilter, CachedCNPJValidator, CNPJValidator, ReceitaFederalAPIError,
+    SQLiteResponseCache, is_valid
+)
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List
+from itertools import chain, islice
+from typing import Iterator, Optional, List
 from enum import Enum
 
 
@@ -145,6 +152,21 @@ class GenerateCNPJResponse(BaseModel):
     is_alphanumeric: bool = Field(..., description="Se contém letras")
 
 
+class CorrectionSuggestion(BaseModel):
+    """Correção sugerida para um CNPJ com DV inválido"""
+    cnpj: str = Field(..., description="CNPJ sugerido sem formatação")
+    cnpj_formatted: str = Field(..., description="CNPJ sugerido formatado")
+    kind: str = Field(..., description="substitution (troca) ou transposition (inversão)")
+    position: int = Field(..., description="Posição alterada (0 a 13, no CNPJ sem formatação)")
+
+
+class SuggestCorrectionsResponse(BaseModel):
+    """Resposta da sugestão de correções"""
+    cnpj: str = Field(..., description="CNPJ informado")
+    valid: bool = Field(..., description="Se o CNPJ informado já é válido")
+    suggestions: List[CorrectionSuggestion] = Field(..., description="Correções sugeridas")
+
+
 class BatchValidationResponse(BaseModel):
     """Resposta da validação em lote"""
     total: int = Field(..., description="Total de CNPJs")
@@ -182,6 +204,31 @@ class HealthResponse(BaseModel):
 
 API_VERSION = "2.1.0"
 
+# Cache LRU opcional dos resultados (CNPJ_CACHE_SIZE > 0 habilita)
+CACHE_SIZE = int(os.environ.get("CNPJ_CACHE_SIZE", "0"))
+
+# Validador compartilhado entre as requisições (não guarda estado por chamada)
+if CACHE_SIZE > 0:
+    validator = CachedCNPJValidator(CACHE_SIZE)
+    alphanumeric_validate = validator.validate_alphanumeric
+else:
+    validator = CNPJValidator()
+    alphanumeric_validate = NewAlphanumericCNPJValidator.validate
+
+# Pré-filtro opcional de CNPJs registrados (arquivo de `cnpj-validator build-filter`),
+# mapeado em memória: CNPJs ausentes dele não geram consulta externa
+PREFILTER_PATH = os.environ.get("CNPJ_PREFILTER_PATH", "")
+prefilter = BloomFilter.open(PREFILTER_PATH) if PREFILTER_PATH else None
+
+# Cache persistente opcional das consultas à Receita Federal (SQLite), compartilhado
+# entre as requisições e entre os workers que apontam para o mesmo arquivo
+RESPONSE_CACHE_PATH = os.environ.get("CNPJ_RESPONSE_CACHE_PATH", "")
+response_cache = SQLiteResponseCache(RESPONSE_CACHE_PATH) if RESPONSE_CACHE_PATH else None
+
+# Hedge opcional das consultas (CNPJ_HEDGE_REQUESTS=1): se o provedor mais rápido
+# passar do próprio p95 sem responder, o seguinte também é consultado
+HEDGE_REQUESTS = os.environ.get("CNPJ_HEDGE_REQUESTS", "") not in ("", "0")
+
 app = FastAPI(
     title="API de Validação de CNPJ",
     description="""
@@ -274,6 +321,23 @@ async def health_check():
     return HealthResponse(status="healthy", version=API_VERSION, service="cnpj-validator-api")
 
 
+@app.get("/cache/stats", tags=["Status"], summary="Estatísticas do Cache")
+async def cache_stats():
+    """
+    Acertos, faltas e descartes do cache de validação.
+
+    O cache é habilitado com a variável de ambiente `CNPJ_CACHE_SIZE` (> 0).
+    Com `CNPJ_RESPONSE_CACHE_PATH`, inclui em `consulta` as estatísticas do
+    cache de consultas à Receita Federal.
+    """
+    stats = {"enabled": False}
+    if isinstance(validator, CachedCNPJValidator):
+        stats = {"enabled": True, **validator.stats()}
+    if response_cache is not None:
+        stats["consulta"] = response_cache.stats()
+    return stats
+
+
 # =============================================================================
 # VALIDAÇÃO BÁSICA
 # =============================================================================
@@ -294,20 +358,18 @@ async def validate_cnpj(
 
     Exemplo: `?cnpj=11222333000181` ou `?cnpj=11.222.333/0001-81`
     """
-    validator = CNPJValidator()
     result = validator.validate(cnpj)
 
     tipo = None
-    if result.get('valid'):
-        info = validator.get_info(cnpj)
-        tipo = TipoEstabelecimento.MATRIZ if info.get('is_matriz') else TipoEstabelecimento.FILIAL
+    if result.valid:
+        tipo = TipoEstabelecimento.MATRIZ if result.is_matriz else TipoEstabelecimento.FILIAL
 
     return CNPJValidationResponse(
-        valid=result.get('valid', False),
-        cnpj_formatted=result.get('cnpj_formatted', ''),
-        cnpj_clean=result.get('cnpj_clean', ''),
+        valid=result.valid,
+        cnpj_formatted=result.cnpj_formatted,
+        cnpj_clean=result.cnpj_clean,
         tipo=tipo,
-        errors=result.get('errors', [])
+        errors=result.errors
     )
 
 
@@ -331,7 +393,6 @@ async def validate_batch(
     if len(cnpj_list) > 50:
         raise HTTPException(status_code=400, detail="Máximo de 50 CNPJs por requisição")
 
-    validator = CNPJValidator()
     results = []
 
     for cnpj in cnpj_list:
@@ -384,10 +445,12 @@ async def validate_numeric(
     second_digit = None
     check_digits_valid = False
 
-    if length_valid and cnpj_clean.isdigit():
-        first_digit = NumericCNPJValidator.calculate_first_digit(cnpj_clean[:12])
-        second_digit = NumericCNPJValidator.calculate_second_digit(cnpj_clean[:13])
-        check_digits_valid = NumericCNPJValidator.validate_check_digits(cnpj_clean)
+    if length_valid:
+        # DV1 e DV2 calculados em uma única passada pelo motor de tabelas
+        digits = NUMERIC_ENGINE.compute(cnpj_clean)
+        if digits is not None:
+            first_digit, second_digit = digits
+            check_digits_valid = cnpj_clean[12:14] == f"{first_digit}{second_digit}"
 
     if not length_valid:
         errors.append(f"CNPJ deve ter 14 dígitos (possui {len(cnpj_clean)})")
@@ -502,7 +565,7 @@ async def validate_alphanumeric(
     - Identificação se é matriz ou filial
     - Se contém letras (is_alphanumeric)
     """
-    result = NewAlphanumericCNPJValidator.validate(cnpj)
+    result = alphanumeric_validate(cnpj)
     cnpj_clean = NewAlphanumericCNPJValidator.remove_formatting(cnpj)
 
     root_valid = False
@@ -588,7 +651,7 @@ async def validate_new_format(
     - Ordem (4 dígitos): Apenas números
     - DV (2 dígitos): Calculados com letras convertidas (A=10...Z=35)
     """
-    result = NewAlphanumericCNPJValidator.validate(cnpj)
+    result = alphanumeric_validate(cnpj)
     cnpj_clean = NewAlphanumericCNPJValidator.remove_formatting(cnpj)
 
     root_valid = NewAlphanumericCNPJValidator.validate_root_chars(
@@ -819,13 +882,19 @@ async def consultar_cnpj(
     Consulta dados cadastrais de um CNPJ na Receita Federal.
 
     **Atenção**: Depende de API externa (BrasilAPI). Pode haver indisponibilidade.
+    A consulta é assíncrona: enquanto aguarda a API externa, o servidor
+    continua atendendo as demais rotas.
+    Com `CNPJ_PREFILTER_PATH` configurado, CNPJs ausentes do pré-filtro de
+    registrados retornam 404 sem consulta externa.
     """
-    if not CNPJValidator.is_valid(cnpj):
+    if not is_valid(cnpj):
         raise HTTPException(status_code=400, detail="CNPJ inválido")
+    if prefilter is not None and cnpj not in prefilter:
+        raise HTTPException(status_code=404, detail="CNPJ não encontrado")
 
     try:
-        api = ReceitaFederalAPI()
-        dados = api.consultar(cnpj)
+        async with AsyncReceitaFederalAPI(cache=response_cache, hedge=HEDGE_REQUESTS) as api:
+            dados = await api.consultar(cnpj)
 
         return CNPJInfoResponse(
             cnpj=dados.cnpj,
@@ -835,11 +904,11 @@ async def consultar_cnpj(
             tipo_estabelecimento="Matriz" if dados.is_matriz() else "Filial",
             data_abertura=dados.data_abertura,
             endereco=dados.get_endereco_completo(),
-            municipio=dados.municipio,
-            uf=dados.uf,
+            municipio=dados.endereco.get("municipio"),
+            uf=dados.endereco.get("uf"),
             telefone=dados.telefone,
             email=dados.email,
-            atividade_principal=dados.atividade_principal
+            atividade_principal=dados.cnae_principal.get("descricao")
         )
     except ReceitaFederalAPIError as e:
         if "não encontrado" in str(e).lower():
@@ -860,15 +929,17 @@ async def verificar_situacao(
 
     Situações possíveis: ATIVA, BAIXADA, INAPTA, SUSPENSA
     """
-    if not CNPJValidator.is_valid(cnpj):
+    if not is_valid(cnpj):
         raise HTTPException(status_code=400, detail="CNPJ inválido")
+    if prefilter is not None and cnpj not in prefilter:
+        raise HTTPException(status_code=404, detail="CNPJ não encontrado")
 
     try:
-        api = ReceitaFederalAPI()
-        situacao = api.verificar_situacao(cnpj)
+        async with AsyncReceitaFederalAPI(cache=response_cache, hedge=HEDGE_REQUESTS) as api:
+            situacao = await api.verificar_situacao(cnpj)
 
         return {
-            "cnpj": CNPJValidator.format(cnpj),
+            "cnpj": validator.format(cnpj),
             "situacao": situacao.get("situacao", "Desconhecida"),
             "ativa": situacao.get("ativa", False)
         }
@@ -893,52 +964,108 @@ async def formatar_cnpj(
     """
     Formata um CNPJ no padrão XX.XXX.XXX/XXXX-XX.
     """
-    formatted = CNPJValidator.format(cnpj)
+    result = validator.validate(cnpj, validate_format=False)
 
-    if not formatted:
+    if not result.valid:
         raise HTTPException(
             status_code=400, detail="Não foi possível formatar. Verifique se possui 14 dígitos.")
 
     return {
         "original": cnpj,
-        "formatted": formatted
+        "formatted": result.cnpj_formatted
     }
 
 
+@app.get(
+    "/api/v1/suggest",
+    tags=["Utilitários"],
+    summary="Sugerir Correções",
+    response_model=SuggestCorrectionsResponse
+)
+async def sugerir_correcoes(
+    cnpj: str = Query(..., description="CNPJ com DV inválido", examples=["11.222.333/0001-18"]),
+    max_results: int = Query(10, ge=1, le=100, description="Quantidade máxima de sugestões")
+):
+    """
+    Sugere CNPJs válidos a uma digitação de distância de um CNPJ inválido:
+    troca de um caractere ou inversão de dois caracteres vizinhos.
+
+    Exemplo: `?cnpj=11.222.333/0001-18` sugere `11.222.333/0001-81`
+    """
+    return SuggestCorrectionsResponse(
+        cnpj=cnpj,
+        valid=NewAlphanumericCNPJValidator.validate(cnpj)['valid'],
+        suggestions=NewAlphanumericCNPJValidator.suggest_corrections(cnpj, max_results)
+    )
+
+
 @app.get(
     "/api/v1/generate",
     tags=["Utilitários"],
     summary="Gerar CNPJ Válido (Tradicional)"
 )
 async def generate_cnpj(
-    tipo: str = Query("matriz", description="Tipo: matriz ou filial", enum=["matriz", "filial"])
+    tipo: str = Query("matriz", description="Tipo: matriz ou filial", enum=["matriz", "filial"]),
+    quantidade: int = Query(
+        1, ge=1, le=10_000, description="Quantidade de CNPJs gerados (lista em 'cnpjs')"
+    ),
+    seed: Optional[int] = Query(None, description="Semente para gerar sempre a mesma sequência")
 ):
     """
-    Gera um CNPJ numérico tradicional válido.
+    Gera CNPJs numéricos tradicionais válidos.
+
+    O primeiro CNPJ gerado é retornado em `cnpj`/`cnpj_formatted`; com
+    `quantidade` maior que 1, todos vêm em `cnpjs` (formatados).
 
     **Atenção**: CNPJs gerados são fictícios, apenas para testes.
     """
-    import random
-
-    # Gera 8 dígitos da raiz
-    raiz = ''.join([str(random.randint(0, 9)) for _ in range(8)])
+    cnpjs = list(iter_generate(
+        quantidade, seed=seed, filial_ratio=1.0 if tipo == "filial" else 0.0
+    ))
 
-    # Define ordem (0001 para matriz, aleatório para filial)
-    ordem = "0001" if tipo == "matriz" else f"{random.randint(2, 9999):04d}"
+    return {
+        "cnpj": NewAlphanumericCNPJValidator.remove_formatting(cnpjs[0]),
+        "cnpj_formatted": cnpjs[0],
+        "tipo": tipo,
+        "cnpjs": cnpjs
+    }
 
-    base = raiz + ordem
 
-    # Calcula DVs
-    dv1 = NumericCNPJValidator.calculate_first_digit(base)
-    dv2 = NumericCNPJValidator.calculate_second_digit(base + str(dv1))
+@app.get(
+    "/api/v1/generate/establishments",
+    tags=["Utilitários"],
+    summary="Listar Estabelecimentos de uma Raiz",
+    response_class=StreamingResponse
+)
+async def generate_establishments(
+    raiz: str = Query(..., description="Raiz do CNPJ (8 caracteres)", examples=["11222333"]),
+    inicio: int = Query(1, ge=1, le=9999, description="Primeira ordem (1 = matriz)"),
+    fim: int = Query(9999, ge=1, le=9999, description="Última ordem, inclusive"),
+    formatado: bool = Query(True, description="Retornar no formato XX.XXX.XXX/XXXX-XX")
+):
+    """
+    Lista os CNPJs válidos de todos os estabelecimentos (ordens) de uma raiz.
 
-    cnpj = base + str(dv1) + str(dv2)
+    A resposta é enviada em fluxo (`text/plain`, um CNPJ por linha), à medida
+    que os DVs são calculados.
 
-    return {
-        "cnpj": cnpj,
-        "cnpj_formatted": CNPJValidator.format(cnpj),
-        "tipo": tipo
-    }
+    **Atenção**: CNPJs gerados são fictícios, apenas para testes.
+    """
+    cnpjs = enumerate_establishments(raiz, inicio, fim, formatado)
+    try:
+        # A raiz é validada no primeiro item, antes de iniciar a resposta
+        first = list(islice(cnpjs, 1))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def lines(cnpjs: Iterator[str], block: int = 1000) -> Iterator[str]:
+        while True:
+            chunk = list(islice(cnpjs, block))
+            if not chunk:
+                return
+            yield '\n'.join(chunk) + '\n'
+
+    return StreamingResponse(lines(chain(first, cnpjs)), media_type="text/plain")
 
 
 # =============================================================================
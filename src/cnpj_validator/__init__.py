@@ -7,15 +7,42 @@ Compatível com Python 3.8+
 
 from .validators.numeric_validator import NumericCNPJValidator
 from .validators.alphanumeric_validator import AlphanumericCNPJValidator
-from .cnpj_validator import CNPJValidator
+from .validators.error_codes import ErrorCode, WarningCode
+from .cnpj_validator import CNPJValidator, is_valid, is_valid_many
+from .validation_result import ValidationResult
+from .cache import CachedCNPJValidator, LRUCache
+from .parallel import validate_parallel
+from .generator import RootRange, enumerate_establishments
+from .keys import CNPJKey
+from .async_receita_federal_api import AsyncReceitaFederalAPI
+from .prefilter import BloomFilter
+from .provider_stats import ProviderStats
+from .rate_limit import SharedRateLimiter
 from .receita_federal_api import ReceitaFederalAPI, CNPJData, ReceitaFederalAPIError
+from .response_cache import SQLiteResponseCache
 
 __version__ = "2.0.0"
 __all__ = [
     "CNPJValidator",
+    "is_valid",
+    "is_valid_many",
+    "ValidationResult",
+    "CachedCNPJValidator",
+    "LRUCache",
+    "validate_parallel",
+    "enumerate_establishments",
+    "RootRange",
+    "CNPJKey",
+    "BloomFilter",
+    "ErrorCode",
+    "WarningCode",
     "NumericCNPJValidator",
     "AlphanumericCNPJValidator",
     "ReceitaFederalAPI",
+    "AsyncReceitaFederalAPI",
     "CNPJData",
     "ReceitaFederalAPIError",
+    "SQLiteResponseCache",
+    "SharedRateLimiter",
+    "ProviderStats",
 ]
@@ -0,0 +1,358 @@
+"""
+Cliente Assíncrono (asyncio) da API da Receita Federal
+
+Mesma consulta de ReceitaFederalAPI (validação, pré-filtro, cache,
+fallback entre provedores, novas tentativas e parsers), sem bloquear o
+event loop:
+
+- Requisições HTTP/1.1 sobre sockets não bloqueantes
+  (asyncio.open_connection), sem dependências além da biblioteca padrão,
+  com conexões keep-alive e gzip (AsyncHTTPConnectionPool, pool_size por
+  host); feche com close() ou use async with
+- Proxies de HTTP(S)_PROXY e NO_PROXY, como no cliente síncrono: túnel
+  CONNECT para https e URL absoluta para http
+- Rate limit e esperas entre tentativas com asyncio.sleep
+- Acessos ao SQLite (rate limiter e cache) no executor padrão do loop:
+  a disputa do lock entre workers não trava o event loop
+- Entradas vencidas do cache atualizadas em tarefas asyncio
+- Hedge (hedge=True) em tarefas: a requisição mais lenta é cancelada
+
+Enquanto uma consulta aguarda a rede ou o rate limit, o event loop segue
+atendendo as demais requisições (health check, validação...).
+
+Uso:
+    api = AsyncReceitaFederalAPI()
+    dados = await api.consultar("11.222.333/0001-81")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import http.client
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Sequence, Tuple, Union
+
+from .bulk_lookup import consultar_many_async
+from .connection_pool import AsyncHTTPConnectionPool
+from .receita_federal_api import (
+    HEDGE_QUANTILE,
+    CNPJData,
+    ReceitaFederalAPI,
+    ReceitaFederalAPIError,
+    _atualizacoes_lock,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncReceitaFederalAPI(ReceitaFederalAPI):
+    """
+    Cliente asyncio para consulta de CNPJ via APIs públicas.
+
+    Aceita os mesmos argumentos de ReceitaFederalAPI; consultar,
+    verificar_situacao e buscar_socios são corrotinas.
+
+    Example:
+        >>> api = AsyncReceitaFederalAPI()
+        >>> dados = await api.consultar("11222333000181")
+        >>> print(dados.razao_social)
+        'EMPRESA EXEMPLO LTDA'
+    """
+
+    async def _em_thread(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Executa uma chamada bloqueante (SQLite) no executor padrão do event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
+    async def _respeitar_rate_limit(self, api_name: str) -> None:
+        """Garante que o rate limit do provedor seja respeitado, sem bloquear o event loop."""
+        # A ficha fica reservada: a espera acontece fora do limitador
+        wait_time = await self._em_thread(self._limitador().reserve, api_name)
+        if wait_time > 0:
+            logger.debug(f"Rate limit {api_name}: aguardando {wait_time:.1f}s")
+            await asyncio.sleep(wait_time)
+
+    def _conexoes(self) -> AsyncHTTPConnectionPool:  # type: ignore[override]
+        """Pool de conexões asyncio do cliente, criado na primeira requisição."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = AsyncHTTPConnectionPool(self.pool_size, self.timeout)
+            return self._pool
+
+    async def __aenter__(self) -> AsyncReceitaFederalAPI:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def _fazer_requisicao(self, url: str) -> dict:
+        """
+        Faz requisição HTTP para a API, reaproveitando conexões keep-alive.
+
+        Args:
+            url: URL completa da API
+
+        Returns:
+            Dados JSON da resposta
+
+        Raises:
+            ReceitaFederalAPIError: Em caso de erro na requisição
+        """
+        try:
+            response = await asyncio.wait_for(self._conexoes().get(url), self.timeout)
+        except asyncio.TimeoutError:
+            raise ReceitaFederalAPIError(f"Timeout após {self.timeout} segundos")
+        except (OSError, http.client.HTTPException, asyncio.IncompleteReadError, ValueError) as e:
+            raise ReceitaFederalAPIError(f"Erro de conexão: {e}")
+
+        text = response.body.decode("utf-8", errors="replace")
+        if response.status >= 400:
+            raise self._erro_http(response.status, response.reason, text)
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ReceitaFederalAPIError(f"Erro ao decodificar resposta JSON: {e}")
+
+    async def consultar(self, cnpj: str, usar_fallback: bool = True) -> CNPJData:
+        """
+        Consulta dados de um CNPJ na Receita Federal.
+
+        Args:
+            cnpj: Número do CNPJ (com ou sem formatação)
+            usar_fallback: Se True, tenta outras APIs em caso de erro
+
+        Returns:
+            CNPJData com os dados da empresa
+
+        Raises:
+            ReceitaFederalAPIError: Em caso de erro na consulta
+            ValueError: Se o CNPJ for inválido
+        """
+        cnpj_limpo, cnpj_numerico = self._preparar_consulta(cnpj)
+
+        if self.cache is not None:
+            entry = await self._em_thread(self.cache.get, cnpj_numerico)
+            if entry is not None:
+                if entry.stale:
+                    self._agendar_atualizacao(cnpj_limpo, cnpj_numerico, usar_fallback)
+                return entry.dados
+
+        dados = await self._consultar_apis(cnpj_limpo, cnpj_numerico, usar_fallback)
+        if self.cache is not None:
+            await self._em_thread(self.cache.set, cnpj_numerico, dados)
+        return dados
+
+    def consultar_many(
+        self,
+        cnpjs: Iterable[str],
+        concurrency: Optional[int] = None,
+        providers: Optional[Sequence[str]] = None,
+        progress: Optional[Callable[[int, int], Any]] = None,
+        cancel: Optional[asyncio.Event] = None,
+    ) -> AsyncIterator[Tuple[str, Union[CNPJData, Exception]]]:
+        """
+        Consulta um lote de CNPJs distribuindo as requisições entre todos os provedores.
+
+        Mesmos argumentos de ReceitaFederalAPI.consultar_many, com cancel
+        como asyncio.Event; use com async for.
+
+        Example:
+            >>> async for cnpj, resultado in api.consultar_many(cnpjs):
+            ...     print(cnpj, resultado)
+        """
+        return consultar_many_async(self, cnpjs, concurrency, providers, progress, cancel)
+
+    def _agendar_atualizacao(
+        self, cnpj_limpo: str, cnpj_numerico: str, usar_fallback: bool
+    ) -> None:
+        """Atualiza em uma tarefa asyncio uma entrada vencida do cache (uma por CNPJ e cache)."""
+        with _atualizacoes_lock:
+            em_andamento = self._atualizacoes_em_andamento()
+            if cnpj_numerico in em_andamento:
+                return
+            em_andamento[cnpj_numerico] = asyncio.ensure_future(
+                self._atualizar_cache(cnpj_limpo, cnpj_numerico, usar_fallback)
+            )
+
+    async def _atualizar_cache(
+        self, cnpj_limpo: str, cnpj_numerico: str, usar_fallback: bool
+    ) -> None:
+        """Executado na tarefa de atualização: consulta a API e regrava o cache."""
+        try:
+            dados = await self._consultar_apis(cnpj_limpo, cnpj_numerico, usar_fallback)
+            await self._em_thread(self.cache.set, cnpj_numerico, dados)
+            self.cache_refreshes += 1
+        except Exception as e:
+            # A entrada vencida continua servida até sair da janela stale_ttl
+            logger.warning(f"Falha ao atualizar o cache do CNPJ {cnpj_limpo}: {e}")
+            self.cache_refresh_errors += 1
+        finally:
+            with _atualizacoes_lock:
+                self._atualizacoes_em_andamento().pop(cnpj_numerico, None)
+
+    async def aguardar_atualizacoes(self, timeout: Optional[float] = None) -> None:
+        """
+        Aguarda as atualizações em segundo plano em andamento no cache do cliente
+        (as tarefas deste event loop).
+
+        Args:
+            timeout: Tempo máximo de espera, em segundos
+        """
+        if self.cache is None:
+            return
+        loop = asyncio.get_running_loop()
+        with _atualizacoes_lock:
+            tasks = [
+                task
+                for task in self._atualizacoes_em_andamento().values()
+                if isinstance(task, asyncio.Future) and task.get_loop() is loop
+            ]
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+
+    async def _consultar_apis(
+        self, cnpj_limpo: str, cnpj_numerico: str, usar_fallback: bool
+    ) -> CNPJData:
+        """
+        Consulta as APIs externas, com fallback entre provedores e novas tentativas.
+
+        Raises:
+            ReceitaFederalAPIError: Se todas as APIs falharem
+        """
+        last_error: Optional[Exception] = None
+        # O roteamento consulta a espera de cada provedor no rate limiter
+        urls = await self._em_thread(self._urls_para_tentar, cnpj_numerico, usar_fallback)
+
+        if self.hedge and len(urls) > 1:
+            dados = await self._consultar_com_hedge(cnpj_limpo, urls[0], urls[1])
+            if dados is not None:
+                return dados
+
+        for api_name, url in urls:
+            for attempt in range(self.max_retries):
+                # Erro do limitador (ex.: banco somente leitura) não é falha do provedor
+                await self._respeitar_rate_limit(api_name)
+                try:
+                    logger.info(
+                        f"Consultando CNPJ {cnpj_limpo} via {api_name} (tentativa {attempt + 1})"
+                    )
+
+                    return await self._requisitar(api_name, url)
+
+                except Exception as e:
+                    last_error = e
+                    if isinstance(e, ReceitaFederalAPIError) and e.status_code == 404:
+                        # CNPJ não encontrado - não adianta tentar novamente
+                        raise
+                    wait_time = self._espera_apos_erro(api_name, e, attempt)
+                    if wait_time:
+                        await asyncio.sleep(wait_time)
+
+            logger.warning(f"Todas as tentativas com {api_name} falharam")
+
+        if last_error:
+            raise last_error
+        raise ReceitaFederalAPIError("Não foi possível consultar o CNPJ em nenhuma API")
+
+    async def _consultar_com_hedge(
+        self, cnpj_limpo: str, principal: Tuple[str, str], reserva: Tuple[str, str]
+    ) -> Optional[CNPJData]:
+        """
+        Consulta o provedor principal e, se ele passar do próprio p95 sem
+        responder, também o reserva; vale a primeira resposta válida e a
+        outra requisição é cancelada.
+
+        Returns:
+            CNPJData, ou None se o principal ainda não tem p95 ou se nenhuma
+            das requisições teve sucesso (a consulta segue o fluxo normal)
+
+        Raises:
+            ReceitaFederalAPIError: CNPJ não encontrado (404 é definitivo)
+        """
+        prazo = self._estatisticas().percentile(principal[0], HEDGE_QUANTILE)
+        if prazo is None:
+            # Poucas amostras para um p95: consulta normal
+            return None
+        await self._respeitar_rate_limit(principal[0])
+        logger.info(f"Consultando CNPJ {cnpj_limpo} via {principal[0]}")
+        tarefas = {asyncio.ensure_future(self._requisitar(*principal)): principal[0]}
+        try:
+            concluidas, _ = await asyncio.wait(tarefas, timeout=prazo)
+            if not concluidas:
+                # Sem hedge se o reserva estiver sem cota: a espera anularia o ganho
+                espera = await self._em_thread(self._limitador().expected_wait, reserva[0])
+                if espera == 0:
+                    await self._respeitar_rate_limit(reserva[0])
+                    logger.info(
+                        f"Hedge do CNPJ {cnpj_limpo} via {reserva[0]} "
+                        f"({principal[0]} passou do p95)"
+                    )
+                    tarefas[asyncio.ensure_future(self._requisitar(*reserva))] = reserva[0]
+                    self.hedges += 1
+
+            pendentes = set(tarefas)
+            while pendentes:
+                concluidas, pendentes = await asyncio.wait(
+                    pendentes, return_when=asyncio.FIRST_COMPLETED
+                )
+                for tarefa in concluidas:
+                    erro = tarefa.exception()
+                    if erro is None:
+                        if tarefas[tarefa] == reserva[0]:
+                            self.hedge_wins += 1
+                        return tarefa.result()
+                    if isinstance(erro, ReceitaFederalAPIError) and erro.status_code == 404:
+                        raise erro
+                    logger.warning(f"Erro na consulta com {tarefas[tarefa]}: {erro}")
+            return None
+        finally:
+            for tarefa in tarefas:
+                tarefa.cancel()
+
+    async def _requisitar(self, api_name: str, url: str) -> CNPJData:
+        """Faz a requisição ao provedor, registrando latência e resultado nas estatísticas."""
+        inicio = time.perf_counter()
+        try:
+            data = await self._fazer_requisicao(url)
+        except Exception as e:
+            # 404 é uma resposta válida do provedor; os demais erros (não o
+            # cancelamento de quem perdeu o hedge) contam na taxa de erro
+            nao_encontrado = isinstance(e, ReceitaFederalAPIError) and e.status_code == 404
+            self._estatisticas().record(api_name, time.perf_counter() - inicio, ok=nao_encontrado)
+            raise
+        self._estatisticas().record(api_name, time.perf_counter() - inicio)
+        return self._interpretar(api_name, data)
+
+    async def verificar_situacao(self, cnpj: str) -> dict:
+        """
+        Verifica apenas a situação cadastral do CNPJ.
+
+        Args:
+            cnpj: Número do CNPJ
+
+        Returns:
+            Dicionário com cnpj, situacao, ativa e data_situacao
+        """
+        dados = await self.consultar(cnpj)
+        return {
+            "cnpj": dados.cnpj,
+            "situacao": dados.situacao_cadastral,
+            "ativa": dados.is_ativa(),
+            "data_situacao": dados.data_situacao_cadastral,
+        }
+
+    async def buscar_socios(self, cnpj: str) -> list:
+        """
+        Busca o quadro societário de um CNPJ.
+
+        Args:
+            cnpj: Número do CNPJ
+
+        Returns:
+            Lista de sócios
+        """
+        dados = await self.consultar(cnpj)
+        return dados.quadro_societario
@@ -0,0 +1,217 @@
+"""
+Leitura e Escrita de Arquivos de Lote
+
+Leitura: arquivos com um CNPJ por linha são lidos sem decodificar para str
+nem copiar as linhas. Arquivos regulares são mapeados em memória (mmap) e
+cada linha é entregue como uma fatia (memoryview) do mapeamento; pipes e
+outros fluxos sem mmap são lidos com leitura bufferizada em modo binário.
+As linhas são entregues sem os espaços ASCII das pontas (espaço, \\t, \\r,
+\\n, \\v, \\f); linhas em branco são ignoradas.
+
+Escrita: os resultados são gravados à medida que são produzidos, em JSON
+(array), JSON Lines, CSV ou TSV, para que o consumidor possa processar a
+saída enquanto a validação ainda está em andamento.
+"""
+
+import csv
+import json
+import mmap
+import os
+import stat
+import sys
+from typing import BinaryIO, Iterable, Iterator, TextIO, Tuple, Union
+
+Line = Union[bytes, memoryview]
+Source = Union[str, "os.PathLike[str]", BinaryIO]
+
+# Espaços ASCII removidos das pontas de cada linha
+_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+OUTPUT_FORMATS = ("json", "jsonl", "csv", "tsv")
+DELIMITED_FIELDS = ("valid", "cnpj", "errors")
+DEFAULT_WRITE_BUFFER_SIZE = 1 << 16
+
+
+# =============================================================================
+# Leitura
+# =============================================================================
+
+
+def _mappable(file: BinaryIO) -> bool:
+    """Se o arquivo é regular e não vazio (mmap de arquivo vazio falha)."""
+    try:
+        info = os.fstat(file.fileno())
+    except (AttributeError, OSError, TypeError, ValueError):
+        return False
+    return stat.S_ISREG(info.st_mode) and info.st_size > 0
+
+
+def _iter_mapped(file: BinaryIO) -> Iterator[memoryview]:
+    """Linhas de um arquivo regular como fatias do mapeamento em memória."""
+    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    find = mapped.find
+    end = len(mapped)
+    whitespace = _WHITESPACE
+    position = 0
+
+    try:
+        while position < end:
+            newline = find(b"\n", position)
+            if newline < 0:
+                newline = end
+
+            start, stop = position, newline
+            while start < stop and view[start] in whitespace:
+                start += 1
+            while stop > start and view[stop - 1] in whitespace:
+                stop -= 1
+            if start < stop:
+                yield view[start:stop]
+
+            position = newline + 1
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # Alguma fatia ainda está em uso; o mapeamento é liberado pelo GC
+            pass
+
+
+def _iter_buffered(file: BinaryIO) -> Iterator[bytes]:
+    """Linhas de um fluxo binário qualquer (pipes, stdin)."""
+    for line in file:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def iter_lines(source: Source) -> Iterator[Line]:
+    """
+    Itera sobre as linhas não vazias de um arquivo de lote, em bytes.
+
+    As fatias de memoryview são válidas apenas durante a iteração; para
+    guardar uma linha, copie-a com bytes(linha).
+
+    Args:
+        source: Caminho do arquivo ou arquivo aberto em modo binário
+            ('-' lê da entrada padrão)
+
+    Yields:
+        Cada linha sem os espaços das pontas (memoryview ou bytes)
+    """
+    if source == "-":
+        source = sys.stdin.buffer
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield from iter_lines(file)
+        return
+
+    if _mappable(source):
+        yield from _iter_mapped(source)
+    else:
+        yield from _iter_buffered(source)
+
+
+# =============================================================================
+# Escrita
+# =============================================================================
+
+
+def open_output(path: str, buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE) -> TextIO:
+    """
+    Abre o arquivo de saída em UTF-8 com buffer de escrita.
+
+    Args:
+        path: Caminho do arquivo
+        buffer_size: Tamanho do buffer de escrita em bytes
+
+    Returns:
+        Arquivo de texto aberto para escrita
+    """
+    return open(path, "w", encoding="utf-8", newline="", buffering=buffer_size)
+
+
+def _write_json(results: Iterable[dict], stream: TextIO, flush: bool) -> Iterator[dict]:
+    """Array JSON (indent=2) escrito item a item, igual a json.dumps(lista, indent=2)."""
+    first = True
+    for result in results:
+        body = json.dumps(result, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+        stream.write(("[\n  " if first else ",\n  ") + body)
+        if flush:
+            stream.flush()
+        first = False
+        yield result
+    stream.write("[]\n" if first else "\n]\n")
+
+
+def _write_jsonl(results: Iterable[dict], stream: TextIO, flush: bool) -> Iterator[dict]:
+    """Um objeto JSON compacto por linha."""
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    write = stream.write
+    for result in results:
+        write(dumps(result) + "\n")
+        if flush:
+            stream.flush()
+        yield result
+
+
+def _write_delimited(
+    results: Iterable[dict], stream: TextIO, flush: bool, delimiter: str
+) -> Iterator[dict]:
+    """CSV/TSV com cabeçalho; valid como true/false e erros separados por '; '."""
+    writer = csv.writer(stream, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(DELIMITED_FIELDS)
+    writerow = writer.writerow
+    for result in results:
+        writerow(
+            (
+                "true" if result["valid"] else "false",
+                result["cnpj"],
+                "; ".join(result["errors"]),
+            )
+        )
+        if flush:
+            stream.flush()
+        yield result
+
+
+def write_results(
+    results: Iterable[dict],
+    stream: TextIO,
+    output_format: str = "jsonl",
+    flush: bool = False,
+) -> Tuple[int, int]:
+    """
+    Grava os resultados do lote à medida que são produzidos.
+
+    Args:
+        results: Resultados no formato do comando batch ({'valid', 'cnpj', 'errors'})
+        stream: Arquivo de texto de saída (ver open_output)
+        output_format: 'json', 'jsonl', 'csv' ou 'tsv'
+        flush: Se True, descarrega o buffer a cada resultado (útil quando
+            outro processo lê a saída em tempo real)
+
+    Returns:
+        Tupla (total, válidos)
+
+    Raises:
+        ValueError: Se o formato não for suportado
+    """
+    if output_format == "json":
+        written = _write_json(results, stream, flush)
+    elif output_format == "jsonl":
+        written = _write_jsonl(results, stream, flush)
+    elif output_format in ("csv", "tsv"):
+        written = _write_delimited(results, stream, flush, "," if output_format == "csv" else "\t")
+    else:
+        raise ValueError(f"Formato de saída não suportado: {output_format}")
+
+    total = valid = 0
+    for result in written:
+        total += 1
+        valid += result["valid"]
+    stream.flush()
+    return total, valid
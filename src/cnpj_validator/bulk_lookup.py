@@ -0,0 +1,334 @@
+"""
+Consulta em Lote à Receita Federal (vários provedores em paralelo)
+
+consultar() usa um provedor por vez: a api_preferida e, só em caso de
+erro, as demais. Em lotes grandes, a vazão fica presa à cota do
+provedor preferido. consultar_many distribui os CNPJs entre todos os
+provedores configurados, cada um dentro da própria cota (rate limiter
+compartilhado), e a vazão passa a ser a soma das cotas.
+
+- Trabalhadores por provedor, alternados até concurrency; cada um
+  retira o próximo CNPJ da fila e só então reserva a vez no seu provedor
+  (nenhuma reserva sem requisição)
+- CNPJ com erro volta à fila para os provedores em que ainda não esgotou
+  max_retries tentativas; 404 é definitivo
+- Validação, pré-filtro e cache antes da fila: CNPJs inválidos, ausentes
+  do pré-filtro ou em cache saem na hora, sem gastar cota
+- Resultados na ordem em que terminam, como (cnpj, CNPJData | exceção)
+- Progresso por callback e cancelamento por evento (ou fechando o iterador)
+- Latências e erros registrados em provider_stats, como em consultar()
+
+Uso:
+    api = ReceitaFederalAPI(cache=SQLiteResponseCache("consultas.sqlite3"))
+    for cnpj, resultado in api.consultar_many(cnpjs, progress=print):
+        if isinstance(resultado, Exception):
+            ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .receita_federal_api import CNPJData, ReceitaFederalAPIError
+
+if TYPE_CHECKING:
+    from .async_receita_federal_api import AsyncReceitaFederalAPI
+    from .receita_federal_api import ReceitaFederalAPI
+
+# Trabalhadores por provedor quando concurrency não é informado
+DEFAULT_WORKERS_PER_PROVIDER = 2
+# Intervalo de verificação de cancelamento e de novas entradas na fila
+_POLL_INTERVAL = 0.05
+
+Resultado = Tuple[str, Union[CNPJData, Exception]]
+ProgressCallback = Callable[[int, int], Any]
+
+
+@dataclass
+class _Pedido:
+    """CNPJ aguardando consulta externa."""
+
+    cnpj: str
+    cnpj_limpo: str
+    cnpj_numerico: str
+    falhas: Dict[str, int] = field(default_factory=dict)
+
+
+class _Lote:
+    """
+    Estado de um lote: fila de pedidos, resultados imediatos e política de
+    novas tentativas (comum às versões com threads e com asyncio).
+    """
+
+    def __init__(
+        self,
+        api: ReceitaFederalAPI,
+        cnpjs: Iterable[str],
+        concurrency: Optional[int],
+        providers: Optional[Sequence[str]],
+    ):
+        self.providers = [p for p in (providers or api.APIS) if p in api.APIS]
+        if not self.providers:
+            raise ValueError("Nenhum provedor configurado em APIS")
+        self.concurrency = concurrency or DEFAULT_WORKERS_PER_PROVIDER * len(self.providers)
+        if self.concurrency < 1:
+            raise ValueError("concurrency deve ser maior ou igual a 1")
+
+        self.api = api
+        self.max_retries = max(1, api.max_retries)
+        self.pendentes: Deque[_Pedido] = deque()
+        self.imediatos: List[Resultado] = []
+        self.vencidos: List[_Pedido] = []
+        for cnpj in cnpjs:
+            try:
+                cnpj_limpo, cnpj_numerico = api._preparar_consulta(cnpj)
+            except (ValueError, ReceitaFederalAPIError) as e:
+                self.imediatos.append((cnpj, e))
+                continue
+            if api.cache is not None:
+                entry = api.cache.get(cnpj_numerico)
+                if entry is not None:
+                    if entry.stale:
+                        self.vencidos.append(_Pedido(cnpj, cnpj_limpo, cnpj_numerico))
+                    self.imediatos.append((cnpj, entry.dados))
+                    continue
+            self.pendentes.append(_Pedido(cnpj, cnpj_limpo, cnpj_numerico))
+        self.em_aberto = len(self.pendentes)
+        self.total = len(self.imediatos) + self.em_aberto
+
+    def agendar_atualizacoes(self) -> None:
+        """Agenda a atualização das entradas vencidas servidas do cache."""
+        for pedido in self.vencidos:
+            self.api._agendar_atualizacao(pedido.cnpj_limpo, pedido.cnpj_numerico, True)
+
+    def trabalhadores(self) -> List[str]:
+        """Provedor de cada trabalhador, alternando entre os provedores."""
+        return [self.providers[i % len(self.providers)] for i in range(self.concurrency)]
+
+    def url(self, provider: str, pedido: _Pedido) -> str:
+        return self.api.APIS[provider].format(cnpj=pedido.cnpj_numerico)
+
+    def elegivel(self, provider: str) -> bool:
+        """Se há pedido na fila que o provedor ainda pode tentar."""
+        return any(pedido.falhas.get(provider, 0) < self.max_retries for pedido in self.pendentes)
+
+    def retirar(self, provider: str) -> Optional[_Pedido]:
+        """Primeiro pedido da fila que o provedor ainda pode tentar."""
+        for i, pedido in enumerate(self.pendentes):
+            if pedido.falhas.get(provider, 0) < self.max_retries:
+                del self.pendentes[i]
+                return pedido
+        return None
+
+    def gravar(self, pedido: _Pedido, dados: CNPJData) -> None:
+        """Grava no cache o resultado de uma consulta bem-sucedida."""
+        if self.api.cache is not None:
+            self.api.cache.set(pedido.cnpj_numerico, dados)
+
+    def concluir(self, pedido: _Pedido, dados: CNPJData) -> Resultado:
+        """Registra a consulta bem-sucedida."""
+        self.em_aberto -= 1
+        return pedido.cnpj, dados
+
+    def falhar(
+        self, provider: str, pedido: _Pedido, erro: Exception
+    ) -> Tuple[Optional[Resultado], float]:
+        """
+        Trata o erro de uma tentativa.
+
+        Returns:
+            (resultado definitivo ou None se o pedido voltou à fila,
+            segundos de pausa do trabalhador deste provedor)
+        """
+        falhas = pedido.falhas[provider] = pedido.falhas.get(provider, 0) + 1
+        if isinstance(erro, ReceitaFederalAPIError) and erro.status_code == 404:
+            self.em_aberto -= 1
+            return (pedido.cnpj, erro), 0.0
+        pausa = self.api._espera_apos_erro(provider, erro, falhas - 1)
+        if all(pedido.falhas.get(p, 0) >= self.max_retries for p in self.providers):
+            self.em_aberto -= 1
+            return (pedido.cnpj, erro), pausa
+        self.pendentes.append(pedido)
+        return None, pausa
+
+
+def consultar_many(
+    api: ReceitaFederalAPI,
+    cnpjs: Iterable[str],
+    concurrency: Optional[int] = None,
+    providers: Optional[Sequence[str]] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Iterator[Resultado]:
+    """
+    Consulta um lote de CNPJs em threads, distribuindo entre os provedores.
+
+    Args:
+        api: Cliente (ReceitaFederalAPI) com rate limiter, cache e pré-filtro
+        cnpjs: CNPJs com ou sem formatação
+        concurrency: Requisições simultâneas (padrão: 2 por provedor)
+        providers: Provedores usados (padrão: todos de api.APIS)
+        progress: Chamado como progress(concluídos, total) a cada resultado
+        cancel: Evento que, quando sinalizado, encerra o lote
+
+    Yields:
+        (cnpj como informado, CNPJData ou exceção), na ordem de conclusão
+
+    Raises:
+        ValueError: Se não houver provedor válido ou concurrency < 1
+    """
+    lote = _Lote(api, cnpjs, concurrency, providers)
+    lote.agendar_atualizacoes()
+    resultados: queue.Queue = queue.Queue()
+    for resultado in lote.imediatos:
+        resultados.put(resultado)
+    parar = threading.Event()
+    condicao = threading.Condition()
+    falhas: List[BaseException] = []
+
+    def trabalhador(provider: str) -> None:
+        try:
+            while not parar.is_set():
+                with condicao:
+                    # Nada para este provedor, mas pedidos em andamento podem voltar à fila
+                    while not lote.elegivel(provider) and lote.em_aberto and not parar.is_set():
+                        condicao.wait(_POLL_INTERVAL)
+                    pedido = lote.retirar(provider)
+                if pedido is None:
+                    return
+                espera = api._limitador().reserve(provider)
+                if espera and parar.wait(espera):
+                    return
+                try:
+                    dados = api._requisitar(provider, lote.url(provider, pedido))
+                except Exception as e:
+                    with condicao:
+                        resultado, pausa = lote.falhar(provider, pedido, e)
+                        condicao.notify_all()
+                    if resultado is not None:
+                        resultados.put(resultado)
+                    if pausa and parar.wait(pausa):
+                        return
+                    continue
+                lote.gravar(pedido, dados)
+                with condicao:
+                    resultado = lote.concluir(pedido, dados)
+                    condicao.notify_all()
+                resultados.put(resultado)
+        except BaseException as e:
+            falhas.append(e)
+            parar.set()
+
+    threads = [
+        threading.Thread(
+            target=trabalhador, args=(provider,), name=f"cnpj-lote-{provider}-{i}", daemon=True
+        )
+        for i, provider in enumerate(lote.trabalhadores())
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        concluidos = 0
+        while concluidos < lote.total:
+            if cancel is not None and cancel.is_set():
+                break
+            try:
+                resultado = resultados.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                if falhas:
+                    raise falhas[0]
+                continue
+            concluidos += 1
+            if progress is not None:
+                progress(concluidos, lote.total)
+            yield resultado
+    finally:
+        parar.set()
+        with condicao:
+            condicao.notify_all()
+        for thread in threads:
+            thread.join()
+
+
+async def consultar_many_async(
+    api: AsyncReceitaFederalAPI,
+    cnpjs: Iterable[str],
+    concurrency: Optional[int] = None,
+    providers: Optional[Sequence[str]] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[asyncio.Event] = None,
+) -> AsyncIterator[Resultado]:
+    """
+    Versão asyncio de consultar_many: trabalhadores são tarefas no event loop.
+
+    Mesmos argumentos e resultados de consultar_many; cancel é um asyncio.Event.
+    """
+    # Validação e leitura do cache (SQLite) fora do event loop
+    lote = await api._em_thread(_Lote, api, cnpjs, concurrency, providers)
+    lote.agendar_atualizacoes()
+    resultados: asyncio.Queue = asyncio.Queue()
+    for resultado in lote.imediatos:
+        resultados.put_nowait(resultado)
+
+    async def trabalhador(provider: str) -> None:
+        while lote.em_aberto:
+            pedido = lote.retirar(provider)
+            if pedido is None:
+                await asyncio.sleep(_POLL_INTERVAL)
+                continue
+            espera = await api._em_thread(api._limitador().reserve, provider)
+            if espera:
+                await asyncio.sleep(espera)
+            try:
+                dados = await api._requisitar(provider, lote.url(provider, pedido))
+            except Exception as e:
+                resultado, pausa = lote.falhar(provider, pedido, e)
+                if resultado is not None:
+                    resultados.put_nowait(resultado)
+                if pausa:
+                    await asyncio.sleep(pausa)
+                continue
+            await api._em_thread(lote.gravar, pedido, dados)
+            resultados.put_nowait(lote.concluir(pedido, dados))
+
+    tarefas = [asyncio.ensure_future(trabalhador(provider)) for provider in lote.trabalhadores()]
+    try:
+        concluidos = 0
+        while concluidos < lote.total:
+            if cancel is not None and cancel.is_set():
+                break
+            try:
+                resultado = await asyncio.wait_for(resultados.get(), _POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                for tarefa in tarefas:
+                    if tarefa.done() and not tarefa.cancelled() and tarefa.exception():
+                        raise tarefa.exception()
+                continue
+            concluidos += 1
+            if progress is not None:
+                progress(concluidos, lote.total)
+            yield resultado
+    finally:
+        for tarefa in tarefas:
+            tarefa.cancel()
+        await asyncio.gather(*tarefas, return_exceptions=True)
@@ -0,0 +1,218 @@
+"""
+Cache de Resultados de Validação (LRU)
+
+Camada opcional na frente de CNPJValidator.validate e de
+NewAlphanumericCNPJValidator.validate, útil quando poucos CNPJs concentram
+a maior parte das consultas.
+
+- Chave: CNPJ limpo (identificador canônico), não a string de entrada
+- Capacidade configurável com descarte do item usado há mais tempo (LRU)
+- Seguro para uso entre threads
+- Estatísticas de acertos, faltas e descartes
+- Resultados imutáveis: entradas compartilhadas não podem ser alteradas
+
+Uso:
+    validator = CachedCNPJValidator(maxsize=10_000)
+    validator.validate("11.222.333/0001-81")
+    validator.stats()
+"""
+
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Hashable, Mapping
+
+from .cnpj_validator import CNPJValidator
+from .validation_result import ValidationResult
+from .validators.new_alphanumeric_validator import NewAlphanumericCNPJValidator
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+class LRUCache:
+    """
+    Cache LRU de capacidade fixa, seguro para threads.
+
+    Args:
+        maxsize: Quantidade máxima de entradas (>= 1)
+
+    Raises:
+        ValueError: Se maxsize for menor que 1
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize deve ser maior ou igual a 1")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Retorna o valor em cache ou calcula, armazena e retorna.
+
+        O cálculo é feito fora do lock; em uma corrida entre threads pela
+        mesma chave, o valor é calculado mais de uma vez, mas apenas um fica
+        armazenado.
+
+        Args:
+            key: Chave do cache
+            compute: Função sem argumentos que produz o valor
+
+        Returns:
+            Valor associado à chave
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+
+        value = compute()
+
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Remove todas as entradas e zera as estatísticas."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Estatísticas de uso do cache.
+
+        Returns:
+            Dicionário com hits, misses, evictions, size, maxsize e hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Cópia somente leitura de um resultado em dicionário: dicts viram
+    MappingProxyType e listas viram tuplas, recursivamente.
+
+    Args:
+        value: Valor a congelar
+
+    Returns:
+        Valor imutável equivalente
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _canonical_key(cnpj: str, validate_format: bool) -> Any:
+    """
+    Chave de cache para entradas nas formas canônicas (14 dígitos ou
+    XX.XXX.XXX/XXXX-XX), cujo resultado depende apenas do CNPJ limpo e da
+    forma. Retorna None para as demais entradas, que não são armazenadas.
+    """
+    length = len(cnpj)
+    if length == 14:
+        if cnpj.isdigit() and cnpj.isascii():
+            return cnpj, False, validate_format
+    elif length == 18 and cnpj[2] == "." and cnpj[6] == "." and cnpj[10] == "/" and cnpj[15] == "-":
+        cnpj_clean = cnpj.replace(".", "").replace("/", "").replace("-", "")
+        if len(cnpj_clean) == 14 and cnpj_clean.isdigit() and cnpj_clean.isascii():
+            return cnpj_clean, True, validate_format
+    return None
+
+
+class CachedCNPJValidator(CNPJValidator):
+    """
+    CNPJValidator com cache LRU dos resultados de validação.
+
+    Substitui CNPJValidator diretamente: format e get_info também passam
+    pelo cache. Entradas fora das formas canônicas (espaços, outros
+    separadores, tamanhos diferentes) são validadas sem cache.
+
+    Args:
+        maxsize: Capacidade de cada cache (validate e validate_alphanumeric)
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        super().__init__()
+        self.cache = LRUCache(maxsize)
+        self.alphanumeric_cache = LRUCache(maxsize)
+
+    def validate(self, cnpj: str, validate_format: bool = True) -> ValidationResult:
+        """
+        Realiza validação completa do CNPJ, reaproveitando resultados em cache.
+
+        Args:
+            cnpj: String com CNPJ formatado ou não
+            validate_format: Se True, valida também o formato alfanumérico
+
+        Returns:
+            ValidationResult (imutável, compartilhado entre chamadas)
+        """
+        key = _canonical_key(cnpj, validate_format) if isinstance(cnpj, str) else None
+        if key is None:
+            return super().validate(cnpj, validate_format)
+        return self.cache.get_or_compute(
+            key, lambda: CNPJValidator.validate(self, cnpj, validate_format)
+        )
+
+    def validate_alphanumeric(self, cnpj: str) -> Mapping[str, Any]:
+        """
+        NewAlphanumericCNPJValidator.validate com cache pelo CNPJ limpo.
+
+        Args:
+            cnpj: String com CNPJ (com ou sem formatação)
+
+        Returns:
+            Resultado somente leitura (MappingProxyType, listas como tuplas)
+        """
+        if not cnpj or not isinstance(cnpj, str):
+            return freeze(NewAlphanumericCNPJValidator.validate(cnpj))
+
+        cnpj_clean = NewAlphanumericCNPJValidator.remove_formatting(cnpj)
+        return self.alphanumeric_cache.get_or_compute(
+            cnpj_clean, lambda: freeze(NewAlphanumericCNPJValidator.validate(cnpj))
+        )
+
+    def stats(self) -> dict:
+        """
+        Estatísticas dos dois caches.
+
+        Returns:
+            Dicionário {'validate': {...}, 'alphanumeric': {...}}
+        """
+        return {
+            "validate": self.cache.stats(),
+            "alphanumeric": self.alphanumeric_cache.stats(),
+        }
+
+    def clear_cache(self) -> None:
+        """Esvazia os dois caches."""
+        self.cache.clear()
+        self.alphanumeric_cache.clear()
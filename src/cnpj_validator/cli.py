@@ -8,33 +8,65 @@ com suporte ao novo formato alfanumérico (2026).
 Uso:
     cnpj-validator validate <cnpj>
     cnpj-validator generate [--alphanumeric] [--root=XXXXXXXX] [--count=N]
+    cnpj-validator establishments <raiz> [--start=N] [--stop=N]
     cnpj-validator format <cnpj>
+    cnpj-validator suggest <cnpj> [--max=N]
     cnpj-validator info <cnpj>
-    cnpj-validator batch <arquivo>
+    cnpj-validator batch <arquivo> [--output-format=jsonl|csv|tsv] [--output=ARQUIVO]
+    cnpj-validator dedupe|intersect|diff <arquivo>... [--output=ARQUIVO] [--workers=N]
+    cnpj-validator build-filter <arquivo>... --output=FILTRO [--fp-rate=0.01]
 """
 
 import argparse
+import os
 import sys
 import json
-from typing import List, Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
 
 try:
-    from cnpj_validator import CNPJValidator
+    from cnpj_validator import CachedCNPJValidator, CNPJValidator
+    from cnpj_validator.batch_io import OUTPUT_FORMATS, iter_lines, open_output, write_results
+    from cnpj_validator.generator import enumerate_establishments, iter_generate
+    from cnpj_validator.keys import CNPJKey
+    from cnpj_validator.prefilter import DEFAULT_FP_RATE, BloomFilter
+    from cnpj_validator.setops import DEFAULT_RUN_SIZE, OPERATIONS, build_runs
+    from cnpj_validator.validators.error_codes import ERROR_MESSAGES, ErrorCode
     from cnpj_validator.validators.new_alphanumeric_validator import NewAlphanumericCNPJValidator
+    from cnpj_validator.validators.scanner import scan_bytes
 except ImportError:
     # Fallback para importação relativa durante desenvolvimento
-    import os
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from cnpj_validator import CNPJValidator
+    from cnpj_validator import CachedCNPJValidator, CNPJValidator
+    from cnpj_validator.batch_io import OUTPUT_FORMATS, iter_lines, open_output, write_results
+    from cnpj_validator.generator import enumerate_establishments, iter_generate
+    from cnpj_validator.keys import CNPJKey
+    from cnpj_validator.prefilter import DEFAULT_FP_RATE, BloomFilter
+    from cnpj_validator.setops import DEFAULT_RUN_SIZE, OPERATIONS, build_runs
+    from cnpj_validator.validators.error_codes import ERROR_MESSAGES, ErrorCode
     from cnpj_validator.validators.new_alphanumeric_validator import NewAlphanumericCNPJValidator
+    from cnpj_validator.validators.scanner import scan_bytes
 
 
 class CNPJValidatorCLI:
     """Interface de linha de comando para o CNPJ Validator."""
     
-    def __init__(self):
-        self.validator = CNPJValidator()
+    def __init__(self, cache_size: int = 0):
+        """
+        Args:
+            cache_size: Capacidade do cache LRU de resultados (0 desabilita)
+        """
+        if cache_size > 0:
+            self.validator = CachedCNPJValidator(cache_size)
+        else:
+            self.validator = CNPJValidator()
         self.alphanumeric_validator = NewAlphanumericCNPJValidator()
+
+    def cache_stats(self) -> Optional[dict]:
+        """Estatísticas do cache de resultados, ou None se desabilitado."""
+        if isinstance(self.validator, CachedCNPJValidator):
+            return self.validator.cache.stats()
+        return None
     
     def validate(self, cnpj: str, verbose: bool = False) -> dict:
         """
@@ -50,56 +82,100 @@ class CNPJValidatorCLI:
         result = self.validator.validate(cnpj)
         
         if verbose:
-            return result
+            return result.to_dict()
         
         return {
-            'valid': result['valid'],
-            'cnpj': result.get('cnpj_formatted', cnpj),
-            'errors': result.get('errors', [])
+            'valid': result.valid,
+            'cnpj': result.cnpj_formatted,
+            'errors': result.errors
         }
     
-    def generate(
+    def iter_generate(
         self,
         count: int = 1,
         alphanumeric: bool = False,
         root: Optional[str] = None,
-        formatted: bool = True
-    ) -> List[str]:
+        formatted: bool = True,
+        seed: Optional[int] = None,
+        filial_ratio: float = 0.0
+    ) -> Iterator[str]:
         """
-        Gera CNPJs válidos para testes.
+        Gera CNPJs válidos para testes sob demanda.
+
+        Sem raiz específica, os CNPJs são gerados em lote (generator.iter_generate).
         
         Args:
             count: Quantidade de CNPJs a gerar
             alphanumeric: Se True, gera CNPJs alfanuméricos
             root: Raiz específica para o CNPJ
             formatted: Se True, retorna formatado
+            seed: Semente para gerar sempre a mesma sequência
+            filial_ratio: Fração (0 a 1) de filiais entre os CNPJs gerados
             
-        Returns:
-            Lista de CNPJs gerados
+        Yields:
+            Cada CNPJ gerado
         """
-        cnpjs = []
+        if not root:
+            yield from iter_generate(
+                count, seed=seed, alphanumeric=alphanumeric,
+                filial_ratio=filial_ratio, formatted=formatted
+            )
+            return
         
         for _ in range(count):
-            if root:
-                cnpj = self.alphanumeric_validator.generate_valid_cnpj(root)
-            elif alphanumeric:
-                import random
-                import string
-                chars = string.ascii_uppercase + string.digits
-                random_root = ''.join(random.choices(chars, k=8))
-                cnpj = self.alphanumeric_validator.generate_valid_cnpj(random_root)
-            else:
-                import random
-                random_root = ''.join([str(random.randint(0, 9)) for _ in range(8)])
-                cnpj = self.alphanumeric_validator.generate_valid_cnpj(random_root)
-            
+            cnpj = self.alphanumeric_validator.generate_valid_cnpj(root)
             if formatted:
                 cnpj = self._format_cnpj(cnpj)
-            
-            cnpjs.append(cnpj)
+            else:
+                cnpj = cnpj.replace('.', '').replace('/', '').replace('-', '')
+            yield cnpj
+
+    def generate(
+        self,
+        count: int = 1,
+        alphanumeric: bool = False,
+        root: Optional[str] = None,
+        formatted: bool = True,
+        seed: Optional[int] = None,
+        filial_ratio: float = 0.0
+    ) -> List[str]:
+        """
+        Gera CNPJs válidos para testes.
         
-        return cnpjs
+        Args:
+            count: Quantidade de CNPJs a gerar
+            alphanumeric: Se True, gera CNPJs alfanuméricos
+            root: Raiz específica para o CNPJ
+            formatted: Se True, retorna formatado
+            seed: Semente para gerar sempre a mesma sequência
+            filial_ratio: Fração (0 a 1) de filiais entre os CNPJs gerados
+
+        Returns:
+            Lista de CNPJs gerados
+        """
+        return list(self.iter_generate(count, alphanumeric, root, formatted, seed, filial_ratio))
     
+    def iter_establishments(
+        self,
+        root: str,
+        start: int = 1,
+        stop: int = 9999,
+        formatted: bool = True
+    ) -> Iterator[str]:
+        """
+        Enumera os CNPJs de todos os estabelecimentos (ordens) de uma raiz.
+
+        Args:
+            root: Raiz do CNPJ (8 caracteres)
+            start: Primeira ordem (1 = matriz)
+            stop: Última ordem, inclusive
+            formatted: Se True, retorna formatado
+
+        Yields:
+            Cada CNPJ válido da raiz, em ordem crescente de ordem
+        """
+        return enumerate_establishments(root, start, stop, formatted)
+
     def _format_cnpj(self, cnpj: str) -> str:
         """Formata um CNPJ."""
         cnpj = cnpj.replace('.', '').replace('/', '').replace('-', '').upper()
@@ -119,6 +195,19 @@ class CNPJValidatorCLI:
         """
         return self._format_cnpj(cnpj)
     
+    def suggest(self, cnpj: str, max_results: int = 10) -> List[dict]:
+        """
+        Sugere correções para um CNPJ com DV inválido.
+
+        Args:
+            cnpj: CNPJ digitado
+            max_results: Quantidade máxima de sugestões
+
+        Returns:
+            Lista de sugestões (CNPJs válidos a uma digitação de distância)
+        """
+        return self.alphanumeric_validator.suggest_corrections(cnpj, max_results)
+
     def info(self, cnpj: str) -> dict:
         """
         Retorna informações detalhadas do CNPJ.
@@ -131,6 +220,61 @@ class CNPJValidatorCLI:
         """
         return self.validator.get_info(cnpj)
     
+    def iter_batch_validate(self, file_path: str) -> Iterator[dict]:
+        """
+        Valida os CNPJs de um arquivo sob demanda, linha a linha.
+
+        A memória usada não depende do tamanho do arquivo. Sem cache, linhas
+        nas formas canônicas (XX.XXX.XXX/XXXX-XX e 14 dígitos) são validadas
+        direto nos bytes do arquivo mapeado; as demais são decodificadas e
+        passam pelo validador. Com cache (cache_size > 0), todas as linhas
+        são decodificadas e passam pelo iter_validate do validador com
+        cache, para que CNPJs repetidos sejam servidos por ele.
+
+        Args:
+            file_path: Caminho para arquivo com CNPJs (um por linha)
+
+        Yields:
+            Resultado de cada CNPJ (no formato de validate)
+        """
+        if isinstance(self.validator, CachedCNPJValidator):
+            lines = (str(line, 'utf-8', 'replace').strip() for line in iter_lines(file_path))
+            for result in self.validator.iter_validate(cnpj for cnpj in lines if cnpj):
+                yield self._batch_result(result)
+            return
+
+        ok = ErrorCode.OK
+        for line in iter_lines(file_path):
+            facts = scan_bytes(line)
+            if facts is None:
+                cnpj = str(line, 'utf-8', 'replace').strip()
+                if cnpj:
+                    yield self._batch_result(self.validator.validate(cnpj))
+                continue
+
+            numeric_code, format_codes, _ = facts
+            if numeric_code != ok:
+                yield {'valid': False, 'cnpj': '', 'errors': [ERROR_MESSAGES[numeric_code]]}
+                continue
+
+            cnpj = str(line, 'ascii')
+            if len(cnpj) == 14:
+                cnpj = f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
+            yield {
+                'valid': not format_codes,
+                'cnpj': cnpj,
+                'errors': [ERROR_MESSAGES[code] for code in format_codes or ()]
+            }
+
+    @staticmethod
+    def _batch_result(result) -> dict:
+        """Resultado de uma linha do lote a partir de um ValidationResult."""
+        return {
+            'valid': result.valid,
+            'cnpj': result.cnpj_formatted,
+            'errors': result.errors
+        }
+
     def batch_validate(self, file_path: str) -> List[dict]:
         """
         Valida múltiplos CNPJs de um arquivo.
@@ -141,16 +285,47 @@ class CNPJValidatorCLI:
         Returns:
             Lista de resultados
         """
-        results = []
-        
-        with open(file_path, 'r') as f:
-            for line in f:
-                cnpj = line.strip()
-                if cnpj:
-                    result = self.validate(cnpj)
-                    results.append(result)
-        
-        return results
+        return list(self.iter_batch_validate(file_path))
+
+
+def _print_lines(items: Iterable[str], chunk_size: int = 10_000) -> None:
+    """Imprime um item por linha, em blocos (sem uma chamada de print por item)."""
+    _write_lines(items, sys.stdout, chunk_size)
+
+
+def _write_lines(items: Iterable[str], stream, chunk_size: int = 10_000) -> int:
+    """Grava um item por linha no fluxo, em blocos, e devolve a quantidade gravada."""
+    items = iter(items)
+    total = 0
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return total
+        stream.write('\n'.join(chunk) + '\n')
+        total += len(chunk)
+
+
+def _print_json_strings(items: Iterable[str], chunk_size: int = 10_000) -> None:
+    """Imprime um array JSON de strings (igual a json.dumps(lista, indent=2)) em blocos."""
+    items = iter(items)
+    separator = '[\n  '
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            break
+        sys.stdout.write(separator + ',\n  '.join(map(json.dumps, chunk)))
+        separator = ',\n  '
+    sys.stdout.write('[]\n' if separator == '[\n  ' else '\n]\n')
+
+
+def _print_summary(total: int, valid: int) -> None:
+    """Imprime o resumo da validação em lote."""
+    invalid = total - valid
+    share = 100 / total if total else 0.0
+    print(f"📊 Resumo da validação em lote:")
+    print(f"   ├─ Total: {total}")
+    print(f"   ├─ Válidos: {valid} ({valid * share:.1f}%)")
+    print(f"   └─ Inválidos: {invalid} ({invalid * share:.1f}%)")
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -168,6 +343,10 @@ Exemplos:
   cnpj-validator format 11222333000181
   cnpj-validator info 11.222.333/0001-81
   cnpj-validator batch cnpjs.txt
+  cnpj-validator batch cnpjs.txt --output-format csv --output resultado.csv
+  cnpj-validator dedupe cnpjs.txt --output unicos.txt
+  cnpj-validator diff clientes.txt inativos.txt --workers 4
+  cnpj-validator build-filter estabelecimentos.csv --output cnpjs.bloom --fp-rate 0.001
 
 Mais informações: https://github.com/RaFeltrim/CNPJ-QA-Training
         '''
@@ -179,6 +358,13 @@ Mais informações: https://github.com/RaFeltrim/CNPJ-QA-Training
         version='%(prog)s 2.0.0'
     )
     
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=int(os.environ.get('CNPJ_CACHE_SIZE', '0')),
+        help='Capacidade do cache LRU de resultados (padrão: $CNPJ_CACHE_SIZE ou 0, desabilitado)'
+    )
+
     subparsers = parser.add_subparsers(dest='command', help='Comandos disponíveis')
     
     # Comando: validate
@@ -218,16 +404,73 @@ Mais informações: https://github.com/RaFeltrim/CNPJ-QA-Training
         action='store_true',
         help='Retorna sem formatação'
     )
+    generate_parser.add_argument(
+        '--seed',
+        type=int,
+        help='Semente para gerar sempre a mesma sequência'
+    )
+    generate_parser.add_argument(
+        '--filial-ratio',
+        type=float,
+        default=0.0,
+        help='Fração (0 a 1) de filiais entre os CNPJs gerados (padrão: 0, só matrizes)'
+    )
     generate_parser.add_argument(
         '--json', '-j',
         action='store_true',
         help='Saída em formato JSON'
     )
     
+    # Comando: establishments
+    establishments_parser = subparsers.add_parser(
+        'establishments', help='Lista os CNPJs de todos os estabelecimentos de uma raiz'
+    )
+    establishments_parser.add_argument('root', help='Raiz do CNPJ (8 caracteres)')
+    establishments_parser.add_argument(
+        '--start',
+        type=int,
+        default=1,
+        help='Primeira ordem (padrão: 1, a matriz)'
+    )
+    establishments_parser.add_argument(
+        '--stop',
+        type=int,
+        default=9999,
+        help='Última ordem, inclusive (padrão: 9999)'
+    )
+    establishments_parser.add_argument(
+        '--no-format',
+        action='store_true',
+        help='Retorna sem formatação'
+    )
+    establishments_parser.add_argument(
+        '--json', '-j',
+        action='store_true',
+        help='Saída em formato JSON'
+    )
+
     # Comando: format
     format_parser = subparsers.add_parser('format', help='Formata um CNPJ')
     format_parser.add_argument('cnpj', help='CNPJ a ser formatado')
     
+    # Comando: suggest
+    suggest_parser = subparsers.add_parser(
+        'suggest', help='Sugere correções para um CNPJ com DV inválido'
+    )
+    suggest_parser.add_argument('cnpj', help='CNPJ digitado')
+    suggest_parser.add_argument(
+        '--max', '-m',
+        type=int,
+        default=10,
+        dest='max_results',
+        help='Quantidade máxima de sugestões (padrão: 10)'
+    )
+    suggest_parser.add_argument(
+        '--json', '-j',
+        action='store_true',
+        help='Saída em formato JSON'
+    )
+
     # Comando: info
     info_parser = subparsers.add_parser('info', help='Mostra informações do CNPJ')
     info_parser.add_argument('cnpj', help='CNPJ a consultar')
@@ -239,7 +482,9 @@ Mais informações: https://github.com/RaFeltrim/CNPJ-QA-Training
     
     # Comando: batch
     batch_parser = subparsers.add_parser('batch', help='Valida CNPJs em lote')
-    batch_parser.add_argument('file', help='Arquivo com CNPJs (um por linha)')
+    batch_parser.add_argument(
+        'file', help="Arquivo com CNPJs (um por linha); '-' lê da entrada padrão"
+    )
     batch_parser.add_argument(
         '--json', '-j',
         action='store_true',
@@ -250,7 +495,93 @@ Mais informações: https://github.com/RaFeltrim/CNPJ-QA-Training
         action='store_true',
         help='Mostra apenas resumo'
     )
+    batch_parser.add_argument(
+        '--output-format', '-f',
+        choices=OUTPUT_FORMATS,
+        help='Formato de saída gravado em fluxo (padrão com --output: jsonl)'
+    )
+    batch_parser.add_argument(
+        '--output', '-o',
+        metavar='ARQUIVO',
+        help='Grava os resultados no arquivo (o resumo vai para a saída padrão)'
+    )
+    batch_parser.add_argument(
+        '--flush',
+        action='store_true',
+        help='Descarrega a saída a cada resultado (consumo em tempo real)'
+    )
     
+    # Comandos: dedupe, intersect, diff
+    set_operation_help = {
+        'dedupe': 'CNPJs válidos únicos de um ou mais arquivos',
+        'intersect': 'CNPJs válidos presentes em todos os arquivos',
+        'diff': 'CNPJs válidos do primeiro arquivo ausentes dos demais',
+    }
+    for operation in OPERATIONS:
+        operation_parser = subparsers.add_parser(operation, help=set_operation_help[operation])
+        operation_parser.add_argument(
+            'files',
+            nargs='+',
+            metavar='arquivo',
+            help="Arquivos com CNPJs (um por linha); '-' lê da entrada padrão"
+        )
+        operation_parser.add_argument(
+            '--output', '-o',
+            metavar='ARQUIVO',
+            help='Grava os CNPJs no arquivo (o resumo vai para a saída padrão)'
+        )
+        operation_parser.add_argument(
+            '--no-format',
+            action='store_true',
+            help='Retorna sem formatação'
+        )
+        operation_parser.add_argument(
+            '--workers', '-w',
+            type=int,
+            default=None,
+            help='Processos que validam e ordenam os blocos (padrão: núcleos da máquina)'
+        )
+        operation_parser.add_argument(
+            '--run-size',
+            type=int,
+            default=DEFAULT_RUN_SIZE,
+            help=f'Linhas ordenadas em memória por bloco (padrão: {DEFAULT_RUN_SIZE})'
+        )
+        operation_parser.add_argument(
+            '--temp-dir',
+            metavar='DIRETORIO',
+            help='Diretório dos arquivos temporários (padrão: o do sistema)'
+        )
+
+    # Comando: build-filter
+    filter_parser = subparsers.add_parser(
+        'build-filter', help='Constrói o pré-filtro de CNPJs registrados a partir de um dump'
+    )
+    filter_parser.add_argument(
+        'files',
+        nargs='+',
+        metavar='arquivo',
+        help="Listas (um CNPJ por linha) ou dumps de Estabelecimentos; '-' lê da entrada padrão"
+    )
+    filter_parser.add_argument(
+        '--output', '-o',
+        metavar='FILTRO',
+        required=True,
+        help='Arquivo do filtro (use com CNPJ_PREFILTER_PATH na API)'
+    )
+    filter_parser.add_argument(
+        '--fp-rate',
+        type=float,
+        default=DEFAULT_FP_RATE,
+        help=f'Taxa de falsos positivos (padrão: {DEFAULT_FP_RATE})'
+    )
+    filter_parser.add_argument(
+        '--capacity',
+        type=int,
+        default=None,
+        help='Quantidade esperada de CNPJs (padrão: linhas dos arquivos; obrigatório com -)'
+    )
+
     return parser
 
 
@@ -264,7 +595,7 @@ def main():
         parser.print_help()
         sys.exit(0)
     
-    cli = CNPJValidatorCLI()
+    cli = CNPJValidatorCLI(cache_size=args.cache_size)
     
     try:
         if args.command == 'validate':
@@ -282,23 +613,55 @@ def main():
                 sys.exit(0 if result['valid'] else 1)
         
         elif args.command == 'generate':
-            cnpjs = cli.generate(
+            cnpjs = cli.iter_generate(
                 count=args.count,
                 alphanumeric=args.alphanumeric,
                 root=args.root,
-                formatted=not args.no_format
+                formatted=not args.no_format,
+                seed=args.seed,
+                filial_ratio=args.filial_ratio
             )
             
             if args.json:
-                print(json.dumps(cnpjs, indent=2))
+                _print_json_strings(cnpjs)
             else:
-                for cnpj in cnpjs:
-                    print(cnpj)
+                _print_lines(cnpjs)
         
+        elif args.command == 'establishments':
+            cnpjs = cli.iter_establishments(
+                args.root,
+                start=args.start,
+                stop=args.stop,
+                formatted=not args.no_format
+            )
+
+            if args.json:
+                _print_json_strings(cnpjs)
+            else:
+                _print_lines(cnpjs)
+
         elif args.command == 'format':
             formatted = cli.format(args.cnpj)
             print(formatted)
         
+        elif args.command == 'suggest':
+            suggestions = cli.suggest(args.cnpj, args.max_results)
+            already_valid = cli.alphanumeric_validator.validate(args.cnpj)['valid']
+
+            if args.json:
+                print(json.dumps(suggestions, indent=2, ensure_ascii=False))
+            elif already_valid:
+                print(f"✅ CNPJ {args.cnpj} já é válido")
+            elif suggestions:
+                print(f"🔧 Sugestões para {args.cnpj}:")
+                for suggestion in suggestions:
+                    kind = 'troca' if suggestion['kind'] == 'substitution' else 'inversão'
+                    print(f"   └─ {suggestion['cnpj_formatted']} "
+                          f"({kind} na posição {suggestion['position'] + 1})")
+            else:
+                print(f"❌ Nenhuma correção encontrada para {args.cnpj}")
+            sys.exit(0 if suggestions or already_valid else 1)
+
         elif args.command == 'info':
             info = cli.info(args.cnpj)
             
@@ -320,27 +683,71 @@ def main():
                     sys.exit(1)
         
         elif args.command == 'batch':
-            results = cli.batch_validate(args.file)
+            results = cli.iter_batch_validate(args.file)
+            output_format = args.output_format or ('json' if args.json else None)
             
-            if args.summary:
-                total = len(results)
-                valid = sum(1 for r in results if r['valid'])
-                invalid = total - valid
-                print(f"📊 Resumo da validação em lote:")
-                print(f"   ├─ Total: {total}")
-                print(f"   ├─ Válidos: {valid} ({valid/total*100:.1f}%)")
-                print(f"   └─ Inválidos: {invalid} ({invalid/total*100:.1f}%)")
-            elif args.json:
-                print(json.dumps(results, indent=2, ensure_ascii=False))
+            if args.output:
+                with open_output(args.output) as output:
+                    total, valid = write_results(
+                        results, output, output_format or 'jsonl', flush=args.flush
+                    )
+                if args.summary:
+                    _print_summary(total, valid)
+                else:
+                    print(f"📊 {valid}/{total} CNPJs válidos -> {args.output}")
+            elif args.summary:
+                total = valid = 0
+                for result in results:
+                    total += 1
+                    valid += result['valid']
+                _print_summary(total, valid)
+            elif output_format:
+                write_results(results, sys.stdout, output_format, flush=args.flush)
             else:
+                total = valid = 0
                 for result in results:
                     status = "✅" if result['valid'] else "❌"
                     print(f"{status} {result['cnpj']}")
+                    total += 1
+                    valid += result['valid']
                 
                 # Resumo no final
-                total = len(results)
-                valid = sum(1 for r in results if r['valid'])
                 print(f"\n📊 {valid}/{total} CNPJs válidos")
+
+            stats = cli.cache_stats()
+            if stats and (args.output or not output_format):
+                print(f"🗃️  Cache: {stats['hits']} acertos, {stats['misses']} faltas, "
+                      f"{stats['evictions']} descartes")
+
+        elif args.command in OPERATIONS:
+            with build_runs(
+                args.files,
+                workers=args.workers,
+                run_size=args.run_size,
+                temp_dir=args.temp_dir
+            ) as runs:
+                keys = getattr(runs, args.command)()
+                formatted = not args.no_format
+                cnpjs = (CNPJKey.decode(key, formatted) for key in keys)
+
+                if args.output:
+                    with open_output(args.output) as output:
+                        total = _write_lines(cnpjs, output)
+                else:
+                    total = _write_lines(cnpjs, sys.stdout)
+
+            # Sem --output, o resumo vai para stderr para não misturar com os CNPJs
+            summary = sys.stdout if args.output else sys.stderr
+            destination = f" -> {args.output}" if args.output else ""
+            print(f"📊 {total} CNPJs{destination} ({sum(runs.invalid)} de "
+                  f"{sum(runs.lines)} linhas inválidas descartadas)", file=summary)
+
+        elif args.command == 'build-filter':
+            bloom = BloomFilter.build(args.files, fp_rate=args.fp_rate, capacity=args.capacity)
+            bloom.save(args.output)
+            print(f"🧮 Filtro com {len(bloom)} CNPJs -> {args.output} "
+                  f"({bloom.size_bytes / 2**20:.1f} MiB, k={bloom.k}, "
+                  f"falsos positivos: {bloom.fp_rate:.2%})")
     
     except FileNotFoundError as e:
         print(f"❌ Erro: Arquivo não encontrado - {e}")
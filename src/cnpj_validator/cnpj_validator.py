@@ -3,8 +3,65 @@ CNPJ Validator - Módulo Principal
 Integra validações numéricas e alfanuméricas de CNPJ
 """
 
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from .validators.check_digits import NUMERIC_ENGINE, strip_numeric
 from .validators.numeric_validator import NumericCNPJValidator
 from .validators.alphanumeric_validator import AlphanumericCNPJValidator
+from .validators.scanner import scan, scan_many
+from .validation_result import ValidationResult
+
+# Entradas consumidas por vez em iter_validate (limita a memória)
+DEFAULT_ITER_CHUNK_SIZE = 10_000
+
+_is_valid_clean = NUMERIC_ENGINE.is_valid
+_scan_formatted = NUMERIC_ENGINE.scan_formatted
+
+
+def is_valid(cnpj: Any) -> bool:
+    """
+    Validação booleana rápida, equivalente a
+    CNPJValidator().validate(cnpj, validate_format=False)['valid'].
+
+    Não instancia validadores nem monta resultado: retorna na primeira
+    falha. Entradas limpas (14 dígitos) e no layout XX.XXX.XXX/XXXX-XX
+    são verificadas sem remover a formatação.
+
+    Args:
+        cnpj: String com CNPJ formatado ou não
+
+    Returns:
+        True se o CNPJ é válido, False caso contrário
+    """
+    if not isinstance(cnpj, str):
+        return False
+
+    length = len(cnpj)
+    if length == 14:
+        # Qualquer caractere que não seja dígito já invalida os DVs
+        return _is_valid_clean(cnpj) and cnpj.count(cnpj[0]) != 14
+    if length == 18:
+        # None: fora da máscara XX.XXX.XXX/XXXX-XX, segue para a limpeza
+        dv_ok = _scan_formatted(cnpj)
+        if dv_ok is not None:
+            return dv_ok and cnpj.count(cnpj[0]) != 14
+
+    clean = strip_numeric(cnpj)
+    return len(clean) == 14 and _is_valid_clean(clean) and clean.count(clean[0]) != 14
+
+
+def is_valid_many(cnpjs: Iterable[Any]) -> bytearray:
+    """
+    Valida uma sequência de CNPJs, retornando um byte por entrada.
+
+    Args:
+        cnpjs: Iterável de CNPJs (formatados ou não)
+
+    Returns:
+        bytearray com 1 para CNPJ válido e 0 para inválido, na ordem da entrada
+    """
+    return bytearray(map(is_valid, cnpjs))
 
 
 class CNPJValidator:
@@ -18,7 +75,7 @@ class CNPJValidator:
         self.numeric_validator = NumericCNPJValidator()
         self.alphanumeric_validator = AlphanumericCNPJValidator()
 
-    def validate(self, cnpj: str, validate_format: bool = True) -> dict:
+    def validate(self, cnpj: str, validate_format: bool = True) -> ValidationResult:
         """
         Realiza validação completa do CNPJ (numérica e alfanumérica).
 
@@ -27,7 +84,7 @@ class CNPJValidator:
             validate_format: Se True, valida também o formato alfanumérico
 
         Returns:
-            Dicionário com resultado completo da validação:
+            ValidationResult (compatível com o dicionário legado):
             {
                 'valid': bool,
                 'cnpj_input': str,
@@ -39,55 +96,48 @@ class CNPJValidator:
                 'warnings': list
             }
         """
-        result = {
-            'valid': False,
-            'cnpj_input': cnpj,
-            'cnpj_clean': '',
-            'cnpj_formatted': '',
-            'numeric_validation': {},
-            'alphanumeric_validation': {},
-            'errors': [],
-            'warnings': []
-        }
-
-        # Validação numérica
-        numeric_result = self.numeric_validator.validate(cnpj)
-        result['numeric_validation'] = numeric_result
-        result['cnpj_clean'] = numeric_result.get('cnpj_clean', '')
-
-        if not numeric_result['valid']:
-            result['errors'].extend(numeric_result['errors'])
-            return result
-
-        # Formatar CNPJ
-        result['cnpj_formatted'] = self.numeric_validator.format_cnpj(result['cnpj_clean'])
-
-        # Validação alfanumérica (se solicitada)
-        if validate_format:
-            # Se o CNPJ de entrada já está formatado, valida o formato original
-            if '.' in cnpj or '/' in cnpj or '-' in cnpj:
-                alphanumeric_result = self.alphanumeric_validator.validate(cnpj)
-            else:
-                # Se não está formatado, valida o formato gerado
-                alphanumeric_result = self.alphanumeric_validator.validate(result['cnpj_formatted'])
-                result['warnings'].append("CNPJ fornecido sem formatação")
-
-            result['alphanumeric_validation'] = alphanumeric_result
-
-            if not alphanumeric_result['valid']:
-                result['errors'].extend(alphanumeric_result['errors'])
+        return ValidationResult(cnpj, *scan(cnpj, validate_format))
+
+    def iter_validate(
+        self,
+        cnpjs: Iterable[str],
+        chunk_size: int = DEFAULT_ITER_CHUNK_SIZE,
+        validate_format: bool = True,
+    ) -> Iterator[ValidationResult]:
+        """
+        Valida um iterável de CNPJs de forma preguiçosa, com memória limitada.
 
-            if alphanumeric_result.get('warnings'):
-                result['warnings'].extend(alphanumeric_result['warnings'])
+        A entrada é consumida em blocos de chunk_size itens, e cada bloco é
+        validado de uma vez (scanner.scan_many: com NumPy, os DVs das formas
+        canônicas numéricas do bloco saem do kernel vetorizado) antes de ser
+        entregue; apenas um bloco de entradas e resultados fica em memória
+        por vez. Subclasses que redefinem validate (ex.: CachedCNPJValidator)
+        continuam validando uma entrada por vez.
 
-        # Definir se é válido
-        if validate_format:
-            result['valid'] = numeric_result['valid'] and result['alphanumeric_validation'].get(
-                'valid', False)
-        else:
-            result['valid'] = numeric_result['valid']
+        Args:
+            cnpjs: Iterável de CNPJs (lista, arquivo, gerador...)
+            chunk_size: Quantidade de entradas processadas por bloco
+            validate_format: Se True, valida também o formato alfanumérico
 
-        return result
+        Yields:
+            ValidationResult de cada entrada, na ordem da entrada
+        """
+        validate = self.validate
+        per_row = type(self).validate is not CNPJValidator.validate
+        iterator = iter(cnpjs)
+        chunk_size = max(1, chunk_size)
+
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            if per_row:
+                yield from [validate(cnpj, validate_format) for cnpj in chunk]
+            else:
+                yield from [
+                    ValidationResult(cnpj, *facts)
+                    for cnpj, facts in zip(chunk, scan_many(chunk, validate_format))
+                ]
 
     def validate_numeric_only(self, cnpj: str) -> dict:
         """
@@ -123,12 +173,12 @@ class CNPJValidator:
         Returns:
             String com CNPJ formatado ou mensagem de erro
         """
-        validation = self.numeric_validator.validate(cnpj)
+        result = self.validate(cnpj, validate_format=False)
 
-        if not validation['valid']:
-            return f"Erro: {', '.join(validation['errors'])}"
+        if not result.valid:
+            return f"Erro: {', '.join(result.errors)}"
 
-        return self.numeric_validator.format_cnpj(validation['cnpj_clean'])
+        return result.cnpj_formatted
 
     def clean(self, cnpj: str) -> str:
         """
@@ -146,36 +196,16 @@ class CNPJValidator:
         """
         Obtém informações detalhadas sobre o CNPJ.
 
+        Para quem já possui o resultado de validate, ValidationResult.info()
+        evita validar novamente.
+
         Args:
             cnpj: String com CNPJ
 
         Returns:
             Dicionário com informações do CNPJ
         """
-        validation = self.validate(cnpj, validate_format=True)
-
-        if not validation['valid']:
-            return {
-                'valid': False,
-                'errors': validation['errors']
-            }
-
-        info = {
-            'valid': True,
-            'cnpj_formatted': validation['cnpj_formatted'],
-            'cnpj_clean': validation['cnpj_clean']
-        }
-
-        # Adicionar informações de matriz/filial
-        alphanumeric = validation.get('alphanumeric_validation', {})
-        if alphanumeric.get('filial_info'):
-            info['matriz_filial'] = alphanumeric['filial_info']
-
-        # Adicionar partes do CNPJ
-        if alphanumeric.get('parts'):
-            info['parts'] = alphanumeric['parts']
-
-        return info
+        return self.validate(cnpj, validate_format=True).info()
 
     @staticmethod
     def is_valid(cnpj: str) -> bool:
@@ -188,6 +218,17 @@ class CNPJValidator:
         Returns:
             True se o CNPJ é válido, False caso contrário
         """
-        validator = CNPJValidator()
-        result = validator.validate(cnpj, validate_format=False)
-        return result['valid']
+        return is_valid(cnpj)
+
+    @staticmethod
+    def is_valid_many(cnpjs: Iterable[str]) -> bytearray:
+        """
+        Validação rápida em lote (ver is_valid_many do módulo).
+
+        Args:
+            cnpjs: Iterável de CNPJs
+
+        Returns:
+            bytearray com 1 (válido) ou 0 (inválido) por CNPJ
+        """
+        return is_valid_many(cnpjs)
@@ -0,0 +1,610 @@
+"""
+Pool de Conexões HTTP Persistentes (keep-alive)
+
+Cada consulta à API externa abria uma conexão TCP + TLS nova (urlopen) e
+criava um contexto SSL novo; em consultas em lote, os handshakes dominam
+o tempo de cada requisição. Este pool mantém, por host, conexões
+http.client abertas entre requisições:
+
+- Conexões ociosas reaproveitadas (keep-alive), até pool_size por host
+- Um único contexto SSL por processo (default_ssl_context)
+- Accept-Encoding: gzip, com descompressão transparente
+- Conexão ociosa fechada pelo servidor: a requisição (GET, idempotente)
+  é refeita em outra conexão
+- Redirecionamentos seguidos, como no urlopen
+- Proxies das variáveis de ambiente (HTTP(S)_PROXY, NO_PROXY), como no
+  urlopen: túnel CONNECT para https e URL absoluta para http
+- Seguro entre threads
+
+AsyncHTTPConnectionPool oferece o mesmo para o cliente asyncio, com pares
+(StreamReader, StreamWriter) ociosos por host no lugar das conexões
+http.client, inclusive os mesmos proxies.
+
+Uso:
+    pool = HTTPConnectionPool(pool_size=4, timeout=30)
+    response = pool.get("https://brasilapi.com.br/api/cnpj/v1/11222333000181")
+    response.status, response.body
+
+    async with AsyncHTTPConnectionPool(pool_size=4) as pool:
+        response = await pool.get(url)
+"""
+
+import asyncio
+import base64
+import gzip
+import http.client
+import socket
+import ssl
+import threading
+import urllib.request
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import unquote, urljoin, urlsplit
+
+# Conexões ociosas mantidas por host
+DEFAULT_POOL_SIZE = 4
+# Redirecionamentos seguidos por requisição
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+_DEFAULT_HEADERS = {
+    "User-Agent": "CNPJ-Validator/1.0 (Python)",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+}
+
+_HostKey = Tuple[str, str, int]
+_Streams = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+# (host do proxy, porta do proxy, cabeçalhos para o proxy)
+_Proxy = Tuple[str, int, Dict[str, str]]
+
+
+@lru_cache(maxsize=None)
+def default_ssl_context() -> ssl.SSLContext:
+    """
+    Contexto SSL dos clientes, criado uma vez por processo.
+
+    Ignora a verificação de certificado (algumas APIs têm certificados
+    problemáticos), como o cliente sempre fez.
+    """
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+@dataclass(frozen=True)
+class PooledResponse:
+    """
+    Resposta HTTP lida por completo.
+
+    Attributes:
+        status: Código HTTP
+        reason: Motivo (texto da linha de status)
+        headers: Cabeçalhos, com nomes em minúsculas
+        body: Corpo (já descomprimido, se veio em gzip)
+    """
+
+    status: int
+    reason: str
+    headers: Dict[str, str]
+    body: bytes
+
+
+class RequestHandle:
+    """
+    Permite abortar, de outra thread, um GET em andamento no HTTPConnectionPool.
+
+    Passado em get(url, handle=...), recebe a conexão em uso; abort()
+    derruba o socket (shutdown), a leitura bloqueada termina na hora com
+    ConnectionAbortedError e a conexão não volta ao pool.
+
+    Uso:
+        handle = RequestHandle()
+        # thread A: pool.get(url, handle=handle)
+        # thread B: handle.abort()
+    """
+
+    def __init__(self) -> None:
+        self.aborted = False
+        self._connection: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+
+    def abort(self) -> None:
+        """Aborta a requisição (sem efeito se ela já terminou)."""
+        with self._lock:
+            self.aborted = True
+            connection = self._connection
+        if connection is not None and connection.sock is not None:
+            try:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _attach(self, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if self.aborted:
+                raise ConnectionAbortedError("Requisição abortada")
+            self._connection = connection
+
+    def _detach(self) -> None:
+        """Solta a conexão; ConnectionAbortedError se a requisição foi abortada."""
+        with self._lock:
+            self._connection = None
+            if self.aborted:
+                raise ConnectionAbortedError("Requisição abortada")
+
+
+def _decode_body(headers: Mapping[str, str], body: bytes) -> bytes:
+    """Descomprime o corpo em gzip (cabeçalhos com nomes em minúsculas)."""
+    if headers.get("content-encoding", "").lower() != "gzip":
+        return body
+    try:
+        return gzip.decompress(body)
+    except (OSError, EOFError, zlib.error) as e:
+        raise http.client.HTTPException(f"Corpo gzip inválido: {e}") from e
+
+
+class _BasePool:
+    """Configuração, proxies, conexões ociosas e estatísticas comuns aos pools."""
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = 30.0,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ):
+        if pool_size < 1:
+            raise ValueError("pool_size deve ser maior ou igual a 1")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.ssl_context = ssl_context or default_ssl_context()
+        self.proxies = dict(urllib.request.getproxies() if proxies is None else proxies)
+        self.connections_created = 0
+        self.connections_reused = 0
+        self._idle: Dict[_HostKey, List[Any]] = {}
+        self._proxy_by_host: Dict[_HostKey, Optional[_Proxy]] = {}
+        self._lock = threading.Lock()
+
+    def _proxy(self, key: _HostKey) -> Optional[_Proxy]:
+        """Proxy usado para o host, ou None para conexão direta."""
+        try:
+            return self._proxy_by_host[key]
+        except KeyError:
+            pass
+
+        scheme, host, _ = key
+        proxy_url = self.proxies.get(scheme)
+        proxy = None
+        if proxy_url and not urllib.request.proxy_bypass(host):
+            if "://" not in proxy_url:
+                proxy_url = "http://" + proxy_url
+            parts = urlsplit(proxy_url)
+            headers = {}
+            if parts.username is not None:
+                credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+                token = base64.b64encode(credentials.encode()).decode("ascii")
+                headers["Proxy-Authorization"] = f"Basic {token}"
+            proxy = (parts.hostname or "", parts.port or 80, headers)
+        self._proxy_by_host[key] = proxy
+        return proxy
+
+    def _request(
+        self, url: str, headers: Optional[Mapping[str, str]]
+    ) -> Tuple[_HostKey, str, Dict[str, str]]:
+        """Host, alvo da requisição e cabeçalhos de um GET (URL absoluta via proxy http)."""
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"URL não suportada: {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname or "", port)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        request_headers = {**_DEFAULT_HEADERS, **(headers or {})}
+
+        proxy = self._proxy(key)
+        if proxy is not None and parts.scheme == "http":
+            target = f"http://{parts.netloc}{target}"
+            request_headers.update(proxy[2])
+        return key, target, request_headers
+
+    def _take_idle(self, key: _HostKey) -> Optional[Any]:
+        """Conexão ociosa do host, ou None (contabiliza reaproveitada ou nova)."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.connections_reused += 1
+                return idle.pop()
+            self.connections_created += 1
+            return None
+
+    def _put_idle(self, key: _HostKey, connection: Any) -> bool:
+        """Guarda a conexão ociosa; False se o pool do host estiver cheio."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.pool_size:
+                idle.append(connection)
+                return True
+        return False
+
+    def _drain_idle(self) -> List[Any]:
+        """Retira todas as conexões ociosas."""
+        with self._lock:
+            connections = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        return connections
+
+    def stats(self) -> dict:
+        """
+        Estatísticas do pool.
+
+        Returns:
+            Dicionário com connections_created, connections_reused e idle
+            (conexões ociosas abertas agora)
+        """
+        with self._lock:
+            return {
+                "connections_created": self.connections_created,
+                "connections_reused": self.connections_reused,
+                "idle": sum(len(idle) for idle in self._idle.values()),
+            }
+
+
+class HTTPConnectionPool(_BasePool):
+    """
+    Conexões HTTP/HTTPS persistentes por host.
+
+    Args:
+        pool_size: Conexões ociosas mantidas por host (as excedentes são
+            fechadas ao serem devolvidas)
+        timeout: Timeout de conexão e leitura, em segundos
+        ssl_context: Contexto SSL (padrão default_ssl_context())
+        proxies: Proxy por esquema, como {"https": "http://proxy:3128"}
+            (padrão: urllib.request.getproxies(), das variáveis de
+            ambiente; {} desabilita). Hosts em NO_PROXY não usam proxy
+
+    Raises:
+        ValueError: Se pool_size for menor que 1
+    """
+
+    def _checkout(self, key: _HostKey) -> Tuple[http.client.HTTPConnection, bool]:
+        """Conexão ociosa do host (reused=True) ou uma nova."""
+        connection = self._take_idle(key)
+        if connection is not None:
+            return connection, True
+
+        scheme, host, port = key
+        proxy = self._proxy(key)
+        if proxy is not None:
+            # https: túnel CONNECT até o host; http: requisição com URL absoluta ao proxy
+            proxy_host, proxy_port, proxy_headers = proxy
+            if scheme == "https":
+                connection = http.client.HTTPSConnection(
+                    proxy_host, proxy_port, timeout=self.timeout, context=self.ssl_context
+                )
+                connection.set_tunnel(host, port, headers=proxy_headers)
+                return connection, False
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=self.timeout), False
+
+        if scheme == "https":
+            return (
+                http.client.HTTPSConnection(
+                    host, port, timeout=self.timeout, context=self.ssl_context
+                ),
+                False,
+            )
+        return http.client.HTTPConnection(host, port, timeout=self.timeout), False
+
+    def _checkin(self, key: _HostKey, connection: http.client.HTTPConnection) -> None:
+        """Devolve a conexão ao pool (ou a fecha, se o pool do host estiver cheio)."""
+        if not self._put_idle(key, connection):
+            connection.close()
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        handle: Optional[RequestHandle] = None,
+    ) -> PooledResponse:
+        """
+        Faz um GET, seguindo redirecionamentos.
+
+        Args:
+            url: URL http:// ou https://
+            headers: Cabeçalhos adicionais (sobrepõem os padrões)
+            handle: RequestHandle para abortar a requisição de outra thread
+
+        Returns:
+            PooledResponse com o corpo lido por completo
+
+        Raises:
+            OSError: Em falhas de conexão ou timeout (ConnectionAbortedError
+                se abortada pelo handle)
+            http.client.HTTPException: Em respostas HTTP malformadas (inclusive
+                corpo gzip inválido ou truncado) ou excesso de redirecionamentos
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._get_once(url, headers, handle)
+            if response.status in REDIRECT_CODES and response.headers.get("location"):
+                url = urljoin(url, response.headers["location"])
+                continue
+            return response
+        raise http.client.HTTPException(f"Excesso de redirecionamentos: {url}")
+
+    def _get_once(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        handle: Optional[RequestHandle],
+    ) -> PooledResponse:
+        key, target, request_headers = self._request(url, headers)
+
+        while True:
+            connection, reused = self._checkout(key)
+            try:
+                if handle is not None:
+                    # Conecta antes: abort() precisa do socket
+                    if connection.sock is None:
+                        connection.connect()
+                    handle._attach(connection)
+                connection.request("GET", target, headers=request_headers)
+                response = connection.getresponse()
+                body = response.read()
+                if handle is not None:
+                    handle._detach()
+            except (ConnectionError, http.client.HTTPException) as e:
+                connection.close()
+                if handle is not None:
+                    handle._detach()
+                if reused and isinstance(e, (ConnectionError, http.client.BadStatusLine)):
+                    # Servidor fechou a conexão ociosa: refazer em outra
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                if handle is not None:
+                    handle._detach()
+                raise
+            break
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._checkin(key, connection)
+
+        response_headers = {name.lower(): value for name, value in response.getheaders()}
+        body = _decode_body(response_headers, body)
+        return PooledResponse(response.status, response.reason, response_headers, body)
+
+    def close(self) -> None:
+        """Fecha as conexões ociosas."""
+        for connection in self._drain_idle():
+            connection.close()
+
+    def __enter__(self) -> "HTTPConnectionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+async def _read_response(
+    reader: asyncio.StreamReader,
+) -> Tuple[int, str, Dict[str, str], bytes, bool]:
+    """
+    Lê status, cabeçalhos e corpo (Content-Length, chunked ou até o EOF).
+
+    Returns:
+        Tupla (status, motivo, cabeçalhos em minúsculas, corpo, will_close),
+        com will_close=True se a conexão não pode ser reaproveitada
+
+    Raises:
+        ConnectionError: Se o servidor fechou a conexão antes da resposta
+        http.client.HTTPException: Em respostas malformadas
+    """
+    status_line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+    if not status_line:
+        raise ConnectionError("Conexão fechada pelo servidor antes da resposta")
+    parts = status_line.split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():
+        raise http.client.BadStatusLine(status_line)
+    status, reason = int(parts[1]), parts[2] if len(parts) > 2 else ""
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    will_close = parts[0] == "HTTP/1.0" or headers.get("connection", "").lower() == "close"
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                # Trailers opcionais até a linha em branco
+                while (await reader.readline()).strip():
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        # Corpo delimitado pelo fim da conexão
+        body = await reader.read()
+        will_close = True
+
+    return status, reason, headers, body, will_close
+
+
+def _close_streams(streams: _Streams) -> None:
+    """Fecha a conexão (sem erro se o event loop dela já terminou)."""
+    try:
+        streams[1].close()
+    except RuntimeError:
+        pass
+
+
+class AsyncHTTPConnectionPool(_BasePool):
+    """
+    Conexões HTTP/HTTPS persistentes por host para asyncio.
+
+    Mesmos argumentos e comportamento de HTTPConnectionPool (keep-alive,
+    gzip, redirecionamentos, nova tentativa em conexão ociosa fechada).
+    As conexões pertencem ao event loop em que foram abertas: usado em
+    outro loop, o pool descarta as ociosas.
+
+    Raises:
+        ValueError: Se pool_size for menor que 1
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _checkout(self, key: _HostKey) -> Tuple[_Streams, bool]:
+        """Conexão ociosa do host (reused=True) ou uma nova."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self.close()
+            self._loop = loop
+
+        streams = self._take_idle(key)
+        if streams is not None:
+            return streams, True
+        return await self._open(key), False
+
+    async def _open(self, key: _HostKey) -> _Streams:
+        """Abre uma conexão com o host."""
+        scheme, host, port = key
+        https = scheme == "https"
+        proxy = self._proxy(key)
+        if proxy is not None:
+            if not https:
+                # Requisição com URL absoluta ao proxy (ver _request)
+                return await asyncio.open_connection(proxy[0], proxy[1])
+            # https: túnel CONNECT até o host, TLS sobre o socket do túnel
+            sock = await self._tunnel(proxy, host, port)
+            try:
+                return await asyncio.open_connection(
+                    sock=sock, ssl=self.ssl_context, server_hostname=host
+                )
+            except BaseException:
+                sock.close()
+                raise
+        return await asyncio.open_connection(
+            host,
+            port,
+            ssl=self.ssl_context if https else None,
+            server_hostname=host if https else None,
+        )
+
+    @staticmethod
+    async def _tunnel(proxy: _Proxy, host: str, port: int) -> socket.socket:
+        """
+        Abre um túnel CONNECT no proxy até host:port.
+
+        Returns:
+            Socket não bloqueante conectado ao host através do proxy
+
+        Raises:
+            OSError: Se o proxy recusar o túnel
+        """
+        loop = asyncio.get_running_loop()
+        proxy_host, proxy_port, proxy_headers = proxy
+        infos = await loop.getaddrinfo(proxy_host, proxy_port, type=socket.SOCK_STREAM)
+        family, type_, proto, _, address = infos[0]
+        sock = socket.socket(family, type_, proto)
+        sock.setblocking(False)
+        try:
+            await loop.sock_connect(sock, address)
+            lines = [f"CONNECT {host}:{port} HTTP/1.1", f"Host: {host}:{port}"]
+            lines += [f"{name}: {value}" for name, value in proxy_headers.items()]
+            await loop.sock_sendall(sock, ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+            # Lê só os cabeçalhos: o proxy não envia nada depois deles até o TLS começar
+            response = b""
+            while b"\r\n\r\n" not in response:
+                chunk = await loop.sock_recv(sock, 4096)
+                if not chunk:
+                    raise OSError("Proxy fechou a conexão durante o CONNECT")
+                response += chunk
+            status_line = response.split(b"\r\n", 1)[0].decode("latin-1")
+            parts = status_line.split(" ", 2)
+            if len(parts) < 2 or parts[1] != "200":
+                raise OSError(f"Tunnel connection failed: {' '.join(parts[1:])}")
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    async def get(self, url: str, headers: Optional[Mapping[str, str]] = None) -> PooledResponse:
+        """
+        Faz um GET, seguindo redirecionamentos (ver HTTPConnectionPool.get).
+
+        O timeout não é aplicado aqui: envolva a chamada em asyncio.wait_for.
+
+        Raises:
+            OSError: Em falhas de conexão
+            http.client.HTTPException: Em respostas HTTP malformadas (inclusive
+                corpo gzip inválido ou truncado) ou excesso de redirecionamentos
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self._get_once(url, headers)
+            if response.status in REDIRECT_CODES and response.headers.get("location"):
+                url = urljoin(url, response.headers["location"])
+                continue
+            return response
+        raise http.client.HTTPException(f"Excesso de redirecionamentos: {url}")
+
+    async def _get_once(self, url: str, headers: Optional[Mapping[str, str]]) -> PooledResponse:
+        key, target, request_headers = self._request(url, headers)
+        _, host, port = key
+        if port != (443 if key[0] == "https" else 80):
+            host = f"{host}:{port}"
+        request = "".join(
+            [f"GET {target} HTTP/1.1\r\nHost: {host}\r\n"]
+            + [f"{name}: {value}\r\n" for name, value in request_headers.items()]
+            + ["\r\n"]
+        ).encode("latin-1")
+
+        while True:
+            streams, reused = await self._checkout(key)
+            reader, writer = streams
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, reason, response_headers, body, will_close = await _read_response(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                _close_streams(streams)
+                if reused:
+                    # Servidor fechou a conexão ociosa: refazer em outra
+                    continue
+                raise
+            except BaseException:
+                # Inclusive cancelamento (timeout, hedge): a resposta ficaria pela metade
+                _close_streams(streams)
+                raise
+            break
+
+        if will_close or not self._put_idle(key, streams):
+            _close_streams(streams)
+
+        body = _decode_body(response_headers, body)
+        return PooledResponse(status, reason, response_headers, body)
+
+    def close(self) -> None:
+        """Fecha as conexões ociosas."""
+        for streams in self._drain_idle():
+            _close_streams(streams)
+
+    async def __aenter__(self) -> "AsyncHTTPConnectionPool":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
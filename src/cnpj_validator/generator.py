@@ -0,0 +1,299 @@
+"""
+Geração de CNPJs Válidos em Fluxo
+
+Entrega CNPJs gerados sob demanda, em blocos produzidos por
+vectorized.generate_many (NumPy). Sem NumPy, gera um CNPJ por vez com o
+módulo random, com a mesma distribuição, mas outra sequência para a mesma
+semente.
+
+Também enumera todos os estabelecimentos (ordens 0001-9999) de uma raiz
+(enumerate_establishments) e faixas contíguas de raízes (RootRange), com
+os DVs atualizados de forma incremental. Uma RootRange pode ser dividida
+em N partes disjuntas (shard) para N processos, sem coordenação.
+
+Uso:
+    for cnpj in iter_generate(1_000_000, seed=42):
+        ...
+"""
+
+import random
+from typing import Any, Iterator, Optional, Union
+
+from .validators.check_digits import ALPHANUMERIC_ENGINE
+from .validators.vectorized import generate_many
+
+DEFAULT_GENERATE_CHUNK_SIZE = 100_000
+
+_DIGITS = "0123456789"
+_ROOT_CHARS = _DIGITS + "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _format(cnpj: str) -> str:
+    """XX.XXX.XXX/XXXX-XX a partir de 14 caracteres."""
+    return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
+
+
+def _iter_generate_python(
+    count: int, seed: Any, alphanumeric: bool, filial_ratio: float, formatted: bool
+) -> Iterator[str]:
+    """Geração um a um, sem NumPy."""
+    rng = random.Random(seed)
+    chars = _ROOT_CHARS if alphanumeric else _DIGITS
+    for _ in range(count):
+        order = rng.randint(2, 9999) if filial_ratio and rng.random() < filial_ratio else 1
+        base = "".join(rng.choices(chars, k=8)) + f"{order:04d}"
+        first, second = ALPHANUMERIC_ENGINE.compute(base)
+        cnpj = f"{base}{first}{second}"
+        yield _format(cnpj) if formatted else cnpj
+
+
+def iter_generate(
+    count: int,
+    seed: Any = None,
+    alphanumeric: bool = False,
+    filial_ratio: float = 0.0,
+    formatted: bool = True,
+    stream: Optional[int] = None,
+    chunk_size: int = DEFAULT_GENERATE_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Gera CNPJs válidos sob demanda, com memória limitada ao bloco.
+
+    Args:
+        count: Quantidade de CNPJs
+        seed: Semente para reprodutibilidade (None sorteia)
+        alphanumeric: Se True, a raiz usa 0-9 e A-Z
+        filial_ratio: Fração (0 a 1) de filiais (ordem 0002-9999)
+        formatted: Se True, no formato XX.XXX.XXX/XXXX-XX
+        stream: Índice do fluxo independente derivado da semente
+            (um por processo em geração paralela)
+        chunk_size: CNPJs gerados por bloco
+
+    Yields:
+        Cada CNPJ gerado
+
+    Raises:
+        ValueError: Se count for negativo ou filial_ratio estiver fora de [0, 1]
+    """
+    if count < 0:
+        raise ValueError("count deve ser maior ou igual a zero")
+    if not 0.0 <= filial_ratio <= 1.0:
+        raise ValueError("filial_ratio deve estar entre 0 e 1")
+
+    try:
+        import numpy
+    except ImportError:
+        yield from _iter_generate_python(count, seed, alphanumeric, filial_ratio, formatted)
+        return
+
+    if not isinstance(seed, numpy.random.Generator):
+        seed = numpy.random.default_rng(
+            numpy.random.SeedSequence(seed, spawn_key=() if stream is None else (stream,))
+        )
+
+    chunk_size = max(1, chunk_size)
+    for start in range(0, count, chunk_size):
+        chunk = generate_many(
+            min(chunk_size, count - start),
+            seed=seed,
+            alphanumeric=alphanumeric,
+            filial_ratio=filial_ratio,
+            formatted=formatted,
+        )
+        yield from chunk.astype(str).tolist()
+
+
+def _clean_root(root: str) -> str:
+    """Raiz em maiúsculas, sem pontos, barras e traços."""
+    return root.upper().replace(".", "").replace("/", "").replace("-", "")
+
+
+def enumerate_establishments(
+    root: str, start: int = 1, stop: int = 9999, formatted: bool = True
+) -> Iterator[str]:
+    """
+    Enumera, sob demanda, os CNPJs de todos os estabelecimentos de uma raiz.
+
+    A soma ponderada da raiz é calculada uma vez e a da ordem é atualizada
+    a cada passo (CheckDigitEngine.iter_orders), em vez de recalcular os
+    DVs do zero para cada ordem.
+
+    Args:
+        root: Raiz com 8 caracteres (0-9, ou A-Z no formato alfanumérico);
+            pontos, barras e traços são ignorados
+        start: Primeira ordem (1 = matriz)
+        stop: Última ordem, inclusive
+        formatted: Se True, no formato XX.XXX.XXX/XXXX-XX
+
+    Yields:
+        Cada CNPJ válido, em ordem crescente de ordem
+
+    Raises:
+        ValueError: Se a raiz for inválida ou a faixa estiver fora de 1-9999
+    """
+    if start < 1:
+        raise ValueError("ordem deve estar entre 1 e 9999 (0000 não é permitida)")
+    if not isinstance(root, str):
+        raise ValueError("raiz deve ser uma string")
+
+    root = _clean_root(root)
+    orders = ALPHANUMERIC_ENGINE.iter_orders(root, start, stop)
+    if formatted:
+        prefix = f"{root[:2]}.{root[2:5]}.{root[5:8]}/"
+        for order, first, second in orders:
+            yield f"{prefix}{order:04d}-{first}{second}"
+    else:
+        for order, first, second in orders:
+            yield f"{root}{order:04d}{first}{second}"
+
+
+class RootRange:
+    """
+    Faixa contígua de raízes [start_root, end_root) com ordem fixa.
+
+    Numérica, as raízes seguem a ordem decimal ('00000000' a '99999999');
+    alfanumérica, a ordem em base 36 (0-9 e depois A-Z em cada posição).
+    Iterar entrega os CNPJs válidos de cada raiz, na ordem da faixa, com
+    a soma ponderada atualizada como um odômetro
+    (CheckDigitEngine.iter_roots).
+
+    Args:
+        start_root: Primeira raiz (8 caracteres) ou seu índice
+        end_root: Raiz final, exclusiva (ou seu índice); None vai até o fim
+        alphanumeric: Se True, as raízes usam 0-9 e A-Z (base 36)
+        order: Ordem dos estabelecimentos gerados (1 = matriz)
+        formatted: Se True, no formato XX.XXX.XXX/XXXX-XX
+
+    Raises:
+        ValueError: Se alguma raiz for inválida, a faixa estiver invertida
+            ou a ordem estiver fora de 1-9999
+
+    Uso:
+        # Processo i de n, sem coordenação entre eles
+        for cnpj in RootRange('11000000', '12000000').shard(i, n):
+            ...
+    """
+
+    __slots__ = ("start", "stop", "alphanumeric", "order", "formatted", "_alphabet")
+
+    def __init__(
+        self,
+        start_root: Union[str, int] = 0,
+        end_root: Union[str, int, None] = None,
+        alphanumeric: bool = False,
+        order: int = 1,
+        formatted: bool = True,
+    ):
+        if not 1 <= order <= 9999:
+            raise ValueError("ordem deve estar entre 1 e 9999 (0000 não é permitida)")
+        self.alphanumeric = alphanumeric
+        self._alphabet = _ROOT_CHARS if alphanumeric else _DIGITS
+        self.order = order
+        self.formatted = formatted
+        self.start = self._index(start_root)
+        self.stop = self._size if end_root is None else self._index(end_root)
+        if not 0 <= self.start <= self.stop <= self._size:
+            raise ValueError("faixa de raízes inválida")
+
+    @classmethod
+    def with_prefix(cls, prefix: str, alphanumeric: bool = False, **kwargs: Any) -> "RootRange":
+        """
+        Todas as raízes que começam com o prefixo.
+
+        Args:
+            prefix: Até 8 caracteres iniciais da raiz
+            alphanumeric: Se True, as raízes usam 0-9 e A-Z (base 36)
+            **kwargs: Demais argumentos de RootRange (order, formatted)
+
+        Returns:
+            RootRange com as raízes do prefixo
+        """
+        prefix = _clean_root(prefix)
+        start = cls(prefix.ljust(8, "0"), alphanumeric=alphanumeric).start
+        width = (36 if alphanumeric else 10) ** (8 - len(prefix))
+        return cls(start, start + width, alphanumeric, **kwargs)
+
+    @property
+    def _base(self) -> int:
+        return len(self._alphabet)
+
+    @property
+    def _size(self) -> int:
+        return self._base**8
+
+    def _index(self, root: Union[str, int]) -> int:
+        """Índice da raiz na numeração da faixa."""
+        if isinstance(root, int):
+            return root
+        if not isinstance(root, str):
+            raise ValueError("raiz deve ser uma string")
+        root = _clean_root(root)
+        alphabet = self._alphabet
+        if len(root) != 8 or any(char not in alphabet for char in root):
+            raise ValueError(f"raiz inválida: {root!r}")
+        return int(root, self._base)
+
+    def _root(self, index: int) -> str:
+        """Raiz (8 caracteres) do índice."""
+        chars = []
+        for _ in range(8):
+            index, digit = divmod(index, self._base)
+            chars.append(self._alphabet[digit])
+        return "".join(reversed(chars))
+
+    @property
+    def start_root(self) -> str:
+        """Primeira raiz da faixa."""
+        return self._root(self.start)
+
+    @property
+    def end_root(self) -> Optional[str]:
+        """Raiz final (exclusiva), ou None se a faixa vai até o fim."""
+        return None if self.stop == self._size else self._root(self.stop)
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __repr__(self) -> str:
+        return (
+            f"RootRange({self.start_root!r}, {self.end_root!r}, "
+            f"alphanumeric={self.alphanumeric}, order={self.order})"
+        )
+
+    def shard(self, index: int, count: int) -> "RootRange":
+        """
+        Parte index (0 a count - 1) da faixa dividida em count partes contíguas.
+
+        As partes são disjuntas, cobrem a faixa inteira e diferem em tamanho
+        em no máximo 1 raiz; cada processo calcula a sua sem coordenação.
+
+        Args:
+            index: Índice da parte
+            count: Quantidade de partes
+
+        Returns:
+            RootRange da parte
+
+        Raises:
+            ValueError: Se count < 1 ou index fora de [0, count)
+        """
+        if count < 1 or not 0 <= index < count:
+            raise ValueError("shard deve satisfazer 0 <= index < count")
+        size = len(self)
+        return RootRange(
+            self.start + size * index // count,
+            self.start + size * (index + 1) // count,
+            self.alphanumeric,
+            self.order,
+            self.formatted,
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        roots = ALPHANUMERIC_ENGINE.iter_roots(self.start, self.stop, self._alphabet, self.order)
+        order = f"{self.order:04d}"
+        if self.formatted:
+            for root, first, second in roots:
+                yield f"{root[:2]}.{root[2:5]}.{root[5:]}/{order}-{first}{second}"
+        else:
+            for root, first, second in roots:
+                yield f"{root}{order}{first}{second}"
@@ -0,0 +1,163 @@
+"""
+Chave Inteira Compacta de CNPJ (CNPJKey)
+
+Empacota um CNPJ em um único inteiro de 64 bits (63 bits usados):
+
+    bits 21-62  raiz em base 36 (0-9 valem 0-9, A-Z valem 10-35; 36^8 < 2^42)
+    bits 7-20   ordem (0 a 9999)
+    bits 0-6    DV (00 a 99)
+
+A ordem numérica das chaves é a ordem por raiz, depois por ordem e DV,
+que é também a ordem lexicográfica dos CNPJs limpos em maiúsculas. Para
+CNPJs numéricos, a raiz em base 36 preserva a ordem decimal.
+
+Em conjuntos e dicionários, um int ocupa menos da metade de uma str de
+14 caracteres; em arrays NumPy uint64 (encode_many/decode_many), 8 bytes
+por CNPJ.
+
+Uso:
+    key = CNPJKey.encode("11.222.333/0001-81")
+    CNPJKey.decode(key)                      # '11222333000181'
+    keys = CNPJKey.encode_many(array_s18)    # numpy.uint64
+"""
+
+from typing import Any, Union
+
+from .validators.vectorized import (
+    DEFAULT_CHUNK_SIZE,
+    INVALID_KEY,
+    KEY_DV_MASK,
+    KEY_ORDER_MASK,
+    KEY_ORDER_SHIFT,
+    KEY_ROOT_LIMIT,
+    KEY_ROOT_SHIFT,
+    decode_keys,
+    encode_keys,
+)
+
+_ROOT_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Pares de caracteres da raiz (36^2 = 1296): 4 consultas por raiz na decodificação
+_PAIRS = tuple(first + second for first in _ROOT_CHARS for second in _ROOT_CHARS)
+
+KeyInput = Union[str, bytes, bytearray, memoryview]
+
+
+class CNPJKey:
+    """
+    Codec entre CNPJ e chave inteira de 64 bits.
+
+    Aceita os layouts canônicos (14 caracteres ou XX.XXX.XXX/XXXX-XX), com
+    raiz alfanumérica e ordem/DV numéricos. O codec não confere os DVs:
+    valide antes de codificar quando a entrada não for confiável.
+    """
+
+    ROOT_SHIFT = KEY_ROOT_SHIFT
+    ORDER_SHIFT = KEY_ORDER_SHIFT
+    INVALID = INVALID_KEY
+
+    @staticmethod
+    def encode(cnpj: KeyInput) -> int:
+        """
+        Converte um CNPJ na sua chave.
+
+        Args:
+            cnpj: CNPJ limpo ou formatado (str ou bytes ASCII)
+
+        Returns:
+            Chave inteira (0 <= chave < 2^63)
+
+        Raises:
+            ValueError: Se o CNPJ não estiver em um layout canônico
+        """
+        if isinstance(cnpj, (bytes, bytearray, memoryview)):
+            cnpj = bytes(cnpj).decode("latin-1")
+        if not isinstance(cnpj, str):
+            raise ValueError(f"CNPJ inválido para chave: {cnpj!r}")
+
+        if len(cnpj) == 14:
+            root, tail = cnpj[:8], cnpj[8:]
+        elif len(cnpj) == 18 and cnpj[2] + cnpj[6] + cnpj[10] + cnpj[15] == "../-":
+            root, tail = cnpj[:2] + cnpj[3:6] + cnpj[7:10], cnpj[11:15] + cnpj[16:]
+        else:
+            raise ValueError(f"CNPJ inválido para chave: {cnpj!r}")
+
+        # isascii descarta dígitos e letras não ASCII aceitos por isdigit/isalnum
+        if not (cnpj.isascii() and root.isalnum() and tail.isdigit()):
+            raise ValueError(f"CNPJ inválido para chave: {cnpj!r}")
+
+        return (
+            (int(root, 36) << KEY_ROOT_SHIFT) | (int(tail[:4]) << KEY_ORDER_SHIFT) | int(tail[4:])
+        )
+
+    @staticmethod
+    def decode(key: int, formatted: bool = False) -> str:
+        """
+        Converte uma chave de volta no CNPJ (raiz em maiúsculas).
+
+        Args:
+            key: Chave de encode
+            formatted: Se True, no formato XX.XXX.XXX/XXXX-XX
+
+        Returns:
+            CNPJ com 14 caracteres (ou 18, formatado)
+
+        Raises:
+            ValueError: Se a chave não corresponder a um CNPJ
+        """
+        root = key >> KEY_ROOT_SHIFT
+        order = (key >> KEY_ORDER_SHIFT) & KEY_ORDER_MASK
+        dv = key & KEY_DV_MASK
+        if key < 0 or root >= KEY_ROOT_LIMIT or order > 9999 or dv > 99:
+            raise ValueError(f"Chave inválida: {key!r}")
+
+        high, low = divmod(root, 1296 * 1296)
+        root = _PAIRS[high // 1296] + _PAIRS[high % 1296] + _PAIRS[low // 1296] + _PAIRS[low % 1296]
+        if formatted:
+            return f"{root[:2]}.{root[2:5]}.{root[5:]}/{order:04d}-{dv:02d}"
+        return f"{root}{order:04d}{dv:02d}"
+
+    @staticmethod
+    def root(key: int) -> int:
+        """
+        Parte da raiz da chave (mesmo valor para todos os estabelecimentos).
+
+        Args:
+            key: Chave de encode
+
+        Returns:
+            Raiz em base 36 como inteiro
+        """
+        return key >> KEY_ROOT_SHIFT
+
+    @staticmethod
+    def encode_many(values: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+        """
+        Converte em lote (NumPy) CNPJs em chaves.
+
+        Args:
+            values: Array 'S14'/'S18' (ou outra largura) ou matriz 2-D uint8
+            chunk_size: Linhas processadas por bloco (limita a memória)
+
+        Returns:
+            Array numpy.uint64; linhas fora do layout canônico recebem
+            CNPJKey.INVALID (maior que qualquer chave válida)
+        """
+        return encode_keys(values, chunk_size)
+
+    @staticmethod
+    def decode_many(
+        keys: Any, formatted: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Any:
+        """
+        Converte em lote (NumPy) chaves de volta em CNPJs.
+
+        Args:
+            keys: Array ou sequência de chaves
+            formatted: Se True, 'S18' no formato XX.XXX.XXX/XXXX-XX; senão 'S14'
+            chunk_size: Linhas processadas por bloco (limita a memória)
+
+        Returns:
+            Array de bytes de largura fixa; chaves inválidas viram b''
+        """
+        return decode_keys(keys, formatted, chunk_size)
@@ -0,0 +1,216 @@
+"""
+Validação Paralela em Lote (ProcessPoolExecutor)
+
+A validação é CPU-bound e em Python puro: para usar mais de um núcleo, a
+entrada é dividida em blocos validados em processos separados.
+
+Cada processo devolve, por bloco, o CNPJ limpo de cada linha e um array de
+inteiros de 32 bits com todos os códigos da linha (em vez de objetos
+ValidationResult serializados), mantendo pequena a troca entre processos:
+
+    bits 0-7    ErrorCode da validação numérica
+    bits 8-23   ErrorCodes de formato (bit 8 + código)
+    bits 25-26  WarningCodes (bit 24 + código)
+    bit 31      validação de formato executada
+
+No modo compact, cada processo devolve apenas 1 byte por linha (código do
+primeiro erro), e o processo principal não monta objetos por linha.
+
+Uso:
+    for result in validate_parallel(cnpjs, workers=8):
+        ...
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .validation_result import ValidationResult
+from .validators.error_codes import ErrorCode, WarningCode
+from .validators.scanner import scan
+
+DEFAULT_PARALLEL_CHUNK_SIZE = 20_000
+
+_FORMAT_SHIFT = 8
+_WARNING_SHIFT = 24
+_FORMAT_VALIDATED = 1 << 31
+
+_ERROR_CODES = tuple(ErrorCode)
+_WARNING_CODES = tuple(WarningCode)
+
+Decoded = Tuple[ErrorCode, Optional[Tuple[ErrorCode, ...]], Tuple[WarningCode, ...]]
+
+
+def encode_record(
+    numeric_code: int,
+    format_codes: Optional[Iterable[int]],
+    warning_codes: Iterable[int],
+) -> int:
+    """
+    Empacota os códigos de um resultado em um inteiro de 32 bits.
+
+    Args:
+        numeric_code: ErrorCode da validação numérica
+        format_codes: ErrorCodes de formato, ou None se não validado
+        warning_codes: WarningCodes
+
+    Returns:
+        Registro compacto (ver docstring do módulo)
+    """
+    record = int(numeric_code)
+    if format_codes is not None:
+        record |= _FORMAT_VALIDATED
+        for code in format_codes:
+            record |= 1 << (_FORMAT_SHIFT + code)
+    for code in warning_codes:
+        record |= 1 << (_WARNING_SHIFT + code)
+    return record
+
+
+def decode_record(record: int) -> Decoded:
+    """
+    Desempacota um registro de encode_record.
+
+    Os códigos de formato e de aviso saem em ordem crescente, que é a
+    mesma ordem em que a validação os produz.
+
+    Args:
+        record: Registro compacto
+
+    Returns:
+        Tupla (ErrorCode numérico, ErrorCodes de formato ou None, WarningCodes)
+    """
+    format_codes = None
+    if record & _FORMAT_VALIDATED:
+        format_codes = tuple(code for code in _ERROR_CODES if record >> (_FORMAT_SHIFT + code) & 1)
+    warning_codes = tuple(code for code in _WARNING_CODES if record >> (_WARNING_SHIFT + code) & 1)
+    return _ERROR_CODES[record & 0xFF], format_codes, warning_codes
+
+
+def _validate_chunk(cnpjs: List[Any], validate_format: bool) -> Tuple[array, List[str]]:
+    """Executado no processo filho: valida um bloco e devolve (registros, CNPJs limpos)."""
+    records = array("I")
+    cleans = []
+    for cnpj in cnpjs:
+        cnpj_clean, numeric_code, format_codes, warning_codes = scan(cnpj, validate_format)
+        cleans.append(cnpj_clean)
+        records.append(encode_record(numeric_code, format_codes, warning_codes))
+    return records, cleans
+
+
+def _codes_chunk(cnpjs: List[Any], validate_format: bool) -> bytes:
+    """Executado no processo filho: apenas o código do primeiro erro de cada linha (1 byte)."""
+    codes = bytearray()
+    for cnpj in cnpjs:
+        _, numeric_code, format_codes, _ = scan(cnpj, validate_format)
+        codes.append(numeric_code or (format_codes[0] if format_codes else 0))
+    return bytes(codes)
+
+
+def _chunks(source: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Divide o iterável em listas de até chunk_size itens."""
+    iterator = iter(source)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _results(
+    chunk: List[Any], payload: Tuple[array, List[str]], decoded: Dict[int, Decoded]
+) -> Iterator[ValidationResult]:
+    """Reconstrói os ValidationResult de um bloco (registros repetidos decodificados uma vez)."""
+    records, cleans = payload
+    for cnpj, cnpj_clean, record in zip(chunk, cleans, records):
+        try:
+            codes = decoded[record]
+        except KeyError:
+            codes = decoded[record] = decode_record(record)
+        yield ValidationResult(cnpj, cnpj_clean, *codes)
+
+
+def validate_parallel(
+    source: Iterable[Any],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+    ordered: bool = True,
+    validate_format: bool = True,
+    compact: bool = False,
+) -> Iterator[Any]:
+    """
+    Valida um iterável de CNPJs em vários processos.
+
+    A entrada é consumida sob demanda: no máximo 2 blocos por processo
+    ficam pendentes, limitando a memória mesmo para arquivos enormes.
+
+    Remontar um ValidationResult por linha tem custo no processo principal,
+    o que limita o ganho com muitos processos. Com compact=True cada
+    processo devolve apenas 1 byte por linha (o código do primeiro erro) e
+    a vazão escala quase linearmente com a quantidade de núcleos.
+
+    Args:
+        source: Iterável de CNPJs (lista, arquivo, gerador...)
+        workers: Quantidade de processos (padrão: os.cpu_count()).
+            Com 1, valida no próprio processo, sem pool.
+        chunk_size: Quantidade de CNPJs enviados por vez a cada processo
+        ordered: Se True, entrega na ordem da entrada; se False, na ordem
+            em que os blocos terminam (correlacione pela entrada)
+        validate_format: Se True, valida também o formato alfanumérico
+        compact: Se True, entrega tuplas (entrada, código do primeiro erro),
+            com 0 (ErrorCode.OK) para CNPJ válido
+
+    Yields:
+        ValidationResult de cada entrada (mesmo resultado de
+        CNPJValidator.validate), ou tuplas (entrada, int) se compact=True
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, chunk_size)
+
+    if compact:
+        task: Callable[[List[Any], bool], Any] = _codes_chunk
+        unpack: Callable[[List[Any], Any], Iterator[Any]] = zip
+    else:
+        decoded: Dict[int, Decoded] = {}
+        task = _validate_chunk
+        unpack = partial(_results, decoded=decoded)
+
+    if workers <= 1:
+        for chunk in _chunks(source, chunk_size):
+            yield from unpack(chunk, task(chunk, validate_format))
+        return
+
+    max_pending = 2 * workers
+    pool = ProcessPoolExecutor(max_workers=workers)
+    pending: "deque[Tuple[List[Any], Future]]" = deque()
+    by_future: Dict[Future, List[Any]] = {}
+    try:
+        if ordered:
+            for chunk in _chunks(source, chunk_size):
+                pending.append((chunk, pool.submit(task, chunk, validate_format)))
+                if len(pending) >= max_pending:
+                    chunk, future = pending.popleft()
+                    yield from unpack(chunk, future.result())
+            while pending:
+                chunk, future = pending.popleft()
+                yield from unpack(chunk, future.result())
+        else:
+            for chunk in _chunks(source, chunk_size):
+                by_future[pool.submit(task, chunk, validate_format)] = chunk
+                if len(by_future) >= max_pending:
+                    done, _ = wait(by_future, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from unpack(by_future.pop(future), future.result())
+            while by_future:
+                done, _ = wait(by_future, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from unpack(by_future.pop(future), future.result())
+    finally:
+        # Consumidor interrompido: descarta os blocos ainda não iniciados
+        for future in [future for _, future in pending] + list(by_future):
+            future.cancel()
+        pool.shutdown(wait=True)
@@ -0,0 +1,393 @@
+"""
+Pré-filtro Probabilístico de CNPJs Registrados (filtro de Bloom em blocos)
+
+Construído offline a partir de uma lista ou dump de CNPJs registrados,
+responde em microssegundos, sem rede, se um CNPJ certamente NÃO está na
+base: a maioria das consultas a identificadores que nunca existiram não
+precisa gastar uma chamada limitada da API.
+
+    - Sem falsos negativos: todo CNPJ inserido é encontrado.
+    - Falsos positivos com taxa configurável (fp_rate): um CNPJ ausente
+      pode ser dado como "talvez registrado" e segue para a API.
+
+Cada CNPJ é validado e normalizado (setops.line_key), convertido em
+CNPJKey e espalhado por hashes de 64 bits (splitmix64): o primeiro
+escolhe o bloco, e os seguintes, fatiados de 9 em 9 bits, as k posições
+dentro dele. O filtro é dividido em blocos de 512 bits (64 bytes, uma
+linha de cache): todos os bits de um CNPJ ficam no mesmo bloco, e uma
+consulta toca uma única página do arquivo mapeado. O tamanho é calculado pela taxa de falsos
+positivos de um filtro em blocos (chaves por bloco com distribuição de
+Poisson), não pela fórmula do Bloom clássico, que a subestima.
+
+Formato do arquivo (mapeável com mmap, sem carregar na memória):
+
+    bytes 0-63   cabeçalho (_HEADER): assinatura, versão, k, blocos,
+                 itens inseridos e taxa de falsos positivos
+    bytes 64-    blocos de 64 bytes
+
+Dumps no layout dos Dados Abertos do CNPJ (Estabelecimentos:
+"CNPJ_BASICO";"CNPJ_ORDEM";"CNPJ_DV";...) são aceitos diretamente,
+além de listas com um CNPJ por linha.
+
+Uso:
+    BloomFilter.build(['estabelecimentos.csv'], fp_rate=0.001).save('cnpjs.bloom')
+    registrados = BloomFilter.open('cnpjs.bloom')
+    if cnpj not in registrados:
+        ...  # certamente não registrado
+"""
+
+import math
+import mmap
+import struct
+from itertools import islice
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from .batch_io import Line, Source, iter_lines
+from .setops import chunk_keys, line_key
+
+DEFAULT_FP_RATE = 0.01
+DEFAULT_BUILD_CHUNK_SIZE = 1_000_000
+
+_MAGIC = b"CNPJBLM1"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQd")
+_HEADER_SIZE = 64
+
+_BLOCK_BITS = 512
+_BLOCK_BYTES = _BLOCK_BITS // 8
+_MASK64 = (1 << 64) - 1
+
+# Posições de 9 bits (0-511) tiradas de cada hash de 64 bits; o bloco vem de outro hash
+_SLICES = 7
+
+
+def _mix(key: int) -> int:
+    """splitmix64: espalha os bits da chave em um hash de 64 bits."""
+    z = (key + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _mix_many(np: Any, keys: Any) -> Any:
+    """splitmix64 vetorizado (a multiplicação uint64 do NumPy já é módulo 2^64)."""
+    with np.errstate(over="ignore"):
+        z = keys.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _distinct_positions(k: int) -> List[float]:
+    """Distribuição da quantidade de posições distintas entre k sorteadas em um bloco."""
+    distribution = [1.0]
+    for _ in range(k):
+        following = [0.0] * (len(distribution) + 1)
+        for distinct, probability in enumerate(distribution):
+            following[distinct] += probability * distinct / _BLOCK_BITS
+            following[distinct + 1] += probability * (_BLOCK_BITS - distinct) / _BLOCK_BITS
+        distribution = following
+    return distribution
+
+
+def blocked_fp_rate(keys_per_block: float, k: int) -> float:
+    """
+    Taxa de falsos positivos de um filtro de Bloom em blocos de 512 bits.
+
+    As chaves por bloco seguem uma distribuição de Poisson. Em um bloco com
+    j chaves (j*k bits sorteados), a chance de d posições distintas estarem
+    todas ligadas sai por inclusão-exclusão:
+    soma de (-1)^i * C(d, i) * (1 - i/512)^(j*k) para i de 0 a d.
+
+    Args:
+        keys_per_block: Média de chaves por bloco
+        k: Bits ligados por chave
+
+    Returns:
+        Probabilidade de um CNPJ ausente ser dado como presente
+    """
+    if keys_per_block <= 0:
+        return 0.0
+    distinct = list(enumerate(_distinct_positions(k)))
+    stop = int(keys_per_block + 12 * math.sqrt(keys_per_block)) + 20
+    probability = math.exp(-keys_per_block)
+    total = 0.0
+    for count in range(stop):
+        if count:
+            probability *= keys_per_block / count
+        misses = [(1 - i / _BLOCK_BITS) ** (k * count) for i in range(k + 1)]
+        covered = sum(
+            share * sum((-1) ** i * math.comb(d, i) * misses[i] for i in range(d + 1))
+            for d, share in distinct
+        )
+        total += probability * covered
+    return total
+
+
+def _dimensions(capacity: int, fp_rate: float) -> Tuple[int, int]:
+    """Menor quantidade de blocos (e o k correspondente) que atinge fp_rate."""
+    bits_per_key = -math.log(fp_rate) / math.log(2) ** 2
+    k = max(1, min(16, round(bits_per_key * math.log(2))))
+    low = max(1, math.ceil(capacity * bits_per_key / _BLOCK_BITS))
+    if not capacity or blocked_fp_rate(capacity / low, k) <= fp_rate:
+        return k, low
+    high = low * 2
+    while blocked_fp_rate(capacity / high, k) > fp_rate:
+        low, high = high, high * 2
+    # Busca binária com precisão de 0,5% do tamanho
+    while high - low > max(1, low // 200):
+        middle = (low + high) // 2
+        if blocked_fp_rate(capacity / middle, k) > fp_rate:
+            low = middle
+        else:
+            high = middle
+    return k, high
+
+
+def _dump_line(line: Line) -> bytes:
+    """CNPJ de uma linha do dump de Estabelecimentos (básico;ordem;dv;...) ou a própria linha."""
+    line = bytes(line)
+    if b";" not in line:
+        return line
+    return b"".join(line.replace(b'"', b"").split(b";", 3)[:3])
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom em blocos de CNPJs, em memória ou mapeado de arquivo.
+
+    Atributos:
+        k: Bits ligados por CNPJ
+        blocks: Quantidade de blocos de 512 bits
+        count: CNPJs inseridos
+        fp_rate: Taxa de falsos positivos para a qual foi dimensionado
+    """
+
+    def __init__(self, capacity: int, fp_rate: float = DEFAULT_FP_RATE):
+        """
+        Cria um filtro vazio, em memória.
+
+        Args:
+            capacity: Quantidade esperada de CNPJs
+            fp_rate: Taxa de falsos positivos desejada com capacity CNPJs
+
+        Raises:
+            ValueError: Se capacity for negativa ou fp_rate fora de (0, 1)
+        """
+        if capacity < 0:
+            raise ValueError("capacity deve ser maior ou igual a zero")
+        if not 0.0 < fp_rate < 1.0:
+            raise ValueError("fp_rate deve estar entre 0 e 1 (exclusive)")
+        self.k, self.blocks = _dimensions(capacity, fp_rate)
+        self.count = 0
+        self.fp_rate = fp_rate
+        self._bits: Any = bytearray(self.blocks * _BLOCK_BYTES)
+        self._mapped: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return (
+            f"BloomFilter(count={self.count}, k={self.k}, "
+            f"blocks={self.blocks}, fp_rate={self.fp_rate})"
+        )
+
+    def __contains__(self, cnpj: Any) -> bool:
+        """Se o CNPJ talvez esteja no filtro (False: certamente ausente ou inválido)."""
+        key = line_key(cnpj) if isinstance(cnpj, (str, bytes, bytearray, memoryview)) else None
+        return key is not None and self.contains_key(key)
+
+    def __enter__(self) -> "BloomFilter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def size_bytes(self) -> int:
+        """Tamanho dos blocos, em bytes (o arquivo tem mais 64 de cabeçalho)."""
+        return self.blocks * _BLOCK_BYTES
+
+    def contains_key(self, key: int) -> bool:
+        """
+        Consulta uma CNPJKey.
+
+        Args:
+            key: Chave de CNPJKey.encode
+
+        Returns:
+            False se a chave certamente não foi inserida
+        """
+        z = _mix(key)
+        base = (z % self.blocks) * _BLOCK_BYTES
+        bits = self._bits
+        for index in range(self.k):
+            if index % _SLICES == 0:
+                z = hashed = _mix(z)
+            position = hashed & 511
+            hashed >>= 9
+            if not bits[base + (position >> 3)] >> (position & 7) & 1:
+                return False
+        return True
+
+    def add_key(self, key: int) -> None:
+        """
+        Insere uma CNPJKey.
+
+        Args:
+            key: Chave de CNPJKey.encode
+        """
+        z = _mix(key)
+        base = (z % self.blocks) * _BLOCK_BYTES
+        bits = self._bits
+        for index in range(self.k):
+            if index % _SLICES == 0:
+                z = hashed = _mix(z)
+            position = hashed & 511
+            hashed >>= 9
+            bits[base + (position >> 3)] |= 1 << (position & 7)
+        self.count += 1
+
+    def add(self, cnpj: Any) -> bool:
+        """
+        Valida, normaliza e insere um CNPJ.
+
+        Args:
+            cnpj: CNPJ formatado ou não (str ou bytes)
+
+        Returns:
+            False se o CNPJ for inválido (e não foi inserido)
+        """
+        key = line_key(cnpj)
+        if key is None:
+            return False
+        self.add_key(key)
+        return True
+
+    def add_keys(self, keys: Iterable[int]) -> None:
+        """
+        Insere várias CNPJKeys (vetorizado quando keys é um array NumPy).
+
+        Args:
+            keys: Iterável de chaves ou array numpy.uint64
+        """
+        if type(keys).__module__ != "numpy":
+            for key in keys:
+                self.add_key(key)
+            return
+
+        import numpy as np
+
+        z = _mix_many(np, keys)
+        base = (z % np.uint64(self.blocks)) * np.uint64(_BLOCK_BYTES)
+        bits = np.frombuffer(self._bits, dtype=np.uint8)
+        for index in range(self.k):
+            if index % _SLICES == 0:
+                z = hashed = _mix_many(np, z)
+            position = hashed & np.uint64(511)
+            hashed = hashed >> np.uint64(9)
+            masks = np.left_shift(1, (position & np.uint64(7)).astype(np.uint8)).astype(np.uint8)
+            np.bitwise_or.at(bits, (base + (position >> np.uint64(3))).astype(np.intp), masks)
+        self.count += len(keys)
+
+    def save(self, path: str) -> None:
+        """
+        Grava o filtro no formato mapeável (ver docstring do módulo).
+
+        Args:
+            path: Arquivo de destino
+        """
+        header = _HEADER.pack(_MAGIC, _VERSION, self.k, self.blocks, self.count, self.fp_rate)
+        with open(path, "wb") as file:
+            file.write(header.ljust(_HEADER_SIZE, b"\0"))
+            file.write(self._bits)
+
+    @classmethod
+    def open(cls, path: str) -> "BloomFilter":
+        """
+        Abre um filtro gravado por save, mapeado em memória (somente leitura).
+
+        As páginas são lidas sob demanda pelo sistema operacional e
+        compartilhadas entre processos que abrem o mesmo arquivo.
+
+        Args:
+            path: Arquivo do filtro
+
+        Returns:
+            BloomFilter somente leitura (use close() ou um bloco with)
+
+        Raises:
+            ValueError: Se o arquivo não for um filtro válido
+        """
+        with open(path, "rb") as file:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"Arquivo de filtro inválido: {path}") from None
+
+        magic, version, k, blocks, count, fp_rate = _HEADER.unpack_from(
+            mapped.read(_HEADER_SIZE).ljust(_HEADER.size, b"\0")
+        )
+        expected_size = _HEADER_SIZE + blocks * _BLOCK_BYTES
+        if magic != _MAGIC or version != _VERSION or len(mapped) != expected_size:
+            mapped.close()
+            raise ValueError(f"Arquivo de filtro inválido: {path}")
+
+        bloom = cls.__new__(cls)
+        bloom.k, bloom.blocks, bloom.count, bloom.fp_rate = k, blocks, count, fp_rate
+        bloom._mapped = mapped
+        bloom._bits = memoryview(mapped)[_HEADER_SIZE:]
+        return bloom
+
+    def close(self) -> None:
+        """Libera o mapeamento do arquivo (sem efeito em filtros em memória)."""
+        if self._mapped is not None:
+            self._bits.release()
+            self._mapped.close()
+            self._mapped = None
+            self._bits = bytearray()
+
+    @classmethod
+    def build(
+        cls,
+        sources: Sequence[Source],
+        fp_rate: float = DEFAULT_FP_RATE,
+        capacity: Optional[int] = None,
+        chunk_size: int = DEFAULT_BUILD_CHUNK_SIZE,
+    ) -> "BloomFilter":
+        """
+        Constrói o filtro a partir de listas ou dumps de CNPJs registrados.
+
+        Linhas inválidas são ignoradas. Os blocos de chunk_size linhas são
+        validados e inseridos de forma vetorizada quando há NumPy.
+
+        Args:
+            sources: Arquivos com um CNPJ por linha ou dumps de
+                Estabelecimentos ('-' lê da entrada padrão)
+            fp_rate: Taxa de falsos positivos desejada
+            capacity: Quantidade esperada de CNPJs (padrão: linhas das
+                entradas, contadas em uma primeira passada)
+            chunk_size: Linhas validadas por bloco (limita a memória)
+
+        Returns:
+            BloomFilter em memória (grave com save)
+
+        Raises:
+            ValueError: Se capacity não for informada ao ler da entrada padrão
+        """
+        if capacity is None:
+            if any(source == "-" for source in sources):
+                raise ValueError("Informe capacity para ler da entrada padrão")
+            capacity = sum(sum(1 for _ in iter_lines(source)) for source in sources)
+
+        bloom = cls(capacity, fp_rate)
+        for source in sources:
+            lines = iter_lines(source)
+            while True:
+                chunk = [_dump_line(line) for line in islice(lines, max(1, chunk_size))]
+                if not chunk:
+                    break
+                keys, _ = chunk_keys(chunk)
+                bloom.add_keys(keys)
+        return bloom
@@ -0,0 +1,229 @@
+"""
+Estatísticas de Latência e Erros por Provedor
+
+Base do roteamento adaptativo de ReceitaFederalAPI: cada requisição
+registra a latência e o resultado no provedor que a atendeu, e cada
+consulta começa pelo provedor com a menor latência esperada.
+
+- EWMA da latência (respostas válidas, inclusive 404), com cada amostra
+  limitada ao p95 atual: a cauda fica com o hedge, e uma resposta lenta
+  isolada não tira o provedor da frente; lentidão contínua sobe o p95 e
+  a EWMA em poucas requisições
+- Percentis (p50, p95, p99) sobre uma janela das últimas latências; o p95
+  é o prazo do pedido de hedge ao segundo provedor
+- EWMA da taxa de erro (5xx, 429, timeouts, falhas de conexão)
+- Latência esperada = EWMA / (1 - taxa de erro): tempo médio até uma
+  resposta válida, contando as novas tentativas
+- Provedor sem amostras tem latência esperada 0: é experimentado logo
+- Seguro entre threads
+
+Sem provider_stats explícito, os clientes usam default_provider_stats(),
+compartilhado pelo processo (as rotas da API criam um cliente por
+requisição).
+
+Uso:
+    stats = ProviderStats()
+    stats.record("brasilapi", 0.180)
+    stats.record("receitaws", 2.5, ok=False)
+    stats.ranking(["brasilapi", "receitaws"])   # ['brasilapi', 'receitaws']
+    stats.percentile("brasilapi", 0.95)
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Sequence
+
+# Peso da amostra nova nas médias móveis exponenciais
+DEFAULT_ALPHA = 0.2
+# Latências guardadas por provedor para os percentis
+DEFAULT_WINDOW = 256
+# Amostras mínimas para haver percentil (e hedge)
+MIN_SAMPLES = 5
+# Percentil que limita as amostras da EWMA
+_EWMA_CAP_QUANTILE = 0.95
+# Limite da taxa de erro na latência esperada (evita divisão por zero)
+_MAX_ERROR_RATE = 0.95
+
+
+@dataclass
+class _Provider:
+    """Estado de um provedor."""
+
+    ewma: Optional[float] = None
+    error_rate: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    latencies: Deque[float] = field(default_factory=deque)
+
+
+class ProviderStats:
+    """
+    Latência e erros por provedor, para roteamento e hedge.
+
+    Args:
+        alpha: Peso da amostra nova nas EWMAs (0 < alpha <= 1)
+        window: Latências recentes guardadas por provedor (percentis)
+
+    Raises:
+        ValueError: Se alpha ou window estiverem fora do intervalo
+    """
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA, window: int = DEFAULT_WINDOW):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha deve estar em (0, 1]")
+        if window < 1:
+            raise ValueError("window deve ser maior ou igual a 1")
+        self.alpha = alpha
+        self.window = window
+        self._providers: Dict[str, _Provider] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, latency: float, ok: bool = True) -> None:
+        """
+        Registra uma requisição.
+
+        Args:
+            provider: Nome do provedor
+            latency: Duração em segundos
+            ok: False para erro (a latência não entra na EWMA nem nos percentis)
+
+        Com MIN_SAMPLES latências na janela, a amostra entra na EWMA
+        limitada ao p95 atual; nos percentis entra sem limite.
+        """
+        with self._lock:
+            state = self._providers.get(provider)
+            if state is None:
+                state = self._providers[provider] = _Provider(latencies=deque(maxlen=self.window))
+            state.requests += 1
+            state.error_rate += self.alpha * ((0.0 if ok else 1.0) - state.error_rate)
+            if not ok:
+                state.errors += 1
+                return
+            limite = _quantil(sorted(state.latencies), _EWMA_CAP_QUANTILE)
+            amostra = latency if limite is None else min(latency, limite)
+            if state.ewma is None:
+                state.ewma = amostra
+            else:
+                state.ewma += self.alpha * (amostra - state.ewma)
+            state.latencies.append(latency)
+
+    def ewma(self, provider: str) -> Optional[float]:
+        """EWMA da latência em segundos (None sem amostras)."""
+        with self._lock:
+            state = self._providers.get(provider)
+            return state.ewma if state else None
+
+    def error_rate(self, provider: str) -> float:
+        """EWMA da taxa de erro (0.0 a 1.0)."""
+        with self._lock:
+            state = self._providers.get(provider)
+            return state.error_rate if state else 0.0
+
+    def percentile(self, provider: str, q: float) -> Optional[float]:
+        """
+        Percentil das latências recentes.
+
+        Args:
+            provider: Nome do provedor
+            q: Quantil (0.95 para p95)
+
+        Returns:
+            Latência em segundos, ou None com menos de MIN_SAMPLES amostras
+        """
+        with self._lock:
+            state = self._providers.get(provider)
+            latencies = sorted(state.latencies) if state else []
+        return _quantil(latencies, q)
+
+    def expected_latency(self, provider: str) -> float:
+        """
+        Tempo esperado até uma resposta válida do provedor.
+
+        Returns:
+            EWMA / (1 - taxa de erro), em segundos; 0.0 sem amostras
+        """
+        with self._lock:
+            state = self._providers.get(provider)
+            if state is None:
+                return 0.0
+            if state.ewma is None:
+                # Só erros até agora: pior que qualquer provedor com respostas
+                return float("inf")
+            return state.ewma / (1.0 - min(state.error_rate, _MAX_ERROR_RATE))
+
+    def ranking(
+        self, providers: Sequence[str], extra_wait: Optional[Callable[[str], float]] = None
+    ) -> List[str]:
+        """
+        Ordena provedores pela latência esperada (empates mantêm a ordem dada).
+
+        Args:
+            providers: Provedores candidatos, em ordem de preferência
+            extra_wait: Espera adicional por provedor (ex.: rate limiter)
+
+        Returns:
+            Provedores do mais rápido ao mais lento
+        """
+
+        def score(provider: str) -> float:
+            wait = extra_wait(provider) if extra_wait is not None else 0.0
+            return self.expected_latency(provider) + wait
+
+        return sorted(providers, key=score)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Estatísticas de todos os provedores.
+
+        Returns:
+            Por provedor: requests, errors, error_rate, ewma_ms, p50_ms,
+            p95_ms e p99_ms (None sem amostras suficientes)
+        """
+        with self._lock:
+            providers = list(self._providers)
+        result = {}
+        for provider in providers:
+            with self._lock:
+                state = self._providers[provider]
+                requests, errors, error_rate, ewma = (
+                    state.requests,
+                    state.errors,
+                    state.error_rate,
+                    state.ewma,
+                )
+            percentiles = {q: self.percentile(provider, q) for q in (0.5, 0.95, 0.99)}
+            result[provider] = {
+                "requests": requests,
+                "errors": errors,
+                "error_rate": error_rate,
+                "ewma_ms": ewma * 1e3 if ewma is not None else None,
+                "p50_ms": _ms(percentiles[0.5]),
+                "p95_ms": _ms(percentiles[0.95]),
+                "p99_ms": _ms(percentiles[0.99]),
+            }
+        return result
+
+    def reset(self) -> None:
+        """Descarta as estatísticas."""
+        with self._lock:
+            self._providers.clear()
+
+
+def _quantil(latencies: List[float], q: float) -> Optional[float]:
+    """Quantil de latências já ordenadas (None com menos de MIN_SAMPLES)."""
+    if len(latencies) < MIN_SAMPLES:
+        return None
+    return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return seconds * 1e3 if seconds is not None else None
+
+
+_default_stats = ProviderStats()
+
+
+def default_provider_stats() -> ProviderStats:
+    """Estatísticas padrão dos clientes, compartilhadas pelo processo."""
+    return _default_stats
@@ -0,0 +1,269 @@
+"""
+Rate Limit Compartilhado por Provedor (Token Bucket em SQLite)
+
+As APIs públicas de consulta limitam as requisições por IP (3 por minuto),
+então o limite precisa valer para o host inteiro: todas as instâncias de
+ReceitaFederalAPI, todas as threads e todos os processos (workers do
+uvicorn, scripts em paralelo).
+
+- Um balde de fichas por provedor (brasilapi, receitaws...), com
+  capacidade para rajadas e reposição contínua
+- Estado em um banco SQLite; BEGIN IMMEDIATE serializa as reservas entre
+  processos e um lock, entre threads
+- reserve() devolve na hora a espera até a vez do chamador (a ficha fica
+  reservada), para quem dorme com time.sleep ou asyncio.sleep; reservas
+  seguintes entram na fila atrás
+- expected_wait() informa a espera estimada sem reservar
+
+Sem rate_limiter explícito, os clientes usam default_limiter(): um
+limitador por processo sobre o arquivo CNPJ_RATE_LIMIT_PATH (ou
+cnpj_validator_rate_limit_<usuário>.sqlite3 no diretório temporário),
+compartilhado por todos os processos do usuário no host.
+
+Uso:
+    limiter = SharedRateLimiter("limites.sqlite3", limits={"brasilapi": (3, 60.0)})
+    limiter.expected_wait("brasilapi")   # 0.0
+    limiter.acquire("brasilapi")         # dorme até a vez, se preciso
+"""
+
+from __future__ import annotations
+
+import getpass
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (requisições, período em segundos): capacidade do balde e ritmo de reposição
+Limit = Tuple[float, float]
+
+# Limites das APIs públicas (3 requisições por minuto)
+DEFAULT_LIMITS: Dict[str, Limit] = {
+    "brasilapi": (3, 60.0),
+    "receitaws": (3, 60.0),
+}
+# Provedores ausentes de limits
+DEFAULT_LIMIT: Limit = (3, 60.0)
+
+
+def _user_tag() -> str:
+    """Identifica o usuário no nome do arquivo padrão (o diretório temporário é comum)."""
+    if hasattr(os, "getuid"):
+        return str(os.getuid())
+    try:
+        return getpass.getuser()
+    except Exception:
+        return "default"
+
+
+DEFAULT_PATH = os.path.join(
+    tempfile.gettempdir(), f"cnpj_validator_rate_limit_{_user_tag()}.sqlite3"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    provider TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+class SharedRateLimiter:
+    """
+    Token bucket por provedor, compartilhado entre threads e processos.
+
+    Args:
+        path: Arquivo do banco, compartilhado pelos processos do host
+            (':memory:' limita apenas as threads deste limitador)
+        limits: (requisições, período em segundos) por provedor; padrão
+            DEFAULT_LIMITS. None em um provedor desativa o limite dele
+        default_limit: Limite dos provedores ausentes de limits (None: sem limite)
+        clock: Relógio em segundos, comum aos processos (padrão time.time)
+
+    Raises:
+        ValueError: Se algum limite não for positivo
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        limits: Optional[Mapping[str, Optional[Limit]]] = None,
+        default_limit: Optional[Limit] = DEFAULT_LIMIT,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        for limit in [default_limit, *self.limits.values()]:
+            if limit is not None and (limit[0] <= 0 or limit[1] <= 0):
+                raise ValueError("Limites devem ter requisições e período positivos")
+        self.path = path
+        self.default_limit = default_limit
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+
+    def limit_for(self, provider: str) -> Optional[Limit]:
+        """
+        Limite de um provedor.
+
+        Args:
+            provider: Nome do provedor (chave de ReceitaFederalAPI.APIS)
+
+        Returns:
+            (requisições, período em segundos), ou None se sem limite
+        """
+        return self.limits.get(provider, self.default_limit)
+
+    def _refill(self, provider: str, limit: Limit, now: float) -> float:
+        """Fichas disponíveis agora (negativas: reservas à frente na fila)."""
+        capacity, period = limit
+        row = self._connection.execute(
+            "SELECT tokens, updated_at FROM buckets WHERE provider = ?", (provider,)
+        ).fetchone()
+        if row is None:
+            return float(capacity)
+        tokens, updated_at = row
+        return min(float(capacity), tokens + max(0.0, now - updated_at) * capacity / period)
+
+    def reserve(self, provider: str) -> float:
+        """
+        Reserva uma requisição ao provedor.
+
+        Args:
+            provider: Nome do provedor
+
+        Returns:
+            Segundos a aguardar antes de fazer a requisição (0.0 = já)
+        """
+        limit = self.limit_for(provider)
+        if limit is None:
+            return 0.0
+        capacity, period = limit
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                now = self.clock()
+                tokens = self._refill(provider, limit, now) - 1.0
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO buckets (provider, tokens, updated_at) "
+                    "VALUES (?, ?, ?)",
+                    (provider, tokens, now),
+                )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        return max(0.0, -tokens * period / capacity)
+
+    def acquire(self, provider: str) -> float:
+        """
+        Reserva uma requisição e dorme até a vez do chamador.
+
+        Args:
+            provider: Nome do provedor
+
+        Returns:
+            Segundos aguardados
+        """
+        wait_time = self.reserve(provider)
+        if wait_time > 0:
+            logger.debug(f"Rate limit {provider}: aguardando {wait_time:.1f}s")
+            time.sleep(wait_time)
+        return wait_time
+
+    def expected_wait(self, provider: str) -> float:
+        """
+        Espera estimada de uma requisição feita agora, sem reservá-la.
+
+        Args:
+            provider: Nome do provedor
+
+        Returns:
+            Segundos até haver uma ficha livre (0.0 = imediata)
+        """
+        limit = self.limit_for(provider)
+        if limit is None:
+            return 0.0
+        capacity, period = limit
+        with self._lock:
+            tokens = self._refill(provider, limit, self.clock())
+        return max(0.0, (1.0 - tokens) * period / capacity)
+
+    def reset(self, provider: Optional[str] = None) -> None:
+        """Enche o balde de um provedor (ou de todos)."""
+        with self._lock:
+            if provider is None:
+                self._connection.execute("DELETE FROM buckets")
+            else:
+                self._connection.execute("DELETE FROM buckets WHERE provider = ?", (provider,))
+
+    def _check_writable(self) -> None:
+        """
+        Faz uma escrita de teste (desfeita) no banco.
+
+        Um arquivo de outro usuário abre e aceita o CREATE TABLE IF NOT
+        EXISTS, mas falha na primeira escrita de reserve().
+
+        Raises:
+            sqlite3.Error: Se o banco não aceitar escrita
+        """
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute("DELETE FROM buckets WHERE provider = ''")
+            finally:
+                self._connection.execute("ROLLBACK")
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._connection.close()
+
+
+_default_limiter: Optional[SharedRateLimiter] = None
+_default_pid: Optional[int] = None
+_default_lock = threading.Lock()
+
+
+def default_limiter() -> SharedRateLimiter:
+    """
+    Limitador padrão dos clientes, compartilhado pelos processos do usuário no host.
+
+    Usa o arquivo CNPJ_RATE_LIMIT_PATH (padrão DEFAULT_PATH, um por
+    usuário); se ele não puder ser aberto ou não aceitar escrita, cai para
+    um limitador em memória, válido só para este processo. Recriado após
+    fork (conexões SQLite não atravessam fork).
+
+    Returns:
+        SharedRateLimiter do processo
+    """
+    global _default_limiter, _default_pid
+    with _default_lock:
+        if _default_limiter is None or _default_pid != os.getpid():
+            path = os.environ.get("CNPJ_RATE_LIMIT_PATH", DEFAULT_PATH)
+            limiter = None
+            try:
+                limiter = SharedRateLimiter(path)
+                limiter._check_writable()
+                _default_limiter = limiter
+            except sqlite3.Error as e:
+                if limiter is not None:
+                    limiter.close()
+                logger.warning(
+                    f"Rate limit compartilhado indisponível em {path} ({e}); "
+                    "usando limite apenas deste processo"
+                )
+                _default_limiter = SharedRateLimiter()
+            _default_pid = os.getpid()
+        return _default_limiter
@@ -7,16 +7,36 @@ from __future__ import annotations
 
 import time
 import logging
+import threading
 from dataclasses import dataclass, field
-from typing import Optional
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from typing import (
+    TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union,
+)
+import http.client
 import json
-import ssl
+import queue
+import socket
+import weakref
+
+from .connection_pool import DEFAULT_POOL_SIZE, HTTPConnectionPool, RequestHandle
+from .provider_stats import ProviderStats, default_provider_stats
+from .rate_limit import SharedRateLimiter, default_limiter
+
+if TYPE_CHECKING:
+    from .prefilter import BloomFilter
+    from .response_cache import SQLiteResponseCache
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
+# Percentil da latência do provedor principal que dispara o hedge
+HEDGE_QUANTILE = 0.95
+
+# Atualizações em segundo plano em andamento, por cache e CNPJ: a deduplicação vale
+# para todos os clientes do mesmo cache (as rotas da API criam um por requisição)
+_atualizacoes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_atualizacoes_lock = threading.Lock()
+
 
 @dataclass
 class CNPJData:
@@ -142,9 +162,17 @@ class ReceitaFederalAPI:
     A BrasilAPI agrega dados de múltiplas fontes oficiais.
 
     Limites:
-        - Rate limit: 3 requisições por minuto (API pública)
+        - Rate limit: 3 requisições por minuto por provedor (API pública),
+          compartilhado por todos os clientes do host (ver rate_limit)
         - Timeout: 30 segundos por requisição
 
+    Roteamento:
+        Cada consulta começa pelo provedor com a menor latência esperada
+        (ver provider_stats), somada à espera do rate limit; api_preferida
+        desempata. Com hedge=True, se o provedor escolhido não responder
+        até o próprio p95, o seguinte também é consultado e vale a
+        primeira resposta.
+
     Example:
         >>> api = ReceitaFederalAPI()
         >>> dados = api.consultar("11222333000181")
@@ -164,6 +192,13 @@ class ReceitaFederalAPI:
         timeout: int = 30,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        prefilter: Optional[BloomFilter] = None,
+        cache: Optional[SQLiteResponseCache] = None,
+        rate_limiter: Optional[SharedRateLimiter] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        provider_stats: Optional[ProviderStats] = None,
+        adaptive_routing: bool = True,
+        hedge: bool = False,
     ):
         """
         Inicializa o cliente da API.
@@ -173,13 +208,41 @@ class ReceitaFederalAPI:
             timeout: Timeout em segundos para requisições
             max_retries: Número máximo de tentativas em caso de erro
             retry_delay: Delay entre tentativas em segundos
+            prefilter: Filtro de CNPJs registrados (BloomFilter); CNPJs
+                ausentes dele são dados como não encontrados sem requisição
+            cache: Cache de consultas (SQLiteResponseCache ou objeto com
+                get/set); entradas vencidas são servidas e atualizadas em
+                segundo plano
+            rate_limiter: Limitador por provedor; padrão default_limiter(),
+                compartilhado entre instâncias, threads e processos do host
+            pool_size: Conexões keep-alive mantidas abertas por host
+            provider_stats: Latências e erros por provedor; padrão
+                default_provider_stats(), compartilhado pelo processo
+            adaptive_routing: Ordenar os provedores pela latência esperada
+                (False: api_preferida e depois a ordem de APIS)
+            hedge: Consultar também o segundo provedor quando o primeiro
+                passar do próprio p95 sem responder
         """
         self.api_preferida = api_preferida
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._last_request_time: float = 0.0
-        self._min_interval: float = 20.0  # 3 req/min = 1 req a cada 20s
+        self.prefilter = prefilter
+        self.cache = cache
+        self.cache_refreshes = 0
+        self.cache_refresh_errors = 0
+        self._refreshing: dict = {}
+        self._refresh_lock = threading.Lock()
+        self.rate_limiter = rate_limiter
+        self.pool_size = pool_size
+        self._pool: Optional[HTTPConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self.provider_stats = provider_stats
+        self.adaptive_routing = adaptive_routing
+        self.hedge = hedge
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._hedge_lock = threading.Lock()
 
     def _limpar_cnpj(self, cnpj: str) -> str:
         """
@@ -230,21 +293,60 @@ class ReceitaFederalAPI:
 
         return True
 
-    def _respeitar_rate_limit(self) -> None:
-        """Garante que o rate limit seja respeitado."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_interval:
-            wait_time = self._min_interval - elapsed
-            logger.debug(f"Rate limit: aguardando {wait_time:.1f}s")
-            time.sleep(wait_time)
-        self._last_request_time = time.time()
+    def _limitador(self) -> SharedRateLimiter:
+        """Limitador em uso: o informado na criação ou o compartilhado do host."""
+        return self.rate_limiter if self.rate_limiter is not None else default_limiter()
+
+    def _respeitar_rate_limit(self, api_name: str) -> None:
+        """Garante que o rate limit do provedor seja respeitado."""
+        self._limitador().acquire(api_name)
+
+    def tempo_espera_estimado(self, api_name: Optional[str] = None) -> float:
+        """
+        Espera estimada pelo rate limit antes de uma requisição feita agora.
+
+        Args:
+            api_name: Provedor (padrão: api_preferida)
+
+        Returns:
+            Segundos até o provedor aceitar uma nova requisição
+        """
+        return self._limitador().expected_wait(api_name or self.api_preferida)
+
+    def _estatisticas(self) -> ProviderStats:
+        """Estatísticas em uso: as informadas na criação ou as do processo."""
+        return self.provider_stats if self.provider_stats is not None else default_provider_stats()
+
+    def routing_stats(self) -> dict:
+        """
+        Estatísticas do roteamento entre provedores.
+
+        Returns:
+            providers (ver ProviderStats.snapshot), hedges (requisições de
+            hedge enviadas) e hedge_wins (hedges que responderam primeiro)
+        """
+        with self._hedge_lock:
+            hedges, hedge_wins = self.hedges, self.hedge_wins
+        return {
+            'providers': self._estatisticas().snapshot(),
+            'hedges': hedges,
+            'hedge_wins': hedge_wins,
+        }
 
-    def _fazer_requisicao(self, url: str) -> dict:
+    def _conexoes(self) -> HTTPConnectionPool:
+        """Pool de conexões do cliente, criado na primeira requisição."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = HTTPConnectionPool(self.pool_size, self.timeout)
+            return self._pool
+
+    def _fazer_requisicao(self, url: str, handle: Optional[RequestHandle] = None) -> dict:
         """
-        Faz requisição HTTP para a API.
+        Faz requisição HTTP para a API, reaproveitando conexões keep-alive.
 
         Args:
             url: URL completa da API
+            handle: RequestHandle para abortar a requisição de outra thread
 
         Returns:
             Dados JSON da resposta
@@ -252,53 +354,53 @@ class ReceitaFederalAPI:
         Raises:
             ReceitaFederalAPIError: Em caso de erro na requisição
         """
-        # Criar contexto SSL que ignora verificação (algumas APIs têm certificados problemáticos)
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-
-        headers = {
-            "User-Agent": "CNPJ-Validator/1.0 (Python)",
-            "Accept": "application/json",
-        }
-
-        request = Request(url, headers=headers)
+        try:
+            response = self._conexoes().get(url, handle=handle)
+        except socket.timeout:
+            raise ReceitaFederalAPIError(f"Timeout após {self.timeout} segundos")
+        except (OSError, http.client.HTTPException) as e:
+            raise ReceitaFederalAPIError(f"Erro de conexão: {e}")
 
+        data = response.body.decode("utf-8", errors="replace")
+        if response.status >= 400:
+            raise self._erro_http(response.status, response.reason, data)
         try:
-            with urlopen(request, timeout=self.timeout, context=ctx) as response:
-                data = response.read().decode("utf-8")
-                return json.loads(data)
-        except HTTPError as e:
-            error_body = ""
-            try:
-                error_body = e.read().decode("utf-8")
-            except Exception:
-                pass
-
-            if e.code == 404:
-                raise ReceitaFederalAPIError(
-                    "CNPJ não encontrado na base da Receita Federal",
-                    status_code=404,
-                    response=error_body,
-                )
-            elif e.code == 429:
-                raise ReceitaFederalAPIError(
-                    "Rate limit excedido. Aguarde antes de fazer nova consulta.",
-                    status_code=429,
-                    response=error_body,
-                )
-            else:
-                raise ReceitaFederalAPIError(
-                    f"Erro HTTP {e.code}: {e.reason}",
-                    status_code=e.code,
-                    response=error_body,
-                )
-        except URLError as e:
-            raise ReceitaFederalAPIError(f"Erro de conexão: {e.reason}")
+            return json.loads(data)
         except json.JSONDecodeError as e:
             raise ReceitaFederalAPIError(f"Erro ao decodificar resposta JSON: {e}")
-        except TimeoutError:
-            raise ReceitaFederalAPIError(f"Timeout após {self.timeout} segundos")
+
+    def close(self) -> None:
+        """Fecha as conexões mantidas abertas pelo cliente."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+
+    def __enter__(self) -> ReceitaFederalAPI:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _erro_http(self, code: int, reason: str, body: str = "") -> ReceitaFederalAPIError:
+        """Converte uma resposta HTTP de erro em ReceitaFederalAPIError."""
+        if code == 404:
+            return ReceitaFederalAPIError(
+                "CNPJ não encontrado na base da Receita Federal",
+                status_code=404,
+                response=body,
+            )
+        elif code == 429:
+            return ReceitaFederalAPIError(
+                "Rate limit excedido. Aguarde antes de fazer nova consulta.",
+                status_code=429,
+                response=body,
+            )
+        return ReceitaFederalAPIError(
+            f"Erro HTTP {code}: {reason}",
+            status_code=code,
+            response=body,
+        )
 
     def _parse_brasilapi(self, data: dict) -> CNPJData:
         """Parse dos dados da BrasilAPI."""
@@ -446,11 +548,45 @@ class ReceitaFederalAPI:
             >>> dados = api.consultar("11.222.333/0001-81")
             >>> print(dados.razao_social)
         """
+        cnpj_limpo, cnpj_numerico = self._preparar_consulta(cnpj)
+
+        if self.cache is not None:
+            entry = self.cache.get(cnpj_numerico)
+            if entry is not None:
+                if entry.stale:
+                    self._agendar_atualizacao(cnpj_limpo, cnpj_numerico, usar_fallback)
+                return entry.dados
+
+        dados = self._consultar_apis(cnpj_limpo, cnpj_numerico, usar_fallback)
+        if self.cache is not None:
+            self.cache.set(cnpj_numerico, dados)
+        return dados
+
+    def _preparar_consulta(self, cnpj: str) -> Tuple[str, str]:
+        """
+        Valida o CNPJ e aplica o pré-filtro antes de qualquer requisição.
+
+        Returns:
+            Tupla (CNPJ limpo, CNPJ numérico)
+
+        Raises:
+            ValueError: Se o CNPJ for inválido
+            ReceitaFederalAPIError: Se o CNPJ estiver ausente do pré-filtro (404)
+                ou for alfanumérico (501)
+        """
         cnpj_limpo = self._limpar_cnpj(cnpj)
 
         if not self._validar_cnpj_basico(cnpj_limpo):
             raise ValueError(f"CNPJ inválido: {cnpj}")
 
+        # Pré-filtro local: ausente do filtro = certamente não registrado
+        # (sem gastar requisição)
+        if self.prefilter is not None and cnpj_limpo not in self.prefilter:
+            raise ReceitaFederalAPIError(
+                "CNPJ não encontrado na base da Receita Federal",
+                status_code=404,
+            )
+
         # Verificar se é alfanumérico
         is_alphanumeric = self._is_alphanumeric_cnpj(cnpj_limpo)
         if is_alphanumeric:
@@ -462,65 +598,152 @@ class ReceitaFederalAPI:
             )
 
         # Para consulta, usar apenas a parte numérica
-        cnpj_numerico = self._limpar_cnpj_numerico(cnpj)
+        return cnpj_limpo, self._limpar_cnpj_numerico(cnpj)
 
-        # Lista de APIs para tentar
-        apis_para_tentar = [self.api_preferida]
-        if usar_fallback:
-            apis_para_tentar.extend(
-                api for api in self.APIS.keys() if api != self.api_preferida
+    def consultar_many(
+        self,
+        cnpjs: Iterable[str],
+        concurrency: Optional[int] = None,
+        providers: Optional[Sequence[str]] = None,
+        progress: Optional[Callable[[int, int], Any]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Iterator[Tuple[str, Union[CNPJData, Exception]]]:
+        """
+        Consulta um lote de CNPJs distribuindo as requisições entre todos os provedores.
+
+        Cada provedor trabalha dentro da própria cota do rate limiter, e a
+        vazão do lote é a soma delas. CNPJs com erro voltam à fila e podem
+        ser atendidos por outro provedor.
+
+        Args:
+            cnpjs: CNPJs com ou sem formatação
+            concurrency: Requisições simultâneas (padrão: 2 por provedor)
+            providers: Provedores usados (padrão: todos de APIS)
+            progress: Chamado como progress(concluídos, total) a cada resultado
+            cancel: Evento que, quando sinalizado, encerra o lote
+
+        Yields:
+            (cnpj como informado, CNPJData ou exceção), na ordem de conclusão
+
+        Example:
+            >>> for cnpj, resultado in api.consultar_many(cnpjs, progress=print):
+            ...     if not isinstance(resultado, Exception):
+            ...         print(cnpj, resultado.situacao_cadastral)
+        """
+        from .bulk_lookup import consultar_many
+        return consultar_many(self, cnpjs, concurrency, providers, progress, cancel)
+
+    def _atualizacoes_em_andamento(self) -> dict:
+        """
+        Atualizações em andamento do cache do cliente, por CNPJ (chamar com
+        _atualizacoes_lock). Compartilhadas entre os clientes do mesmo cache.
+        """
+        try:
+            return _atualizacoes.setdefault(self.cache, {})
+        except TypeError:
+            # Cache sem suporte a weakref: deduplicação só dentro do cliente
+            return self._refreshing
+
+    def _agendar_atualizacao(
+        self, cnpj_limpo: str, cnpj_numerico: str, usar_fallback: bool
+    ) -> None:
+        """Atualiza em segundo plano uma entrada vencida do cache (uma vez por CNPJ e cache)."""
+        with _atualizacoes_lock:
+            em_andamento = self._atualizacoes_em_andamento()
+            if cnpj_numerico in em_andamento:
+                return
+            thread = threading.Thread(
+                target=self._atualizar_cache,
+                args=(cnpj_limpo, cnpj_numerico, usar_fallback),
+                name=f"cnpj-refresh-{cnpj_numerico}",
+                daemon=True,
             )
+            em_andamento[cnpj_numerico] = thread
+        thread.start()
 
-        last_error: Optional[Exception] = None
+    def _atualizar_cache(self, cnpj_limpo: str, cnpj_numerico: str, usar_fallback: bool) -> None:
+        """Executado na thread de atualização: consulta a API e regrava o cache."""
+        try:
+            dados = self._consultar_apis(cnpj_limpo, cnpj_numerico, usar_fallback)
+            self.cache.set(cnpj_numerico, dados)
+            with self._refresh_lock:
+                self.cache_refreshes += 1
+        except Exception as e:
+            # A entrada vencida continua servida até sair da janela stale_ttl
+            logger.warning(f"Falha ao atualizar o cache do CNPJ {cnpj_limpo}: {e}")
+            with self._refresh_lock:
+                self.cache_refresh_errors += 1
+        finally:
+            with _atualizacoes_lock:
+                self._atualizacoes_em_andamento().pop(cnpj_numerico, None)
+
+    def aguardar_atualizacoes(self, timeout: Optional[float] = None) -> None:
+        """
+        Aguarda as atualizações em segundo plano em andamento no cache do cliente.
 
-        for api_name in apis_para_tentar:
-            if api_name not in self.APIS:
-                continue
+        Args:
+            timeout: Tempo máximo de espera por atualização, em segundos
+        """
+        if self.cache is None:
+            return
+        with _atualizacoes_lock:
+            threads = [
+                thread for thread in self._atualizacoes_em_andamento().values()
+                if isinstance(thread, threading.Thread)
+            ]
+        for thread in threads:
+            thread.join(timeout)
+
+    def cache_stats(self) -> Optional[dict]:
+        """
+        Estatísticas do cache de consultas.
 
-            url = self.APIS[api_name].format(cnpj=cnpj_numerico)
+        Returns:
+            Estatísticas do cache (ver SQLiteResponseCache.stats), com
+            refreshes e refresh_errors das atualizações em segundo plano;
+            None se o cliente não tiver cache
+        """
+        if self.cache is None:
+            return None
+        stats = dict(self.cache.stats()) if hasattr(self.cache, "stats") else {}
+        with self._refresh_lock:
+            stats["refreshes"] = self.cache_refreshes
+            stats["refresh_errors"] = self.cache_refresh_errors
+        return stats
+
+    def _consultar_apis(self, cnpj_limpo: str, cnpj_numerico: str, usar_fallback: bool) -> CNPJData:
+        """
+        Consulta as APIs externas, com fallback entre provedores e novas tentativas.
 
+        Raises:
+            ReceitaFederalAPIError: Se todas as APIs falharem
+        """
+        last_error: Optional[Exception] = None
+        urls = self._urls_para_tentar(cnpj_numerico, usar_fallback)
+
+        if self.hedge and len(urls) > 1:
+            dados = self._consultar_com_hedge(cnpj_limpo, urls[0], urls[1])
+            if dados is not None:
+                return dados
+
+        for api_name, url in urls:
             for attempt in range(self.max_retries):
+                # Erro do limitador (ex.: banco somente leitura) não é falha do provedor
+                self._respeitar_rate_limit(api_name)
                 try:
-                    self._respeitar_rate_limit()
                     logger.info(
                         f"Consultando CNPJ {cnpj_limpo} via {api_name} (tentativa {attempt + 1})")
 
-                    data = self._fazer_requisicao(url)
-
-                    # Verificar se a API retornou erro
-                    if data.get("status") == "ERROR" or data.get("message"):
-                        raise ReceitaFederalAPIError(
-                            data.get("message", "Erro desconhecido na API")
-                        )
+                    return self._requisitar(api_name, url)
 
-                    # Parse baseado na API
-                    if api_name == "brasilapi":
-                        return self._parse_brasilapi(data)
-                    elif api_name == "receitaws":
-                        return self._parse_receitaws(data)
-                    else:
-                        # Parser genérico
-                        return self._parse_brasilapi(data)
-
-                except ReceitaFederalAPIError as e:
+                except Exception as e:
                     last_error = e
-                    if e.status_code == 404:
+                    if isinstance(e, ReceitaFederalAPIError) and e.status_code == 404:
                         # CNPJ não encontrado - não adianta tentar novamente
                         raise
-                    elif e.status_code == 429:
-                        # Rate limit - esperar mais
-                        wait_time = self.retry_delay * (attempt + 1) * 5
-                        logger.warning(f"Rate limit atingido, aguardando {wait_time}s")
+                    wait_time = self._espera_apos_erro(api_name, e, attempt)
+                    if wait_time:
                         time.sleep(wait_time)
-                    else:
-                        # Outros erros - tentar novamente após delay
-                        if attempt < self.max_retries - 1:
-                            time.sleep(self.retry_delay * (attempt + 1))
-                except Exception as e:
-                    last_error = e
-                    logger.warning(f"Erro na tentativa {attempt + 1} com {api_name}: {e}")
-                    if attempt < self.max_retries - 1:
-                        time.sleep(self.retry_delay * (attempt + 1))
 
             logger.warning(f"Todas as tentativas com {api_name} falharam")
 
@@ -529,6 +752,157 @@ class ReceitaFederalAPI:
             raise last_error
         raise ReceitaFederalAPIError("Não foi possível consultar o CNPJ em nenhuma API")
 
+    def _consultar_com_hedge(
+        self, cnpj_limpo: str, principal: Tuple[str, str], reserva: Tuple[str, str]
+    ) -> Optional[CNPJData]:
+        """
+        Consulta o provedor principal e, se ele passar do próprio p95 sem
+        responder, também o reserva; vale a primeira resposta válida.
+
+        Com a primeira resposta, a requisição mais lenta é abortada
+        (RequestHandle derruba o socket): a thread termina na hora, a
+        conexão não volta ao pool e o aborto não conta como erro do provedor.
+
+        Returns:
+            CNPJData, ou None se o principal ainda não tem p95 ou se nenhuma
+            das requisições teve sucesso (a consulta segue o fluxo normal)
+
+        Raises:
+            ReceitaFederalAPIError: CNPJ não encontrado (404 é definitivo)
+        """
+        resultados: queue.Queue = queue.Queue()
+        handles: List[RequestHandle] = []
+
+        def executar(api_name: str, url: str, handle: RequestHandle) -> None:
+            try:
+                resultados.put((api_name, self._requisitar(api_name, url, handle)))
+            except Exception as e:
+                resultados.put((api_name, e))
+
+        def iniciar(api_name: str, url: str) -> None:
+            handle = RequestHandle()
+            handles.append(handle)
+            threading.Thread(
+                target=executar, args=(api_name, url, handle),
+                name=f"cnpj-hedge-{api_name}-{cnpj_limpo}", daemon=True,
+            ).start()
+
+        prazo = self._estatisticas().percentile(principal[0], HEDGE_QUANTILE)
+        if prazo is None:
+            # Poucas amostras para um p95: consulta normal
+            return None
+        self._respeitar_rate_limit(principal[0])
+        logger.info(f"Consultando CNPJ {cnpj_limpo} via {principal[0]}")
+        iniciar(*principal)
+        em_andamento = 1
+        hedge_enviado = False
+        try:
+            api_name, resultado = resultados.get(timeout=prazo)
+        except queue.Empty:
+            # Sem hedge se o reserva estiver sem cota: a espera anularia o ganho
+            if self._limitador().expected_wait(reserva[0]) == 0:
+                self._respeitar_rate_limit(reserva[0])
+                logger.info(
+                    f"Hedge do CNPJ {cnpj_limpo} via {reserva[0]} ({principal[0]} passou do p95)"
+                )
+                iniciar(*reserva)
+                em_andamento += 1
+                hedge_enviado = True
+                with self._hedge_lock:
+                    self.hedges += 1
+            api_name, resultado = resultados.get()
+
+        try:
+            while True:
+                em_andamento -= 1
+                if isinstance(resultado, CNPJData):
+                    if hedge_enviado and api_name == reserva[0]:
+                        with self._hedge_lock:
+                            self.hedge_wins += 1
+                    return resultado
+                if isinstance(resultado, ReceitaFederalAPIError) and resultado.status_code == 404:
+                    raise resultado
+                logger.warning(f"Erro na consulta com {api_name}: {resultado}")
+                if not em_andamento:
+                    return None
+                api_name, resultado = resultados.get()
+        finally:
+            # Aborta a requisição que ainda estiver em andamento
+            for handle in handles:
+                handle.abort()
+
+    def _requisitar(
+        self, api_name: str, url: str, handle: Optional[RequestHandle] = None
+    ) -> CNPJData:
+        """Faz a requisição ao provedor, registrando latência e resultado nas estatísticas."""
+        inicio = time.perf_counter()
+        try:
+            data = self._fazer_requisicao(url, handle=handle)
+        except Exception as e:
+            if handle is not None and handle.aborted:
+                # Perdeu o hedge: não é falha do provedor
+                raise
+            # 404 é uma resposta válida do provedor; os demais erros contam na taxa de erro
+            nao_encontrado = isinstance(e, ReceitaFederalAPIError) and e.status_code == 404
+            self._estatisticas().record(api_name, time.perf_counter() - inicio, ok=nao_encontrado)
+            raise
+        self._estatisticas().record(api_name, time.perf_counter() - inicio)
+        return self._interpretar(api_name, data)
+
+    def _urls_para_tentar(self, cnpj_numerico: str, usar_fallback: bool) -> List[Tuple[str, str]]:
+        """
+        Pares (API, URL) na ordem de tentativa: a preferida e, com fallback,
+        as demais; com adaptive_routing, da menor à maior latência esperada.
+        """
+        apis_para_tentar = [self.api_preferida]
+        if usar_fallback:
+            apis_para_tentar.extend(
+                api for api in self.APIS.keys() if api != self.api_preferida
+            )
+        apis_para_tentar = [api_name for api_name in apis_para_tentar if api_name in self.APIS]
+        if self.adaptive_routing and len(apis_para_tentar) > 1:
+            apis_para_tentar = self._estatisticas().ranking(
+                apis_para_tentar, self._limitador().expected_wait
+            )
+        return [
+            (api_name, self.APIS[api_name].format(cnpj=cnpj_numerico))
+            for api_name in apis_para_tentar
+        ]
+
+    def _interpretar(self, api_name: str, data: dict) -> CNPJData:
+        """
+        Converte a resposta JSON de uma API em CNPJData.
+
+        Raises:
+            ReceitaFederalAPIError: Se a API retornou erro no corpo da resposta
+        """
+        # Verificar se a API retornou erro
+        if data.get("status") == "ERROR" or data.get("message"):
+            raise ReceitaFederalAPIError(
+                data.get("message", "Erro desconhecido na API")
+            )
+
+        # Parse baseado na API
+        if api_name == "receitaws":
+            return self._parse_receitaws(data)
+        # BrasilAPI e parser genérico
+        return self._parse_brasilapi(data)
+
+    def _espera_apos_erro(self, api_name: str, erro: Exception, attempt: int) -> float:
+        """Segundos de espera antes da próxima tentativa após um erro (0 = não esperar)."""
+        if isinstance(erro, ReceitaFederalAPIError):
+            if erro.status_code == 429:
+                # Rate limit - esperar mais
+                wait_time = self.retry_delay * (attempt + 1) * 5
+                logger.warning(f"Rate limit atingido, aguardando {wait_time}s")
+                return wait_time
+        else:
+            logger.warning(f"Erro na tentativa {attempt + 1} com {api_name}: {erro}")
+        # Outros erros - tentar novamente após delay
+        if attempt < self.max_retries - 1:
+            return self.retry_delay * (attempt + 1)
+        return 0.0
+
     def verificar_situacao(self, cnpj: str) -> dict:
         """
         Verifica apenas a situação cadastral do CNPJ.
@@ -0,0 +1,251 @@
+"""
+Cache Persistente de Consultas à Receita Federal (SQLite)
+
+Dados cadastrais mudam pouco, mas cada consulta à API externa custa uma
+requisição limitada (3 por minuto na API pública). Este cache guarda em
+disco, por CNPJ numérico, o CNPJData interpretado e o payload bruto da
+API, e é usado por ReceitaFederalAPI(cache=...).
+
+- Validade (TTL) por situação cadastral: empresas baixadas ou nulas
+  quase não mudam; as ativas mudam com mais frequência
+- Stale-while-revalidate: depois do TTL, a entrada ainda é servida na
+  hora durante stale_ttl segundos, enquanto o cliente a atualiza em
+  segundo plano; depois disso, vira falta
+- Seguro entre threads (uma conexão com lock) e entre processos (modo WAL)
+- Estatísticas de acertos, acertos vencidos e faltas
+
+Qualquer objeto com get(cnpj) -> Optional[CacheEntry] e set(cnpj, dados)
+pode substituir o SQLiteResponseCache no cliente.
+
+Uso:
+    cache = SQLiteResponseCache("consultas.sqlite3")
+    api = ReceitaFederalAPI(cache=cache)
+    api.consultar("11.222.333/0001-81")   # rede
+    api.consultar("11.222.333/0001-81")   # disco, em milissegundos
+    api.cache_stats()
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Optional
+
+from .receita_federal_api import CNPJData
+
+DAY = 24 * 60 * 60
+
+# Validade por situação cadastral (segundos)
+DEFAULT_TTLS: Dict[str, float] = {
+    "ATIVA": 7 * DAY,
+    "SUSPENSA": 30 * DAY,
+    "INAPTA": 30 * DAY,
+    "BAIXADA": 365 * DAY,
+    "NULA": 365 * DAY,
+}
+# Situação ausente de ttls
+DEFAULT_TTL = 1 * DAY
+# Janela, após o TTL, em que a entrada vencida ainda é servida
+DEFAULT_STALE_TTL = 30 * DAY
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS consultas (
+    cnpj TEXT PRIMARY KEY,
+    situacao TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    dados TEXT NOT NULL,
+    raw TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """
+    Entrada do cache de consultas.
+
+    Attributes:
+        dados: CNPJData armazenado (com raw_data)
+        fetched_at: Momento da consulta à API (time.time())
+        stale: Se o TTL já venceu (servir e atualizar em segundo plano)
+    """
+
+    dados: CNPJData
+    fetched_at: float
+    stale: bool
+
+
+class SQLiteResponseCache:
+    """
+    Cache de CNPJData em SQLite, com TTL por situação cadastral.
+
+    Args:
+        path: Arquivo do banco (':memory:' para cache apenas em memória)
+        ttls: Validade em segundos por situação cadastral (maiúsculas);
+            padrão DEFAULT_TTLS
+        default_ttl: Validade para situações ausentes de ttls
+        stale_ttl: Segundos, após o TTL, em que a entrada vencida ainda é servida
+        clock: Relógio em segundos (padrão time.time; substituível em testes)
+
+    Raises:
+        ValueError: Se algum TTL for negativo
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        stale_ttl: float = DEFAULT_STALE_TTL,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttls = {situacao.upper(): ttl for situacao, ttl in (ttls or DEFAULT_TTLS).items()}
+        if min([default_ttl, stale_ttl, *self.ttls.values()]) < 0:
+            raise ValueError("TTLs devem ser maiores ou iguais a zero")
+        self.path = path
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.clock = clock
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        if path != ":memory:":
+            # WAL: leitores de outros processos não bloqueiam a escrita
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+
+    def ttl_for(self, situacao: str) -> float:
+        """
+        Validade de uma entrada pela situação cadastral.
+
+        Args:
+            situacao: Situação cadastral (ATIVA, BAIXADA...)
+
+        Returns:
+            TTL em segundos
+        """
+        return self.ttls.get((situacao or "").upper(), self.default_ttl)
+
+    def get(self, cnpj: str) -> Optional[CacheEntry]:
+        """
+        Busca a consulta de um CNPJ.
+
+        Args:
+            cnpj: CNPJ numérico (14 dígitos, sem formatação)
+
+        Returns:
+            CacheEntry (stale=True se o TTL venceu, mas ainda na janela
+            stale_ttl), ou None se ausente ou vencida além da janela
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT situacao, fetched_at, dados, raw FROM consultas WHERE cnpj = ?", (cnpj,)
+            ).fetchone()
+            age = self.clock() - row[1] if row else 0.0
+            ttl = self.ttl_for(row[0]) if row else 0.0
+            if row is None or age >= ttl + self.stale_ttl:
+                self.misses += 1
+                return None
+            stale = age >= ttl
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+
+        situacao, fetched_at, dados, raw = row
+        consulta = CNPJData(**json.loads(dados), raw_data=json.loads(raw))
+        return CacheEntry(consulta, fetched_at, stale)
+
+    def set(self, cnpj: str, dados: CNPJData, fetched_at: Optional[float] = None) -> None:
+        """
+        Armazena (ou substitui) a consulta de um CNPJ.
+
+        Args:
+            cnpj: CNPJ numérico (14 dígitos, sem formatação)
+            dados: CNPJData interpretado (raw_data é guardado à parte)
+            fetched_at: Momento da consulta (padrão: agora)
+        """
+        row = (
+            cnpj,
+            dados.situacao_cadastral or "",
+            self.clock() if fetched_at is None else fetched_at,
+            json.dumps(dados.to_dict(), ensure_ascii=False),
+            json.dumps(dados.raw_data, ensure_ascii=False),
+        )
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO consultas (cnpj, situacao, fetched_at, dados, raw) "
+                "VALUES (?, ?, ?, ?, ?)",
+                row,
+            )
+
+    def delete(self, cnpj: str) -> None:
+        """Remove a consulta de um CNPJ."""
+        with self._lock:
+            self._connection.execute("DELETE FROM consultas WHERE cnpj = ?", (cnpj,))
+
+    def purge(self) -> int:
+        """
+        Remove as entradas vencidas além da janela stale_ttl.
+
+        Returns:
+            Quantidade de entradas removidas
+        """
+        now = self.clock()
+        removed = 0
+        with self._lock:
+            situacoes = [
+                row[0]
+                for row in self._connection.execute("SELECT DISTINCT situacao FROM consultas")
+            ]
+            for situacao in situacoes:
+                limit = now - self.ttl_for(situacao) - self.stale_ttl
+                removed += self._connection.execute(
+                    "DELETE FROM consultas WHERE situacao = ? AND fetched_at <= ?",
+                    (situacao, limit),
+                ).rowcount
+        return removed
+
+    def clear(self) -> None:
+        """Esvazia o cache e zera as estatísticas."""
+        with self._lock:
+            self._connection.execute("DELETE FROM consultas")
+            self.hits = self.stale_hits = self.misses = 0
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._connection.close()
+
+    def stats(self) -> dict:
+        """
+        Estatísticas de uso do cache.
+
+        Returns:
+            Dicionário com hits, stale_hits, misses, size e hit_rate
+            (acertos vencidos também contam como acerto)
+        """
+        with self._lock:
+            size = self._connection.execute("SELECT COUNT(*) FROM consultas").fetchone()[0]
+            served = self.hits + self.stale_hits
+            lookups = served + self.misses
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "size": size,
+                "hit_rate": served / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM consultas").fetchone()[0]
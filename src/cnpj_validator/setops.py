@@ -0,0 +1,424 @@
+"""
+Operações de Conjunto em Memória Externa (dedupe, intersect, diff)
+
+Arquivos com bilhões de linhas não cabem em um set: as operações seguem
+o esquema de ordenação externa, com memória limitada por run_size.
+
+1. Cada linha é validada (regras de NewAlphanumericCNPJValidator.validate),
+   normalizada e convertida na sua CNPJKey (inteiro de 64 bits). Linhas
+   inválidas são descartadas e contadas.
+2. A cada run_size linhas, as chaves do bloco são ordenadas, deduplicadas
+   e gravadas em um arquivo temporário (run) de uint64, 8 bytes por CNPJ.
+   Os blocos são processados em paralelo, um por processo.
+3. Os runs são intercalados (k-way merge com heapq.merge), lidos em blocos
+   pequenos. Com mais de max_fan_in runs, passadas intermediárias juntam
+   grupos de runs, limitando os arquivos abertos ao mesmo tempo.
+4. Com uma sequência ordenada e sem repetições por entrada, a operação é
+   uma intercalação: dedupe (união), intersect (presentes em todas as
+   entradas) e diff (presentes na primeira e em nenhuma das outras).
+
+A saída sai em ordem crescente de chave, que é a ordem dos CNPJs limpos
+em maiúsculas.
+
+Uso:
+    with build_runs(['a.txt', 'b.txt'], workers=4) as runs:
+        for key in runs.intersect():
+            print(CNPJKey.decode(key, formatted=True))
+"""
+
+import heapq
+import os
+import shutil
+import tempfile
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .batch_io import Line, Source, iter_lines
+from .keys import CNPJKey
+from .validators.check_digits import ALPHANUMERIC_ENGINE
+from .validators.new_alphanumeric_validator import NewAlphanumericCNPJValidator
+from .validators.vectorized import INVALID_KEY, encode_keys, validate_mixed_many
+
+DEFAULT_RUN_SIZE = 1_000_000
+DEFAULT_MAX_FAN_IN = 64
+OPERATIONS = ("dedupe", "intersect", "diff")
+
+# Chaves lidas por vez de cada run na intercalação (64 KiB)
+_READ_BLOCK = 1 << 13
+
+# Linhas mais largas vão para a validação escalar (a matriz NumPy teria a largura da maior linha)
+_MAX_VECTOR_WIDTH = 32
+
+# CNPJs com os 14 dígitos iguais passam nos DVs, mas a validação os rejeita
+_ALL_SAME_KEYS = frozenset(CNPJKey.encode(str(digit) * 14) for digit in range(10))
+
+
+def line_key(line: Any) -> Optional[int]:
+    """
+    Valida uma linha e devolve a chave do CNPJ normalizado.
+
+    Linhas nos layouts canônicos (14 caracteres ou XX.XXX.XXX/XXXX-XX) são
+    conferidas direto pelo motor de DVs; as demais passam pela validação
+    completa, que remove qualquer formatação.
+
+    Args:
+        line: CNPJ (str ou bytes), formatado ou não
+
+    Returns:
+        CNPJKey do CNPJ, ou None se a linha não for um CNPJ válido
+    """
+    try:
+        key = CNPJKey.encode(line)
+    except ValueError:
+        pass
+    else:
+        if len(line) == 14:
+            valid = ALPHANUMERIC_ENGINE.scan_clean(line)
+        else:
+            valid = ALPHANUMERIC_ENGINE.scan_formatted(line)
+        return key if valid and key not in _ALL_SAME_KEYS else None
+
+    if isinstance(line, (bytes, bytearray, memoryview)):
+        line = bytes(line).decode("utf-8", "replace")
+    if not isinstance(line, str) or not NewAlphanumericCNPJValidator.validate(line)["valid"]:
+        return None
+    return CNPJKey.encode(NewAlphanumericCNPJValidator.remove_formatting(line))
+
+
+def _keys_python(lines: List[bytes]) -> Tuple[array, int]:
+    """Chaves ordenadas e sem repetição de um bloco, uma linha por vez."""
+    keys = [line_key(line) for line in lines]
+    invalid = keys.count(None)
+    unique = set(keys)
+    unique.discard(None)
+    return array("Q", sorted(unique)), invalid
+
+
+def _keys_numpy(np: Any, lines: List[bytes]) -> Tuple[Any, int]:
+    """Chaves ordenadas e sem repetição de um bloco (validação e codificação vetorizadas)."""
+    if max(map(len, lines)) > _MAX_VECTOR_WIDTH:
+        narrow = [line for line in lines if len(line) <= _MAX_VECTOR_WIDTH]
+        wide = [line_key(line) for line in lines if len(line) > _MAX_VECTOR_WIDTH]
+    else:
+        narrow, wide = lines, []
+
+    keys = np.empty(0, dtype=np.uint64)
+    invalid = wide.count(None)
+    if narrow:
+        values = np.array(narrow, dtype=f"S{max(map(len, narrow))}")
+        valid, _, _ = validate_mixed_many(values)
+        keys = encode_keys(values)
+        # Válidas fora do layout canônico (espaços, outros separadores...):
+        # normalização escalar
+        for row in np.flatnonzero(valid & (keys == INVALID_KEY)).tolist():
+            keys[row] = line_key(narrow[row])
+        keys = keys[valid]
+        invalid += len(narrow) - keys.size
+
+    extra = [key for key in wide if key is not None]
+    if extra:
+        keys = np.concatenate([keys, np.array(extra, dtype=np.uint64)])
+    return np.unique(keys), invalid
+
+
+def chunk_keys(lines: List[bytes]) -> Tuple[Any, int]:
+    """
+    Valida e converte um bloco de linhas em chaves (mesmas regras de line_key).
+
+    Args:
+        lines: Linhas não vazias, em bytes
+
+    Returns:
+        Tupla (chaves ordenadas e sem repetição, linhas inválidas); as
+        chaves vêm em um array numpy.uint64, ou array('Q') sem NumPy
+    """
+    try:
+        import numpy
+    except ImportError:
+        return _keys_python(lines)
+    return _keys_numpy(numpy, lines)
+
+
+def _sort_run(blob: bytes, path: str) -> Tuple[int, int, int]:
+    """
+    Executado no processo filho: valida um bloco de linhas (separadas por
+    \\n) e grava as chaves ordenadas, sem repetição, no arquivo do run.
+
+    Returns:
+        Tupla (linhas, linhas inválidas, chaves gravadas)
+    """
+    lines = blob.split(b"\n")
+    keys, invalid = chunk_keys(lines)
+
+    with open(path, "wb") as file:
+        keys.tofile(file)
+    return len(lines), invalid, len(keys)
+
+
+def _blobs(lines: Iterable[Line], run_size: int) -> Iterator[bytes]:
+    """Agrupa as linhas em blocos de até run_size linhas, unidas por \\n."""
+    chunk: List[Line] = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= run_size:
+            yield b"\n".join(chunk)
+            chunk = []
+    if chunk:
+        yield b"\n".join(chunk)
+
+
+def iter_run(path: str) -> Iterator[int]:
+    """
+    Lê as chaves de um run em blocos de tamanho fixo.
+
+    Args:
+        path: Arquivo do run (uint64 na ordem de bytes nativa)
+
+    Yields:
+        Cada chave, na ordem do arquivo
+    """
+    with open(path, "rb") as file:
+        while True:
+            block = array("Q")
+            try:
+                block.fromfile(file, _READ_BLOCK)
+            except EOFError:
+                # Último bloco, incompleto: os itens lidos ficam no array
+                pass
+            if not block:
+                return
+            yield from block
+
+
+def _unique(keys: Iterable[int]) -> Iterator[int]:
+    """Remove repetições consecutivas de uma sequência ordenada."""
+    last = None
+    for key in keys:
+        if key != last:
+            yield key
+            last = key
+
+
+def _intersection(streams: Sequence[Iterator[int]]) -> Iterator[int]:
+    """Chaves presentes em todas as sequências (ordenadas e sem repetições)."""
+    needed = len(streams)
+    last, count = None, 0
+    for key in heapq.merge(*streams):
+        if key == last:
+            count += 1
+        else:
+            last, count = key, 1
+        if count == needed:
+            yield key
+
+
+def _difference(first: Iterator[int], others: Iterator[int]) -> Iterator[int]:
+    """Chaves de first ausentes de others (ambas ordenadas)."""
+    other = next(others, None)
+    for key in first:
+        while other is not None and other < key:
+            other = next(others, None)
+        if key != other:
+            yield key
+
+
+class SortedRuns:
+    """
+    Runs ordenados das entradas de uma operação de conjunto, em um diretório
+    temporário removido por close() (ou ao sair do bloco with).
+
+    Atributos:
+        directory: Diretório dos runs
+        runs: Arquivos dos runs de cada entrada
+        lines: Linhas lidas de cada entrada
+        invalid: Linhas inválidas (descartadas) de cada entrada
+    """
+
+    def __init__(self, directory: str, count: int, max_fan_in: int = DEFAULT_MAX_FAN_IN):
+        self.directory = directory
+        self.runs: List[List[str]] = [[] for _ in range(count)]
+        self.lines = [0] * count
+        self.invalid = [0] * count
+        self.max_fan_in = max(2, max_fan_in)
+        self._merges = 0
+
+    def __enter__(self) -> "SortedRuns":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove o diretório temporário e os runs."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _reduce(self, runs: List[str], limit: int) -> List[str]:
+        """Junta grupos de runs em runs maiores até restarem no máximo limit."""
+        runs = list(runs)
+        while len(runs) > max(1, limit):
+            merged = []
+            for start in range(0, len(runs), self.max_fan_in):
+                stop = start + self.max_fan_in
+                group = runs[start:stop]
+                if len(group) == 1:
+                    merged.extend(group)
+                    continue
+                self._merges += 1
+                path = os.path.join(self.directory, f"merge-{self._merges}.bin")
+                with open(path, "wb") as file:
+                    block = array("Q")
+                    for key in _unique(heapq.merge(*map(iter_run, group))):
+                        block.append(key)
+                        if len(block) >= _READ_BLOCK:
+                            block.tofile(file)
+                            block = array("Q")
+                    block.tofile(file)
+                for old in group:
+                    os.remove(old)
+                merged.append(path)
+            runs = merged
+        return runs
+
+    def _streams(self) -> List[Iterator[int]]:
+        """Uma sequência ordenada e sem repetições por entrada."""
+        limit = max(1, self.max_fan_in // len(self.runs))
+        streams = []
+        for index, runs in enumerate(self.runs):
+            self.runs[index] = runs = self._reduce(runs, limit)
+            streams.append(_unique(heapq.merge(*map(iter_run, runs))))
+        return streams
+
+    def dedupe(self) -> Iterator[int]:
+        """
+        União das entradas, sem repetições.
+
+        Yields:
+            Cada chave, em ordem crescente
+        """
+        runs = self._reduce([path for group in self.runs for path in group], self.max_fan_in)
+        self.runs = [runs] + [[] for _ in self.runs[1:]]
+        return _unique(heapq.merge(*map(iter_run, runs)))
+
+    def intersect(self) -> Iterator[int]:
+        """
+        Chaves presentes em todas as entradas.
+
+        Yields:
+            Cada chave, em ordem crescente
+        """
+        return _intersection(self._streams())
+
+    def diff(self) -> Iterator[int]:
+        """
+        Chaves da primeira entrada ausentes de todas as outras.
+
+        Yields:
+            Cada chave, em ordem crescente
+        """
+        first, *others = self._streams()
+        return _difference(first, _unique(heapq.merge(*others)))
+
+
+def build_runs(
+    sources: Sequence[Source],
+    workers: Optional[int] = None,
+    run_size: int = DEFAULT_RUN_SIZE,
+    temp_dir: Optional[str] = None,
+    max_fan_in: int = DEFAULT_MAX_FAN_IN,
+) -> SortedRuns:
+    """
+    Lê as entradas e grava os runs ordenados de cada uma.
+
+    A leitura é sequencial (batch_io.iter_lines); a validação, a
+    codificação e a ordenação de cada bloco de run_size linhas rodam em
+    paralelo, com no máximo 2 blocos pendentes por processo.
+
+    Args:
+        sources: Arquivos com um CNPJ por linha ('-' lê da entrada padrão)
+        workers: Quantidade de processos (padrão: os.cpu_count()).
+            Com 1, processa no próprio processo, sem pool.
+        run_size: Linhas por run (limita a memória de cada processo)
+        temp_dir: Diretório onde criar o diretório temporário dos runs
+            (padrão: o do sistema)
+        max_fan_in: Máximo de runs intercalados ao mesmo tempo
+
+    Returns:
+        SortedRuns (use em um bloco with para remover os runs no final)
+
+    Raises:
+        ValueError: Se nenhuma entrada for informada
+    """
+    if not sources:
+        raise ValueError("Informe ao menos uma entrada")
+    workers = workers or os.cpu_count() or 1
+    run_size = max(1, run_size)
+
+    runs = SortedRuns(tempfile.mkdtemp(prefix="cnpj-runs-", dir=temp_dir), len(sources), max_fan_in)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    pending: "deque[Tuple[int, str, Future]]" = deque()
+
+    def collect(index: int, path: str, counts: Tuple[int, int, int]) -> None:
+        lines, invalid, _ = counts
+        runs.lines[index] += lines
+        runs.invalid[index] += invalid
+        runs.runs[index].append(path)
+
+    try:
+        submitted = 0
+        for index, source in enumerate(sources):
+            for blob in _blobs(iter_lines(source), run_size):
+                submitted += 1
+                path = os.path.join(runs.directory, f"run-{submitted}.bin")
+                if pool is None:
+                    collect(index, path, _sort_run(blob, path))
+                    continue
+                pending.append((index, path, pool.submit(_sort_run, blob, path)))
+                if len(pending) >= 2 * workers:
+                    done_index, done_path, future = pending.popleft()
+                    collect(done_index, done_path, future.result())
+        while pending:
+            done_index, done_path, future = pending.popleft()
+            collect(done_index, done_path, future.result())
+    except BaseException:
+        for _, _, future in pending:
+            future.cancel()
+        runs.close()
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+    return runs
+
+
+def set_operation(
+    operation: str,
+    sources: Sequence[Source],
+    workers: Optional[int] = None,
+    run_size: int = DEFAULT_RUN_SIZE,
+    temp_dir: Optional[str] = None,
+    max_fan_in: int = DEFAULT_MAX_FAN_IN,
+) -> Iterator[int]:
+    """
+    Executa uma operação de conjunto sobre arquivos de CNPJs, em memória externa.
+
+    Args:
+        operation: 'dedupe', 'intersect' ou 'diff' (ver OPERATIONS)
+        sources: Arquivos com um CNPJ por linha ('-' lê da entrada padrão)
+        workers: Quantidade de processos que montam os runs
+        run_size: Linhas por run (limita a memória)
+        temp_dir: Diretório para os arquivos temporários
+        max_fan_in: Máximo de runs intercalados ao mesmo tempo
+
+    Yields:
+        Cada CNPJKey do resultado, em ordem crescente
+
+    Raises:
+        ValueError: Se a operação for desconhecida ou sem entradas
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"Operação desconhecida: {operation!r} (use {', '.join(OPERATIONS)})")
+    with build_runs(sources, workers, run_size, temp_dir, max_fan_in) as runs:
+        method: Callable[[], Iterator[int]] = getattr(runs, operation)
+        yield from method()
@@ -0,0 +1,247 @@
+"""
+Resultado de Validação de CNPJ
+
+Objeto compacto retornado por CNPJValidator.validate. Guarda apenas a
+entrada, o CNPJ limpo e códigos inteiros de erro/aviso; o CNPJ formatado,
+as partes, as informações de matriz/filial e as mensagens são montados
+somente quando acessados.
+
+Compatível com o dicionário retornado anteriormente: result['valid'],
+result.get('errors'), 'parts' in result e to_dict() continuam funcionando.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Iterator, List, Optional, Tuple
+
+from .validators.error_codes import ERROR_MESSAGES, WARNING_MESSAGES, ErrorCode, WarningCode
+
+# Erros de formato que interrompem a validação alfanumérica antes de extrair as partes
+_FORMAT_FAILURES = frozenset(
+    {
+        ErrorCode.SPECIAL_CHARACTERS,
+        ErrorCode.UNFORMATTED,
+        ErrorCode.INVALID_FORMAT,
+    }
+)
+
+_VALID_FORMAT_CHARS = frozenset("0123456789./-")
+
+
+class ValidationResult(Mapping):
+    """
+    Resultado imutável da validação de um CNPJ.
+
+    Attributes:
+        cnpj_input: Entrada original
+        cnpj_clean: CNPJ sem formatação
+        numeric_code: ErrorCode da validação numérica (OK se válida)
+        format_codes: ErrorCodes da validação de formato, ou None se não executada
+        warning_codes: WarningCodes encontrados
+    """
+
+    __slots__ = ("cnpj_input", "cnpj_clean", "numeric_code", "format_codes", "warning_codes")
+
+    # Chaves do dicionário legado, na ordem original
+    KEYS = (
+        "valid",
+        "cnpj_input",
+        "cnpj_clean",
+        "cnpj_formatted",
+        "numeric_validation",
+        "alphanumeric_validation",
+        "errors",
+        "warnings",
+    )
+
+    def __init__(
+        self,
+        cnpj_input: Any,
+        cnpj_clean: str,
+        numeric_code: ErrorCode,
+        format_codes: Optional[Tuple[ErrorCode, ...]] = None,
+        warning_codes: Tuple[WarningCode, ...] = (),
+    ):
+        _set_input(self, cnpj_input)
+        _set_clean(self, cnpj_clean)
+        _set_numeric(self, numeric_code)
+        _set_format(self, format_codes)
+        _set_warnings(self, warning_codes)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ValidationResult é imutável")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("ValidationResult é imutável")
+
+    def __reduce__(self) -> Any:
+        return (
+            self.__class__,
+            (
+                self.cnpj_input,
+                self.cnpj_clean,
+                self.numeric_code,
+                self.format_codes,
+                self.warning_codes,
+            ),
+        )
+
+    # =========================================================================
+    # Estado
+    # =========================================================================
+
+    @property
+    def valid(self) -> bool:
+        """Se o CNPJ é válido."""
+        return self.numeric_code == ErrorCode.OK and not self.format_codes
+
+    @property
+    def error_codes(self) -> Tuple[ErrorCode, ...]:
+        """Todos os códigos de erro, na ordem das mensagens de errors."""
+        if self.numeric_code != ErrorCode.OK:
+            return (self.numeric_code,)
+        return self.format_codes or ()
+
+    @property
+    def errors(self) -> List[str]:
+        """Mensagens de erro (montadas a cada acesso)."""
+        return [self._message(code) for code in self.error_codes]
+
+    @property
+    def warnings(self) -> List[str]:
+        """Mensagens de aviso (montadas a cada acesso)."""
+        return [WARNING_MESSAGES[code] for code in self.warning_codes]
+
+    def _message(self, code: ErrorCode) -> str:
+        """Monta a mensagem de um código de erro."""
+        if code == ErrorCode.INVALID_LENGTH:
+            return ERROR_MESSAGES[code].format(length=len(self.cnpj_clean))
+        if code == ErrorCode.SPECIAL_CHARACTERS:
+            invalid = set(self.cnpj_input.strip()) - _VALID_FORMAT_CHARS
+            return ERROR_MESSAGES[code].format(chars=", ".join(sorted(invalid)))
+        return ERROR_MESSAGES[code]
+
+    # =========================================================================
+    # Campos derivados
+    # =========================================================================
+
+    @property
+    def cnpj_formatted(self) -> str:
+        """CNPJ no formato XX.XXX.XXX/XXXX-XX (vazio se a validação numérica falhou)."""
+        if self.numeric_code != ErrorCode.OK:
+            return ""
+        clean = self.cnpj_clean
+        return f"{clean[:2]}.{clean[2:5]}.{clean[5:8]}/{clean[8:12]}-{clean[12:]}"
+
+    @property
+    def parts(self) -> Optional[dict]:
+        """Partes do CNPJ (raiz, ordem, dv), ou None se a validação numérica falhou."""
+        if self.numeric_code != ErrorCode.OK:
+            return None
+        clean = self.cnpj_clean
+        return {
+            "valid": True,
+            "raiz": clean[:8],
+            "ordem": clean[8:12],
+            "dv": clean[12:],
+            "formatted": self.cnpj_formatted,
+        }
+
+    @property
+    def filial_info(self) -> Optional[dict]:
+        """Informações de matriz/filial, ou None se a validação numérica falhou."""
+        if self.numeric_code != ErrorCode.OK:
+            return None
+        code = self.cnpj_clean[8:12]
+        number = int(code)
+        if number == 0:
+            return {"type": "inválido"}
+        if number == 1:
+            return {"type": "matriz", "code": code}
+        return {"type": "filial", "code": code, "number": number}
+
+    @property
+    def is_matriz(self) -> Optional[bool]:
+        """Se é matriz (ordem 0001), ou None se a validação numérica falhou."""
+        if self.numeric_code != ErrorCode.OK:
+            return None
+        return self.cnpj_clean[8:12] == "0001"
+
+    @property
+    def numeric_validation(self) -> dict:
+        """Sub-resultado da validação numérica, no formato de NumericCNPJValidator.validate."""
+        if self.numeric_code == ErrorCode.OK:
+            return {"valid": True, "cnpj_clean": self.cnpj_clean, "errors": []}
+        return {
+            "valid": False,
+            "cnpj_clean": self.cnpj_clean,
+            "errors": [self._message(self.numeric_code)],
+        }
+
+    @property
+    def alphanumeric_validation(self) -> dict:
+        """Sub-resultado da validação de formato, como AlphanumericCNPJValidator.validate."""
+        if self.numeric_code != ErrorCode.OK or self.format_codes is None:
+            return {}
+
+        result = {
+            "valid": not self.format_codes,
+            "errors": [self._message(code) for code in self.format_codes],
+            "warnings": [
+                WARNING_MESSAGES[code]
+                for code in self.warning_codes
+                if code != WarningCode.UNFORMATTED_INPUT
+            ],
+        }
+        if _FORMAT_FAILURES.isdisjoint(self.format_codes):
+            result["parts"] = self.parts
+            result["filial_info"] = self.filial_info
+        return result
+
+    def info(self) -> dict:
+        """
+        Informações detalhadas do CNPJ (formato de CNPJValidator.get_info).
+
+        Returns:
+            Dicionário com validade, CNPJ formatado/limpo, matriz/filial e partes
+        """
+        if not self.valid:
+            return {"valid": False, "errors": self.errors}
+
+        return {
+            "valid": True,
+            "cnpj_formatted": self.cnpj_formatted,
+            "cnpj_clean": self.cnpj_clean,
+            "matriz_filial": self.filial_info,
+            "parts": self.parts,
+        }
+
+    # =========================================================================
+    # Compatibilidade com o dicionário legado
+    # =========================================================================
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def to_dict(self) -> dict:
+        """Converte para o dicionário retornado pelas versões anteriores."""
+        return {key: getattr(self, key) for key in self.KEYS}
+
+    def __repr__(self) -> str:
+        return (
+            f"ValidationResult(cnpj_input={self.cnpj_input!r}, valid={self.valid}, "
+            f"error_codes={[int(c) for c in self.error_codes]})"
+        )
+
+
+# Escrita direta nos slots, contornando o __setattr__ que bloqueia alterações
+_set_input, _set_clean, _set_numeric, _set_format, _set_warnings = (
+    getattr(ValidationResult, name).__set__ for name in ValidationResult.__slots__
+)
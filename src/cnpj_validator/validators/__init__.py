@@ -5,5 +5,12 @@ Módulo de validadores de CNPJ
 from .numeric_validator import NumericCNPJValidator
 from .alphanumeric_validator import AlphanumericCNPJValidator
 from .new_alphanumeric_validator import NewAlphanumericCNPJValidator
+from .error_codes import ErrorCode, WarningCode
 
-__all__ = ["NumericCNPJValidator", "AlphanumericCNPJValidator", "NewAlphanumericCNPJValidator"]
+__all__ = [
+    "NumericCNPJValidator",
+    "AlphanumericCNPJValidator",
+    "NewAlphanumericCNPJValidator",
+    "ErrorCode",
+    "WarningCode",
+]
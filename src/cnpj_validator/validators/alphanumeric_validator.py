@@ -4,6 +4,9 @@ Responsável pela validação de padrões alfanuméricos e formatação
 """
 
 import re
+from typing import Tuple
+
+from .error_codes import ErrorCode, WarningCode
 
 
 class AlphanumericCNPJValidator:
@@ -18,6 +21,9 @@ class AlphanumericCNPJValidator:
     # Padrão sem formatação
     CNPJ_DIGITS_PATTERN = re.compile(r'^\d{14}$')
 
+    # Caracteres permitidos em um CNPJ formatado
+    VALID_CHARS = frozenset('0123456789./-')
+
     @staticmethod
     def validate_format(cnpj: str) -> dict:
         """
@@ -208,6 +214,48 @@ class AlphanumericCNPJValidator:
             'formatted': cnpj
         }
 
+    @staticmethod
+    def check(cnpj: str) -> Tuple[Tuple[ErrorCode, ...], Tuple[WarningCode, ...]]:
+        """
+        Valida o formato retornando apenas códigos de erro e de aviso.
+
+        Versão compacta de validate (mesmas regras e mesma ordem dos erros),
+        sem montar dicionários nem mensagens.
+
+        Args:
+            cnpj: String com CNPJ
+
+        Returns:
+            Tupla (códigos de erro, códigos de aviso)
+        """
+        if not cnpj:
+            return (ErrorCode.EMPTY,), ()
+
+        errors = []
+        warnings = ()
+        cnpj_trimmed = cnpj.strip()
+
+        if cnpj != cnpj_trimmed:
+            warnings = (WarningCode.SURROUNDING_WHITESPACE,)
+        if ' ' in cnpj:
+            errors.append(ErrorCode.WHITESPACE)
+        if '\t' in cnpj:
+            errors.append(ErrorCode.TAB)
+        if '\n' in cnpj or '\r' in cnpj:
+            errors.append(ErrorCode.LINE_BREAK)
+
+        if not AlphanumericCNPJValidator.VALID_CHARS.issuperset(cnpj_trimmed):
+            errors.append(ErrorCode.SPECIAL_CHARACTERS)
+        elif not AlphanumericCNPJValidator.CNPJ_PATTERN.match(cnpj_trimmed):
+            if AlphanumericCNPJValidator.CNPJ_DIGITS_PATTERN.match(cnpj_trimmed):
+                errors.append(ErrorCode.UNFORMATTED)
+            else:
+                errors.append(ErrorCode.INVALID_FORMAT)
+        elif cnpj_trimmed[11:15] == '0000':
+            errors.append(ErrorCode.FILIAL_ZERO)
+
+        return tuple(errors), warnings
+
     @staticmethod
     def validate(cnpj: str) -> dict:
         """
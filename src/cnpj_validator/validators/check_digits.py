@@ -0,0 +1,378 @@
+"""
+Motor de Cálculo dos Dígitos Verificadores (Módulo 11)
+
+Pré-calcula, para cada uma das 12 posições da base do CNPJ, uma tabela de
+256 entradas indexada pelo código do caractere. Cada entrada já contém o
+valor multiplicado pelos pesos do 1º e do 2º DV, empacotados em um único
+inteiro, de modo que DV1 e DV2 saem de uma única passada sobre a base.
+
+Caracteres fora do alfabeto aceito recebem uma sentinela que "estoura" a
+soma, permitindo rejeitá-los dentro da mesma passada.
+"""
+
+import re
+from operator import getitem
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+# Pesos oficiais do cálculo do DV
+WEIGHTS_FIRST = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+WEIGHTS_SECOND = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Soma do 1º DV nos 16 bits baixos, soma do 2º DV nos 16 bits seguintes
+_SHIFT = 16
+_MASK = (1 << _SHIFT) - 1
+
+# Sentinela para caracteres inválidos (nunca alcançada por somas válidas)
+_INVALID = 1 << 48
+
+_NON_DIGITS = re.compile(r"[^0-9]")
+
+# Separadores do layout XX.XXX.XXX/XXXX-XX e posição de cada caractere útil na base
+_SEPARATORS = {2: ".", 6: ".", 10: "/", 15: "-"}
+_FORMATTED_INDEX = {
+    position: index for index, position in enumerate(p for p in range(16) if p not in _SEPARATORS)
+}
+
+BytesLike = Union[str, bytes, bytearray, memoryview]
+
+
+def _to_bytes(cnpj: BytesLike) -> BytesLike:
+    """
+    Converte a entrada para uma sequência de códigos de 1 byte por caractere.
+
+    Caracteres fora do Latin-1 viram '?', preservando o tamanho da entrada
+    (e portanto as posições) e caindo na sentinela de caractere inválido.
+    """
+    if isinstance(cnpj, str):
+        return cnpj.encode("latin-1", "replace")
+    return cnpj
+
+
+def _dv(total: int) -> int:
+    """Converte uma soma ponderada no dígito verificador (Módulo 11)."""
+    remainder = total % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def strip_numeric(cnpj: str) -> str:
+    """
+    Remove tudo que não for dígito ASCII, evitando a regex quando a
+    entrada já está limpa (caso mais comum em lotes).
+
+    Args:
+        cnpj: String com CNPJ formatado ou não
+
+    Returns:
+        String contendo apenas os dígitos
+    """
+    if len(cnpj) == 14 and cnpj.isdigit() and cnpj.isascii():
+        return cnpj
+    return _NON_DIGITS.sub("", cnpj)
+
+
+class CheckDigitEngine:
+    """
+    Calculadora de DVs baseada em tabelas pré-calculadas por posição.
+
+    Args:
+        values: Mapeamento código do caractere -> valor no cálculo do DV.
+            Códigos ausentes são tratados como caracteres inválidos.
+    """
+
+    __slots__ = ("_tables", "_formatted_tables", "_dv_values")
+
+    def __init__(self, values: Dict[int, int]):
+        tables = []
+        for weight_first, weight_second in zip(WEIGHTS_FIRST, WEIGHTS_SECOND):
+            row = [_INVALID] * 256
+            for code, value in values.items():
+                row[code] = weight_first * value + ((weight_second * value) << _SHIFT)
+            tables.append(tuple(row))
+        self._tables = tuple(tables)
+
+        # Os DVs são sempre numéricos, qualquer que seja o alfabeto da raiz
+        dv_values = [-1] * 256
+        digit_row = [_INVALID] * 256
+        for digit in range(10):
+            dv_values[48 + digit] = digit
+            digit_row[48 + digit] = 0
+        self._dv_values = tuple(dv_values)
+
+        # Tabelas para o layout XX.XXX.XXX/XXXX-XX: separadores valem 0 na
+        # posição esperada e as posições dos DVs só aceitam dígitos
+        formatted = []
+        for position in range(18):
+            if position in _SEPARATORS:
+                row = [_INVALID] * 256
+                row[ord(_SEPARATORS[position])] = 0
+                formatted.append(tuple(row))
+            elif position >= 16:
+                formatted.append(tuple(digit_row))
+            else:
+                formatted.append(tables[_FORMATTED_INDEX[position]])
+        self._formatted_tables = tuple(formatted)
+
+    def _sums(self, data: BytesLike) -> Optional[Tuple[int, int]]:
+        """Retorna as somas ponderadas (DV1, DV2 parcial) dos 12 primeiros códigos."""
+        packed = sum(map(getitem, self._tables, data))
+        if packed >= _INVALID:
+            return None
+        return packed & _MASK, packed >> _SHIFT
+
+    def compute(self, base: BytesLike) -> Optional[Tuple[int, int]]:
+        """
+        Calcula DV1 e DV2 em uma única passada sobre os 12 primeiros caracteres.
+
+        Args:
+            base: Raiz + ordem (12 caracteres ou mais; o excedente é ignorado)
+
+        Returns:
+            Tupla (dv1, dv2) ou None se a base for curta ou contiver
+            caracteres inválidos
+        """
+        data = _to_bytes(base)
+        if len(data) < 12:
+            return None
+        sums = self._sums(data)
+        if sums is None:
+            return None
+        first = _dv(sums[0])
+        return first, _dv(sums[1] + 2 * first)
+
+    def second_digit(self, base: BytesLike) -> Optional[int]:
+        """
+        Calcula o 2º DV a partir dos 13 primeiros caracteres (base + DV1 informado).
+
+        Args:
+            base: 13 caracteres ou mais
+
+        Returns:
+            Segundo dígito verificador ou None se a entrada for inválida
+        """
+        data = _to_bytes(base)
+        if len(data) < 13:
+            return None
+        sums = self._sums(data)
+        first = self._dv_values[data[12]]
+        if sums is None or first < 0:
+            return None
+        return _dv(sums[1] + 2 * first)
+
+    def is_valid(self, cnpj: BytesLike) -> bool:
+        """
+        Verifica se os dois últimos caracteres de um CNPJ limpo (14 caracteres)
+        correspondem aos DVs calculados.
+
+        Args:
+            cnpj: CNPJ sem formatação
+
+        Returns:
+            True se os DVs conferem, False caso contrário
+        """
+        data = _to_bytes(cnpj)
+        if len(data) != 14:
+            return False
+        packed = sum(map(getitem, self._tables, data))
+        if packed >= _INVALID:
+            return False
+        first = _dv(packed & _MASK)
+        if self._dv_values[data[12]] != first:
+            return False
+        return self._dv_values[data[13]] == _dv((packed >> _SHIFT) + 2 * first)
+
+    def scan_clean(self, cnpj: BytesLike) -> Optional[bool]:
+        """
+        Confere, em uma única passada, os caracteres e os DVs de um CNPJ limpo.
+
+        Args:
+            cnpj: CNPJ sem formatação (14 caracteres)
+
+        Returns:
+            None se o tamanho ou algum caractere não confere;
+            caso contrário, se os DVs conferem
+        """
+        data = _to_bytes(cnpj)
+        if len(data) != 14:
+            return None
+        packed = sum(map(getitem, self._tables, data))
+        first = self._dv_values[data[12]]
+        second = self._dv_values[data[13]]
+        if packed >= _INVALID or first < 0 or second < 0:
+            return None
+        return first == _dv(packed & _MASK) and second == _dv((packed >> _SHIFT) + 2 * first)
+
+    def scan_formatted(self, cnpj: BytesLike) -> Optional[bool]:
+        """
+        Confere, em uma única passada, a máscara XX.XXX.XXX/XXXX-XX, os
+        caracteres e os DVs de um CNPJ formatado.
+
+        Args:
+            cnpj: CNPJ formatado (18 caracteres)
+
+        Returns:
+            None se o tamanho, a máscara ou algum caractere não confere;
+            caso contrário, se os DVs conferem
+        """
+        data = _to_bytes(cnpj)
+        if len(data) != 18:
+            return None
+        packed = sum(map(getitem, self._formatted_tables, data))
+        if packed >= _INVALID:
+            return None
+        first = _dv(packed & _MASK)
+        if self._dv_values[data[16]] != first:
+            return False
+        return self._dv_values[data[17]] == _dv((packed >> _SHIFT) + 2 * first)
+
+    def iter_orders(
+        self, root: BytesLike, start: int = 1, stop: int = 9999
+    ) -> Iterator[Tuple[int, int, int]]:
+        """
+        Calcula os DVs de uma raiz para cada ordem de start a stop (inclusive).
+
+        A soma ponderada da raiz é calculada uma única vez. As ordens são
+        percorridas em dezenas: a contribuição das três primeiras posições
+        da ordem é atualizada como um odômetro (cada dezena soma o peso da
+        posição das dezenas e, no "vai um", desconta 10 pesos e passa à
+        posição anterior), e a das unidades vem de uma tabela de 10 entradas.
+
+        Args:
+            root: Raiz (8 caracteres)
+            start: Primeira ordem (0 a 9999)
+            stop: Última ordem (0 a 9999)
+
+        Yields:
+            Tuplas (ordem, dv1, dv2)
+
+        Raises:
+            ValueError: Se a raiz não tiver 8 caracteres válidos ou a faixa
+                de ordens estiver fora de 0-9999
+        """
+        data = _to_bytes(root)
+        if not 0 <= start <= 9999 or not 0 <= stop <= 9999:
+            raise ValueError("ordem deve estar entre 0 e 9999")
+        packed = sum(map(getitem, self._tables[:8], data)) if len(data) == 8 else _INVALID
+        if packed >= _INVALID:
+            raise ValueError(f"raiz inválida: {root!r}")
+
+        # Contribuição de um dígito 1 em cada posição da ordem (8 a 11)
+        steps = [table[49] - table[48] for table in self._tables[8:12]]
+        units = [(digit * steps[3]) & _MASK for digit in range(10)]
+        units_second = [(digit * steps[3]) >> _SHIFT for digit in range(10)]
+
+        tens = start // 10
+        digits = [int(digit) for digit in f"{tens:03d}"]
+        packed += sum(digit * step for digit, step in zip(digits, steps))
+
+        for tens in range(tens, stop // 10 + 1):
+            base = tens * 10
+            first_sum = packed & _MASK
+            second_sum = packed >> _SHIFT
+            for unit in range(max(start - base, 0), min(stop - base, 9) + 1):
+                first = (first_sum + units[unit]) % 11
+                first = 0 if first < 2 else 11 - first
+                second = (second_sum + units_second[unit] + 2 * first) % 11
+                yield base + unit, first, 0 if second < 2 else 11 - second
+
+            position = 2
+            while position >= 0:
+                packed += steps[position]
+                digits[position] += 1
+                if digits[position] < 10:
+                    break
+                packed -= 10 * steps[position]
+                digits[position] = 0
+                position -= 1
+
+    def iter_roots(
+        self, start: int, stop: int, alphabet: str = "0123456789", order: int = 1
+    ) -> Iterator[Tuple[str, int, int]]:
+        """
+        Calcula os DVs das raízes de índice start a stop - 1 para uma ordem fixa.
+
+        As raízes são numeradas em notação posicional sobre o alfabeto (base
+        len(alphabet), 8 posições): com '0123456789', o índice é a própria
+        raiz; com '0-9A-Z', é a ordem em base 36. A soma ponderada é
+        atualizada como um odômetro: cada bloco de len(alphabet) raízes
+        compartilha as 7 primeiras posições, e só a posição que muda (mais
+        o "vai um") é recalculada.
+
+        Args:
+            start: Índice da primeira raiz
+            stop: Índice final (exclusivo)
+            alphabet: Caracteres de cada posição, em ordem crescente
+            order: Ordem do estabelecimento (0 a 9999)
+
+        Yields:
+            Tuplas (raiz, dv1, dv2)
+
+        Raises:
+            ValueError: Se o alfabeto tiver caracteres inválidos para o motor
+                ou a faixa/ordem estiver fora dos limites
+        """
+        base = len(alphabet)
+        codes = alphabet.encode("latin-1", "replace")
+        columns = [[table[code] for code in codes] for table in self._tables[:8]]
+        if base < 2 or any(value >= _INVALID for column in columns for value in column):
+            raise ValueError(f"alfabeto inválido: {alphabet!r}")
+        if not 0 <= start <= stop <= base**8:
+            raise ValueError("faixa de raízes fora dos limites")
+        if not 0 <= order <= 9999:
+            raise ValueError("ordem deve estar entre 0 e 9999")
+        if start == stop:
+            return
+
+        digits = []
+        high = start // base
+        for _ in range(7):
+            high, digit = divmod(high, base)
+            digits.insert(0, digit)
+        packed = sum(map(getitem, self._tables[8:12], f"{order:04d}".encode()))
+        packed += sum(column[digit] for column, digit in zip(columns, digits))
+        units = columns[7]
+
+        for high in range(start // base, (stop - 1) // base + 1):
+            prefix = "".join(alphabet[digit] for digit in digits)
+            offset = high * base
+            for unit in range(max(start - offset, 0), min(stop - offset, base)):
+                total = packed + units[unit]
+                first = (total & _MASK) % 11
+                first = 0 if first < 2 else 11 - first
+                second = ((total >> _SHIFT) + 2 * first) % 11
+                yield prefix + alphabet[unit], first, 0 if second < 2 else 11 - second
+
+            position = 6
+            while position >= 0:
+                column = columns[position]
+                digit = digits[position] + 1
+                if digit < base:
+                    packed += column[digit] - column[digit - 1]
+                    digits[position] = digit
+                    break
+                packed += column[0] - column[-1]
+                digits[position] = 0
+                position -= 1
+
+    def is_valid_formatted(self, cnpj: BytesLike) -> bool:
+        """
+        Verifica os DVs de um CNPJ no layout XX.XXX.XXX/XXXX-XX sem removê-lo
+        antes: separadores, caracteres e DVs são conferidos na mesma passada.
+
+        Args:
+            cnpj: CNPJ formatado (18 caracteres)
+
+        Returns:
+            True se o layout e os DVs conferem, False caso contrário
+        """
+        return self.scan_formatted(cnpj) is True
+
+
+# Motor do CNPJ numérico tradicional: apenas '0'-'9' (código ASCII - 48)
+NUMERIC_ENGINE = CheckDigitEngine({48 + digit: digit for digit in range(10)})
+
+# Motor do CNPJ alfanumérico: '0'-'9' valem 0-9 e 'A'-'Z' valem 10-35
+# (minúsculas valem o mesmo que as maiúsculas, como em get_char_value)
+_ALPHANUMERIC_VALUES = {48 + digit: digit for digit in range(10)}
+_ALPHANUMERIC_VALUES.update({65 + index: 10 + index for index in range(26)})
+_ALPHANUMERIC_VALUES.update({97 + index: 10 + index for index in range(26)})
+ALPHANUMERIC_ENGINE = CheckDigitEngine(_ALPHANUMERIC_VALUES)
@@ -0,0 +1,183 @@
+"""
+Sugestão de Correções para CNPJs com DV Inválido
+
+Sugere os CNPJs válidos a uma digitação de distância: troca de um único
+caractere (substituição) ou inversão de dois caracteres vizinhos
+(transposição).
+
+As somas ponderadas do DV são lineares: trocar o caractere da posição p
+de valor v para x altera a soma do 1º DV em w1[p] * (x - v) e a do 2º DV
+em w2[p] * (x - v). Como o DV depende só do resto da soma por 11, basta
+resolver, para cada posição, as congruências
+
+    w1[p] * x ≡ alvo1 - (S1 - w1[p] * v)   (mod 11)
+    w2[p] * x ≡ alvo2 - (S2 - w2[p] * v)   (mod 11)
+
+com os inversos modulares dos pesos (pré-calculados). A solução é uma
+classe de resto x mod 11, e os caracteres de cada classe também são
+pré-calculados: todas as substituições de uma posição saem de poucas
+consultas a tabela, sem validar cada candidato.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from .check_digits import ALPHANUMERIC_ENGINE, WEIGHTS_FIRST, WEIGHTS_SECOND
+
+DEFAULT_MAX_RESULTS = 10
+
+_DIGITS = "0123456789"
+_ROOT_CHARS = _DIGITS + "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_VALUES = {char: value for value, char in enumerate(_ROOT_CHARS)}
+
+_NON_ALPHANUMERIC = re.compile(r"[^0-9A-Za-z]")
+
+# Inverso multiplicativo de cada peso módulo 11 (os pesos vão de 2 a 9)
+_INVERSE = {weight: pow(weight, -1, 11) for weight in set(WEIGHTS_FIRST + WEIGHTS_SECOND)}
+
+# Restos da soma que produzem cada DV (DV 0 vem dos restos 0 e 1)
+_RESIDUES_FOR_DV = {0: (0, 1)}
+_RESIDUES_FOR_DV.update({digit: (11 - digit,) for digit in range(1, 10)})
+
+
+def _by_residue(alphabet: str) -> Tuple[Tuple[str, ...], ...]:
+    """Caracteres do alfabeto agrupados pelo valor módulo 11."""
+    return tuple(
+        tuple(char for char in alphabet if _VALUES[char] % 11 == residue) for residue in range(11)
+    )
+
+
+_DIGITS_BY_RESIDUE = _by_residue(_DIGITS)
+_ROOT_CHARS_BY_RESIDUE = _by_residue(_ROOT_CHARS)
+
+
+def _dv(total: int) -> int:
+    remainder = total % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def _format(cnpj: str) -> str:
+    return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
+
+
+def _acceptable(cnpj: str) -> bool:
+    """Descarta candidatos que a validação rejeitaria por outras regras."""
+    return cnpj[8:12] != "0000" and cnpj.count(cnpj[0]) != 14
+
+
+def _suggestion(cnpj: str, kind: str, position: int) -> Dict[str, Any]:
+    return {
+        "cnpj": cnpj,
+        "cnpj_formatted": _format(cnpj),
+        "kind": kind,
+        "position": position,
+    }
+
+
+def _transpositions(clean: str) -> List[Dict[str, Any]]:
+    """Inversões de caracteres vizinhos que produzem um CNPJ válido."""
+    suggestions = []
+    for position in range(13):
+        if clean[position] == clean[position + 1]:
+            continue
+        after = position + 2
+        candidate = clean[:position] + clean[position + 1] + clean[position] + clean[after:]
+        if (
+            candidate[8:].isdigit()
+            and ALPHANUMERIC_ENGINE.scan_clean(candidate)
+            and _acceptable(candidate)
+        ):
+            suggestions.append(_suggestion(candidate, "transposition", position))
+    return suggestions
+
+
+def _substitutions(clean: str, values: List[Optional[int]], numeric: bool) -> List[Dict[str, Any]]:
+    """Trocas de um único caractere que produzem um CNPJ válido."""
+    first = [WEIGHTS_FIRST[p] * (values[p] or 0) for p in range(12)]
+    second = [WEIGHTS_SECOND[p] * (values[p] or 0) for p in range(13)]
+    sum_first, sum_second = sum(first), sum(second)
+    unknown = [position for position, value in enumerate(values) if value is None]
+    dv1, dv2 = values[12], values[13]
+
+    suggestions = []
+    for position in range(12):
+        if (unknown and unknown != [position]) or dv1 is None or dv2 is None:
+            continue
+        weight_first, weight_second = WEIGHTS_FIRST[position], WEIGHTS_SECOND[position]
+        base_first = sum_first - first[position]
+        base_second = sum_second - second[position]
+        by_residue = _ROOT_CHARS_BY_RESIDUE if position < 8 and not numeric else _DIGITS_BY_RESIDUE
+        after = position + 1
+
+        for target_first in _RESIDUES_FOR_DV[dv1]:
+            residue = (target_first - base_first) * _INVERSE[weight_first] % 11
+            if not any(
+                (target_second - base_second) * _INVERSE[weight_second] % 11 == residue
+                for target_second in _RESIDUES_FOR_DV[dv2]
+            ):
+                continue
+            for char in by_residue[residue]:
+                if char == clean[position]:
+                    continue
+                candidate = clean[:position] + char + clean[after:]
+                if _acceptable(candidate):
+                    suggestions.append(_suggestion(candidate, "substitution", position))
+
+    # DV1: a base define o DV1; ele só serve se o DV2 informado também fechar
+    if not unknown or unknown == [12]:
+        expected = _dv(sum_first)
+        dv2_ok = dv2 is not None and _dv(sum_second - second[12] + 2 * expected) == dv2
+        if expected != dv1 and dv2_ok:
+            candidate = f"{clean[:12]}{expected}{clean[13]}"
+            if _acceptable(candidate):
+                suggestions.append(_suggestion(candidate, "substitution", 12))
+
+    # DV2: só muda o último caractere, se o DV1 estiver correto
+    if (not unknown or unknown == [13]) and dv1 == _dv(sum_first):
+        expected = _dv(sum_second)
+        if expected != dv2:
+            candidate = f"{clean[:13]}{expected}"
+            if _acceptable(candidate):
+                suggestions.append(_suggestion(candidate, "substitution", 13))
+
+    return suggestions
+
+
+def suggest_corrections(cnpj: Any, max_results: int = DEFAULT_MAX_RESULTS) -> List[Dict[str, Any]]:
+    """
+    Sugere CNPJs válidos a uma digitação de distância de um CNPJ inválido.
+
+    São consideradas a troca de um caractere e a inversão de dois
+    caracteres vizinhos. Na raiz, as trocas usam apenas dígitos quando a
+    raiz informada é numérica, e 0-9/A-Z quando tem letras; ordem e DVs
+    usam apenas dígitos. Uma letra na ordem ou nos DVs só é corrigida
+    por substituição na própria posição ou por transposição.
+
+    Args:
+        cnpj: CNPJ formatado ou não (14 caracteres úteis)
+        max_results: Quantidade máxima de sugestões
+
+    Returns:
+        Lista de sugestões ({'cnpj', 'cnpj_formatted', 'kind', 'position'}),
+        com as transposições primeiro e depois as substituições, por posição
+        (0 a 13, no CNPJ sem formatação). Vazia se o CNPJ já for válido ou
+        não tiver 14 caracteres úteis.
+    """
+    if not isinstance(cnpj, str) or max_results < 1:
+        return []
+    clean = _NON_ALPHANUMERIC.sub("", cnpj).upper()
+    if len(clean) != 14:
+        return []
+
+    values: List[Optional[int]] = [_VALUES.get(char) for char in clean]
+    for position in range(8, 14):
+        if values[position] is not None and values[position] > 9:
+            values[position] = None
+    if values.count(None) > 1:
+        return []
+    if None not in values and ALPHANUMERIC_ENGINE.scan_clean(clean) and _acceptable(clean):
+        return []
+
+    suggestions = _transpositions(clean)
+    suggestions += _substitutions(clean, values, numeric=clean[:8].isdigit())
+    return suggestions[:max_results]
@@ -0,0 +1,65 @@
+"""
+Códigos de Erro de Validação
+
+Códigos inteiros compactos usados pelas APIs de validação em lote
+(onde cada linha recebe um único código, o primeiro erro encontrado)
+e pelo ValidationResult, que só gera as mensagens quando solicitado.
+"""
+
+from enum import IntEnum
+
+
+class ErrorCode(IntEnum):
+    """
+    Código do primeiro erro encontrado na validação de um CNPJ.
+
+    Os valores cabem em um byte, permitindo armazená-los em arrays uint8.
+    """
+
+    OK = 0
+    EMPTY = 1  # CNPJ vazio
+    NOT_STRING = 2  # Entrada não é string
+    INVALID_CHARACTERS = 3  # Nenhum caractere aproveitável / caracteres inválidos
+    INVALID_LENGTH = 4  # Não possui 14 caracteres após a limpeza
+    ALL_SAME = 5  # Todos os caracteres iguais
+    INVALID_CHECK_DIGITS = 6  # DVs não conferem
+    INVALID_ORDER = 7  # Ordem (posições 9-12) não numérica
+    INVALID_DV_FORMAT = 8  # DVs (posições 13-14) não numéricos
+    WHITESPACE = 9  # Espaços em branco
+    TAB = 10  # Tabulações
+    LINE_BREAK = 11  # Quebras de linha
+    SPECIAL_CHARACTERS = 12  # Caracteres fora de 0-9 . / -
+    UNFORMATTED = 13  # 14 dígitos sem a máscara XX.XXX.XXX/XXXX-XX
+    INVALID_FORMAT = 14  # Máscara diferente de XX.XXX.XXX/XXXX-XX
+    FILIAL_ZERO = 15  # Código de matriz/filial 0000
+
+
+class WarningCode(IntEnum):
+    """Código de aviso (não invalida o CNPJ)."""
+
+    UNFORMATTED_INPUT = 1  # CNPJ fornecido sem formatação
+    SURROUNDING_WHITESPACE = 2  # Espaços no início ou fim
+
+
+# Mensagens exibidas por CNPJValidator. Campos entre chaves são
+# preenchidos pelo ValidationResult a partir da entrada.
+ERROR_MESSAGES = {
+    ErrorCode.EMPTY: "CNPJ não pode ser vazio",
+    ErrorCode.NOT_STRING: "CNPJ deve ser uma string",
+    ErrorCode.INVALID_CHARACTERS: "CNPJ deve conter apenas números",
+    ErrorCode.INVALID_LENGTH: "CNPJ deve ter 14 dígitos, possui {length}",
+    ErrorCode.ALL_SAME: "CNPJ não pode ter todos os dígitos iguais",
+    ErrorCode.INVALID_CHECK_DIGITS: "Dígitos verificadores inválidos",
+    ErrorCode.WHITESPACE: "CNPJ contém espaços em branco",
+    ErrorCode.TAB: "CNPJ contém tabulações",
+    ErrorCode.LINE_BREAK: "CNPJ contém quebras de linha",
+    ErrorCode.SPECIAL_CHARACTERS: "Caracteres inválidos encontrados: {chars}",
+    ErrorCode.UNFORMATTED: "CNPJ sem formatação - esperado: XX.XXX.XXX/XXXX-XX",
+    ErrorCode.INVALID_FORMAT: "Formato inválido - esperado: XX.XXX.XXX/XXXX-XX",
+    ErrorCode.FILIAL_ZERO: "Código de matriz/filial não pode ser 0000",
+}
+
+WARNING_MESSAGES = {
+    WarningCode.UNFORMATTED_INPUT: "CNPJ fornecido sem formatação",
+    WarningCode.SURROUNDING_WHITESPACE: "CNPJ contém espaços no início ou fim",
+}
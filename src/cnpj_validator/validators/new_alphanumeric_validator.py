@@ -12,8 +12,16 @@ Formato: AA.AAA.AAA/NNNN-DD
 Referência: https://www.gov.br/receitafederal/pt-br
 """
 
+import random
 import re
-from typing import Optional
+import string
+from typing import Any, Dict, List, Optional, Tuple
+
+from .check_digits import ALPHANUMERIC_ENGINE
+from .corrections import DEFAULT_MAX_RESULTS, suggest_corrections
+from .vectorized import (
+    DEFAULT_CHUNK_SIZE, generate_many, validate_alphanumeric_many, validate_mixed_many
+)
 
 
 class NewAlphanumericCNPJValidator:
@@ -159,26 +167,35 @@ class NewAlphanumericCNPJValidator:
         """
         return NewAlphanumericCNPJValidator.CHAR_VALUES.get(char.upper(), 0)
 
+    @staticmethod
+    def _weighted_digit(cnpj: str, weights: list) -> int:
+        """DV pelo cálculo caractere a caractere (caracteres desconhecidos valem 0)."""
+        total = 0
+        for i, char in enumerate(cnpj[:len(weights)]):
+            total += NewAlphanumericCNPJValidator.get_char_value(char) * weights[i]
+
+        remainder = total % 11
+        return 0 if remainder < 2 else 11 - remainder
+
     @staticmethod
     def calculate_first_digit(cnpj: str) -> int:
         """
         Calcula o primeiro dígito verificador do CNPJ alfanumérico.
 
+        Bases com 12 caracteres alfanuméricos usam o motor de tabelas; as
+        demais seguem o cálculo caractere a caractere.
+
         Args:
             cnpj: String com os primeiros 12 caracteres do CNPJ
 
         Returns:
             Primeiro dígito verificador calculado
         """
-        weights = NewAlphanumericCNPJValidator.WEIGHTS_FIRST
-        total = 0
-
-        for i, char in enumerate(cnpj[:12]):
-            value = NewAlphanumericCNPJValidator.get_char_value(char)
-            total += value * weights[i]
-
-        remainder = total % 11
-        return 0 if remainder < 2 else 11 - remainder
+        digits = ALPHANUMERIC_ENGINE.compute(cnpj)
+        if digits is not None:
+            return digits[0]
+        return NewAlphanumericCNPJValidator._weighted_digit(
+            cnpj, NewAlphanumericCNPJValidator.WEIGHTS_FIRST)
 
     @staticmethod
     def calculate_second_digit(cnpj: str) -> int:
@@ -191,21 +208,20 @@ class NewAlphanumericCNPJValidator:
         Returns:
             Segundo dígito verificador calculado
         """
-        weights = NewAlphanumericCNPJValidator.WEIGHTS_SECOND
-        total = 0
-
-        for i, char in enumerate(cnpj[:13]):
-            value = NewAlphanumericCNPJValidator.get_char_value(char)
-            total += value * weights[i]
-
-        remainder = total % 11
-        return 0 if remainder < 2 else 11 - remainder
+        digit = ALPHANUMERIC_ENGINE.second_digit(cnpj)
+        if digit is not None:
+            return digit
+        return NewAlphanumericCNPJValidator._weighted_digit(
+            cnpj, NewAlphanumericCNPJValidator.WEIGHTS_SECOND)
 
     @staticmethod
     def validate_check_digits(cnpj: str) -> dict:
         """
         Valida os dígitos verificadores do CNPJ alfanumérico.
 
+        DV1 e DV2 são calculados juntos, em uma única passada pelo motor de
+        tabelas, que também rejeita caracteres fora do alfabeto.
+
         Args:
             cnpj: String com CNPJ completo (14 caracteres)
 
@@ -219,9 +235,13 @@ class NewAlphanumericCNPJValidator:
         if not cnpj[12:14].isdigit():
             return {'valid': False, 'errors': ["Dígitos verificadores devem ser numéricos"]}
 
-        first_digit = NewAlphanumericCNPJValidator.calculate_first_digit(cnpj[:12])
-        second_digit = NewAlphanumericCNPJValidator.calculate_second_digit(
-            cnpj[:12] + str(first_digit))
+        digits = ALPHANUMERIC_ENGINE.compute(cnpj)
+        if digits is not None:
+            first_digit, second_digit = digits
+        else:
+            first_digit = NewAlphanumericCNPJValidator.calculate_first_digit(cnpj[:12])
+            second_digit = NewAlphanumericCNPJValidator.calculate_second_digit(
+                cnpj[:12] + str(first_digit))
 
         expected_dv = f"{first_digit}{second_digit}"
         actual_dv = cnpj[12:14]
@@ -405,6 +425,91 @@ class NewAlphanumericCNPJValidator:
             'errors': errors
         }
 
+    @staticmethod
+    def validate_many(values: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[Any, Any]:
+        """
+        Valida em lote, de forma vetorizada (NumPy), seguindo as mesmas regras de validate.
+
+        Args:
+            values: Array NumPy de bytes de largura fixa ('S14'/'S18')
+                ou matriz 2-D uint8 com um CNPJ por linha
+            chunk_size: Linhas processadas por bloco (limita a memória)
+
+        Returns:
+            Tupla (máscara bool de válidos, array uint8 com o ErrorCode de cada linha)
+        """
+        return validate_alphanumeric_many(values, chunk_size)
+
+    @staticmethod
+    def validate_mixed_many(
+        values: Any, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Tuple[Any, Any, Any]:
+        """
+        Valida em lote uma coluna que mistura CNPJs numéricos, formatados e
+        alfanuméricos, com as mesmas regras de validate.
+
+        Cada linha é classificada (vectorized.RowKind) em uma pré-passada
+        vetorizada e validada pelo kernel da sua classe, sem desvio em
+        Python por linha.
+
+        Args:
+            values: Array NumPy de bytes de largura fixa ('S14'/'S18')
+                ou matriz 2-D uint8 com um CNPJ por linha
+            chunk_size: Linhas processadas por bloco (limita a memória)
+
+        Returns:
+            Tupla (máscara bool de válidos, array uint8 com o ErrorCode de
+            cada linha, array uint8 com a RowKind de cada linha)
+        """
+        return validate_mixed_many(values, chunk_size)
+
+    @staticmethod
+    def suggest_corrections(
+        cnpj: str, max_results: int = DEFAULT_MAX_RESULTS
+    ) -> List[Dict[str, Any]]:
+        """
+        Sugere CNPJs válidos a uma digitação de distância (troca de um
+        caractere ou inversão de dois vizinhos) de um CNPJ com DV inválido.
+
+        Os candidatos de cada posição saem da linearidade da soma ponderada
+        (ver validators.corrections), sem validar um a um.
+
+        Args:
+            cnpj: CNPJ formatado ou não
+            max_results: Quantidade máxima de sugestões
+
+        Returns:
+            Lista de sugestões ({'cnpj', 'cnpj_formatted', 'kind', 'position'});
+            vazia se o CNPJ já for válido ou não tiver 14 caracteres úteis
+        """
+        return suggest_corrections(cnpj, max_results)
+
+    @staticmethod
+    def generate_many(
+        n: int,
+        seed: Any = None,
+        alphanumeric: bool = True,
+        filial_ratio: float = 0.0,
+        formatted: bool = True,
+        stream: Optional[int] = None,
+    ) -> Any:
+        """
+        Gera CNPJs válidos em lote (vectorized.generate_many), com as raízes
+        sorteadas de uma vez e os DVs calculados de forma vetorizada.
+
+        Args:
+            n: Quantidade de CNPJs
+            seed: Semente (int), SeedSequence ou numpy.random.Generator
+            alphanumeric: Se True, a raiz usa 0-9 e A-Z; senão, só dígitos
+            filial_ratio: Fração (0 a 1) de filiais
+            formatted: Se True, no formato XX.XXX.XXX/XXXX-XX
+            stream: Fluxo independente derivado da semente (um por processo)
+
+        Returns:
+            Array NumPy de bytes de largura fixa ('S18' ou 'S14')
+        """
+        return generate_many(n, seed, alphanumeric, filial_ratio, formatted, stream)
+
     @staticmethod
     def generate_valid_cnpj(root: str = None) -> str:
         """
@@ -416,9 +521,6 @@ class NewAlphanumericCNPJValidator:
         Returns:
             CNPJ alfanumérico válido formatado
         """
-        import random
-        import string
-
         if root:
             root = root.upper()[:8].ljust(8, '0')
         else:
@@ -3,7 +3,11 @@ Validador Numérico de CNPJ
 Responsável pela validação da estrutura numérica e dígitos verificadores
 """
 
-import re
+from typing import Any, Tuple
+
+from .check_digits import NUMERIC_ENGINE, strip_numeric
+from .error_codes import ERROR_MESSAGES, ErrorCode
+from .vectorized import DEFAULT_CHUNK_SIZE, validate_numeric_many
 
 
 class NumericCNPJValidator:
@@ -25,7 +29,7 @@ class NumericCNPJValidator:
         """
         if not isinstance(cnpj, str):
             return ""
-        return re.sub(r'[^0-9]', '', cnpj)
+        return strip_numeric(cnpj)
 
     @staticmethod
     def validate_length(cnpj: str) -> bool:
@@ -64,11 +68,14 @@ class NumericCNPJValidator:
 
         Returns:
             Primeiro dígito verificador calculado
+
+        Raises:
+            ValueError: Se a base for curta ou contiver caracteres não numéricos
         """
-        weights = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_result = sum(int(cnpj[i]) * weights[i] for i in range(12))
-        remainder = sum_result % 11
-        return 0 if remainder < 2 else 11 - remainder
+        digits = NUMERIC_ENGINE.compute(cnpj)
+        if digits is None:
+            raise ValueError(f"Base de CNPJ inválida para cálculo do DV: {cnpj!r}")
+        return digits[0]
 
     @staticmethod
     def calculate_second_digit(cnpj: str) -> int:
@@ -80,11 +87,14 @@ class NumericCNPJValidator:
 
         Returns:
             Segundo dígito verificador calculado
+
+        Raises:
+            ValueError: Se a base for curta ou contiver caracteres não numéricos
         """
-        weights = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_result = sum(int(cnpj[i]) * weights[i] for i in range(13))
-        remainder = sum_result % 11
-        return 0 if remainder < 2 else 11 - remainder
+        digit = NUMERIC_ENGINE.second_digit(cnpj)
+        if digit is None:
+            raise ValueError(f"Base de CNPJ inválida para cálculo do DV: {cnpj!r}")
+        return digit
 
     @staticmethod
     def validate_check_digits(cnpj: str) -> bool:
@@ -97,13 +107,42 @@ class NumericCNPJValidator:
         Returns:
             True se os dígitos verificadores são válidos, False caso contrário
         """
-        if len(cnpj) != 14:
-            return False
+        return NUMERIC_ENGINE.is_valid(cnpj)
+
+    @staticmethod
+    def check(cnpj: str) -> Tuple[ErrorCode, str]:
+        """
+        Valida o CNPJ numérico retornando apenas o código do primeiro erro.
+
+        Versão compacta de validate, sem montar dicionários nem mensagens.
+
+        Args:
+            cnpj: String com CNPJ formatado ou não
+
+        Returns:
+            Tupla (ErrorCode, CNPJ sem formatação)
+        """
+        if not cnpj:
+            return ErrorCode.EMPTY, ''
+
+        if not isinstance(cnpj, str):
+            return ErrorCode.NOT_STRING, ''
 
-        first_digit = NumericCNPJValidator.calculate_first_digit(cnpj[:12])
-        second_digit = NumericCNPJValidator.calculate_second_digit(cnpj[:13])
+        cnpj_clean = strip_numeric(cnpj)
 
-        return int(cnpj[12]) == first_digit and int(cnpj[13]) == second_digit
+        if not cnpj_clean:
+            return ErrorCode.INVALID_CHARACTERS, cnpj_clean
+
+        if len(cnpj_clean) != 14:
+            return ErrorCode.INVALID_LENGTH, cnpj_clean
+
+        if cnpj_clean.count(cnpj_clean[0]) == 14:
+            return ErrorCode.ALL_SAME, cnpj_clean
+
+        if not NUMERIC_ENGINE.is_valid(cnpj_clean):
+            return ErrorCode.INVALID_CHECK_DIGITS, cnpj_clean
+
+        return ErrorCode.OK, cnpj_clean
 
     @staticmethod
     def validate(cnpj: str) -> dict:
@@ -121,35 +160,28 @@ class NumericCNPJValidator:
                 'errors': list
             }
         """
-        errors = []
+        code, cnpj_clean = NumericCNPJValidator.check(cnpj)
 
-        if not cnpj:
-            errors.append("CNPJ não pode ser vazio")
-            return {'valid': False, 'cnpj_clean': '', 'errors': errors}
-
-        if not isinstance(cnpj, str):
-            errors.append("CNPJ deve ser uma string")
-            return {'valid': False, 'cnpj_clean': '', 'errors': errors}
+        if code == ErrorCode.OK:
+            return {'valid': True, 'cnpj_clean': cnpj_clean, 'errors': []}
 
-        cnpj_clean = NumericCNPJValidator.remove_formatting(cnpj)
+        message = ERROR_MESSAGES[code].format(length=len(cnpj_clean))
+        return {'valid': False, 'cnpj_clean': cnpj_clean, 'errors': [message]}
 
-        if not cnpj_clean.isdigit():
-            errors.append("CNPJ deve conter apenas números")
-            return {'valid': False, 'cnpj_clean': cnpj_clean, 'errors': errors}
-
-        if not NumericCNPJValidator.validate_length(cnpj_clean):
-            errors.append(f"CNPJ deve ter 14 dígitos, possui {len(cnpj_clean)}")
-            return {'valid': False, 'cnpj_clean': cnpj_clean, 'errors': errors}
-
-        if not NumericCNPJValidator.validate_all_same_digits(cnpj_clean):
-            errors.append("CNPJ não pode ter todos os dígitos iguais")
-            return {'valid': False, 'cnpj_clean': cnpj_clean, 'errors': errors}
+    @staticmethod
+    def validate_many(values: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[Any, Any]:
+        """
+        Valida em lote, de forma vetorizada (NumPy), seguindo as mesmas regras de validate.
 
-        if not NumericCNPJValidator.validate_check_digits(cnpj_clean):
-            errors.append("Dígitos verificadores inválidos")
-            return {'valid': False, 'cnpj_clean': cnpj_clean, 'errors': errors}
+        Args:
+            values: Array NumPy de bytes de largura fixa ('S14'/'S18')
+                ou matriz 2-D uint8 com um CNPJ por linha
+            chunk_size: Linhas processadas por bloco (limita a memória)
 
-        return {'valid': True, 'cnpj_clean': cnpj_clean, 'errors': []}
+        Returns:
+            Tupla (máscara bool de válidos, array uint8 com o ErrorCode de cada linha)
+        """
+        return validate_numeric_many(values, chunk_size)
 
     @staticmethod
     def format_cnpj(cnpj: str) -> str:
@@ -164,11 +196,8 @@ class NumericCNPJValidator:
         """
         cnpj_clean = NumericCNPJValidator.remove_formatting(cnpj)
 
-        if len(cnpj_clean) != 14 or not cnpj_clean.isdigit():
+        if len(cnpj_clean) != 14:
             return ""
 
-        parts = [
-            cnpj_clean[:2], cnpj_clean[2:5], cnpj_clean[5:8],
-            cnpj_clean[8:12], cnpj_clean[12:]
-        ]
-        return f"{parts[0]}.{parts[1]}.{parts[2]}/{parts[3]}-{parts[4]}"
+        return (f"{cnpj_clean[:2]}.{cnpj_clean[2:5]}.{cnpj_clean[5:8]}/"
+                f"{cnpj_clean[8:12]}-{cnpj_clean[12:]}")
@@ -0,0 +1,202 @@
+"""
+Varredura Única do CNPJ
+
+Reúne em uma só passada sobre a entrada os fatos usados por
+CNPJValidator.validate: CNPJ limpo, máscara e separadores, caracteres
+inválidos, espaços, código de matriz/filial e dígitos verificadores.
+
+As duas formas mais comuns (XX.XXX.XXX/XXXX-XX e 14 dígitos) são
+conferidas por uma única passada nas tabelas do motor de DVs; as demais
+entradas seguem as verificações detalhadas dos validadores numérico e
+alfanumérico, que produzem os mesmos códigos.
+
+scan_many faz a mesma varredura para um bloco de entradas: com NumPy, os
+DVs das formas canônicas numéricas são calculados de uma vez pelo kernel
+vetorizado.
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .alphanumeric_validator import AlphanumericCNPJValidator
+from .check_digits import NUMERIC_ENGINE, BytesLike
+from .error_codes import ErrorCode, WarningCode
+from .numeric_validator import NumericCNPJValidator
+from .vectorized import RowKind, _require_numpy, validate_mixed_many
+
+# (CNPJ limpo, código numérico, códigos de formato ou None, códigos de aviso)
+ScanFacts = Tuple[str, ErrorCode, Optional[Tuple[ErrorCode, ...]], Tuple[WarningCode, ...]]
+
+_NO_FORMAT_ERRORS: Tuple[ErrorCode, ...] = ()
+_FILIAL_ZERO = (ErrorCode.FILIAL_ZERO,)
+_UNFORMATTED_INPUT = (WarningCode.UNFORMATTED_INPUT,)
+
+_scan_formatted = NUMERIC_ENGINE.scan_formatted
+_scan_clean = NUMERIC_ENGINE.scan_clean
+_is_valid_clean = NUMERIC_ENGINE.is_valid
+
+# Linhas com todos os dígitos iguais, por código do primeiro dígito
+_SAME_CLEAN = {48 + d: str(d).encode() * 14 for d in range(10)}
+_SAME_FORMATTED = {
+    48 + d: "{0}{0}.{0}{0}{0}.{0}{0}{0}/{0}{0}{0}{0}-{0}{0}".format(d).encode() for d in range(10)
+}
+
+# Códigos do kernel vetorizado para as formas canônicas numéricas
+_VECTOR_CODES = {
+    int(code): code for code in (ErrorCode.OK, ErrorCode.INVALID_CHECK_DIGITS, ErrorCode.ALL_SAME)
+}
+
+# (código numérico, códigos de formato ou None, códigos de aviso)
+ByteScanFacts = Tuple[ErrorCode, Optional[Tuple[ErrorCode, ...]], Tuple[WarningCode, ...]]
+
+
+def _numeric_code(cnpj_clean: str, dv_ok: bool) -> ErrorCode:
+    """Código numérico de um CNPJ limpo com 14 dígitos ASCII."""
+    if cnpj_clean.count(cnpj_clean[0]) == 14:
+        return ErrorCode.ALL_SAME
+    if not dv_ok:
+        return ErrorCode.INVALID_CHECK_DIGITS
+    return ErrorCode.OK
+
+
+def _filial_codes(cnpj_clean: str) -> Tuple[ErrorCode, ...]:
+    """Única regra de formato que se aplica a uma máscara correta."""
+    return _FILIAL_ZERO if cnpj_clean[8:12] == "0000" else _NO_FORMAT_ERRORS
+
+
+def _scan_generic(cnpj: Any, validate_format: bool) -> ScanFacts:
+    """Entradas fora das formas canônicas: verificações detalhadas."""
+    numeric_code, cnpj_clean = NumericCNPJValidator.check(cnpj)
+
+    if numeric_code != ErrorCode.OK or not validate_format:
+        return cnpj_clean, numeric_code, None, ()
+
+    # Se o CNPJ de entrada já está formatado, valida o formato original
+    if "." in cnpj or "/" in cnpj or "-" in cnpj:
+        format_codes, warning_codes = AlphanumericCNPJValidator.check(cnpj)
+        return cnpj_clean, numeric_code, format_codes, warning_codes
+
+    # O formato gerado a partir do CNPJ limpo é sempre correto;
+    # resta apenas a regra do código de matriz/filial
+    return cnpj_clean, numeric_code, _filial_codes(cnpj_clean), _UNFORMATTED_INPUT
+
+
+def scan(cnpj: Any, validate_format: bool = True) -> ScanFacts:
+    """
+    Levanta todos os fatos de validação de um CNPJ.
+
+    Args:
+        cnpj: String com CNPJ formatado ou não
+        validate_format: Se True, levanta também os códigos de formato
+
+    Returns:
+        Tupla (CNPJ limpo, ErrorCode numérico, ErrorCodes de formato ou None,
+        WarningCodes), na ordem dos argumentos de ValidationResult
+    """
+    if type(cnpj) is str:
+        length = len(cnpj)
+
+        if length == 18:
+            # Máscara, caracteres e DVs na mesma passada (None: fora da máscara)
+            dv_ok = _scan_formatted(cnpj)
+            if dv_ok is not None:
+                cnpj_clean = cnpj.replace(".", "").replace("/", "").replace("-", "")
+                numeric_code = _numeric_code(cnpj_clean, dv_ok)
+                if numeric_code != ErrorCode.OK or not validate_format:
+                    return cnpj_clean, numeric_code, None, ()
+                return cnpj_clean, numeric_code, _filial_codes(cnpj_clean), ()
+
+        elif length == 14 and cnpj.isdigit() and cnpj.isascii():
+            numeric_code = _numeric_code(cnpj, _is_valid_clean(cnpj))
+            if numeric_code != ErrorCode.OK or not validate_format:
+                return cnpj, numeric_code, None, ()
+            return cnpj, numeric_code, _filial_codes(cnpj), _UNFORMATTED_INPUT
+
+    return _scan_generic(cnpj, validate_format)
+
+
+def scan_many(cnpjs: Sequence[Any], validate_format: bool = True) -> List[ScanFacts]:
+    """
+    Versão de scan para um bloco de entradas, com o mesmo resultado.
+
+    Com NumPy, as entradas nas formas canônicas numéricas (XX.XXX.XXX/XXXX-XX
+    e 14 dígitos) têm os DVs calculados de uma vez por validate_mixed_many;
+    as demais, e o bloco inteiro sem NumPy, passam por scan.
+
+    Args:
+        cnpjs: Bloco de CNPJs formatados ou não
+        validate_format: Se True, levanta também os códigos de formato
+
+    Returns:
+        Lista com os fatos de scan de cada entrada, na ordem da entrada
+    """
+    try:
+        np = _require_numpy()
+        # Só strings ASCII de 14 ou 18 caracteres podem estar em forma canônica
+        values = np.array(
+            [
+                cnpj if type(cnpj) is str and len(cnpj) in (14, 18) and cnpj.isascii() else ""
+                for cnpj in cnpjs
+            ],
+            dtype="S18",
+        )
+    except ImportError:
+        return [scan(cnpj, validate_format) for cnpj in cnpjs]
+
+    _, codes, kinds = validate_mixed_many(values)
+    numeric, formatted = RowKind.NUMERIC, RowKind.NUMERIC_FORMATTED
+    facts = []
+    for cnpj, kind, code in zip(cnpjs, kinds.tolist(), codes.tolist()):
+        if kind == numeric:
+            cnpj_clean, warnings = cnpj, _UNFORMATTED_INPUT
+        elif kind == formatted:
+            cnpj_clean, warnings = cnpj.replace(".", "").replace("/", "").replace("-", ""), ()
+        else:
+            facts.append(scan(cnpj, validate_format))
+            continue
+
+        numeric_code = _VECTOR_CODES[code]
+        if numeric_code != ErrorCode.OK or not validate_format:
+            facts.append((cnpj_clean, numeric_code, None, ()))
+        else:
+            facts.append((cnpj_clean, numeric_code, _filial_codes(cnpj_clean), warnings))
+    return facts
+
+
+def scan_bytes(data: BytesLike, validate_format: bool = True) -> Optional[ByteScanFacts]:
+    """
+    Versão de scan para uma linha em bytes (ex.: fatia de memoryview de um
+    arquivo mapeado), sem decodificar nem copiar a linha.
+
+    Atende apenas as formas canônicas (XX.XXX.XXX/XXXX-XX e 14 dígitos);
+    para as demais retorna None e a linha deve ser decodificada e passada
+    para scan.
+
+    Args:
+        data: Linha em bytes, sem espaços nas pontas
+        validate_format: Se True, levanta também os códigos de formato
+
+    Returns:
+        Tupla (ErrorCode numérico, ErrorCodes de formato ou None, WarningCodes)
+        ou None se a linha não está em uma forma canônica
+    """
+    length = len(data)
+    if length == 18:
+        dv_ok = _scan_formatted(data)
+        if dv_ok is None:
+            return None
+        same, order, warnings = _SAME_FORMATTED, data[11:15], ()
+    elif length == 14:
+        dv_ok = _scan_clean(data)
+        if dv_ok is None:
+            return None
+        same, order, warnings = _SAME_CLEAN, data[8:12], _UNFORMATTED_INPUT
+    else:
+        return None
+
+    if data == same[data[0]]:
+        return ErrorCode.ALL_SAME, None, ()
+    if not dv_ok:
+        return ErrorCode.INVALID_CHECK_DIGITS, None, ()
+    if not validate_format:
+        return ErrorCode.OK, None, ()
+    return ErrorCode.OK, _FILIAL_ZERO if order == b"0000" else _NO_FORMAT_ERRORS, warnings
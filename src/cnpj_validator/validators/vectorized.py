@@ -0,0 +1,598 @@
+"""
+Validação Vetorizada de CNPJ em Lote (NumPy)
+
+Valida milhões de CNPJs sem uma chamada Python por linha: a entrada é
+tratada como uma matriz de bytes (n, largura) e os DVs são calculados
+como um produto matriz x pesos seguido de Módulo 11.
+
+Entradas aceitas:
+- Array NumPy de strings de bytes de largura fixa (ex.: dtype 'S14' ou 'S18')
+- Matriz 2-D uint8 com um CNPJ por linha (bytes ASCII, preenchidos com 0)
+
+Saída: (máscara de validade bool, array uint8 de códigos ErrorCode).
+
+Para colunas que misturam CNPJs numéricos, formatados e alfanuméricos,
+validate_mixed_many classifica cada linha em uma pré-passada vetorizada
+(tamanho, layout dos separadores, presença de letras) e envia cada classe
+ao kernel correspondente, devolvendo os resultados na ordem da entrada.
+
+generate_many faz o caminho inverso: sorteia raízes e ordens em lote, com
+um gerador NumPy semeado, e calcula os DVs com o mesmo produto matricial.
+
+encode_keys/decode_keys convertem entre CNPJs e chaves inteiras de 64 bits
+(layout em keys.CNPJKey).
+
+NumPy é uma dependência opcional: pip install cnpj-validator-br[fast]
+"""
+
+from enum import IntEnum
+from typing import Any, Optional, Tuple
+
+from .check_digits import WEIGHTS_FIRST, WEIGHTS_SECOND
+from .error_codes import ErrorCode
+
+# NumPy é importado sob demanda para não pesar na importação do pacote
+np: Any = None
+
+# Processa a entrada em blocos para limitar a memória dos intermediários
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+# Colunas dos caracteres úteis no layout XX.XXX.XXX/XXXX-XX
+_FORMATTED_COLUMNS = [0, 1, 3, 4, 5, 7, 8, 9, 11, 12, 13, 14, 16, 17]
+_FORMATTED_MASK: Any = None
+
+# Separadores do layout XX.XXX.XXX/XXXX-XX (coluna, código ASCII)
+_SEPARATOR_COLUMNS = [2, 6, 10, 15]
+_SEPARATOR_CODES = [ord("."), ord("."), ord("/"), ord("-")]
+
+# Caracteres da raiz na geração, pelo valor no DV (0-9 e A-Z)
+_ROOT_ALPHABET = b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Layout da chave de 64 bits: raiz em base 36 (42 bits) | ordem (14 bits) | DV (7 bits)
+KEY_ROOT_SHIFT = 21
+KEY_ORDER_SHIFT = 7
+KEY_ORDER_MASK = (1 << 14) - 1
+KEY_DV_MASK = (1 << 7) - 1
+KEY_ROOT_LIMIT = 36**8
+INVALID_KEY = (1 << 64) - 1
+
+# Tabelas por código de byte, montadas na primeira utilização
+# (ver _alphanumeric_table e _key_values_table)
+_ALPHANUMERIC_TABLE: Any = None
+_KEY_VALUES_TABLE: Any = None
+
+
+class RowKind(IntEnum):
+    """Classe de cada linha na pré-passada de validate_mixed_many."""
+
+    OTHER = 0  # Layout irregular (vazio, espaços, separadores fora do lugar...)
+    NUMERIC = 1  # 14 dígitos
+    NUMERIC_FORMATTED = 2  # XX.XXX.XXX/XXXX-XX só com dígitos
+    ALPHANUMERIC = 3  # 14 caracteres alfanuméricos, com letras
+    ALPHANUMERIC_FORMATTED = 4  # AA.AAA.AAA/AAAA-AA com letras
+
+
+def _require_numpy() -> Any:
+    """Importa o NumPy na primeira utilização, com mensagem clara se ausente."""
+    global np, _FORMATTED_MASK
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "A validação vetorizada requer NumPy. "
+                "Instale com: pip install cnpj-validator-br[fast]"
+            ) from None
+        np = numpy
+        _FORMATTED_MASK = np.zeros(18, dtype=bool)
+        _FORMATTED_MASK[_FORMATTED_COLUMNS] = True
+    return np
+
+
+def _weights() -> Any:
+    """Matriz de pesos (12, 2): coluna 0 = DV1, coluna 1 = DV2 (sem o DV1)."""
+    return np.array([WEIGHTS_FIRST, WEIGHTS_SECOND[:12]], dtype=np.int32).T
+
+
+def as_byte_matrix(values: Any) -> Any:
+    """
+    Converte a entrada para uma matriz uint8 (n, largura) sem copiar os dados
+    quando possível.
+
+    Args:
+        values: Array de bytes de largura fixa ('S') ou matriz 2-D uint8
+
+    Returns:
+        Matriz uint8 (n, largura)
+
+    Raises:
+        TypeError: Se o tipo do array não for suportado
+    """
+    _require_numpy()
+    arr = np.asarray(values)
+
+    if arr.dtype.kind == "S":
+        arr = np.ascontiguousarray(arr.reshape(-1))
+        return arr.view(np.uint8).reshape(-1, arr.dtype.itemsize)
+
+    if arr.dtype == np.uint8 and arr.ndim == 2:
+        return arr
+
+    raise TypeError(
+        f"Entrada não suportada: dtype={arr.dtype}, ndim={arr.ndim}. "
+        "Use um array de bytes de largura fixa (ex.: 'S14'/'S18') ou uma matriz 2-D uint8."
+    )
+
+
+def _row_lengths(mat: Any) -> Any:
+    """Tamanho de cada linha até o primeiro byte nulo (preenchimento)."""
+    nul = mat == 0
+    return np.where(nul.any(axis=1), nul.argmax(axis=1), mat.shape[1])
+
+
+def _gather(mat: Any, keep: Any) -> Tuple[Any, Any]:
+    """
+    Equivalente vetorizado de remover a formatação: compacta, por linha,
+    os bytes marcados em ``keep`` para as 14 primeiras colunas.
+
+    Linhas já limpas (14 bytes) ou no layout XX.XXX.XXX/XXXX-XX usam
+    colunas fixas; apenas as demais passam pela compactação genérica.
+
+    Returns:
+        Tupla (matriz (n, 14), quantidade de bytes mantidos por linha)
+    """
+    counts = keep.sum(axis=1)
+
+    if mat.shape[1] < 14:
+        pad = 14 - mat.shape[1]
+        mat = np.pad(mat, ((0, 0), (0, pad)))
+        keep = np.pad(keep, ((0, 0), (0, pad)))
+
+    bare = keep[:, :14].all(axis=1)
+    if mat.shape[1] > 14:
+        bare &= ~keep[:, 14:].any(axis=1)
+    if bool(bare.all()):
+        return mat[:, :14], counts
+
+    out = np.zeros((mat.shape[0], 14), dtype=np.uint8)
+    out[bare] = mat[bare, :14]
+    rest = ~bare
+
+    if mat.shape[1] >= 18:
+        formatted = rest & (keep[:, :18] == _FORMATTED_MASK).all(axis=1) & ~keep[:, 18:].any(axis=1)
+        if bool(formatted.all()):
+            return mat[:, _FORMATTED_COLUMNS], counts
+        out[formatted] = mat[formatted][:, _FORMATTED_COLUMNS]
+        rest &= ~formatted
+
+    if bool(rest.any()):
+        order = np.argsort(~keep[rest], axis=1, kind="stable")[:, :14]
+        out[rest] = np.take_along_axis(mat[rest], order, axis=1)
+
+    return out, counts
+
+
+def _check_digits(values: Any) -> Tuple[Any, Any]:
+    """DV1 e DV2 esperados a partir dos valores (n, >=12) das posições."""
+    sums = values[:, :12] @ _weights()
+    remainder = sums[:, 0] % 11
+    first = np.where(remainder < 2, 0, 11 - remainder)
+    remainder = (sums[:, 1] + 2 * first) % 11
+    second = np.where(remainder < 2, 0, 11 - remainder)
+    return first, second
+
+
+def _numeric_codes(values: Any) -> Any:
+    """Códigos por DV e dígitos iguais para valores (n, 14) de linhas com 14 caracteres."""
+    first, second = _check_digits(values)
+    dv_ok = (values[:, 12] == first) & (values[:, 13] == second)
+
+    # Atribuídos da menor para a maior prioridade (o último vence)
+    codes = np.where(dv_ok, ErrorCode.OK, ErrorCode.INVALID_CHECK_DIGITS).astype(np.uint8)
+    codes[(values == values[:, :1]).all(axis=1)] = ErrorCode.ALL_SAME
+    return codes
+
+
+def _numeric_chunk(mat: Any) -> Any:
+    """Códigos de erro de um bloco, seguindo NumericCNPJValidator.validate."""
+    lengths = _row_lengths(mat)
+    digits, counts = _gather(mat, (mat >= 48) & (mat <= 57))
+
+    codes = _numeric_codes(digits.astype(np.int32) - 48)
+    codes[counts != 14] = ErrorCode.INVALID_LENGTH
+    codes[counts == 0] = ErrorCode.INVALID_CHARACTERS
+    codes[lengths == 0] = ErrorCode.EMPTY
+    return codes
+
+
+def _upper(mat: Any) -> Any:
+    """Converte a-z para A-Z, como o upper() de remove_formatting."""
+    return np.where((mat >= 97) & (mat <= 122), mat - 32, mat).astype(np.uint8)
+
+
+def _alphanumeric_codes(chars: Any) -> Any:
+    """Códigos (exceto tamanho e vazio) para caracteres (n, 14) já em maiúsculas."""
+    # 0-9 -> 0-9, A-Z -> 10-35
+    values = np.where(chars >= 65, chars.astype(np.int32) - 55, chars.astype(np.int32) - 48)
+    numeric = (chars >= 48) & (chars <= 57)
+
+    first, second = _check_digits(values)
+    dv_ok = (values[:, 12] == first) & (values[:, 13] == second)
+
+    codes = np.where(dv_ok, ErrorCode.OK, ErrorCode.INVALID_CHECK_DIGITS).astype(np.uint8)
+    codes[(chars == chars[:, :1]).all(axis=1)] = ErrorCode.ALL_SAME
+    codes[~numeric[:, 12:14].all(axis=1)] = ErrorCode.INVALID_DV_FORMAT
+    codes[~numeric[:, 8:12].all(axis=1)] = ErrorCode.INVALID_ORDER
+    return codes
+
+
+def _alphanumeric_chunk(mat: Any) -> Any:
+    """Códigos de erro de um bloco, seguindo NewAlphanumericCNPJValidator.validate."""
+    lengths = _row_lengths(mat)
+    upper = _upper(mat)
+    is_digit = (upper >= 48) & (upper <= 57)
+    is_letter = (upper >= 65) & (upper <= 90)
+    chars, counts = _gather(upper, is_digit | is_letter)
+
+    codes = _alphanumeric_codes(chars)
+    codes[counts != 14] = ErrorCode.INVALID_LENGTH
+    codes[lengths == 0] = ErrorCode.EMPTY
+    return codes
+
+
+def _alphanumeric_table() -> Any:
+    """Tabela de 256 entradas: se o código é de um caractere alfanumérico (0-9, A-Z, a-z)."""
+    global _ALPHANUMERIC_TABLE
+    if _ALPHANUMERIC_TABLE is None:
+        table = np.zeros(256, dtype=bool)
+        table[48:58] = table[65:91] = table[97:123] = True
+        _ALPHANUMERIC_TABLE = table
+    return _ALPHANUMERIC_TABLE
+
+
+def _classify(mat: Any) -> Any:
+    """
+    Pré-passada de validate_mixed_many: classe (RowKind) de cada linha,
+    pelo tamanho, pelo layout dos separadores e pela presença de letras.
+    """
+    total, width = mat.shape
+    kinds = np.zeros(total, dtype=np.uint8)
+    if width < 14:
+        return kinds
+
+    keep = _alphanumeric_table()[mat]
+
+    # 14 caracteres alfanuméricos e nada depois (CNPJ limpo)
+    clean = keep[:, :14].all(axis=1)
+    if width > 14:
+        clean &= ~mat[:, 14:].any(axis=1)
+    kinds[clean] = RowKind.NUMERIC
+
+    if width >= 18:
+        formatted = (mat[:, _SEPARATOR_COLUMNS] == _SEPARATOR_CODES).all(axis=1)
+        formatted &= keep[:, _FORMATTED_COLUMNS].all(axis=1)
+        if width > 18:
+            formatted &= ~mat[:, 18:].any(axis=1)
+        kinds[formatted] = RowKind.NUMERIC_FORMATTED
+
+    # Letras (qualquer byte >= 'A' em linha canônica) levam à classe alfanumérica
+    letters = (mat >= 65).any(axis=1) & (kinds != RowKind.OTHER)
+    kinds[letters] += RowKind.ALPHANUMERIC - RowKind.NUMERIC
+    return kinds
+
+
+def _mixed_chunk(mat: Any) -> Tuple[Any, Any]:
+    """
+    Códigos (regras de NewAlphanumericCNPJValidator.validate) e classes
+    (RowKind) de um bloco.
+
+    As linhas de cada classe são reunidas em um bloco homogêneo e validadas
+    pelo kernel correspondente; os códigos voltam para as posições originais.
+    """
+    kinds = _classify(mat)
+    codes = np.empty(mat.shape[0], dtype=np.uint8)
+
+    for kind in np.unique(kinds):
+        rows = np.flatnonzero(kinds == kind)
+        block = mat if rows.size == mat.shape[0] else mat[rows]
+
+        if kind == RowKind.NUMERIC:
+            # Só dígitos, colunas fixas: nunca falham em ordem/DV numéricos
+            codes[rows] = _numeric_codes(block[:, :14].astype(np.int32) - 48)
+        elif kind == RowKind.NUMERIC_FORMATTED:
+            codes[rows] = _numeric_codes(block[:, _FORMATTED_COLUMNS].astype(np.int32) - 48)
+        elif kind == RowKind.ALPHANUMERIC:
+            codes[rows] = _alphanumeric_codes(_upper(block[:, :14]))
+        elif kind == RowKind.ALPHANUMERIC_FORMATTED:
+            codes[rows] = _alphanumeric_codes(_upper(block[:, _FORMATTED_COLUMNS]))
+        else:
+            # Layout irregular: remoção de formatação genérica
+            codes[rows] = _alphanumeric_chunk(block)
+
+    return codes, kinds
+
+
+def _run(kernel: Any, values: Any, chunk_size: int) -> Tuple[Any, Any]:
+    """Aplica o kernel em blocos e monta (máscara, códigos)."""
+    mat = as_byte_matrix(values)
+    total = mat.shape[0]
+    codes = np.empty(total, dtype=np.uint8)
+    chunk_size = max(1, chunk_size)
+
+    for start in range(0, total, chunk_size):
+        stop = min(start + chunk_size, total)
+        codes[start:stop] = kernel(mat[start:stop])
+
+    return codes == ErrorCode.OK, codes
+
+
+def validate_numeric_many(values: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[Any, Any]:
+    """
+    Valida em lote CNPJs numéricos (regras de NumericCNPJValidator.validate).
+
+    Args:
+        values: Array 'S14'/'S18' (ou outra largura) ou matriz 2-D uint8
+        chunk_size: Linhas processadas por bloco
+
+    Returns:
+        Tupla (máscara bool de válidos, array uint8 de ErrorCode)
+    """
+    return _run(_numeric_chunk, values, chunk_size)
+
+
+def validate_alphanumeric_many(
+    values: Any, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Tuple[Any, Any]:
+    """
+    Valida em lote CNPJs alfanuméricos (regras de NewAlphanumericCNPJValidator.validate).
+
+    Args:
+        values: Array 'S14'/'S18' (ou outra largura) ou matriz 2-D uint8
+        chunk_size: Linhas processadas por bloco
+
+    Returns:
+        Tupla (máscara bool de válidos, array uint8 de ErrorCode)
+    """
+    return _run(_alphanumeric_chunk, values, chunk_size)
+
+
+def validate_mixed_many(values: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[Any, Any, Any]:
+    """
+    Valida em lote uma coluna que mistura CNPJs numéricos, formatados e
+    alfanuméricos (regras de NewAlphanumericCNPJValidator.validate).
+
+    Cada linha é classificada (RowKind) em uma pré-passada vetorizada e
+    cada classe segue para o kernel correspondente: linhas só com dígitos
+    dispensam o mapeamento de letras, e linhas nos layouts canônicos
+    dispensam a remoção genérica de formatação.
+
+    Args:
+        values: Array de bytes de largura fixa (ex.: 'S18') ou matriz 2-D uint8
+        chunk_size: Linhas processadas por bloco
+
+    Returns:
+        Tupla (máscara bool de válidos, array uint8 de ErrorCode,
+        array uint8 de RowKind), na ordem da entrada
+    """
+    mat = as_byte_matrix(values)
+    total = mat.shape[0]
+    codes = np.empty(total, dtype=np.uint8)
+    kinds = np.empty(total, dtype=np.uint8)
+    chunk_size = max(1, chunk_size)
+
+    for start in range(0, total, chunk_size):
+        stop = min(start + chunk_size, total)
+        codes[start:stop], kinds[start:stop] = _mixed_chunk(mat[start:stop])
+
+    return codes == ErrorCode.OK, codes, kinds
+
+
+def _generator(seed: Any, stream: Optional[int]) -> Any:
+    """Gerador NumPy a partir de uma semente, de um fluxo derivado dela ou de um Generator."""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    if stream is not None:
+        seed = np.random.SeedSequence(seed, spawn_key=(stream,))
+    return np.random.default_rng(seed)
+
+
+def _generate_chunk(rng: Any, total: int, alphanumeric: bool, filial_ratio: float) -> Any:
+    """Valores (n, 14) de CNPJs válidos: raiz sorteada, ordem e DVs calculados."""
+    values = np.empty((total, 14), dtype=np.int32)
+    values[:, :8] = rng.integers(0, 36 if alphanumeric else 10, size=(total, 8))
+
+    order = np.ones(total, dtype=np.int32)
+    if filial_ratio:
+        filial = rng.random(total) < filial_ratio
+        order[filial] = rng.integers(2, 10000, size=int(filial.sum()))
+    for column, power in enumerate((1000, 100, 10, 1), start=8):
+        values[:, column] = order // power % 10
+
+    values[:, 12], values[:, 13] = _check_digits(values)
+    return values
+
+
+def generate_many(
+    n: int,
+    seed: Any = None,
+    alphanumeric: bool = False,
+    filial_ratio: float = 0.0,
+    formatted: bool = True,
+    stream: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Any:
+    """
+    Gera CNPJs válidos em lote, de forma vetorizada.
+
+    A mesma semente (e o mesmo fluxo) produz sempre a mesma sequência.
+    Para processos em paralelo, use a mesma semente com um fluxo por
+    processo (stream=0, 1, 2...): os fluxos são independentes entre si.
+    CNPJs podem se repetir (sorteio com reposição).
+
+    Args:
+        n: Quantidade de CNPJs
+        seed: Semente (int), SeedSequence ou numpy.random.Generator;
+            None sorteia uma semente
+        alphanumeric: Se True, a raiz usa 0-9 e A-Z; senão, só dígitos
+        filial_ratio: Fração (0 a 1) de filiais (ordem 0002-9999);
+            as demais são matrizes (0001)
+        formatted: Se True, no formato XX.XXX.XXX/XXXX-XX ('S18');
+            senão, 14 caracteres ('S14')
+        stream: Índice do fluxo independente derivado da semente
+        chunk_size: Linhas geradas por bloco (limita a memória)
+
+    Returns:
+        Array NumPy de bytes de largura fixa, um CNPJ por linha
+
+    Raises:
+        ValueError: Se n for negativo ou filial_ratio estiver fora de [0, 1]
+    """
+    _require_numpy()
+    if n < 0:
+        raise ValueError("n deve ser maior ou igual a zero")
+    if not 0.0 <= filial_ratio <= 1.0:
+        raise ValueError("filial_ratio deve estar entre 0 e 1")
+
+    rng = _generator(seed, stream)
+    alphabet = np.frombuffer(_ROOT_ALPHABET, dtype=np.uint8)
+    width = 18 if formatted else 14
+    out = np.empty((n, width), dtype=np.uint8)
+    if formatted:
+        out[:, _SEPARATOR_COLUMNS] = _SEPARATOR_CODES
+    columns = _FORMATTED_COLUMNS if formatted else slice(0, 14)
+
+    chunk_size = max(1, chunk_size)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        values = _generate_chunk(rng, stop - start, alphanumeric, filial_ratio)
+        out[start:stop, columns] = alphabet[values]
+
+    return out.view(f"S{width}").reshape(n)
+
+
+def _key_values_table() -> Any:
+    """Tabela de 256 entradas: valor do caractere na chave (0-9, A-Z/a-z = 10-35; demais 255)."""
+    global _KEY_VALUES_TABLE
+    if _KEY_VALUES_TABLE is None:
+        table = np.full(256, 255, dtype=np.uint8)
+        table[48:58] = np.arange(10)
+        table[65:91] = table[97:123] = np.arange(10, 36)
+        _KEY_VALUES_TABLE = table
+    return _KEY_VALUES_TABLE
+
+
+def _encode_chunk(mat: Any) -> Any:
+    """Chaves de um bloco; linhas fora do layout canônico recebem INVALID_KEY."""
+    total, width = mat.shape
+    if width < 14:
+        return np.full(total, INVALID_KEY, dtype=np.uint64)
+
+    # Layout: 14 caracteres e nada depois, ou XX.XXX.XXX/XXXX-XX
+    layout = ~mat[:, 14:].any(axis=1) if width > 14 else np.ones(total, dtype=bool)
+    chars = mat[:, :14]
+    if width >= 18:
+        formatted = (mat[:, _SEPARATOR_COLUMNS] == _SEPARATOR_CODES).all(axis=1)
+        if width > 18:
+            formatted &= ~mat[:, 18:].any(axis=1)
+        if bool(formatted.all()):
+            chars = mat[:, _FORMATTED_COLUMNS]
+        elif bool(formatted.any()):
+            chars = chars.copy()
+            chars[formatted] = mat[formatted][:, _FORMATTED_COLUMNS]
+        layout |= formatted
+
+    values = _key_values_table()[chars]
+    valid = layout & (values[:, :8] < 36).all(axis=1) & (values[:, 8:] < 10).all(axis=1)
+
+    root = values[:, 0].astype(np.uint64)
+    for column in range(1, 8):
+        root *= np.uint64(36)
+        root += values[:, column]
+    order = values[:, 8].astype(np.uint64)
+    for column in range(9, 12):
+        order *= np.uint64(10)
+        order += values[:, column]
+    dv = values[:, 12].astype(np.uint64) * np.uint64(10) + values[:, 13]
+
+    keys = (root << np.uint64(KEY_ROOT_SHIFT)) | (order << np.uint64(KEY_ORDER_SHIFT)) | dv
+    keys[~valid] = INVALID_KEY
+    return keys
+
+
+def encode_keys(values: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """
+    Converte CNPJs em chaves inteiras de 64 bits (ver keys.CNPJKey).
+
+    Aceita os layouts canônicos: 14 caracteres ou XX.XXX.XXX/XXXX-XX, com
+    raiz alfanumérica (minúsculas valem como maiúsculas) e ordem/DV numéricos.
+    Os DVs não são conferidos.
+
+    Args:
+        values: Array 'S14'/'S18' (ou outra largura) ou matriz 2-D uint8
+        chunk_size: Linhas processadas por bloco
+
+    Returns:
+        Array uint64 com a chave de cada linha (INVALID_KEY nas linhas
+        fora do layout canônico)
+    """
+    mat = as_byte_matrix(values)
+    total = mat.shape[0]
+    keys = np.empty(total, dtype=np.uint64)
+    chunk_size = max(1, chunk_size)
+    for start in range(0, total, chunk_size):
+        stop = min(start + chunk_size, total)
+        keys[start:stop] = _encode_chunk(mat[start:stop])
+    return keys
+
+
+def _decode_chunk(keys: Any, formatted: bool) -> Any:
+    """Matriz de bytes de um bloco de chaves; chaves inválidas viram linhas vazias."""
+    root = keys >> np.uint64(KEY_ROOT_SHIFT)
+    order = (keys >> np.uint64(KEY_ORDER_SHIFT)) & np.uint64(KEY_ORDER_MASK)
+    dv = keys & np.uint64(KEY_DV_MASK)
+    valid = (root < np.uint64(KEY_ROOT_LIMIT)) & (order <= 9999) & (dv <= 99)
+
+    alphabet = np.frombuffer(_ROOT_ALPHABET, dtype=np.uint8)
+    chars = np.empty((keys.shape[0], 14), dtype=np.uint8)
+    for column in range(7, -1, -1):
+        root, digit = np.divmod(root, np.uint64(36))
+        chars[:, column] = alphabet[digit]
+    for column in range(11, 7, -1):
+        order, digit = np.divmod(order, np.uint64(10))
+        chars[:, column] = digit + 48
+    chars[:, 12] = dv // np.uint64(10) % np.uint64(10) + np.uint64(48)
+    chars[:, 13] = dv % np.uint64(10) + np.uint64(48)
+
+    if formatted:
+        out = np.empty((keys.shape[0], 18), dtype=np.uint8)
+        out[:, _FORMATTED_COLUMNS] = chars
+        out[:, _SEPARATOR_COLUMNS] = _SEPARATOR_CODES
+    else:
+        out = chars
+    out[~valid] = 0
+    return out
+
+
+def decode_keys(keys: Any, formatted: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """
+    Converte chaves de 64 bits (ver keys.CNPJKey) de volta em CNPJs.
+
+    Args:
+        keys: Array (ou sequência) de inteiros sem sinal
+        formatted: Se True, no formato XX.XXX.XXX/XXXX-XX ('S18');
+            senão, 14 caracteres ('S14')
+        chunk_size: Linhas processadas por bloco
+
+    Returns:
+        Array de bytes de largura fixa; chaves inválidas (ex.: INVALID_KEY)
+        viram b''
+    """
+    _require_numpy()
+    keys = np.asarray(keys, dtype=np.uint64).reshape(-1)
+    width = 18 if formatted else 14
+    out = np.empty((keys.shape[0], width), dtype=np.uint8)
+    chunk_size = max(1, chunk_size)
+    for start in range(0, keys.shape[0], chunk_size):
+        stop = min(start + chunk_size, keys.shape[0])
+        out[start:stop] = _decode_chunk(keys[start:stop], formatted)
+    return out.view(f"S{width}").reshape(-1)
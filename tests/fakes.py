@@ -0,0 +1,76 @@
+"""
+Dublês compartilhados pelos testes (relógio e provedores da API)
+"""
+
+import asyncio
+import threading
+import time
+
+from src.cnpj_validator.receita_federal_api import ReceitaFederalAPIError
+
+
+class FakeClock:
+    """Relógio controlado pelos testes."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeProviders:
+    """
+    Substitui _fazer_requisicao (URLs "<provedor>/<cnpj>"): atraso e falhas
+    configuráveis por provedor.
+
+    Args:
+        delays: Atraso por provedor, em segundos
+        failing: Provedores que respondem erro 500
+        not_found: Provedores ou CNPJs que respondem 404
+        delay: Atraso dos provedores fora de delays
+    """
+
+    def __init__(self, delays=None, failing=(), not_found=(), delay=0.0):
+        self.delays = delays or {}
+        self.failing = set(failing)
+        self.not_found = set(not_found)
+        self.delay = delay
+        self.calls = []
+        self.cancelled = []
+        self.lock = threading.Lock()
+
+    @property
+    def providers(self):
+        """Provedores consultados, na ordem das chamadas."""
+        return [provider for provider, _ in self.calls]
+
+    def _begin(self, url):
+        provider, cnpj = url.split("/")
+        with self.lock:
+            self.calls.append((provider, cnpj))
+        return provider, cnpj, self.delays.get(provider, self.delay)
+
+    def _answer(self, provider, cnpj):
+        if provider in self.failing:
+            raise ReceitaFederalAPIError("Erro HTTP 500: X", status_code=500)
+        if provider in self.not_found or cnpj in self.not_found:
+            raise ReceitaFederalAPIError(
+                "CNPJ não encontrado na base da Receita Federal", status_code=404
+            )
+        return {"cnpj": cnpj, "razao_social": f"EMPRESA {provider.upper()}",
+                "descricao_situacao_cadastral": "ATIVA"}
+
+    def __call__(self, url, handle=None):
+        provider, cnpj, delay = self._begin(url)
+        time.sleep(delay)
+        return self._answer(provider, cnpj)
+
+    async def async_call(self, url):
+        provider, cnpj, delay = self._begin(url)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(provider)
+            raise
+        return self._answer(provider, cnpj)
@@ -0,0 +1,277 @@
+"""
+Testes para o cliente assíncrono da API da Receita Federal
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.cnpj_validator.async_receita_federal_api import AsyncReceitaFederalAPI
+from src.cnpj_validator.prefilter import BloomFilter
+from src.cnpj_validator.provider_stats import ProviderStats
+from src.cnpj_validator.rate_limit import SharedRateLimiter
+from src.cnpj_validator.receita_federal_api import ReceitaFederalAPIError
+from src.cnpj_validator.response_cache import SQLiteResponseCache
+
+BRASILAPI_DATA = {
+    "cnpj": "11222333000181",
+    "razao_social": "EMPRESA TESTE LTDA",
+    "descricao_situacao_cadastral": "ATIVA",
+    "municipio": "SAO PAULO",
+    "uf": "SP",
+    "qsa": [{"nome_socio": "FULANO", "qualificacao_socio": "Sócio"}],
+}
+RECEITAWS_DATA = {
+    "cnpj": "11.222.333/0001-81",
+    "nome": "EMPRESA RECEITAWS LTDA",
+    "situacao": "ATIVA",
+}
+
+
+async def _servidor(rotas):
+    """Servidor HTTP local: rotas mapeia o caminho em (status, corpo, chunked)."""
+    pedidos = []
+
+    async def handler(reader, writer):
+        request_line = (await reader.readline()).decode()
+        while (await reader.readline()).strip():
+            pass
+        path = request_line.split()[1]
+        pedidos.append(path)
+        status, body, chunked = rotas.get(path, (404, {"message": "not found"}, False))
+        payload = json.dumps(body).encode()
+        head = f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n"
+        if chunked:
+            half = len(payload) // 2
+            writer.write((head + "Transfer-Encoding: chunked\r\n\r\n").encode())
+            for part in (payload[:half], payload[half:]):
+                writer.write(b"%x\r\n%s\r\n" % (len(part), part))
+            writer.write(b"0\r\n\r\n")
+        else:
+            writer.write((head + f"Content-Length: {len(payload)}\r\n\r\n").encode() + payload)
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handler, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1], pedidos
+
+
+def _cliente(port, **kwargs):
+    kwargs.setdefault("retry_delay", 0.0)
+    kwargs.setdefault("max_retries", 1)
+    kwargs.setdefault("rate_limiter", SharedRateLimiter(limits={}, default_limit=None))
+    kwargs.setdefault("provider_stats", ProviderStats())
+    # Ordem fixa de provedores: o roteamento adaptativo tem testes próprios
+    kwargs.setdefault("adaptive_routing", False)
+    api = AsyncReceitaFederalAPI(**kwargs)
+    api.APIS = {
+        "brasilapi": f"http://127.0.0.1:{port}/brasilapi/{{cnpj}}",
+        "receitaws": f"http://127.0.0.1:{port}/receitaws/{{cnpj}}",
+    }
+    return api
+
+
+class TestAsyncReceitaFederalAPI:
+    """Testes para AsyncReceitaFederalAPI."""
+
+    def test_consultar_sucesso(self):
+        """Deve consultar via HTTP não bloqueante e usar o parser da BrasilAPI."""
+        async def cenario():
+            server, port, _ = await _servidor({
+                "/brasilapi/11222333000181": (200, BRASILAPI_DATA, True),
+            })
+            async with server:
+                return await _cliente(port).consultar("11.222.333/0001-81")
+
+        dados = asyncio.run(cenario())
+
+        assert dados.razao_social == "EMPRESA TESTE LTDA"
+        assert dados.endereco["municipio"] == "SAO PAULO"
+        assert dados.quadro_societario[0]["nome"] == "FULANO"
+
+    def test_consultar_fallback(self):
+        """Deve recorrer à ReceitaWS quando a BrasilAPI falhar."""
+        async def cenario():
+            server, port, pedidos = await _servidor({
+                "/brasilapi/11222333000181": (500, {}, False),
+                "/receitaws/11222333000181": (200, RECEITAWS_DATA, False),
+            })
+            async with server:
+                dados = await _cliente(port, max_retries=2).consultar("11222333000181")
+            return dados, pedidos
+
+        dados, pedidos = asyncio.run(cenario())
+
+        assert dados.razao_social == "EMPRESA RECEITAWS LTDA"
+        assert pedidos == ["/brasilapi/11222333000181"] * 2 + ["/receitaws/11222333000181"]
+
+    def test_consultar_nao_encontrado(self):
+        """Deve propagar 404 sem novas tentativas nem fallback."""
+        async def cenario():
+            server, port, pedidos = await _servidor({})
+            async with server:
+                with pytest.raises(ReceitaFederalAPIError) as exc_info:
+                    await _cliente(port, max_retries=3).consultar("11222333000181")
+            return exc_info.value, pedidos
+
+        erro, pedidos = asyncio.run(cenario())
+
+        assert erro.status_code == 404
+        assert len(pedidos) == 1
+
+    def test_consultar_erro_conexao(self):
+        """Deve converter falha de conexão em ReceitaFederalAPIError."""
+        async def cenario():
+            server, port, _ = await _servidor({})
+            server.close()
+            await server.wait_closed()
+            return await _cliente(port, max_retries=1).consultar("11222333000181", usar_fallback=False)
+
+        with pytest.raises(ReceitaFederalAPIError, match="Erro de conexão"):
+            asyncio.run(cenario())
+
+    def test_consultar_cnpj_invalido_e_prefiltro(self):
+        """Deve rejeitar CNPJ inválido e ausente do pré-filtro sem requisição."""
+        prefilter = BloomFilter(10)
+        prefilter.add("11222333000181")
+        api = _cliente(1, prefilter=prefilter)
+
+        with pytest.raises(ValueError):
+            asyncio.run(api.consultar("123"))
+        with pytest.raises(ReceitaFederalAPIError) as exc_info:
+            asyncio.run(api.consultar("34028316000103"))
+        assert exc_info.value.status_code == 404
+
+    def test_rate_limit_nao_bloqueia_event_loop(self):
+        """Deve aguardar o rate limit com asyncio.sleep, liberando o event loop."""
+        async def cenario():
+            server, port, _ = await _servidor({
+                "/brasilapi/11222333000181": (200, BRASILAPI_DATA, False),
+            })
+            # Balde de uma ficha, já gasta: a próxima vez é em 0.3 s
+            limiter = SharedRateLimiter(limits={"brasilapi": (1, 0.3)})
+            limiter.reserve("brasilapi")
+            api = _cliente(port, rate_limiter=limiter)
+            ticks = 0
+
+            async def health_check():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            async with server:
+                task = asyncio.ensure_future(health_check())
+                await api.consultar("11222333000181")
+                task.cancel()
+            return ticks
+
+        assert asyncio.run(cenario()) >= 10
+
+    def test_sqlite_fora_do_event_loop(self):
+        """Deve esperar lock do rate limiter e do cache fora do event loop."""
+        class Lento:
+            """Envolve limiter e cache simulando disputa do lock do SQLite."""
+
+            def __init__(self, alvo):
+                self.alvo = alvo
+
+            def __getattr__(self, nome):
+                metodo = getattr(self.alvo, nome)
+
+                def lento(*args, **kwargs):
+                    time.sleep(0.1)
+                    return metodo(*args, **kwargs)
+                return lento
+
+        async def cenario():
+            server, port, _ = await _servidor({
+                "/brasilapi/11222333000181": (200, BRASILAPI_DATA, False),
+            })
+            api = _cliente(
+                port,
+                rate_limiter=Lento(SharedRateLimiter(limits={}, default_limit=None)),
+                cache=Lento(SQLiteResponseCache()),
+            )
+            ticks = 0
+
+            async def health_check():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            async with server:
+                task = asyncio.ensure_future(health_check())
+                await api.consultar("11222333000181")
+                task.cancel()
+            return ticks
+
+        # cache.get + reserve + cache.set: ~0,3 s bloqueados fora do loop
+        assert asyncio.run(cenario()) >= 10
+
+    def test_cache_e_atualizacao_em_segundo_plano(self):
+        """Deve servir do cache e atualizar entradas vencidas em tarefa asyncio."""
+        now = [1000.0]
+        cache = SQLiteResponseCache(ttls={"ATIVA": 10}, stale_ttl=100, clock=lambda: now[0])
+
+        async def cenario():
+            server, port, pedidos = await _servidor({
+                "/brasilapi/11222333000181": (200, BRASILAPI_DATA, False),
+            })
+            api = _cliente(port, cache=cache)
+            async with server:
+                await api.consultar("11222333000181")
+                await api.consultar("11222333000181")
+                now[0] += 50
+                stale = await api.consultar("11222333000181")
+                await api.aguardar_atualizacoes(timeout=5)
+            return api, stale, pedidos
+
+        api, stale, pedidos = asyncio.run(cenario())
+
+        assert stale.razao_social == "EMPRESA TESTE LTDA"
+        assert len(pedidos) == 2
+        stats = api.cache_stats()
+        assert stats["hits"] == 1
+        assert stats["stale_hits"] == 1
+        assert stats["refreshes"] == 1
+
+    def test_uma_atualizacao_por_cache_entre_clientes(self):
+        """Deve atualizar a entrada vencida uma única vez com um cliente por requisição."""
+        now = [1000.0]
+        cache = SQLiteResponseCache(ttls={"ATIVA": 10}, stale_ttl=100, clock=lambda: now[0])
+        cache.set("11222333000181", _cliente(1)._interpretar("brasilapi", BRASILAPI_DATA))
+        now[0] += 50
+
+        async def cenario():
+            server, port, pedidos = await _servidor({
+                "/brasilapi/11222333000181": (200, BRASILAPI_DATA, False),
+            })
+            async with server:
+                clientes = [_cliente(port, cache=cache) for _ in range(10)]
+                for api in clientes:
+                    await api.consultar("11222333000181")
+                await clientes[0].aguardar_atualizacoes(timeout=5)
+            return pedidos
+
+        assert len(asyncio.run(cenario())) == 1
+        assert cache.get("11222333000181").stale is False
+
+    def test_verificar_situacao_e_socios(self):
+        """Deve expor verificar_situacao e buscar_socios como corrotinas."""
+        async def cenario():
+            server, port, _ = await _servidor({
+                "/brasilapi/11222333000181": (200, BRASILAPI_DATA, False),
+            })
+            api = _cliente(port)
+            async with server:
+                return (await api.verificar_situacao("11222333000181"),
+                        await api.buscar_socios("11222333000181"))
+
+        situacao, socios = asyncio.run(cenario())
+
+        assert situacao["ativa"] is True
+        assert socios[0]["nome"] == "FULANO"
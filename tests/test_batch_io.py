@@ -0,0 +1,154 @@
+"""
+Testes Unitários para a leitura de arquivos de lote em bytes (batch_io)
+Seguindo princípios de Shift Left Testing
+"""
+
+import csv
+import io
+import json
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.batch_io import iter_lines, open_output, write_results
+from src.cnpj_validator.cli import CNPJValidatorCLI
+
+
+CONTENT = b"11.222.333/0001-81\r\n\n  11222333000181 \t\n\n11111111111111"
+EXPECTED = [b"11.222.333/0001-81", b"11222333000181", b"11111111111111"]
+
+
+class TestIterLines:
+    """Testes de iter_lines"""
+
+    def test_mapped_file(self, tmp_path):
+        """Arquivos regulares são lidos por mmap, em fatias de memoryview"""
+        path = tmp_path / "cnpjs.txt"
+        path.write_bytes(CONTENT)
+
+        lines = []
+        for line in iter_lines(str(path)):
+            assert isinstance(line, memoryview)
+            lines.append(bytes(line))
+        assert lines == EXPECTED
+
+    def test_empty_file(self, tmp_path):
+        """Arquivo vazio não produz linhas (mmap não aceita tamanho 0)"""
+        path = tmp_path / "vazio.txt"
+        path.write_bytes(b"")
+        assert list(iter_lines(path)) == []
+
+    def test_blank_lines_only(self, tmp_path):
+        """Linhas em branco são ignoradas"""
+        path = tmp_path / "brancos.txt"
+        path.write_bytes(b"\n \r\n\t\n")
+        assert list(iter_lines(path)) == []
+
+    def test_stream_fallback(self):
+        """Fluxos sem descritor de arquivo usam leitura bufferizada"""
+        assert list(iter_lines(io.BytesIO(CONTENT))) == EXPECTED
+
+    def test_stdin(self):
+        """'-' lê da entrada padrão"""
+        stdin = io.TextIOWrapper(io.BytesIO(CONTENT))
+        with patch('sys.stdin', stdin):
+            assert list(iter_lines('-')) == EXPECTED
+
+    def test_consumer_can_keep_copies(self, tmp_path):
+        """Interromper a iteração com fatias ainda referenciadas não falha"""
+        path = tmp_path / "cnpjs.txt"
+        path.write_bytes(CONTENT)
+        lines = iter_lines(path)
+        first = next(lines)
+        lines.close()
+        assert first is not None
+
+
+class TestBatchValidateMapped:
+    """O comando batch sobre arquivos reais deve coincidir com validate"""
+
+    def test_matches_validate(self, tmp_path):
+        """Linhas canônicas e não canônicas produzem o mesmo resultado"""
+        cnpjs = [
+            "11.222.333/0001-81", "11222333000181", "11.222.333/0001-82",
+            "11.222.333/0000-09", "11222333000009", "11111111111111",
+            " 11.222.333/0001-81 ", "11 222 333 0001 81", "11.222.333/0001-8A",
+            "11.222.333\\0001-81", "ação",
+        ]
+        path = tmp_path / "cnpjs.txt"
+        path.write_text("\n".join(cnpjs) + "\n", encoding="utf-8")
+
+        cli = CNPJValidatorCLI()
+        expected = [
+            {'valid': r['valid'], 'cnpj': r['cnpj'], 'errors': r['errors']}
+            for r in map(cli.validate, (cnpj.strip() for cnpj in cnpjs))
+        ]
+        assert cli.batch_validate(str(path)) == expected
+
+
+RESULTS = [
+    {'valid': True, 'cnpj': '11.222.333/0001-81', 'errors': []},
+    {'valid': False, 'cnpj': '', 'errors': ['CNPJ com todos os dígitos iguais', 'outro, erro']},
+]
+
+
+class TestWriteResults:
+    """Testes de write_results"""
+
+    def test_json_matches_dumps(self):
+        """O array JSON deve ser igual ao de json.dumps(indent=2)"""
+        stream = io.StringIO()
+        assert write_results(RESULTS, stream, 'json') == (2, 1)
+        assert stream.getvalue() == json.dumps(RESULTS, indent=2, ensure_ascii=False) + "\n"
+
+    def test_json_empty(self):
+        """Lote vazio gera array vazio"""
+        stream = io.StringIO()
+        assert write_results([], stream, 'json') == (0, 0)
+        assert json.loads(stream.getvalue()) == []
+
+    def test_jsonl(self):
+        """Um objeto JSON por linha"""
+        stream = io.StringIO()
+        write_results(RESULTS, stream, 'jsonl')
+        assert [json.loads(line) for line in stream.getvalue().splitlines()] == RESULTS
+
+    @pytest.mark.parametrize("output_format,delimiter", [('csv', ','), ('tsv', '\t')])
+    def test_delimited(self, output_format, delimiter):
+        """Cabeçalho, valid como true/false e erros separados por '; '"""
+        stream = io.StringIO()
+        write_results(RESULTS, stream, output_format)
+        rows = list(csv.reader(io.StringIO(stream.getvalue()), delimiter=delimiter))
+        assert rows == [
+            ['valid', 'cnpj', 'errors'],
+            ['true', '11.222.333/0001-81', ''],
+            ['false', '', 'CNPJ com todos os dígitos iguais; outro, erro'],
+        ]
+
+    def test_writes_while_consuming(self):
+        """Cada resultado é gravado antes de o próximo ser produzido"""
+        stream = io.StringIO()
+        seen = []
+
+        def produce():
+            for result in RESULTS:
+                seen.append(stream.getvalue().count('\n'))
+                yield result
+
+        write_results(produce(), stream, 'jsonl', flush=True)
+        assert seen == [0, 1]
+
+    def test_unknown_format(self):
+        """Formato desconhecido levanta ValueError"""
+        with pytest.raises(ValueError):
+            write_results(RESULTS, io.StringIO(), 'xml')
+
+    def test_open_output(self, tmp_path):
+        """O arquivo de saída é gravado em UTF-8"""
+        path = tmp_path / "saida.jsonl"
+        with open_output(str(path)) as output:
+            write_results(RESULTS, output, 'jsonl')
+        assert 'dígitos' in path.read_text(encoding='utf-8')
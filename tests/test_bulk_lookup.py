@@ -0,0 +1,205 @@
+"""
+Testes da consulta em lote (consultar_many) com vários provedores
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.async_receita_federal_api import AsyncReceitaFederalAPI
+from src.cnpj_validator.generator import iter_generate
+from src.cnpj_validator.prefilter import BloomFilter
+from src.cnpj_validator.rate_limit import SharedRateLimiter
+from src.cnpj_validator.receita_federal_api import (
+    CNPJData,
+    ReceitaFederalAPI,
+    ReceitaFederalAPIError,
+)
+from src.cnpj_validator.response_cache import SQLiteResponseCache
+from tests.fakes import FakeProviders
+
+CNPJS = list(iter_generate(12, seed=7, formatted=False))
+
+
+def _contar_reservas(api):
+    """Conta as chamadas a reserve do rate limiter do cliente (cada uma lenta)."""
+    reservas = []
+    reserve = api._limitador().reserve
+
+    def contando(provider):
+        reservas.append(provider)
+        time.sleep(0.02)
+        return reserve(provider)
+
+    api._limitador().reserve = contando
+    return reservas
+
+
+def _api(fake, limits=None, cls=ReceitaFederalAPI, **kwargs):
+    limiter = SharedRateLimiter(limits=limits or {}, default_limit=None)
+    api = cls(max_retries=2, retry_delay=0.0, rate_limiter=limiter, **kwargs)
+    api.APIS = {"a": "a/{cnpj}", "b": "b/{cnpj}"}
+    api._fazer_requisicao = fake.async_call if cls is AsyncReceitaFederalAPI else fake
+    return api
+
+
+class TestConsultarMany:
+    """Testes de ReceitaFederalAPI.consultar_many."""
+
+    def test_all_results_across_providers(self):
+        """Deve consultar todos os CNPJs usando todos os provedores."""
+        fake = FakeProviders(delay=0.01)
+        results = dict(_api(fake).consultar_many(CNPJS))
+
+        assert set(results) == set(CNPJS)
+        assert all(isinstance(dados, CNPJData) for dados in results.values())
+        assert {provider for provider, _ in fake.calls} == {"a", "b"}
+        assert len(fake.calls) == len(CNPJS)
+
+    def test_combined_throughput(self):
+        """Deve somar as cotas dos provedores em vez de usar só a preferida."""
+        fake = FakeProviders()
+        api = _api(fake, limits={"a": (1, 0.1), "b": (1, 0.1)})
+
+        start = time.perf_counter()
+        list(api.consultar_many(CNPJS[:10], concurrency=2))
+        elapsed = time.perf_counter() - start
+
+        # 10 CNPJs, 1 por 0,1 s em cada provedor: ~0,4 s juntos (~0,9 s só com um)
+        assert elapsed < 0.8
+        assert sum(1 for provider, _ in fake.calls if provider == "a") >= 3
+        assert sum(1 for provider, _ in fake.calls if provider == "b") >= 3
+
+    def test_failing_provider_falls_over(self):
+        """Deve reenviar para outro provedor os CNPJs que falharam."""
+        fake = FakeProviders(failing={"a"})
+        results = dict(_api(fake).consultar_many(CNPJS))
+
+        assert all(dados.razao_social == "EMPRESA B" for dados in results.values())
+
+    def test_one_reservation_per_request(self):
+        """Não deve gastar cota de provedor sem enviar a requisição."""
+        fake = FakeProviders(delay=0.01)
+        api = _api(fake)
+        reservas = _contar_reservas(api)
+
+        assert len(list(api.consultar_many(CNPJS[:6], concurrency=8))) == 6
+        assert len(reservas) == len(fake.calls) == 6
+
+    def test_all_providers_failing(self):
+        """Deve devolver o erro após max_retries tentativas por provedor."""
+        fake = FakeProviders(failing={"a", "b"})
+        results = dict(_api(fake).consultar_many(CNPJS[:2]))
+
+        assert all(isinstance(erro, ReceitaFederalAPIError) for erro in results.values())
+        assert len(fake.calls) == 2 * 2 * 2
+
+    def test_not_found_is_final(self):
+        """Deve dar 404 como definitivo, sem nova tentativa."""
+        fake = FakeProviders(not_found={CNPJS[0]})
+        results = dict(_api(fake).consultar_many(CNPJS[:3]))
+
+        assert results[CNPJS[0]].status_code == 404
+        assert [cnpj for _, cnpj in fake.calls].count(CNPJS[0]) == 1
+
+    def test_immediate_results_without_requests(self):
+        """Deve resolver inválidos, ausentes do pré-filtro e cache sem requisição."""
+        prefilter = BloomFilter(10)
+        for cnpj in CNPJS[:2]:
+            prefilter.add(cnpj)
+        cache = SQLiteResponseCache()
+        cache.set(CNPJS[0], CNPJData(cnpj=CNPJS[0], razao_social="EM CACHE", situacao_cadastral="ATIVA"))
+        fake = FakeProviders()
+        api = _api(fake, prefilter=prefilter, cache=cache)
+
+        results = dict(api.consultar_many(["123", CNPJS[0], CNPJS[1], CNPJS[2]]))
+
+        assert isinstance(results["123"], ValueError)
+        assert results[CNPJS[0]].razao_social == "EM CACHE"
+        assert isinstance(results[CNPJS[1]], CNPJData)
+        assert results[CNPJS[2]].status_code == 404
+        assert fake.calls == [(fake.calls[0][0], CNPJS[1])]
+        assert cache.get(CNPJS[1]) is not None
+
+    def test_progress(self):
+        """Deve informar o progresso a cada resultado."""
+        progress = []
+        list(_api(FakeProviders()).consultar_many(CNPJS[:4], progress=lambda *args: progress.append(args)))
+
+        assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    def test_cancel(self):
+        """Deve encerrar o lote quando o evento de cancelamento for sinalizado."""
+        fake = FakeProviders()
+        api = _api(fake, limits={"a": (1, 0.2), "b": (1, 0.2)})
+        cancel = threading.Event()
+
+        received = []
+        for result in api.consultar_many(CNPJS, concurrency=2, cancel=cancel):
+            received.append(result)
+            cancel.set()
+
+        assert 1 <= len(received) < len(CNPJS)
+        assert not any(thread.name.startswith("cnpj-lote-") for thread in threading.enumerate())
+
+    def test_invalid_arguments(self):
+        """Deve rejeitar provedor inexistente e concurrency < 1."""
+        api = _api(FakeProviders())
+
+        with pytest.raises(ValueError):
+            list(api.consultar_many(CNPJS, providers=["x"]))
+        with pytest.raises(ValueError):
+            list(api.consultar_many(CNPJS, concurrency=-1))
+
+
+class TestConsultarManyAsync:
+    """Testes de AsyncReceitaFederalAPI.consultar_many."""
+
+    def test_async_across_providers(self):
+        """Deve consultar o lote em tarefas asyncio usando todos os provedores."""
+        fake = FakeProviders(delay=0.01, not_found={CNPJS[1]})
+        api = _api(fake, cls=AsyncReceitaFederalAPI)
+        progress = []
+
+        async def cenario():
+            return [result async for result in api.consultar_many(
+                CNPJS, progress=lambda *args: progress.append(args))]
+
+        results = dict(asyncio.run(cenario()))
+
+        assert set(results) == set(CNPJS)
+        assert results[CNPJS[1]].status_code == 404
+        assert {provider for provider, _ in fake.calls} == {"a", "b"}
+        assert progress[-1] == (len(CNPJS), len(CNPJS))
+
+    def test_async_one_reservation_per_request(self):
+        """Não deve gastar cota de provedor sem enviar a requisição (asyncio)."""
+        fake = FakeProviders(delay=0.01)
+        api = _api(fake, cls=AsyncReceitaFederalAPI)
+        reservas = _contar_reservas(api)
+
+        async def cenario():
+            return [result async for result in api.consultar_many(CNPJS[:6], concurrency=8)]
+
+        assert len(asyncio.run(cenario())) == 6
+        assert len(reservas) == len(fake.calls) == 6
+
+    def test_async_cancel(self):
+        """Deve encerrar o lote assíncrono pelo asyncio.Event."""
+        api = _api(FakeProviders(), limits={"a": (1, 0.2), "b": (1, 0.2)}, cls=AsyncReceitaFederalAPI)
+
+        async def cenario():
+            cancel = asyncio.Event()
+            received = []
+            async for result in api.consultar_many(CNPJS, cancel=cancel):
+                received.append(result)
+                cancel.set()
+            return received
+
+        assert 1 <= len(asyncio.run(cenario())) < len(CNPJS)
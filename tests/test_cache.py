@@ -0,0 +1,188 @@
+"""
+Testes Unitários para o cache LRU de resultados (cache)
+Seguindo princípios de Shift Left Testing
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJValidator
+from src.cnpj_validator.cache import CachedCNPJValidator, LRUCache, freeze
+from src.cnpj_validator.cli import CNPJValidatorCLI, create_parser
+from src.cnpj_validator.validators.new_alphanumeric_validator import NewAlphanumericCNPJValidator
+
+
+class TestLRUCache:
+    """Testes do cache LRU genérico"""
+
+    def test_hits_and_misses(self):
+        """Deve calcular apenas na primeira consulta de cada chave"""
+        cache = LRUCache(4)
+        calls = []
+        for _ in range(3):
+            assert cache.get_or_compute('a', lambda: calls.append(1) or 'A') == 'A'
+        assert len(calls) == 1
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['size']) == (2, 1, 1)
+
+    def test_evicts_least_recently_used(self):
+        """Deve descartar a chave usada há mais tempo"""
+        cache = LRUCache(2)
+        cache.get_or_compute('a', lambda: 1)
+        cache.get_or_compute('b', lambda: 2)
+        cache.get_or_compute('a', lambda: 1)   # 'a' passa a ser a mais recente
+        cache.get_or_compute('c', lambda: 3)   # descarta 'b'
+        assert cache.get_or_compute('b', lambda: 'novo') == 'novo'
+        assert cache.stats()['evictions'] == 2
+        assert len(cache) == 2
+
+    def test_clear_resets_stats(self):
+        """Deve esvaziar o cache e zerar as estatísticas"""
+        cache = LRUCache(2)
+        cache.get_or_compute('a', lambda: 1)
+        cache.clear()
+        assert cache.stats() == {
+            'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'maxsize': 2, 'hit_rate': 0.0,
+        }
+
+    def test_invalid_maxsize(self):
+        """Deve rejeitar capacidade menor que 1"""
+        with pytest.raises(ValueError):
+            LRUCache(0)
+
+    def test_thread_safety(self):
+        """Contadores devem permanecer consistentes com várias threads"""
+        cache = LRUCache(8)
+
+        def worker():
+            for i in range(1000):
+                cache.get_or_compute(i % 16, lambda: i)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert stats['hits'] + stats['misses'] == 8000
+        assert stats['size'] <= 8
+
+
+class TestFreeze:
+    """Testes do congelamento de resultados"""
+
+    def test_freeze_nested(self):
+        """Dicts viram somente leitura e listas viram tuplas"""
+        frozen = freeze({'errors': ['x'], 'parts': {'raiz': '1'}})
+        assert frozen['errors'] == ('x',)
+        with pytest.raises(TypeError):
+            frozen['valid'] = True
+        with pytest.raises(TypeError):
+            frozen['parts']['raiz'] = '2'
+
+
+class TestCachedCNPJValidator:
+    """Testes do validador com cache"""
+
+    def setup_method(self):
+        self.validator = CachedCNPJValidator(maxsize=16)
+
+    @pytest.mark.parametrize("cnpj", [
+        "11.222.333/0001-81", "11222333000181", "11.222.333/0001-82",
+        "11222333000009", " 11.222.333/0001-81", "", None,
+    ])
+    @pytest.mark.parametrize("validate_format", [True, False])
+    def test_same_result_as_uncached(self, cnpj, validate_format):
+        """Deve retornar o mesmo resultado do CNPJValidator, com ou sem acerto"""
+        expected = CNPJValidator().validate(cnpj, validate_format).to_dict()
+        assert self.validator.validate(cnpj, validate_format).to_dict() == expected
+        assert self.validator.validate(cnpj, validate_format).to_dict() == expected
+
+    def test_formatted_and_clean_inputs_are_distinct_entries(self):
+        """Formas diferentes do mesmo CNPJ têm avisos diferentes"""
+        clean = self.validator.validate("11222333000181")
+        formatted = self.validator.validate("11.222.333/0001-81")
+        assert clean.warnings != formatted.warnings
+        assert self.validator.stats()['validate']['misses'] == 2
+
+    def test_hit_returns_shared_immutable_result(self):
+        """Acertos retornam o mesmo objeto, que não pode ser alterado"""
+        first = self.validator.validate("11.222.333/0001-81")
+        second = self.validator.validate("11.222.333/0001-81")
+        assert first is second
+        with pytest.raises(AttributeError):
+            first.cnpj_clean = "00000000000000"
+        first.errors.append("alterado")
+        assert second.errors == []
+
+    def test_non_canonical_inputs_bypass_cache(self):
+        """Entradas fora das formas canônicas não são armazenadas"""
+        self.validator.validate(" 11.222.333/0001-81")
+        self.validator.validate("11-222-333-0001-81")
+        assert self.validator.stats()['validate']['size'] == 0
+
+    def test_format_and_get_info_use_cache(self):
+        """format e get_info passam pelo cache"""
+        self.validator.format("11222333000181")
+        self.validator.get_info("11222333000181")
+        self.validator.get_info("11222333000181")
+        assert self.validator.stats()['validate']['hits'] == 1
+
+    def test_validate_alphanumeric(self):
+        """Deve ser chaveado pelo CNPJ limpo e retornar resultado somente leitura"""
+        expected = NewAlphanumericCNPJValidator.validate("12.ABC.345/01DE-35")
+        result = self.validator.validate_alphanumeric("12.ABC.345/01DE-35")
+        again = self.validator.validate_alphanumeric("12abc34501de35")
+
+        assert again is result
+        assert result['valid'] == expected['valid']
+        assert list(result['errors']) == expected['errors']
+        assert self.validator.stats()['alphanumeric']['hits'] == 1
+        with pytest.raises(TypeError):
+            result['valid'] = True
+
+    def test_validate_alphanumeric_empty(self):
+        """Entradas vazias não são armazenadas"""
+        assert self.validator.validate_alphanumeric("")['valid'] is False
+        assert self.validator.validate_alphanumeric("...")['cnpj_clean'] == ''
+        assert self.validator.stats()['alphanumeric']['size'] == 1
+
+    def test_clear_cache(self):
+        """Deve esvaziar os dois caches"""
+        self.validator.validate("11222333000181")
+        self.validator.validate_alphanumeric("11222333000181")
+        self.validator.clear_cache()
+        assert self.validator.stats()['validate']['size'] == 0
+        assert self.validator.stats()['alphanumeric']['size'] == 0
+
+
+class TestCacheConfiguration:
+    """Habilitação do cache no CLI e na API"""
+
+    def test_cli_cache_disabled_by_default(self):
+        """O CLI não usa cache sem configuração"""
+        cli = CNPJValidatorCLI()
+        assert cli.cache_stats() is None
+
+    def test_cli_cache_size(self):
+        """--cache-size habilita o cache do CLI"""
+        args = create_parser().parse_args(['--cache-size', '8', 'validate', '11222333000181'])
+        cli = CNPJValidatorCLI(cache_size=args.cache_size)
+        cli.validate(args.cnpj)
+        cli.validate(args.cnpj)
+        assert cli.cache_stats()['hits'] == 1
+
+    def test_api_cache_stats(self):
+        """GET /cache/stats informa se o cache está habilitado"""
+        pytest.importorskip("fastapi")
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+
+        response = TestClient(app).get("/cache/stats")
+        assert response.status_code == 200
+        assert "enabled" in response.json()
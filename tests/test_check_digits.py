@@ -0,0 +1,228 @@
+"""
+Testes Unitários para o motor de dígitos verificadores (check_digits)
+Seguindo princípios de Shift Left Testing
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.validators.check_digits import (
+    ALPHANUMERIC_ENGINE,
+    NUMERIC_ENGINE,
+    strip_numeric,
+)
+
+
+def _reference_digits(base: str):
+    """Implementação de referência (Módulo 11 direto, sem tabelas)."""
+    weights_first = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+    weights_second = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+    remainder = sum(int(c) * w for c, w in zip(base, weights_first)) % 11
+    first = 0 if remainder < 2 else 11 - remainder
+    remainder = sum(int(c) * w for c, w in zip(base + str(first), weights_second)) % 11
+    second = 0 if remainder < 2 else 11 - remainder
+    return first, second
+
+
+class TestNumericEngine:
+    """Testes do motor numérico baseado em tabelas"""
+
+    def test_compute_known_cnpj(self):
+        """Deve calcular os DVs 8 e 1 para a base 112223330001"""
+        assert NUMERIC_ENGINE.compute("112223330001") == (8, 1)
+
+    def test_compute_ignores_extra_characters(self):
+        """Deve considerar apenas os 12 primeiros caracteres"""
+        assert NUMERIC_ENGINE.compute("11222333000181") == (8, 1)
+
+    @pytest.mark.parametrize("base", [
+        "000000000001", "123456789012", "999999999999",
+        "340283160001", "112223330002", "605749600001",
+    ])
+    def test_compute_matches_reference(self, base):
+        """Deve coincidir com o cálculo direto do Módulo 11"""
+        assert NUMERIC_ENGINE.compute(base) == _reference_digits(base)
+
+    def test_compute_accepts_bytes(self):
+        """Deve aceitar bytes e memoryview sem decodificar"""
+        assert NUMERIC_ENGINE.compute(b"112223330001") == (8, 1)
+        assert NUMERIC_ENGINE.compute(memoryview(b"112223330001")) == (8, 1)
+
+    def test_compute_rejects_short_base(self):
+        """Deve retornar None para base com menos de 12 caracteres"""
+        assert NUMERIC_ENGINE.compute("11222333") is None
+
+    @pytest.mark.parametrize("base", ["11222333000A", "11.222.333/0", "1122233300é1"])
+    def test_compute_rejects_invalid_characters(self, base):
+        """Deve rejeitar caracteres fora do alfabeto numérico"""
+        assert NUMERIC_ENGINE.compute(base) is None
+
+    def test_second_digit_uses_informed_first_digit(self):
+        """Deve calcular o 2º DV a partir do 13º caractere informado"""
+        assert NUMERIC_ENGINE.second_digit("1122233300018") == 1
+        assert NUMERIC_ENGINE.second_digit("112223330001") is None
+        assert NUMERIC_ENGINE.second_digit("112223330001X") is None
+
+    def test_is_valid(self):
+        """Deve validar os DVs de um CNPJ limpo"""
+        assert NUMERIC_ENGINE.is_valid("11222333000181") is True
+        assert NUMERIC_ENGINE.is_valid(b"11222333000181") is True
+        assert NUMERIC_ENGINE.is_valid("11222333000182") is False
+        assert NUMERIC_ENGINE.is_valid("11222333000191") is False
+        assert NUMERIC_ENGINE.is_valid("1122233300018") is False
+        assert NUMERIC_ENGINE.is_valid("1122233300018X") is False
+
+    def test_is_valid_formatted(self):
+        """Deve validar separadores e DVs do layout XX.XXX.XXX/XXXX-XX"""
+        assert NUMERIC_ENGINE.is_valid_formatted("11.222.333/0001-81") is True
+        assert NUMERIC_ENGINE.is_valid_formatted(b"11.222.333/0001-81") is True
+        assert NUMERIC_ENGINE.is_valid_formatted("11.222.333/0001-82") is False
+        assert NUMERIC_ENGINE.is_valid_formatted("11.222.333.0001-81") is False
+        assert NUMERIC_ENGINE.is_valid_formatted("11.222.333/0001-8A") is False
+        assert NUMERIC_ENGINE.is_valid_formatted("11222333000181") is False
+
+    def test_scan_clean(self):
+        """Deve distinguir entrada inválida (None) de DV inválido (False)"""
+        assert NUMERIC_ENGINE.scan_clean(b"11222333000181") is True
+        assert NUMERIC_ENGINE.scan_clean(memoryview(b"11222333000181")) is True
+        assert NUMERIC_ENGINE.scan_clean(b"11222333000182") is False
+        assert NUMERIC_ENGINE.scan_clean(b"1122233300018X") is None
+        assert NUMERIC_ENGINE.scan_clean(b"1122233300018") is None
+
+
+class TestAlphanumericEngine:
+    """Testes do motor alfanumérico baseado em tabelas"""
+
+    @staticmethod
+    def _reference(base: str):
+        """Cálculo direto com A=10 ... Z=35."""
+        def value(char):
+            return int(char) if char.isdigit() else ord(char.upper()) - 55
+        remainder = sum(value(c) * w for c, w in zip(base, [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])) % 11
+        first = 0 if remainder < 2 else 11 - remainder
+        weights = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+        remainder = sum(value(c) * w for c, w in zip(base + str(first), weights)) % 11
+        return first, 0 if remainder < 2 else 11 - remainder
+
+    @pytest.mark.parametrize("base", ["12ABC34501DE", "ZZZZZZZZ0001", "112223330001", "a1b2c3d40001"])
+    def test_compute_matches_reference(self, base):
+        """Deve coincidir com o cálculo direto, inclusive para minúsculas"""
+        assert ALPHANUMERIC_ENGINE.compute(base) == self._reference(base)
+
+    def test_lowercase_equals_uppercase(self):
+        """Minúsculas valem o mesmo que maiúsculas"""
+        assert ALPHANUMERIC_ENGINE.compute("12abc34501de") == ALPHANUMERIC_ENGINE.compute("12ABC34501DE")
+
+    @pytest.mark.parametrize("base", ["12ABC34501D@", "12ABÇ34501DE", "12 ABC34501D"])
+    def test_rejects_invalid_characters(self, base):
+        """Caracteres fora de 0-9/A-Z invalidam a base na mesma passada"""
+        assert ALPHANUMERIC_ENGINE.compute(base) is None
+
+    def test_check_digits_are_numeric(self):
+        """Os DVs continuam restritos a dígitos"""
+        first, second = ALPHANUMERIC_ENGINE.compute("12ABC34501DE")
+        assert ALPHANUMERIC_ENGINE.is_valid(f"12ABC34501DE{first}{second}") is True
+        assert ALPHANUMERIC_ENGINE.is_valid(f"12ABC34501DE{first}A") is False
+
+
+class TestIterOrders:
+    """Testes da enumeração incremental das ordens de uma raiz"""
+
+    @pytest.mark.parametrize("engine, root", [
+        (NUMERIC_ENGINE, "11222333"),
+        (ALPHANUMERIC_ENGINE, "12ABC345"),
+        (ALPHANUMERIC_ENGINE, "zzzzzzzz"),
+    ])
+    @pytest.mark.parametrize("start, stop", [(0, 9999), (9, 11), (7, 7), (123, 4567), (9990, 9999)])
+    def test_matches_compute(self, engine, root, start, stop):
+        """Cada ordem deve ter os mesmos DVs do cálculo completo"""
+        expected = [
+            (order,) + engine.compute(f"{root}{order:04d}") for order in range(start, stop + 1)
+        ]
+        assert list(engine.iter_orders(root, start, stop)) == expected
+
+    def test_empty_range(self):
+        """start maior que stop não gera nada"""
+        assert list(NUMERIC_ENGINE.iter_orders("11222333", 10, 9)) == []
+
+    @pytest.mark.parametrize("root, start, stop", [
+        ("1122233", 1, 9999), ("11222333A", 1, 9999), ("1122233A", 1, 9999),
+        ("11222333", -1, 10), ("11222333", 1, 10000),
+    ])
+    def test_invalid_arguments(self, root, start, stop):
+        """Raiz inválida (no alfabeto do motor) ou faixa fora de 0-9999"""
+        with pytest.raises(ValueError):
+            list(NUMERIC_ENGINE.iter_orders(root, start, stop))
+
+
+class TestIterRoots:
+    """Testes da enumeração de raízes como odômetro"""
+
+    DIGITS = "0123456789"
+    BASE36 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+    @staticmethod
+    def _root(index, alphabet):
+        chars = ""
+        for _ in range(8):
+            index, digit = divmod(index, len(alphabet))
+            chars = alphabet[digit] + chars
+        return chars
+
+    @pytest.mark.parametrize("engine, alphabet", [
+        (NUMERIC_ENGINE, DIGITS), (ALPHANUMERIC_ENGINE, BASE36),
+    ])
+    @pytest.mark.parametrize("start, stop", [
+        (0, 25), (9, 11), (35, 37), (11222333, 11222533), (99_999_990, 100_000_000),
+    ])
+    @pytest.mark.parametrize("order", [1, 9999])
+    def test_matches_compute(self, engine, alphabet, start, stop, order):
+        """Cada raiz deve ter os mesmos DVs do cálculo completo"""
+        if stop > len(alphabet) ** 8:
+            pytest.skip("fora do espaço de raízes")
+        expected = []
+        for index in range(start, stop):
+            root = self._root(index, alphabet)
+            expected.append((root,) + engine.compute(f"{root}{order:04d}"))
+        assert list(engine.iter_roots(start, stop, alphabet, order)) == expected
+
+    def test_carry_across_all_positions(self):
+        """O "vai um" deve atravessar as 7 posições sem perder a soma"""
+        roots = list(ALPHANUMERIC_ENGINE.iter_roots(36 ** 8 - 2, 36 ** 8, self.BASE36))
+        assert [root for root, _, _ in roots] == ["ZZZZZZZY", "ZZZZZZZZ"]
+        assert list(NUMERIC_ENGINE.iter_roots(9_999_999, 10_000_001))[1][0] == "10000000"
+
+    def test_empty_range(self):
+        """start igual a stop não gera nada"""
+        assert list(NUMERIC_ENGINE.iter_roots(5, 5)) == []
+
+    @pytest.mark.parametrize("kwargs", [
+        {"start": 0, "stop": 10, "alphabet": "0123456789A"},
+        {"start": 10, "stop": 5},
+        {"start": 0, "stop": 10 ** 8 + 1},
+        {"start": 0, "stop": 10, "order": 10000},
+    ])
+    def test_invalid_arguments(self, kwargs):
+        """Alfabeto inválido para o motor ou faixa/ordem fora dos limites"""
+        with pytest.raises(ValueError):
+            list(NUMERIC_ENGINE.iter_roots(**kwargs))
+
+
+class TestStripNumeric:
+    """Testes da limpeza rápida de formatação"""
+
+    def test_clean_input_is_returned_as_is(self):
+        """Deve devolver a própria string quando já está limpa"""
+        cnpj = "11222333000181"
+        assert strip_numeric(cnpj) is cnpj
+
+    def test_formatted_input(self):
+        """Deve remover pontuação"""
+        assert strip_numeric("11.222.333/0001-81") == "11222333000181"
+
+    def test_non_ascii_digits_are_removed(self):
+        """Deve remover dígitos não ASCII (ex.: árabe-índicos)"""
+        assert strip_numeric("١١222333000181") == "222333000181"
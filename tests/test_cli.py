@@ -102,6 +102,31 @@ class TestCNPJValidatorCLI:
         assert len(cnpjs) == 3
         assert all(cnpj is not None for cnpj in cnpjs)
     
+    def test_generate_with_seed_is_reproducible(self):
+        """Testa geração reprodutível com semente."""
+        first = self.cli.generate(count=20, seed=42, filial_ratio=0.5)
+        
+        assert first == self.cli.generate(count=20, seed=42, filial_ratio=0.5)
+        assert all(self.cli.validate(cnpj)['valid'] for cnpj in first)
+    
+    def test_generate_with_root_without_format(self):
+        """Testa geração com raiz e sem formatação."""
+        cnpjs = self.cli.generate(count=1, root="11222333", formatted=False)
+        
+        assert cnpjs == ["11222333000181"]
+    
+    def test_iter_establishments(self):
+        """Testa enumeração dos estabelecimentos de uma raiz."""
+        cnpjs = list(self.cli.iter_establishments("11222333", start=1, stop=2, formatted=False))
+        
+        assert cnpjs == ["11222333000181", "11222333000262"]
+    
+    def test_suggest(self):
+        """Testa sugestão de correções para DV inválido."""
+        suggestions = self.cli.suggest("11.222.333/0001-18")
+        
+        assert [s['cnpj_formatted'] for s in suggestions] == ["11.222.333/0001-81"]
+    
     def test_format_valid_cnpj(self):
         """Testa formatação de CNPJ válido."""
         formatted = self.cli.format("11222333000181")
@@ -139,7 +164,7 @@ class TestCNPJValidatorCLI:
     
     def test_batch_validate_file(self):
         """Testa validação em lote de arquivo."""
-        mock_file_content = "11.222.333/0001-81\n34.028.316/0001-03\n11111111111111\n"
+        mock_file_content = b"11.222.333/0001-81\n34.028.316/0001-03\n11111111111111\n"
         
         with patch('builtins.open', mock_open(read_data=mock_file_content)):
             results = self.cli.batch_validate("test.txt")
@@ -151,12 +176,21 @@ class TestCNPJValidatorCLI:
     
     def test_batch_validate_empty_file(self):
         """Testa validação em lote de arquivo vazio."""
-        mock_file_content = "\n\n\n"
+        mock_file_content = b"\n\n\n"
         
         with patch('builtins.open', mock_open(read_data=mock_file_content)):
             results = self.cli.batch_validate("test.txt")
         
         assert len(results) == 0
+    
+    def test_iter_batch_validate_is_lazy(self):
+        """Testa que a validação em lote é entregue sob demanda."""
+        mock_file_content = b"11.222.333/0001-81\n\n11111111111111\n"
+        
+        with patch('builtins.open', mock_open(read_data=mock_file_content)):
+            results = self.cli.iter_batch_validate("test.txt")
+            assert not isinstance(results, list)
+            assert [r['valid'] for r in results] == [True, False]
 
 
 class TestCLIParser:
@@ -304,6 +338,65 @@ class TestCLIMainFunction:
         output = mock_stdout.getvalue()
         assert len(output.strip()) > 0
     
+    @patch('sys.argv', ['cnpj-validator', 'generate', '-n', '3', '--seed', '1', '--json'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_generate_json(self, mock_stdout):
+        """Testa generate --json: array JSON com a quantidade pedida."""
+        main()
+        
+        cnpjs = json.loads(mock_stdout.getvalue())
+        assert len(cnpjs) == 3
+        assert mock_stdout.getvalue() == json.dumps(cnpjs, indent=2) + '\n'
+    
+    @patch('sys.argv', ['cnpj-validator', 'generate', '-n', '25000', '--seed', '1', '--no-format'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_generate_streams_lines(self, mock_stdout):
+        """Testa generate com muitos CNPJs: um por linha, em blocos."""
+        main()
+        
+        lines = mock_stdout.getvalue().splitlines()
+        assert len(lines) == 25000
+        assert all(len(line) == 14 for line in lines)
+    
+    @patch('sys.argv', ['cnpj-validator', 'establishments', '11222333', '--stop', '3', '--json'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_establishments(self, mock_stdout):
+        """Testa execução da função main com establishments."""
+        main()
+        
+        assert json.loads(mock_stdout.getvalue()) == [
+            "11.222.333/0001-81", "11.222.333/0002-62", "11.222.333/0003-43"
+        ]
+    
+    @patch('sys.argv', ['cnpj-validator', 'establishments', '1122'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_establishments_invalid_root(self, mock_stdout):
+        """Testa establishments com raiz inválida."""
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+        
+        assert excinfo.value.code == 1
+        assert "raiz inválida" in mock_stdout.getvalue()
+    
+    @patch('sys.argv', ['cnpj-validator', 'suggest', '11.222.333/0001-82'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_suggest(self, mock_stdout):
+        """Testa execução da função main com suggest."""
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+        
+        assert excinfo.value.code == 0
+        assert "11.222.333/0001-81" in mock_stdout.getvalue()
+    
+    @patch('sys.argv', ['cnpj-validator', 'suggest', '123'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_suggest_without_suggestions(self, mock_stdout):
+        """Testa suggest sem correções possíveis."""
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+        
+        assert excinfo.value.code == 1
+    
     @patch('sys.argv', ['cnpj-validator', 'format', '11222333000181'])
     @patch('sys.stdout', new_callable=StringIO)
     def test_main_format(self, mock_stdout):
@@ -316,6 +409,36 @@ class TestCLIMainFunction:
         output = mock_stdout.getvalue()
         assert "11.222.333/0001-81" in output
     
+    def test_main_dedupe_output(self, tmp_path):
+        """Testa dedupe com --output: CNPJs únicos no arquivo e resumo na saída padrão."""
+        source = tmp_path / "cnpjs.txt"
+        source.write_text("11222333000181\n11.222.333/0001-81\n11111111111111\n34.028.316/0001-03\n")
+        output = tmp_path / "unicos.txt"
+        
+        with patch('sys.argv', ['cnpj-validator', 'dedupe', str(source), '-o', str(output),
+                                '--workers', '1']), \
+                patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            main()
+        
+        assert output.read_text().splitlines() == ["11.222.333/0001-81", "34.028.316/0001-03"]
+        assert "2 CNPJs" in mock_stdout.getvalue()
+        assert "1 de 4 linhas inválidas" in mock_stdout.getvalue()
+    
+    def test_main_diff_to_stdout(self, tmp_path):
+        """Testa diff sem --output: só os CNPJs na saída padrão."""
+        first = tmp_path / "a.txt"
+        first.write_text("11222333000181\n34028316000103\n12ABC345000177\n")
+        second = tmp_path / "b.txt"
+        second.write_text("34.028.316/0001-03\n")
+        
+        with patch('sys.argv', ['cnpj-validator', 'diff', str(first), str(second),
+                                '--no-format', '-w', '1']), \
+                patch('sys.stdout', new_callable=StringIO) as mock_stdout, \
+                patch('sys.stderr', new_callable=StringIO):
+            main()
+        
+        assert mock_stdout.getvalue().splitlines() == ["11222333000181", "12ABC345000177"]
+    
     @patch('sys.argv', ['cnpj-validator'])
     @patch('sys.stdout', new_callable=StringIO)
     def test_main_no_command(self, mock_stdout):
@@ -326,6 +449,90 @@ class TestCLIMainFunction:
         assert excinfo.value.code == 0
 
 
+class TestCLIBatchStreaming:
+    """Testes da saída do comando batch (processada em fluxo)."""
+    
+    CONTENT = b"11.222.333/0001-81\n11111111111111\n"
+    
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_batch_json_is_valid_array(self, mock_stdout):
+        """A saída JSON deve ser idêntica à da lista completa."""
+        with patch('sys.argv', ['cnpj-validator', 'batch', 'cnpjs.txt', '--json']), \
+                patch('builtins.open', mock_open(read_data=self.CONTENT)):
+            main()
+        
+        output = mock_stdout.getvalue()
+        with patch('builtins.open', mock_open(read_data=self.CONTENT)):
+            results = CNPJValidatorCLI().batch_validate("cnpjs.txt")
+        assert output == json.dumps(results, indent=2, ensure_ascii=False) + "\n"
+    
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_batch_json_empty(self, mock_stdout):
+        """Arquivo vazio deve gerar um array JSON vazio."""
+        with patch('sys.argv', ['cnpj-validator', 'batch', 'cnpjs.txt', '--json']), \
+                patch('builtins.open', mock_open(read_data=b"")):
+            main()
+        
+        assert json.loads(mock_stdout.getvalue()) == []
+    
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_batch_summary(self, mock_stdout):
+        """O resumo deve contar os resultados sem guardá-los."""
+        with patch('sys.argv', ['cnpj-validator', 'batch', 'cnpjs.txt', '--summary']), \
+                patch('builtins.open', mock_open(read_data=self.CONTENT)):
+            main()
+        
+        output = mock_stdout.getvalue()
+        assert "Total: 2" in output
+        assert "Válidos: 1" in output
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_batch_uses_cache(self, mock_stdout):
+        """Com --cache-size, CNPJs repetidos do lote devem ser servidos pelo cache."""
+        content = self.CONTENT * 3
+        argv = ['cnpj-validator', '--cache-size', '100', 'batch', 'cnpjs.txt', '--summary']
+        with patch('sys.argv', argv), patch('builtins.open', mock_open(read_data=content)):
+            main()
+
+        output = mock_stdout.getvalue()
+        assert "Total: 6" in output
+        assert "Cache: 4 acertos, 2 faltas" in output
+
+        with patch('builtins.open', mock_open(read_data=content)):
+            assert CNPJValidatorCLI(cache_size=100).batch_validate("cnpjs.txt") == \
+                CNPJValidatorCLI().batch_validate("cnpjs.txt")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_batch_output_format_stdout(self, mock_stdout):
+        """--output-format jsonl grava um objeto por linha, sem resumo."""
+        with patch('sys.argv', ['cnpj-validator', 'batch', 'cnpjs.txt', '--output-format', 'jsonl']), \
+                patch('builtins.open', mock_open(read_data=self.CONTENT)):
+            main()
+
+        lines = mock_stdout.getvalue().splitlines()
+        assert [json.loads(line)['valid'] for line in lines] == [True, False]
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_batch_output_file(self, mock_stdout, tmp_path):
+        """--output grava o arquivo e imprime o resumo na saída padrão."""
+        source = tmp_path / "cnpjs.txt"
+        source.write_bytes(self.CONTENT)
+        target = tmp_path / "resultado.csv"
+        argv = ['cnpj-validator', 'batch', str(source), '-f', 'csv', '-o', str(target), '--flush']
+        with patch('sys.argv', argv):
+            main()
+
+        assert target.read_text(encoding='utf-8').splitlines()[:2] == [
+            'valid,cnpj,errors', 'true,11.222.333/0001-81,'
+        ]
+        assert "1/2 CNPJs válidos" in mock_stdout.getvalue()
+
+    def test_parser_output_format_choices(self):
+        """Formatos de saída desconhecidos são rejeitados."""
+        with pytest.raises(SystemExit):
+            create_parser().parse_args(['batch', 'cnpjs.txt', '--output-format', 'xml'])
+
+
 class TestCLIIntegration:
     """Testes de integração do CLI."""
     
@@ -357,7 +564,7 @@ class TestCLIIntegration:
         """Testa workflow de validação em lote."""
         cli = CNPJValidatorCLI()
         
-        mock_file_content = "11.222.333/0001-81\n34.028.316/0001-03\n"
+        mock_file_content = b"11.222.333/0001-81\n34.028.316/0001-03\n"
         
         with patch('builtins.open', mock_open(read_data=mock_file_content)):
             results = cli.batch_validate("test.txt")
@@ -0,0 +1,97 @@
+"""
+Testes Unitários para a sugestão de correções (corrections)
+Compara as sugestões com a busca exaustiva validando cada candidato
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJValidator
+from src.cnpj_validator.validators.corrections import suggest_corrections
+from src.cnpj_validator.validators.new_alphanumeric_validator import (
+    NewAlphanumericCNPJValidator
+)
+
+DIGITS = "0123456789"
+ROOT_CHARS = DIGITS + "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _acceptable(cnpj):
+    return (NewAlphanumericCNPJValidator.validate(cnpj)['valid'] and cnpj[8:].isdigit()
+            and cnpj[8:12] != "0000" and len(set(cnpj)) > 1)
+
+
+def _brute_force(clean):
+    """Todos os candidatos a uma digitação de distância, validados um a um"""
+    found = []
+    for position in range(13):
+        candidate = clean[:position] + clean[position + 1] + clean[position] + clean[position + 2:]
+        if clean[position] != clean[position + 1] and _acceptable(candidate):
+            found.append((candidate, 'transposition', position))
+    for position in range(14):
+        alphabet = ROOT_CHARS if position < 8 and not clean[:8].isdigit() else DIGITS
+        for char in alphabet:
+            candidate = clean[:position] + char + clean[position + 1:]
+            if char != clean[position] and _acceptable(candidate):
+                found.append((candidate, 'substitution', position))
+    return found
+
+
+class TestSuggestCorrections:
+    """Testes de suggest_corrections"""
+
+    @pytest.mark.parametrize("cnpj", [
+        "11222333000182", "11222333000118", "11222333000811", "11223233000181",
+        "12222333000181", "ABCDE123000199", "5IP2XAIJ000148", "5IP2XAIJ00018A",
+        "1122233300A181", "11222333000100", "00000000000000", "11222333000091",
+    ])
+    def test_matches_brute_force(self, cnpj):
+        """Deve encontrar exatamente os candidatos da busca exaustiva"""
+        got = [(s['cnpj'], s['kind'], s['position']) for s in suggest_corrections(cnpj, 1000)]
+        assert sorted(got) == sorted(_brute_force(cnpj))
+
+    def test_recovers_single_typo(self):
+        """O CNPJ original deve estar entre as sugestões"""
+        assert "11222333000181" in [s['cnpj'] for s in suggest_corrections("11.222.333/0001-82")]
+        assert "11222333000181" in [s['cnpj'] for s in suggest_corrections("11.222.333/0001-18")]
+
+    def test_suggestion_fields(self):
+        """Cada sugestão traz o CNPJ limpo e formatado, o tipo e a posição"""
+        assert suggest_corrections("11.222.333/0001-18") == [{
+            'cnpj': "11222333000181",
+            'cnpj_formatted': "11.222.333/0001-81",
+            'kind': 'transposition',
+            'position': 12,
+        }]
+
+    def test_transpositions_come_first(self):
+        """Transposições antes das substituições, cada grupo por posição"""
+        suggestions = suggest_corrections("11222333000811", 1000)
+        kinds = [s['kind'] for s in suggestions]
+        assert kinds == sorted(kinds, key=lambda kind: kind != 'transposition')
+        substitutions = [s['position'] for s in suggestions if s['kind'] == 'substitution']
+        assert substitutions == sorted(substitutions)
+
+    def test_numeric_root_gets_numeric_suggestions(self):
+        """Raiz numérica recebe apenas sugestões numéricas"""
+        validator = CNPJValidator()
+        for suggestion in suggest_corrections("11222333000182", 1000):
+            assert validator.validate(suggestion['cnpj']).valid
+
+    def test_max_results(self):
+        """Deve limitar a quantidade de sugestões"""
+        assert len(suggest_corrections("ABCDE123000199", 1)) == 1
+        assert suggest_corrections("ABCDE123000199", 0) == []
+
+    @pytest.mark.parametrize("cnpj", ["11.222.333/0001-81", "5I.P2X.AIJ/0001-84", "123", "", None])
+    def test_nothing_to_suggest(self, cnpj):
+        """CNPJ válido ou sem 14 caracteres úteis não tem sugestões"""
+        assert suggest_corrections(cnpj) == []
+
+    def test_validator_staticmethod(self):
+        """NewAlphanumericCNPJValidator expõe a mesma função"""
+        assert (NewAlphanumericCNPJValidator.suggest_corrections("11222333000182")
+                == suggest_corrections("11222333000182"))
@@ -0,0 +1,156 @@
+"""
+Testes Unitários para a geração em fluxo (generator)
+Seguindo princípios de Shift Left Testing
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.generator import (
+    RootRange, _iter_generate_python, enumerate_establishments, iter_generate
+)
+from src.cnpj_validator.validators.new_alphanumeric_validator import (
+    NewAlphanumericCNPJValidator
+)
+
+
+def _all_valid(cnpjs):
+    return all(NewAlphanumericCNPJValidator.validate(cnpj)['valid'] for cnpj in cnpjs)
+
+
+class TestIterGenerate:
+    """Testes de iter_generate"""
+
+    def test_count_and_validity(self):
+        """Deve gerar a quantidade pedida, todos válidos, atravessando blocos"""
+        cnpjs = list(iter_generate(250, seed=1, alphanumeric=True, chunk_size=100))
+        assert len(cnpjs) == 250
+        assert all(isinstance(cnpj, str) and len(cnpj) == 18 for cnpj in cnpjs)
+        assert _all_valid(cnpjs)
+
+    def test_seed_is_reproducible(self):
+        """A mesma semente e o mesmo bloco geram a mesma sequência"""
+        assert list(iter_generate(50, seed=9)) == list(iter_generate(50, seed=9))
+        assert list(iter_generate(50, seed=9, stream=0)) != list(iter_generate(50, seed=9, stream=1))
+
+    def test_unformatted(self):
+        """formatted=False gera 14 caracteres"""
+        assert all(len(cnpj) == 14 for cnpj in iter_generate(20, seed=2, formatted=False))
+
+    def test_zero(self):
+        """count=0 não gera nada"""
+        assert list(iter_generate(0)) == []
+
+    @pytest.mark.parametrize("kwargs", [{"count": -1}, {"count": 1, "filial_ratio": -0.1}])
+    def test_invalid_arguments(self, kwargs):
+        """Deve rejeitar quantidade negativa e fração fora de [0, 1]"""
+        with pytest.raises(ValueError):
+            list(iter_generate(**kwargs))
+
+
+class TestPythonFallback:
+    """Testes da geração sem NumPy"""
+
+    @pytest.mark.parametrize("alphanumeric", [False, True])
+    def test_valid_and_reproducible(self, alphanumeric):
+        """Deve gerar CNPJs válidos e reprodutíveis pela semente"""
+        cnpjs = list(_iter_generate_python(200, 5, alphanumeric, 0.5, True))
+        assert _all_valid(cnpjs)
+        assert cnpjs == list(_iter_generate_python(200, 5, alphanumeric, 0.5, True))
+        if not alphanumeric:
+            assert all(cnpj.replace('.', '').replace('/', '').replace('-', '').isdigit()
+                       for cnpj in cnpjs)
+
+
+class TestEnumerateEstablishments:
+    """Testes de enumerate_establishments"""
+
+    def test_all_orders_of_root(self):
+        """Deve gerar as 9999 ordens da raiz, todas válidas e em sequência"""
+        cnpjs = list(enumerate_establishments("11.222.333"))
+        assert len(cnpjs) == 9999
+        assert cnpjs[0] == "11.222.333/0001-81"
+        assert cnpjs[-1].startswith("11.222.333/9999-")
+        assert _all_valid(cnpjs)
+
+    def test_alphanumeric_unformatted_range(self):
+        """Raiz alfanumérica (minúsculas aceitas) e faixa parcial sem formatação"""
+        cnpjs = list(enumerate_establishments("ab.cde.123", start=98, stop=102, formatted=False))
+        assert [cnpj[8:12] for cnpj in cnpjs] == ["0098", "0099", "0100", "0101", "0102"]
+        assert all(cnpj.startswith("ABCDE123") for cnpj in cnpjs)
+        assert _all_valid(cnpjs)
+
+    def test_is_lazy(self):
+        """Deve produzir os itens sob demanda"""
+        cnpjs = enumerate_establishments("11222333")
+        assert next(cnpjs) == "11.222.333/0001-81"
+
+    @pytest.mark.parametrize("root, start", [("1122233", 1), ("11*22333", 1), (None, 1), ("11222333", 0)])
+    def test_invalid_arguments(self, root, start):
+        """Deve rejeitar raiz inválida e a ordem 0000"""
+        with pytest.raises(ValueError):
+            list(enumerate_establishments(root, start=start))
+
+
+class TestRootRange:
+    """Testes de RootRange"""
+
+    def test_numeric_range(self):
+        """Deve gerar uma matriz válida por raiz, na ordem decimal"""
+        cnpjs = list(RootRange("11222333", "11222343"))
+        assert len(cnpjs) == 10
+        assert cnpjs[0] == "11.222.333/0001-81"
+        assert cnpjs[-1].startswith("11.222.342/0001-")
+        assert _all_valid(cnpjs)
+
+    def test_alphanumeric_base36_order(self):
+        """Alfanumérica, a ordem é base 36: 9 < A < Z < 10"""
+        roots = [cnpj[:8] for cnpj in RootRange("AB000008", "AB000011", alphanumeric=True,
+                                                  formatted=False)]
+        assert roots[:3] == ["AB000008", "AB000009", "AB00000A"]
+        assert roots[-2:] == ["AB00000Z", "AB000010"]
+        assert len(roots) == 29
+
+    def test_order_and_format(self):
+        """A ordem informada é usada em todos os CNPJs"""
+        cnpjs = list(RootRange("11222333", "11222335", order=2, formatted=False))
+        assert cnpjs[0] == "11222333000262"
+        assert all(cnpj[8:12] == "0002" for cnpj in cnpjs)
+        assert _all_valid(cnpjs)
+
+    def test_with_prefix(self):
+        """with_prefix cobre todas as raízes do prefixo"""
+        numeric = RootRange.with_prefix("11.222.3")
+        assert (numeric.start_root, numeric.end_root, len(numeric)) == ("11222300", "11222400", 100)
+        alphanumeric = RootRange.with_prefix("zzzzzz", alphanumeric=True)
+        assert (alphanumeric.start_root, alphanumeric.end_root) == ("ZZZZZZ00", None)
+        assert len(alphanumeric) == 36 ** 2
+
+    @pytest.mark.parametrize("count", [1, 3, 7, 150])
+    def test_shards_partition_the_range(self, count):
+        """As partes são contíguas, disjuntas e cobrem a faixa inteira"""
+        whole = RootRange("11222300", "11222400", formatted=False)
+        shards = [whole.shard(index, count) for index in range(count)]
+        assert shards[0].start == whole.start and shards[-1].stop == whole.stop
+        assert all(a.stop == b.start for a, b in zip(shards, shards[1:]))
+        assert max(map(len, shards)) - min(map(len, shards)) <= 1
+        assert [cnpj for shard in shards for cnpj in shard] == list(whole)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"start_root": "1122233"}, {"start_root": "1122233A"},
+        {"start_root": "2", "end_root": "1"}, {"start_root": "11222334", "end_root": "11222333"},
+        {"order": 0}, {"order": 10000},
+    ])
+    def test_invalid_arguments(self, kwargs):
+        """Deve rejeitar raízes inválidas, faixa invertida e ordem fora de 1-9999"""
+        with pytest.raises(ValueError):
+            RootRange(**kwargs)
+
+    @pytest.mark.parametrize("index, count", [(0, 0), (3, 3), (-1, 2)])
+    def test_invalid_shard(self, index, count):
+        """Deve rejeitar partes fora de [0, count)"""
+        with pytest.raises(ValueError):
+            RootRange().shard(index, count)
@@ -10,7 +10,7 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.cnpj_validator import CNPJValidator
+from src.cnpj_validator import CNPJValidator, is_valid, is_valid_many
 from src.cnpj_validator.validators.numeric_validator import NumericCNPJValidator
 from src.cnpj_validator.validators.alphanumeric_validator import AlphanumericCNPJValidator
 
@@ -84,6 +84,77 @@ class TestCNPJValidatorStaticMethod:
         assert CNPJValidator.is_valid("") is False
         assert CNPJValidator.is_valid(None) is False
 
+    @pytest.mark.parametrize("cnpj", [
+        "11222333000181", "11.222.333/0001-81", "11222333/0001-81",
+        " 11.222.333/0001-81 ", "11-222-333-0001.81", "11.222.333/0001-8",
+        "11.222.333/0001-811", "11222333000182", "11.222.333/0001-82",
+        "1122233300018a", "11.222.333/0001-8a", "11.222.333.0001-81",
+        "00.000.000/0000-00", "11111111111111", "١١222333000181",
+        "", "abc", 11222333000181, b"11222333000181",
+    ])
+    def test_is_valid_matches_validate(self, cnpj):
+        """O atalho deve coincidir com validate(validate_format=False)"""
+        expected = CNPJValidator().validate(cnpj, validate_format=False)['valid']
+        assert is_valid(cnpj) is expected
+        assert CNPJValidator.is_valid(cnpj) is expected
+
+    def test_is_valid_many(self):
+        """Deve retornar um byte (1/0) por CNPJ, na ordem da entrada"""
+        cnpjs = ["11222333000181", "00000000000000", None, "11.222.333/0001-81"]
+        result = is_valid_many(cnpjs)
+        assert isinstance(result, bytearray)
+        assert list(result) == [1, 0, 0, 1]
+        assert CNPJValidator.is_valid_many(iter(cnpjs)) == result
+        assert is_valid_many([]) == bytearray()
+
+
+class TestCNPJValidatorIterValidate:
+    """Testes da validação em fluxo (iter_validate)"""
+    
+    CNPJS = ["11.222.333/0001-81", "11222333000181", "11111111111111", "", "11.222.333/0001-82"]
+    
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 100])
+    def test_same_results_as_validate(self, chunk_size):
+        """Deve produzir os mesmos resultados de validate, na mesma ordem"""
+        validator = CNPJValidator()
+        results = validator.iter_validate(iter(self.CNPJS), chunk_size=chunk_size)
+        assert [r.to_dict() for r in results] == [validator.validate(c).to_dict() for c in self.CNPJS]
+    
+    def test_is_lazy(self):
+        """Deve consumir a entrada apenas um bloco por vez"""
+        consumed = []
+        
+        def source():
+            for cnpj in self.CNPJS:
+                consumed.append(cnpj)
+                yield cnpj
+        
+        results = CNPJValidator().iter_validate(source(), chunk_size=2)
+        assert consumed == []
+        assert next(results).valid is True
+        assert len(consumed) == 2
+    
+    def test_validate_format_flag(self):
+        """Deve repassar validate_format"""
+        result = next(CNPJValidator().iter_validate(["11222333000181"], validate_format=False))
+        assert result['alphanumeric_validation'] == {}
+    
+    def test_empty_iterable(self):
+        """Iterável vazio não produz resultados"""
+        assert list(CNPJValidator().iter_validate([])) == []
+
+    def test_overridden_validate_is_used(self):
+        """Subclasses que redefinem validate devem ser chamadas a cada entrada"""
+        calls = []
+
+        class Counting(CNPJValidator):
+            def validate(self, cnpj, validate_format=True):
+                calls.append(cnpj)
+                return super().validate(cnpj, validate_format)
+
+        assert len(list(Counting().iter_validate(self.CNPJS, chunk_size=2))) == len(self.CNPJS)
+        assert calls == self.CNPJS
+
 
 class TestCNPJValidatorFormatMethod:
     """Testes do método format"""
@@ -126,6 +126,77 @@ class TestAlphanumericCNPJIntegration:
         # Todos devem ser únicos
         assert len(generated_cnpjs) == 10, "Todos os CNPJs gerados devem ser únicos"
 
+    def test_api_establishments_stream(self):
+        """Deve listar em fluxo os estabelecimentos válidos de uma raiz."""
+        response = client.get(
+            "/api/v1/generate/establishments",
+            params={"raiz": "AB.CDE.123", "inicio": 1, "fim": 12}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        cnpjs = response.text.splitlines()
+        assert len(cnpjs) == 12
+        assert cnpjs[0].startswith("AB.CDE.123/0001-")
+        assert cnpjs[-1].startswith("AB.CDE.123/0012-")
+        for cnpj in cnpjs:
+            assert self.validator.validate(cnpj)['valid'], cnpj
+
+    def test_api_establishments_invalid_root(self):
+        """Deve rejeitar raiz inválida antes de iniciar o fluxo."""
+        response = client.get("/api/v1/generate/establishments", params={"raiz": "AB@CD123"})
+
+        assert response.status_code == 400
+
+    def test_api_consulta_prefilter(self):
+        """Deve responder 404 sem consulta externa para CNPJ ausente do pré-filtro."""
+        from unittest.mock import patch
+        from src.cnpj_validator.prefilter import BloomFilter
+
+        prefilter = BloomFilter(10)
+        prefilter.add("11222333000181")
+        with patch("src.api.main.prefilter", prefilter), \
+                patch("src.api.main.AsyncReceitaFederalAPI") as api_class:
+            response = client.get("/api/v1/consulta", params={"cnpj": "34028316000103"})
+            situacao = client.get("/api/v1/consulta/situacao", params={"cnpj": "34028316000103"})
+
+        assert response.status_code == 404
+        assert situacao.status_code == 404
+        api_class.assert_not_called()
+
+    def test_api_consulta_async(self):
+        """Deve consultar pelo cliente assíncrono e mapear endereço e CNAE."""
+        from unittest.mock import AsyncMock, patch
+        from src.cnpj_validator.receita_federal_api import CNPJData
+
+        dados = CNPJData(
+            cnpj="11222333000181",
+            razao_social="EMPRESA TESTE LTDA",
+            situacao_cadastral="ATIVA",
+            endereco={"municipio": "SAO PAULO", "uf": "SP"},
+            cnae_principal={"codigo": "6201501", "descricao": "Desenvolvimento de software"},
+        )
+        with patch("src.api.main.AsyncReceitaFederalAPI.consultar",
+                   new=AsyncMock(return_value=dados)):
+            response = client.get("/api/v1/consulta", params={"cnpj": "11222333000181"})
+            situacao = client.get("/api/v1/consulta/situacao", params={"cnpj": "11222333000181"})
+
+        assert response.status_code == 200
+        assert response.json()["municipio"] == "SAO PAULO"
+        assert response.json()["atividade_principal"] == "Desenvolvimento de software"
+        assert situacao.json()["ativa"] is True
+
+    def test_api_suggest_corrections(self):
+        """Deve sugerir correções válidas para um DV inválido."""
+        response = client.get("/api/v1/suggest", params={"cnpj": "AB.CDE.123/0001-99"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["valid"] is False
+        assert len(data["suggestions"]) > 0
+        for suggestion in data["suggestions"]:
+            assert self.validator.validate(suggestion["cnpj_formatted"])['valid']
+
     def test_validator_business_rules(self):
         """Deve validar regras de negócio do CNPJ alfanumérico."""
         # Testar que não permite caracteres especiais além de letras e números
@@ -0,0 +1,107 @@
+"""
+Testes Unitários para a chave inteira compacta (CNPJKey)
+Seguindo princípios de Shift Left Testing
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJKey
+
+
+CNPJS = [
+    "11222333000181", "11.222.333/0001-81", "AB.CDE.123/0001-45", "5ip2xaij000184",
+    "00000000000000", "ZZZZZZZZ999999", "12ABC345000199",
+]
+INVALID = [
+    "", "1122233300018", "11222333000181 ", "11.222.333/0001-8A", "1122233300A181",
+    "11-222-333/0001-81", "١١222333000181", "1122233300018²", "+1222333000181",
+    "1_222333000181", "11.222.333/0001_81",
+]
+
+
+def _clean(cnpj):
+    return cnpj.upper().replace('.', '').replace('/', '').replace('-', '')
+
+
+class TestCNPJKey:
+    """Testes da codificação escalar"""
+
+    @pytest.mark.parametrize("cnpj", CNPJS)
+    def test_roundtrip(self, cnpj):
+        """decode(encode(x)) devolve o CNPJ limpo em maiúsculas"""
+        key = CNPJKey.encode(cnpj)
+        assert 0 <= key < 2 ** 63
+        assert CNPJKey.decode(key) == _clean(cnpj)
+
+    def test_formatted_decode(self):
+        """decode com formatted=True devolve XX.XXX.XXX/XXXX-XX"""
+        assert CNPJKey.decode(CNPJKey.encode("ab.cde.123/0001-45"), formatted=True) == \
+            "AB.CDE.123/0001-45"
+
+    def test_bytes_input(self):
+        """Aceita bytes, com o mesmo resultado da str"""
+        assert CNPJKey.encode(b"11.222.333/0001-81") == CNPJKey.encode("11222333000181")
+        assert CNPJKey.encode(memoryview(b"11222333000181")) == CNPJKey.encode("11222333000181")
+
+    def test_order_follows_root_then_order(self):
+        """A ordem das chaves é a ordem lexicográfica dos CNPJs limpos"""
+        cnpjs = ["11222333000181", "11222333000262", "11222334000181", "9ZZZZZZZ000100",
+                 "A0000000000100", "00000001999999", "11222333000100"]
+        assert sorted(cnpjs, key=CNPJKey.encode) == sorted(cnpjs)
+
+    def test_root(self):
+        """Todos os estabelecimentos de uma raiz têm a mesma parte de raiz"""
+        assert CNPJKey.root(CNPJKey.encode("11222333000181")) == \
+            CNPJKey.root(CNPJKey.encode("11.222.333/0002-62")) == int("11222333", 36)
+
+    @pytest.mark.parametrize("cnpj", INVALID + [None, 11222333000181])
+    def test_invalid_input(self, cnpj):
+        """Deve rejeitar entradas fora do layout canônico"""
+        with pytest.raises(ValueError):
+            CNPJKey.encode(cnpj)
+
+    @pytest.mark.parametrize("key", [-1, 2 ** 63, 36 ** 8 << 21, 10000 << 7, 100, CNPJKey.INVALID])
+    def test_invalid_key(self, key):
+        """Deve rejeitar chaves que não correspondem a um CNPJ"""
+        with pytest.raises(ValueError):
+            CNPJKey.decode(key)
+
+
+class TestCNPJKeyMany:
+    """Testes da codificação vetorizada"""
+
+    np = pytest.importorskip("numpy")
+
+    def test_matches_scalar(self):
+        """encode_many deve concordar com encode, com INVALID nas linhas rejeitadas"""
+        values = CNPJS + INVALID
+        keys = CNPJKey.encode_many(self.np.array([v.encode() for v in values], dtype="S20"))
+        assert keys.dtype == self.np.uint64
+        expected = [CNPJKey.encode(v) for v in CNPJS] + [CNPJKey.INVALID] * len(INVALID)
+        assert keys.tolist() == expected
+
+    @pytest.mark.parametrize("formatted", [False, True])
+    def test_decode_many(self, formatted):
+        """decode_many deve concordar com decode; chaves inválidas viram b''"""
+        keys = [CNPJKey.encode(v) for v in CNPJS] + [CNPJKey.INVALID, 10000 << 7]
+        decoded = CNPJKey.decode_many(keys, formatted=formatted, chunk_size=3)
+        assert decoded.dtype == self.np.dtype("S18" if formatted else "S14")
+        assert decoded.astype(str).tolist() == \
+            [CNPJKey.decode(key, formatted) for key in keys[:-2]] + ["", ""]
+
+    def test_sorting_keys_sorts_cnpjs(self):
+        """Ordenar o array de chaves ordena os CNPJs por raiz e ordem"""
+        values = self.np.array([_clean(v).encode() for v in CNPJS], dtype="S14")
+        keys = self.np.sort(CNPJKey.encode_many(values))
+        assert CNPJKey.decode_many(keys).tolist() == sorted(values.tolist())
+
+    def test_narrow_and_empty_input(self):
+        """Entradas curtas são inválidas e entrada vazia retorna array vazio"""
+        assert CNPJKey.encode_many(self.np.array([b"123"], dtype="S3")).tolist() == \
+            [CNPJKey.INVALID]
+        assert CNPJKey.encode_many(self.np.array([], dtype="S14")).size == 0
+        assert CNPJKey.decode_many([]).size == 0
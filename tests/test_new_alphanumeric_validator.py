@@ -155,6 +155,19 @@ class TestNewAlphanumericCNPJValidator:
         result = NewAlphanumericCNPJValidator.validate_check_digits("11222333000181")
         assert result['valid'] is True
         assert result['expected_dv'] == "81"
+    
+    def test_unknown_characters_count_as_zero(self):
+        """Caracteres fora do alfabeto continuam valendo 0 no cálculo"""
+        assert (NewAlphanumericCNPJValidator.calculate_first_digit("11222333000@")
+                == NewAlphanumericCNPJValidator.calculate_first_digit("112223330000"))
+        assert (NewAlphanumericCNPJValidator.calculate_second_digit("1122233300A@")
+                == NewAlphanumericCNPJValidator.calculate_second_digit("1122233300A0"))
+    
+    def test_validate_check_digits_lowercase(self):
+        """Minúsculas produzem os mesmos DVs que maiúsculas"""
+        upper = NewAlphanumericCNPJValidator.validate_check_digits("12ABC34501DE35")
+        lower = NewAlphanumericCNPJValidator.validate_check_digits("12abc34501de35")
+        assert upper == lower
 
     # =========================================================================
     # Testes de Validação Completa
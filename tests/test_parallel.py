@@ -0,0 +1,87 @@
+"""
+Testes Unitários para a validação paralela (parallel)
+Seguindo princípios de Shift Left Testing
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJValidator, validate_parallel
+from src.cnpj_validator.parallel import decode_record, encode_record
+from src.cnpj_validator.validators.error_codes import ErrorCode, WarningCode
+
+
+CNPJS = [
+    "11.222.333/0001-81", "11222333000181", "11.222.333/0001-82", "11111111111111",
+    " 11.222.333/0001-81", "11 222 333 0001 81", "11.222.333/0000-09", "11222333000009",
+    "11.222.333/0001-8\t1", "11.222.333\\0001-81", "", None, "abc",
+] * 7
+
+
+def _expected(validate_format=True):
+    validator = CNPJValidator()
+    return [validator.validate(cnpj, validate_format).to_dict() for cnpj in CNPJS]
+
+
+class TestRecordEncoding:
+    """Testes da codificação compacta entre processos"""
+
+    @pytest.mark.parametrize("codes", [
+        (ErrorCode.OK, None, ()),
+        (ErrorCode.OK, (), (WarningCode.UNFORMATTED_INPUT,)),
+        (ErrorCode.INVALID_CHECK_DIGITS, None, ()),
+        (ErrorCode.OK, (ErrorCode.WHITESPACE, ErrorCode.TAB, ErrorCode.SPECIAL_CHARACTERS),
+         (WarningCode.SURROUNDING_WHITESPACE,)),
+        (ErrorCode.OK, (ErrorCode.FILIAL_ZERO,), ()),
+    ])
+    def test_roundtrip(self, codes):
+        """Deve recuperar exatamente os mesmos códigos"""
+        record = encode_record(*codes)
+        assert 0 <= record < 2 ** 32
+        assert decode_record(record) == codes
+
+
+class TestValidateParallel:
+    """Testes de validate_parallel"""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_ordered_matches_validate(self, workers):
+        """Deve produzir os resultados de CNPJValidator.validate, na ordem"""
+        results = validate_parallel(iter(CNPJS), workers=workers, chunk_size=10)
+        assert [r.to_dict() for r in results] == _expected()
+
+    def test_unordered_has_same_results(self):
+        """Na ordem de conclusão, o conjunto de resultados é o mesmo"""
+        results = validate_parallel(CNPJS, workers=2, chunk_size=10, ordered=False)
+        got = sorted(repr(r.to_dict()) for r in results)
+        assert got == sorted(repr(r) for r in _expected())
+
+    def test_without_format_validation(self):
+        """Deve repassar validate_format"""
+        results = validate_parallel(CNPJS, workers=2, chunk_size=10, validate_format=False)
+        assert [r.to_dict() for r in results] == _expected(validate_format=False)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_compact(self, workers):
+        """compact=True entrega (entrada, código do primeiro erro)"""
+        validator = CNPJValidator()
+        expected = []
+        for cnpj in CNPJS:
+            error_codes = validator.validate(cnpj).error_codes
+            expected.append((cnpj, error_codes[0] if error_codes else ErrorCode.OK))
+
+        results = list(validate_parallel(CNPJS, workers=workers, chunk_size=10, compact=True))
+        assert results == expected
+
+    def test_empty_source(self):
+        """Fonte vazia não produz resultados"""
+        assert list(validate_parallel([], workers=2)) == []
+
+    def test_consumer_can_stop_early(self):
+        """Interromper o consumo encerra o pool sem erros"""
+        results = validate_parallel(iter(CNPJS * 10), workers=2, chunk_size=5)
+        assert next(results).valid is True
+        results.close()
@@ -0,0 +1,137 @@
+"""
+Testes do pré-filtro de CNPJs registrados (filtro de Bloom em blocos)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.generator import iter_generate
+from src.cnpj_validator.keys import CNPJKey
+from src.cnpj_validator.prefilter import BloomFilter, blocked_fp_rate
+
+
+def _write(path, lines):
+    path.write_text('\n'.join(lines) + '\n')
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def registered():
+    return list(iter_generate(5000, seed=1, alphanumeric=True, filial_ratio=0.3, formatted=False))
+
+
+@pytest.fixture(scope="module")
+def absent():
+    return list(iter_generate(20000, seed=2, alphanumeric=True, filial_ratio=0.3, formatted=False))
+
+
+class TestBloomFilter:
+    """Testes de inserção, consulta e taxa de falsos positivos."""
+
+    def test_no_false_negatives(self, registered):
+        """Deve encontrar todos os CNPJs inseridos, em qualquer formatação."""
+        bloom = BloomFilter(len(registered), fp_rate=0.01)
+        for cnpj in registered:
+            assert bloom.add(cnpj)
+
+        assert len(bloom) == len(registered)
+        assert all(cnpj in bloom for cnpj in registered)
+        assert all(f"{c[:2]}.{c[2:5]}.{c[5:8]}/{c[8:12]}-{c[12:]}".lower() in bloom for c in registered[:200])
+
+    @pytest.mark.parametrize("fp_rate", [0.05, 0.01])
+    def test_false_positive_rate(self, registered, absent, fp_rate):
+        """Deve manter a taxa de falsos positivos perto da configurada."""
+        bloom = BloomFilter(len(registered), fp_rate=fp_rate)
+        for cnpj in registered:
+            bloom.add(cnpj)
+
+        measured = sum(cnpj in bloom for cnpj in absent) / len(absent)
+        assert measured < fp_rate * 1.5
+
+    def test_invalid_cnpjs(self):
+        """Deve recusar CNPJs inválidos na inserção e na consulta."""
+        bloom = BloomFilter(10)
+        assert bloom.add("11222333000182") is False
+        assert len(bloom) == 0
+        assert "11222333000182" not in bloom
+        assert "abc" not in bloom
+        assert 11222333000181 not in bloom
+
+    def test_vectorized_add_matches_scalar(self, registered):
+        """Deve ligar os mesmos bits com chaves em array NumPy e uma a uma."""
+        numpy = pytest.importorskip("numpy")
+        keys = [CNPJKey.encode(cnpj) for cnpj in registered]
+
+        scalar = BloomFilter(len(keys), fp_rate=0.001)
+        scalar.add_keys(keys)
+        vectorized = BloomFilter(len(keys), fp_rate=0.001)
+        vectorized.add_keys(numpy.array(keys, dtype=numpy.uint64))
+
+        assert scalar.k > 7  # mais de um hash por chave
+        assert bytes(scalar._bits) == bytes(vectorized._bits)
+        assert len(scalar) == len(vectorized) == len(keys)
+
+    def test_sized_by_fp_rate(self):
+        """Deve crescer conforme a taxa de falsos positivos diminui."""
+        sizes = [BloomFilter(100_000, fp_rate).size_bytes for fp_rate in (0.1, 0.01, 0.001)]
+        assert sizes == sorted(sizes)
+        bloom = BloomFilter(100_000, 0.01)
+        assert blocked_fp_rate(100_000 / bloom.blocks, bloom.k) <= 0.01
+
+    @pytest.mark.parametrize("capacity, fp_rate", [(-1, 0.01), (10, 0.0), (10, 1.0)])
+    def test_invalid_parameters(self, capacity, fp_rate):
+        """Deve rejeitar capacidade negativa e taxa fora de (0, 1)."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity, fp_rate)
+
+
+class TestPersistence:
+    """Testes de gravação e abertura mapeada em memória."""
+
+    def test_save_and_open(self, registered, absent, tmp_path):
+        """Deve responder igual depois de gravado e mapeado."""
+        bloom = BloomFilter(len(registered), fp_rate=0.01)
+        bloom.add_keys(CNPJKey.encode(cnpj) for cnpj in registered)
+        path = str(tmp_path / "cnpjs.bloom")
+        bloom.save(path)
+
+        with BloomFilter.open(path) as mapped:
+            assert (mapped.k, mapped.blocks, mapped.count, mapped.fp_rate) == (
+                bloom.k, bloom.blocks, bloom.count, bloom.fp_rate
+            )
+            assert all(cnpj in mapped for cnpj in registered)
+            assert [cnpj in mapped for cnpj in absent] == [cnpj in bloom for cnpj in absent]
+        assert os.path.getsize(path) == 64 + bloom.size_bytes
+
+    @pytest.mark.parametrize("content", [b"", b"nao e um filtro", b"CNPJBLM1" + b"\0" * 100])
+    def test_open_invalid_file(self, tmp_path, content):
+        """Deve rejeitar arquivos que não são filtros."""
+        path = tmp_path / "invalido.bloom"
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            BloomFilter.open(str(path))
+
+
+class TestBuild:
+    """Testes da construção a partir de listas e dumps."""
+
+    def test_build_from_list_and_dump(self, registered, tmp_path):
+        """Deve aceitar listas e o layout de Estabelecimentos ("básico";"ordem";"dv";...)."""
+        listing = _write(tmp_path / "lista.txt", registered[:100] + ["invalido"])
+        dump = _write(tmp_path / "estabelecimentos.csv", [
+            f'"{c[:8]}";"{c[8:12]}";"{c[12:]}";"1";"EMPRESA"' for c in registered[100:200]
+        ])
+
+        bloom = BloomFilter.build([listing, dump], fp_rate=0.01, chunk_size=30)
+
+        assert len(bloom) == 200
+        assert all(cnpj in bloom for cnpj in registered[:200])
+
+    def test_build_requires_capacity_for_stdin(self):
+        """Deve exigir capacity ao ler da entrada padrão."""
+        with pytest.raises(ValueError):
+            BloomFilter.build(['-'])
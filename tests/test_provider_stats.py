@@ -0,0 +1,264 @@
+"""
+Testes das estatísticas por provedor, do roteamento adaptativo e do hedge
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.async_receita_federal_api import AsyncReceitaFederalAPI
+from src.cnpj_validator.provider_stats import MIN_SAMPLES, ProviderStats, default_provider_stats
+from src.cnpj_validator.rate_limit import SharedRateLimiter
+from src.cnpj_validator.receita_federal_api import ReceitaFederalAPI, ReceitaFederalAPIError
+from tests.fakes import FakeProviders
+
+CNPJ = "11222333000181"
+
+
+def _api(fake, stats=None, limits=None, cls=ReceitaFederalAPI, **kwargs):
+    api = cls(
+        api_preferida="a", max_retries=1, retry_delay=0.0,
+        rate_limiter=SharedRateLimiter(limits=limits or {}, default_limit=None),
+        provider_stats=stats if stats is not None else ProviderStats(),
+        **kwargs,
+    )
+    api.APIS = {"a": "a/{cnpj}", "b": "b/{cnpj}"}
+    api._fazer_requisicao = fake.async_call if cls is AsyncReceitaFederalAPI else fake
+    return api
+
+
+def _stats(**latencies):
+    """ProviderStats com MIN_SAMPLES respostas por provedor (latência fixa)."""
+    stats = ProviderStats()
+    for provider, latency in latencies.items():
+        for _ in range(MIN_SAMPLES):
+            stats.record(provider, latency)
+    return stats
+
+
+class TestProviderStats:
+    """Testes do ProviderStats."""
+
+    def test_ewma(self):
+        """Deve começar pela primeira amostra e suavizar as seguintes."""
+        stats = ProviderStats(alpha=0.5)
+        assert stats.ewma("a") is None
+
+        stats.record("a", 1.0)
+        stats.record("a", 3.0)
+
+        assert stats.ewma("a") == pytest.approx(2.0)
+
+    def test_errors_not_in_latency(self):
+        """Deve contar erros na taxa de erro, fora da EWMA e dos percentis."""
+        stats = ProviderStats(alpha=0.5)
+        stats.record("a", 1.0)
+        stats.record("a", 30.0, ok=False)
+
+        assert stats.ewma("a") == pytest.approx(1.0)
+        assert stats.error_rate("a") == pytest.approx(0.5)
+        assert stats.expected_latency("a") == pytest.approx(2.0)
+
+    def test_ewma_capped_at_p95(self):
+        """Deve limitar ao p95 a amostra lenta isolada na EWMA, mas não nos percentis."""
+        stats = _stats(a=0.1)
+        stats.record("a", 10.0)
+
+        assert stats.ewma("a") == pytest.approx(0.1)
+        assert stats.percentile("a", 1.0) == 10.0
+
+    def test_percentile(self):
+        """Deve calcular percentis sobre a janela, só com amostras suficientes."""
+        stats = ProviderStats(window=100)
+        for i in range(MIN_SAMPLES - 1):
+            stats.record("a", 1.0)
+        assert stats.percentile("a", 0.95) is None
+
+        for i in range(200):
+            stats.record("a", float(i))
+
+        assert stats.percentile("a", 0.5) == 150.0
+        assert stats.percentile("a", 0.95) == 195.0
+        assert stats.percentile("a", 1.0) == 199.0
+
+    def test_expected_latency_unknown_and_only_errors(self):
+        """Deve experimentar provedores sem amostras e evitar os que só falharam."""
+        stats = ProviderStats()
+        stats.record("a", 0.1)
+        stats.record("b", 0.1, ok=False)
+
+        assert stats.expected_latency("c") == 0.0
+        assert stats.expected_latency("b") == float("inf")
+        assert stats.ranking(["a", "b", "c"]) == ["c", "a", "b"]
+
+    def test_ranking(self):
+        """Deve ordenar pela latência esperada somada à espera extra, estável nos empates."""
+        stats = _stats(a=0.5, b=0.1)
+
+        assert stats.ranking(["a", "b"]) == ["b", "a"]
+        assert stats.ranking(["a", "b"], {"a": 0.0, "b": 1.0}.get) == ["a", "b"]
+        assert stats.ranking(["x", "y"]) == ["x", "y"]
+
+    def test_snapshot_and_reset(self):
+        """Deve resumir as estatísticas em milissegundos e descartá-las no reset."""
+        stats = _stats(a=0.2)
+        stats.record("a", 1.0, ok=False)
+
+        snapshot = stats.snapshot()["a"]
+        assert snapshot["requests"] == MIN_SAMPLES + 1
+        assert snapshot["errors"] == 1
+        assert snapshot["ewma_ms"] == pytest.approx(200.0)
+        assert snapshot["p95_ms"] == pytest.approx(200.0)
+
+        stats.reset()
+        assert stats.snapshot() == {}
+
+    def test_invalid_arguments(self):
+        """Deve rejeitar alpha e window fora do intervalo."""
+        with pytest.raises(ValueError):
+            ProviderStats(alpha=0)
+        with pytest.raises(ValueError):
+            ProviderStats(window=0)
+
+    def test_default_shared(self):
+        """Deve usar as estatísticas do processo sem provider_stats explícito."""
+        assert default_provider_stats() is default_provider_stats()
+        assert ReceitaFederalAPI()._estatisticas() is default_provider_stats()
+
+
+class TestRoteamento:
+    """Testes do roteamento adaptativo no ReceitaFederalAPI."""
+
+    def test_records_latency_and_errors(self):
+        """Deve registrar latência das respostas (inclusive 404) e os erros."""
+        fake = FakeProviders(failing={"a"})
+        api = _api(fake)
+
+        assert api.consultar(CNPJ).razao_social == "EMPRESA B"
+        providers = api.routing_stats()["providers"]
+
+        assert providers["a"]["errors"] == 1
+        assert providers["b"]["errors"] == 0
+        assert providers["b"]["ewma_ms"] is not None
+
+        fake.failing, fake.not_found = set(), {"a"}
+        with pytest.raises(ReceitaFederalAPIError):
+            api.consultar(CNPJ, usar_fallback=False)
+        providers = api.routing_stats()["providers"]
+        assert providers["a"]["requests"] == 2
+        assert providers["a"]["errors"] == 1
+
+    def test_fastest_provider_first(self):
+        """Deve começar pelo provedor com a menor latência esperada."""
+        fake = FakeProviders()
+        api = _api(fake, stats=_stats(a=0.5, b=0.1))
+
+        assert api.consultar(CNPJ).razao_social == "EMPRESA B"
+        assert fake.providers == ["b"]
+
+    def test_error_rate_penalized(self):
+        """Deve evitar o provedor mais rápido quando ele costuma falhar."""
+        stats = _stats(a=0.1, b=0.2)
+        for _ in range(5):
+            stats.record("a", 0.1, ok=False)
+
+        assert [api_name for api_name, _ in _api(FakeProviders(), stats)._urls_para_tentar(CNPJ, True)] == ["b", "a"]
+
+    def test_rate_limit_wait_counts(self):
+        """Deve somar a espera do rate limit à latência esperada."""
+        fake = FakeProviders()
+        api = _api(fake, stats=_stats(a=0.1, b=0.2), limits={"a": (1, 60.0)})
+        api._limitador().reserve("a")
+
+        api.consultar(CNPJ)
+
+        assert fake.providers == ["b"]
+
+    def test_without_adaptive_routing_or_fallback(self):
+        """Deve manter a api_preferida sem roteamento adaptativo ou sem fallback."""
+        stats = _stats(a=0.5, b=0.1)
+
+        assert [name for name, _ in _api(FakeProviders(), stats, adaptive_routing=False)
+                ._urls_para_tentar(CNPJ, True)] == ["a", "b"]
+        assert [name for name, _ in _api(FakeProviders(), stats)._urls_para_tentar(CNPJ, False)] == ["a"]
+
+
+class TestHedge:
+    """Testes do hedge (sync e asyncio)."""
+
+    def test_hedge_wins(self):
+        """Deve consultar o segundo provedor quando o primeiro passa do p95."""
+        fake = FakeProviders(delays={"a": 0.5})
+        api = _api(fake, stats=_stats(a=0.01, b=0.02), hedge=True)
+
+        start = time.perf_counter()
+        dados = api.consultar(CNPJ)
+
+        assert time.perf_counter() - start < 0.4
+        assert dados.razao_social == "EMPRESA B"
+        assert fake.providers == ["a", "b"]
+        assert api.routing_stats()["hedges"] == 1
+        assert api.routing_stats()["hedge_wins"] == 1
+
+    def test_no_hedge_when_fast(self):
+        """Não deve enviar hedge quando o primeiro responde dentro do p95."""
+        fake = FakeProviders()
+        api = _api(fake, stats=_stats(a=0.2, b=0.3), hedge=True)
+
+        assert api.consultar(CNPJ).razao_social == "EMPRESA A"
+        assert fake.providers == ["a"]
+        assert api.routing_stats()["hedges"] == 0
+
+    def test_no_hedge_without_samples_or_quota(self):
+        """Não deve enviar hedge sem p95 do primeiro ou sem cota no segundo."""
+        fake = FakeProviders(delays={"a": 0.1})
+        api = _api(fake, hedge=True)
+        api.consultar(CNPJ)
+        assert api.routing_stats()["hedges"] == 0
+
+        fake = FakeProviders(delays={"a": 0.1})
+        api = _api(fake, stats=_stats(a=0.01, b=0.02), limits={"b": (1, 60.0)}, hedge=True)
+        api._limitador().reserve("b")
+        assert api.consultar(CNPJ).razao_social == "EMPRESA A"
+        assert fake.providers == ["a"]
+        assert api.routing_stats()["hedges"] == 0
+
+    def test_hedge_not_found_is_final(self):
+        """Deve propagar o 404 do primeiro provedor que responder."""
+        fake = FakeProviders(delays={"a": 0.5}, not_found={"b"})
+        api = _api(fake, stats=_stats(a=0.01, b=0.02), hedge=True)
+
+        with pytest.raises(ReceitaFederalAPIError) as exc_info:
+            api.consultar(CNPJ)
+
+        assert exc_info.value.status_code == 404
+
+    def test_hedge_failures_fall_back_to_retries(self):
+        """Deve seguir com as novas tentativas normais se o hedge inteiro falhar."""
+        fake = FakeProviders(delays={"a": 0.05}, failing={"a", "b"})
+        api = _api(fake, stats=_stats(a=0.01, b=0.02), hedge=True)
+
+        with pytest.raises(ReceitaFederalAPIError):
+            api.consultar(CNPJ)
+
+        assert sorted(fake.providers) == ["a", "a", "b", "b"]
+
+    def test_async_hedge_cancels_slower(self):
+        """Deve cancelar a requisição mais lenta no cliente asyncio."""
+        fake = FakeProviders(delays={"a": 5.0})
+        api = _api(fake, stats=_stats(a=0.01, b=0.02), cls=AsyncReceitaFederalAPI, hedge=True)
+
+        start = time.perf_counter()
+        dados = asyncio.run(api.consultar(CNPJ))
+
+        assert time.perf_counter() - start < 1.0
+        assert dados.razao_social == "EMPRESA B"
+        assert fake.cancelled == ["a"]
+        assert api.routing_stats()["hedge_wins"] == 1
+        # O cancelado não conta como erro do provedor
+        assert api.routing_stats()["providers"]["a"]["errors"] == 0
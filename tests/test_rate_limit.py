@@ -0,0 +1,204 @@
+"""
+Testes do rate limit compartilhado por provedor (token bucket em SQLite)
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import rate_limit
+from src.cnpj_validator.rate_limit import SharedRateLimiter, default_limiter
+from src.cnpj_validator.receita_federal_api import ReceitaFederalAPI
+from tests.fakes import FakeClock
+
+
+def _reservar(path, quantidade, fila):
+    """Executado em outro processo: reserva fichas no mesmo arquivo."""
+    limiter = SharedRateLimiter(path, limits={"brasilapi": (3, 60.0)})
+    fila.put([limiter.reserve("brasilapi") for _ in range(quantidade)])
+
+
+class TestSharedRateLimiter:
+    """Testes do SharedRateLimiter."""
+
+    def test_burst_then_wait(self):
+        """Deve liberar a rajada na hora e enfileirar as reservas seguintes."""
+        limiter = SharedRateLimiter(limits={"brasilapi": (3, 60.0)}, clock=FakeClock())
+
+        waits = [limiter.reserve("brasilapi") for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(20.0)
+        assert waits[4] == pytest.approx(40.0)
+
+    def test_refill(self):
+        """Deve repor fichas com o tempo, até a capacidade."""
+        clock = FakeClock()
+        limiter = SharedRateLimiter(limits={"brasilapi": (3, 60.0)}, clock=clock)
+        for _ in range(3):
+            limiter.reserve("brasilapi")
+
+        assert limiter.expected_wait("brasilapi") == pytest.approx(20.0)
+        clock.now += 10
+        assert limiter.expected_wait("brasilapi") == pytest.approx(10.0)
+        clock.now += 3600
+        assert [limiter.reserve("brasilapi") for _ in range(4)][-1] == pytest.approx(20.0)
+
+    def test_expected_wait_does_not_reserve(self):
+        """Deve estimar a espera sem consumir fichas."""
+        limiter = SharedRateLimiter(limits={"brasilapi": (1, 10.0)}, clock=FakeClock())
+
+        assert limiter.expected_wait("brasilapi") == 0.0
+        assert limiter.expected_wait("brasilapi") == 0.0
+        assert limiter.reserve("brasilapi") == 0.0
+        assert limiter.expected_wait("brasilapi") == pytest.approx(10.0)
+
+    def test_providers_are_independent(self):
+        """Deve manter um balde por provedor."""
+        limiter = SharedRateLimiter(limits={"brasilapi": (1, 60.0), "receitaws": (1, 60.0)},
+                                    clock=FakeClock())
+        limiter.reserve("brasilapi")
+
+        assert limiter.expected_wait("brasilapi") > 0
+        assert limiter.reserve("receitaws") == 0.0
+
+    def test_unlimited(self):
+        """Deve dispensar espera para provedores sem limite."""
+        limiter = SharedRateLimiter(limits={"brasilapi": None}, default_limit=None)
+
+        assert all(limiter.reserve("brasilapi") == 0.0 for _ in range(100))
+        assert limiter.reserve("outro") == 0.0
+
+    def test_reset(self):
+        """Deve encher o balde de novo."""
+        limiter = SharedRateLimiter(limits={"brasilapi": (1, 60.0)}, clock=FakeClock())
+        limiter.reserve("brasilapi")
+        limiter.reset("brasilapi")
+
+        assert limiter.expected_wait("brasilapi") == 0.0
+
+    def test_invalid_limit(self):
+        """Deve rejeitar limites não positivos."""
+        with pytest.raises(ValueError):
+            SharedRateLimiter(limits={"brasilapi": (0, 60.0)})
+
+    def test_threads(self):
+        """Deve distribuir as fichas sem duplicar entre threads."""
+        limiter = SharedRateLimiter(limits={"brasilapi": (10, 60.0)}, clock=FakeClock())
+        waits = []
+
+        def worker():
+            for _ in range(5):
+                waits.append(limiter.reserve("brasilapi"))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(waits) == pytest.approx([0.0] * 10 + [6.0 * i for i in range(1, 11)])
+
+    def test_processes_share_file(self, tmp_path):
+        """Deve compartilhar o balde entre processos pelo mesmo arquivo."""
+        path = str(tmp_path / "limites.sqlite3")
+        context = multiprocessing.get_context("spawn")
+        fila = context.Queue()
+        processes = [context.Process(target=_reservar, args=(path, 2, fila)) for _ in range(2)]
+        for process in processes:
+            process.start()
+        waits = sorted(fila.get(timeout=60) + fila.get(timeout=60))
+        for process in processes:
+            process.join()
+
+        # 4 reservas em um balde de 3: só uma espera (cerca de 20 s)
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert 15.0 < waits[3] <= 20.0
+
+
+class TestDefaultLimiter:
+    """Testes do limitador padrão dos clientes."""
+
+    def test_default_limiter_env_path(self, tmp_path, monkeypatch):
+        """Deve usar CNPJ_RATE_LIMIT_PATH e reaproveitar o limitador no processo."""
+        path = str(tmp_path / "padrao.sqlite3")
+        monkeypatch.setenv("CNPJ_RATE_LIMIT_PATH", path)
+        monkeypatch.setattr(rate_limit, "_default_limiter", None)
+
+        limiter = default_limiter()
+
+        assert limiter.path == path
+        assert default_limiter() is limiter
+        assert ReceitaFederalAPI()._limitador() is limiter
+
+    def test_default_limiter_fallback(self, tmp_path, monkeypatch):
+        """Deve cair para um limitador em memória se o arquivo não abrir."""
+        monkeypatch.setenv("CNPJ_RATE_LIMIT_PATH", str(tmp_path / "ausente" / "x.sqlite3"))
+        monkeypatch.setattr(rate_limit, "_default_limiter", None)
+
+        assert default_limiter().path == ":memory:"
+
+    def test_default_limiter_read_only_file(self, tmp_path, monkeypatch):
+        """Deve cair para um limitador em memória se o arquivo não aceitar escrita."""
+        path = str(tmp_path / "outro_usuario.sqlite3")
+        SharedRateLimiter(path).close()
+        connect = sqlite3.connect
+
+        def somente_leitura(database, **kwargs):
+            # Arquivo de outro usuário: abre e lê, mas não grava
+            if database == ":memory:":
+                return connect(database, **kwargs)
+            return connect(f"file:{database}?mode=ro", uri=True, **kwargs)
+
+        monkeypatch.setattr(rate_limit.sqlite3, "connect", somente_leitura)
+        monkeypatch.setenv("CNPJ_RATE_LIMIT_PATH", path)
+        monkeypatch.setattr(rate_limit, "_default_limiter", None)
+
+        limiter = default_limiter()
+
+        assert limiter.path == ":memory:"
+        assert limiter.reserve("brasilapi") == 0.0
+
+    def test_default_path_per_user(self):
+        """O arquivo padrão no diretório temporário comum deve ser por usuário."""
+        assert os.path.basename(rate_limit.DEFAULT_PATH) == (
+            f"cnpj_validator_rate_limit_{rate_limit._user_tag()}.sqlite3"
+        )
+
+
+class TestClientRateLimit:
+    """Testes do rate limit compartilhado nos clientes."""
+
+    def test_limiter_error_is_not_retried(self):
+        """Erro do limitador deve subir na hora, sem gastar as tentativas nos provedores."""
+        limiter = SharedRateLimiter()
+        client = ReceitaFederalAPI(rate_limiter=limiter, max_retries=3, retry_delay=0.0)
+        erro = sqlite3.OperationalError("attempt to write a readonly database")
+
+        with patch.object(limiter, "reserve", side_effect=erro) as mock_reserve, \
+                patch.object(client, "_fazer_requisicao") as mock_request:
+            with pytest.raises(sqlite3.OperationalError):
+                client.consultar("11222333000181")
+
+        assert mock_reserve.call_count == 1
+        mock_request.assert_not_called()
+
+    def test_instances_share_limiter(self):
+        """Deve coordenar instâncias diferentes pelo mesmo limitador."""
+        limiter = SharedRateLimiter(limits={"brasilapi": (2, 60.0)}, clock=FakeClock())
+        clients = [ReceitaFederalAPI(rate_limiter=limiter) for _ in range(3)]
+
+        with patch("src.cnpj_validator.rate_limit.time.sleep") as mock_sleep:
+            for client in clients:
+                client._respeitar_rate_limit("brasilapi")
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(30.0)
+        assert clients[0].tempo_espera_estimado() == pytest.approx(60.0)
@@ -3,9 +3,13 @@ Testes para o cliente da API da Receita Federal
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import json
 
+from src.cnpj_validator.connection_pool import PooledResponse
+from src.cnpj_validator.prefilter import BloomFilter
+from src.cnpj_validator.provider_stats import ProviderStats
+from src.cnpj_validator.rate_limit import SharedRateLimiter
 from src.cnpj_validator.receita_federal_api import (
     ReceitaFederalAPI,
     CNPJData,
@@ -143,12 +147,11 @@ class TestReceitaFederalAPI:
         with pytest.raises(ValueError):
             api.consultar("00000000000000")
 
-    @patch("src.cnpj_validator.receita_federal_api.urlopen")
-    def test_consultar_sucesso_brasilapi(self, mock_urlopen):
+    @patch("src.cnpj_validator.receita_federal_api.HTTPConnectionPool.get")
+    def test_consultar_sucesso_brasilapi(self, mock_get):
         """Testa consulta bem-sucedida via BrasilAPI."""
         # Mock da resposta da API
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({
+        mock_get.return_value = PooledResponse(200, "OK", {}, json.dumps({
             "cnpj": "11222333000181",
             "razao_social": "EMPRESA TESTE LTDA",
             "nome_fantasia": "TESTE",
@@ -167,13 +170,11 @@ class TestReceitaFederalAPI:
             "qsa": [
                 {"nome_socio": "João Silva", "qualificacao_socio": "Sócio-Administrador"}
             ],
-        }).encode("utf-8")
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+        }).encode("utf-8"))
 
         api = ReceitaFederalAPI()
-        api._min_interval = 0  # Desabilitar rate limit para testes
+        api.rate_limiter = SharedRateLimiter(limits={}, default_limit=None)  # Sem rate limit nos testes
+        api.provider_stats = ProviderStats()
         
         resultado = api.consultar("11222333000181")
 
@@ -182,21 +183,14 @@ class TestReceitaFederalAPI:
         assert resultado.situacao_cadastral == "ATIVA"
         assert resultado.is_ativa() is True
 
-    @patch("src.cnpj_validator.receita_federal_api.urlopen")
-    def test_consultar_cnpj_nao_encontrado(self, mock_urlopen):
+    @patch("src.cnpj_validator.receita_federal_api.HTTPConnectionPool.get")
+    def test_consultar_cnpj_nao_encontrado(self, mock_get):
         """Testa consulta com CNPJ não encontrado."""
-        from urllib.error import HTTPError
-        
-        mock_urlopen.side_effect = HTTPError(
-            url="https://api.test",
-            code=404,
-            msg="Not Found",
-            hdrs={},
-            fp=MagicMock(read=MagicMock(return_value=b"Not Found")),
-        )
+        mock_get.return_value = PooledResponse(404, "Not Found", {}, b"Not Found")
 
         api = ReceitaFederalAPI()
-        api._min_interval = 0
+        api.rate_limiter = SharedRateLimiter(limits={}, default_limit=None)
+        api.provider_stats = ProviderStats()
 
         with pytest.raises(ReceitaFederalAPIError) as exc_info:
             api.consultar("11222333000181", usar_fallback=False)
@@ -204,6 +198,22 @@ class TestReceitaFederalAPI:
         assert exc_info.value.status_code == 404
         assert "não encontrado" in str(exc_info.value).lower()
 
+    @patch("src.cnpj_validator.receita_federal_api.HTTPConnectionPool.get")
+    def test_consultar_prefiltro_sem_requisicao(self, mock_get):
+        """Testa que CNPJ ausente do pré-filtro é dado como não encontrado sem requisição."""
+        prefilter = BloomFilter(10)
+        prefilter.add("11.222.333/0001-81")
+
+        api = ReceitaFederalAPI(prefilter=prefilter)
+        api.rate_limiter = SharedRateLimiter(limits={}, default_limit=None)
+        api.provider_stats = ProviderStats()
+
+        with pytest.raises(ReceitaFederalAPIError) as exc_info:
+            api.consultar("34.028.316/0001-03")
+
+        assert exc_info.value.status_code == 404
+        mock_get.assert_not_called()
+
     def test_verificar_situacao(self):
         """Testa método verificar_situacao."""
         api = ReceitaFederalAPI()
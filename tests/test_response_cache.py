@@ -0,0 +1,211 @@
+"""
+Testes do cache persistente de consultas à Receita Federal (SQLite)
+"""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.cnpj_validator.receita_federal_api import (
+    CNPJData,
+    ReceitaFederalAPI,
+    ReceitaFederalAPIError,
+)
+from src.cnpj_validator.connection_pool import PooledResponse
+from src.cnpj_validator.provider_stats import ProviderStats
+from src.cnpj_validator.rate_limit import SharedRateLimiter
+from src.cnpj_validator.response_cache import DAY, SQLiteResponseCache
+from tests.fakes import FakeClock
+
+
+def _dados(situacao="ATIVA", razao_social="EMPRESA TESTE LTDA"):
+    raw = {"cnpj": "11222333000181", "razao_social": razao_social,
+           "descricao_situacao_cadastral": situacao}
+    return CNPJData(
+        cnpj="11222333000181",
+        razao_social=razao_social,
+        situacao_cadastral=situacao,
+        endereco={"municipio": "São Paulo", "uf": "SP"},
+        quadro_societario=[{"nome": "João Silva"}],
+        raw_data=raw,
+    )
+
+
+def _response(razao_social="EMPRESA TESTE LTDA"):
+    return PooledResponse(200, "OK", {}, json.dumps({
+        "cnpj": "11222333000181",
+        "razao_social": razao_social,
+        "descricao_situacao_cadastral": "ATIVA",
+    }).encode("utf-8"))
+
+
+class TestSQLiteResponseCache:
+    """Testes de armazenamento, TTL e estatísticas."""
+
+    def test_roundtrip(self):
+        """Deve devolver o CNPJData e o payload bruto armazenados."""
+        cache = SQLiteResponseCache()
+        cache.set("11222333000181", _dados())
+
+        entry = cache.get("11222333000181")
+
+        assert entry.dados == _dados()
+        assert entry.dados.raw_data["razao_social"] == "EMPRESA TESTE LTDA"
+        assert entry.stale is False
+
+    def test_miss(self):
+        """Deve devolver None para CNPJ ausente."""
+        cache = SQLiteResponseCache()
+        assert cache.get("11222333000181") is None
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.parametrize("situacao, ttl", [
+        ("ATIVA", 7 * DAY), ("BAIXADA", 365 * DAY), ("baixada", 365 * DAY), ("DESCONHECIDA", DAY),
+    ])
+    def test_ttl_by_situacao(self, situacao, ttl):
+        """Deve usar o TTL da situação cadastral (ou o padrão)."""
+        assert SQLiteResponseCache().ttl_for(situacao) == ttl
+
+    def test_fresh_stale_and_expired(self):
+        """Deve servir fresca, depois vencida na janela stale_ttl e por fim tratar como falta."""
+        clock = FakeClock()
+        cache = SQLiteResponseCache(ttls={"ATIVA": 100}, stale_ttl=50, clock=clock)
+        cache.set("11222333000181", _dados())
+
+        clock.now += 99
+        assert cache.get("11222333000181").stale is False
+        clock.now += 1
+        assert cache.get("11222333000181").stale is True
+        clock.now += 50
+        assert cache.get("11222333000181") is None
+
+        assert cache.stats() == {
+            "hits": 1, "stale_hits": 1, "misses": 1, "size": 1, "hit_rate": 2 / 3,
+        }
+
+    def test_purge(self):
+        """Deve remover apenas as entradas vencidas além da janela."""
+        clock = FakeClock()
+        cache = SQLiteResponseCache(ttls={"ATIVA": 10, "BAIXADA": 1000}, stale_ttl=0, clock=clock)
+        cache.set("11222333000181", _dados("ATIVA"))
+        cache.set("34028316000103", _dados("BAIXADA"))
+
+        clock.now += 500
+        assert cache.purge() == 1
+        assert len(cache) == 1
+        assert cache.get("34028316000103") is not None
+
+    def test_persists_between_instances(self, tmp_path):
+        """Deve manter as entradas no arquivo entre instâncias."""
+        path = str(tmp_path / "consultas.sqlite3")
+        first = SQLiteResponseCache(path)
+        first.set("11222333000181", _dados())
+        first.close()
+
+        assert SQLiteResponseCache(path).get("11222333000181").dados == _dados()
+
+    def test_delete_and_clear(self):
+        """Deve remover uma entrada e esvaziar o cache."""
+        cache = SQLiteResponseCache()
+        cache.set("11222333000181", _dados())
+        cache.set("34028316000103", _dados())
+
+        cache.delete("11222333000181")
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats()["misses"] == 0
+
+    def test_negative_ttl(self):
+        """Deve rejeitar TTL negativo."""
+        with pytest.raises(ValueError):
+            SQLiteResponseCache(ttls={"ATIVA": -1})
+
+
+class TestClientCache:
+    """Testes do cache no ReceitaFederalAPI."""
+
+    @patch("src.cnpj_validator.receita_federal_api.HTTPConnectionPool.get")
+    def test_second_lookup_from_cache(self, mock_get):
+        """Deve consultar a rede uma única vez para o mesmo CNPJ numérico."""
+        mock_get.return_value = _response()
+        api = ReceitaFederalAPI(cache=SQLiteResponseCache())
+        api.rate_limiter = SharedRateLimiter(limits={}, default_limit=None)
+        api.provider_stats = ProviderStats()
+
+        first = api.consultar("11222333000181")
+        second = api.consultar("11.222.333/0001-81")
+
+        assert mock_get.call_count == 1
+        assert second == first
+        assert api.cache_stats()["hits"] == 1
+        assert api.cache_stats()["misses"] == 1
+
+    @patch("src.cnpj_validator.receita_federal_api.HTTPConnectionPool.get")
+    def test_stale_while_revalidate(self, mock_get):
+        """Deve servir a entrada vencida na hora e atualizá-la em segundo plano."""
+        clock = FakeClock()
+        cache = SQLiteResponseCache(ttls={"ATIVA": 100}, clock=clock)
+        cache.set("11222333000181", _dados(razao_social="NOME ANTIGO"))
+        mock_get.return_value = _response("NOME NOVO")
+        api = ReceitaFederalAPI(cache=cache)
+        api.rate_limiter = SharedRateLimiter(limits={}, default_limit=None)
+        api.provider_stats = ProviderStats()
+
+        clock.now += 200
+        assert api.consultar("11222333000181").razao_social == "NOME ANTIGO"
+        api.aguardar_atualizacoes(timeout=10)
+
+        assert mock_get.call_count == 1
+        entry = cache.get("11222333000181")
+        assert entry.dados.razao_social == "NOME NOVO"
+        assert entry.stale is False
+        assert api.cache_stats()["refreshes"] == 1
+
+    @patch("src.cnpj_validator.receita_federal_api.HTTPConnectionPool.get")
+    def test_one_refresh_per_cache_across_clients(self, mock_get):
+        """Deve atualizar a entrada vencida uma única vez, mesmo com um cliente por consulta."""
+        clock = FakeClock()
+        cache = SQLiteResponseCache(ttls={"ATIVA": 100}, clock=clock)
+        cache.set("11222333000181", _dados(razao_social="NOME ANTIGO"))
+        liberar = threading.Event()
+
+        def resposta_lenta(*args, **kwargs):
+            liberar.wait(10)
+            return _response("NOME NOVO")
+
+        mock_get.side_effect = resposta_lenta
+        clock.now += 200
+        clientes = []
+        for _ in range(10):
+            api = ReceitaFederalAPI(cache=cache)
+            api.rate_limiter = SharedRateLimiter(limits={}, default_limit=None)
+            api.provider_stats = ProviderStats()
+            assert api.consultar("11222333000181").razao_social == "NOME ANTIGO"
+            clientes.append(api)
+        liberar.set()
+        clientes[0].aguardar_atualizacoes(timeout=10)
+
+        assert mock_get.call_count == 1
+        assert cache.get("11222333000181").dados.razao_social == "NOME NOVO"
+
+    def test_refresh_error_keeps_stale_entry(self):
+        """Deve manter a entrada vencida e contar o erro se a atualização falhar."""
+        clock = FakeClock()
+        cache = SQLiteResponseCache(ttls={"ATIVA": 100}, clock=clock)
+        cache.set("11222333000181", _dados())
+        api = ReceitaFederalAPI(cache=cache)
+
+        clock.now += 200
+        with patch.object(api, "_consultar_apis", side_effect=ReceitaFederalAPIError("falhou")):
+            api.consultar("11222333000181")
+            api.aguardar_atualizacoes(timeout=10)
+
+        assert api.cache_stats()["refresh_errors"] == 1
+        assert cache.get("11222333000181").stale is True
+
+    def test_without_cache(self):
+        """Deve retornar None nas estatísticas sem cache."""
+        assert ReceitaFederalAPI().cache_stats() is None
@@ -0,0 +1,112 @@
+"""
+Testes Unitários para a varredura única (scanner)
+Seguindo princípios de Shift Left Testing
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.validators import scanner
+from src.cnpj_validator.validators.scanner import scan, scan_bytes, scan_many, _scan_generic
+from src.cnpj_validator.validators.error_codes import ErrorCode, WarningCode
+
+
+class TestScanCanonicalForms:
+    """Testes das formas canônicas (passada única nas tabelas)"""
+
+    def test_formatted_valid(self):
+        """Deve extrair o CNPJ limpo sem erros nem avisos"""
+        assert scan("11.222.333/0001-81") == ("11222333000181", ErrorCode.OK, (), ())
+
+    def test_clean_valid_warns_unformatted(self):
+        """Deve avisar que o CNPJ foi fornecido sem formatação"""
+        assert scan("11222333000181") == (
+            "11222333000181", ErrorCode.OK, (), (WarningCode.UNFORMATTED_INPUT,))
+
+    def test_filial_zero(self):
+        """Deve apontar ordem 0000 nas duas formas"""
+        assert scan("11.222.333/0000-09")[2] == (ErrorCode.FILIAL_ZERO,)
+        assert scan("11222333000009")[2] == (ErrorCode.FILIAL_ZERO,)
+
+    def test_invalid_check_digits(self):
+        """Deve apontar DV inválido sem levantar o formato"""
+        assert scan("11.222.333/0001-82") == (
+            "11222333000182", ErrorCode.INVALID_CHECK_DIGITS, None, ())
+
+    def test_all_same_digits_has_priority_over_check_digits(self):
+        """Deve apontar dígitos iguais antes dos DVs"""
+        assert scan("11.111.111/1111-11")[1] == ErrorCode.ALL_SAME
+        assert scan("11111111111111")[1] == ErrorCode.ALL_SAME
+
+    def test_without_format_validation(self):
+        """Não deve levantar códigos de formato quando validate_format=False"""
+        assert scan("11.222.333/0001-81", False) == ("11222333000181", ErrorCode.OK, None, ())
+        assert scan("11222333000181", False) == ("11222333000181", ErrorCode.OK, None, ())
+
+
+class TestScanMatchesDetailedChecks:
+    """A passada única deve coincidir com as verificações detalhadas"""
+
+    @pytest.mark.parametrize("cnpj", [
+        "11.222.333/0001-81", "11222333000181", "11.222.333/0000-09",
+        "11222333000009", "11.222.333/0001-82", "11.111.111/1111-11",
+        "11.222.333.0001-81", "11.222.333/0001-8a", " 11.222.333/0001-81",
+        "11222333/0001-81", "11 222 333 0001 81", "١١.222.333/0001-81",
+        "", None, 11222333000181,
+    ])
+    @pytest.mark.parametrize("validate_format", [True, False])
+    def test_same_facts(self, cnpj, validate_format):
+        """Deve produzir os mesmos códigos que o caminho genérico"""
+        assert scan(cnpj, validate_format) == _scan_generic(cnpj, validate_format)
+
+
+class TestScanBytes:
+    """Testes da varredura sobre linhas em bytes"""
+
+    @pytest.mark.parametrize("cnpj", [
+        "11.222.333/0001-81", "11222333000181", "11.222.333/0000-09",
+        "11222333000009", "11.222.333/0001-82", "11222333000182",
+        "11.111.111/1111-11", "00000000000000",
+    ])
+    @pytest.mark.parametrize("validate_format", [True, False])
+    def test_canonical_forms_match_scan(self, cnpj, validate_format):
+        """Deve produzir os mesmos códigos que scan, também em memoryview"""
+        expected = scan(cnpj, validate_format)[1:]
+        assert scan_bytes(cnpj.encode(), validate_format) == expected
+        assert scan_bytes(memoryview(cnpj.encode()), validate_format) == expected
+
+    @pytest.mark.parametrize("line", [
+        b"", b"11.222.333.0001-81", b"1122233300018A", b" 11222333000181",
+        b"11 222 333 0001 81", "11.222.333/0001-8\u00e1".encode(),
+    ])
+    def test_non_canonical_forms_return_none(self, line):
+        """Linhas fora das formas canônicas devem ser passadas para scan"""
+        assert scan_bytes(line) is None
+
+
+class TestScanMany:
+    """Testes da varredura em bloco"""
+
+    CNPJS = [
+        "11.222.333/0001-81", "11222333000181", "11.222.333/0000-09", "11222333000009",
+        "11.222.333/0001-82", "11222333000182", "11.111.111/1111-11", "00000000000000",
+        "12ABC345000177", "12.ABC.345/0001-77", " 11222333000181", "11.222.333.0001-81",
+        "11222333000181\x00", "١١.222.333/0001-81", "11.222.333/0001-81 ", "",
+        None, 11222333000181,
+    ]
+
+    @pytest.mark.parametrize("validate_format", [True, False])
+    def test_same_facts_as_scan(self, validate_format):
+        """Deve produzir os mesmos fatos de scan, na ordem da entrada"""
+        assert scan_many(self.CNPJS, validate_format) == [
+            scan(cnpj, validate_format) for cnpj in self.CNPJS
+        ]
+
+    def test_without_numpy(self):
+        """Sem NumPy, deve seguir por scan com o mesmo resultado"""
+        with patch.object(scanner, '_require_numpy', side_effect=ImportError):
+            assert scan_many(self.CNPJS) == [scan(cnpj) for cnpj in self.CNPJS]
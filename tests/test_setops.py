@@ -0,0 +1,152 @@
+"""
+Testes das operações de conjunto em memória externa (dedupe, intersect, diff)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator.generator import iter_generate
+from src.cnpj_validator.keys import CNPJKey
+from src.cnpj_validator.setops import (
+    OPERATIONS, build_runs, iter_run, line_key, set_operation, _keys_python,
+)
+from src.cnpj_validator.validators.new_alphanumeric_validator import NewAlphanumericCNPJValidator
+
+
+def _write(path, lines):
+    path.write_bytes(b'\n'.join(line.encode() for line in lines) + b'\n')
+    return str(path)
+
+
+def _lines(count, seed):
+    """CNPJs válidos em vários layouts, com repetições e inválidos misturados."""
+    numeric = list(iter_generate(count, seed=seed, formatted=True))
+    alphanumeric = list(iter_generate(count, seed=seed + 1, alphanumeric=True, formatted=False))
+    lines = []
+    for index, cnpj in enumerate(numeric + alphanumeric):
+        lines.append(cnpj)
+        if index % 7 == 0:
+            lines.append(cnpj.lower().replace('.', ' '))
+        if index % 11 == 0:
+            lines.append(cnpj[:-1] + str((int(cnpj[-1]) + 1) % 10))
+    return lines + ['11111111111111', 'abc', '12.345']
+
+
+def _keys(lines):
+    return {key for key in map(line_key, lines) if key is not None}
+
+
+class TestLineKey:
+    """Testes da validação e normalização de cada linha."""
+
+    @pytest.mark.parametrize("line", [
+        "11222333000181", "11.222.333/0001-81", b"11.222.333/0001-81",
+        " 11 222 333 0001 81", "11-222-333/0001-81",
+    ])
+    def test_layouts_normalize_to_same_key(self, line):
+        """Deve normalizar qualquer formatação aceita pela validação para a mesma chave."""
+        assert line_key(line) == CNPJKey.encode("11222333000181")
+
+    def test_lowercase_alphanumeric(self):
+        """Deve normalizar a raiz alfanumérica para maiúsculas."""
+        assert CNPJKey.decode(line_key("12abc345000177")) == "12ABC345000177"
+
+    @pytest.mark.parametrize("line", [
+        "11222333000182", "11111111111111", "", "abc", b"\xff\xfe", "11.222.333/0001-811",
+    ])
+    def test_invalid_lines(self, line):
+        """Deve devolver None para linhas que a validação rejeita."""
+        assert line_key(line) is None
+
+    def test_matches_validate(self):
+        """Deve concordar com NewAlphanumericCNPJValidator.validate em cada linha."""
+        for line in _lines(300, seed=3):
+            result = NewAlphanumericCNPJValidator.validate(line)
+            key = line_key(line)
+            assert (key is not None) == result['valid'], line
+            if key is not None:
+                assert CNPJKey.decode(key) == result['cnpj_clean']
+
+    def test_vectorized_matches_python(self):
+        """Deve produzir as mesmas chaves e contagem de inválidos com e sem NumPy."""
+        numpy = pytest.importorskip("numpy")
+        from src.cnpj_validator.setops import _keys_numpy
+
+        lines = [line.encode() for line in _lines(500, seed=5)] + [b'x' * 40 + b'11222333000181']
+        expected, expected_invalid = _keys_python(lines)
+        keys, invalid = _keys_numpy(numpy, lines)
+
+        assert keys.tolist() == list(expected)
+        assert invalid == expected_invalid
+
+
+class TestSetOperation:
+    """Testes de dedupe, intersect e diff contra conjuntos em memória."""
+
+    @pytest.fixture
+    def sources(self, tmp_path):
+        lines = _lines(400, seed=7)
+        groups = [lines[:900], lines[500:], lines[200:1100:2]]
+        paths = [_write(tmp_path / f"{index}.txt", group) for index, group in enumerate(groups)]
+        return paths, [_keys(group) for group in groups]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    @pytest.mark.parametrize("max_fan_in", [2, 64])
+    def test_against_sets(self, sources, tmp_path, workers, max_fan_in):
+        """Deve igualar as operações de set, em ordem crescente, com runs pequenos."""
+        paths, (first, second, third) = sources
+        options = dict(workers=workers, run_size=97, max_fan_in=max_fan_in, temp_dir=str(tmp_path))
+
+        assert list(set_operation('dedupe', paths, **options)) == sorted(first | second | third)
+        assert list(set_operation('intersect', paths, **options)) == sorted(first & second & third)
+        assert list(set_operation('diff', paths, **options)) == sorted(first - second - third)
+
+    def test_single_source(self, sources):
+        """Deve reduzir as três operações à deduplicação com uma única entrada."""
+        paths, (first, _, _) = sources
+        for operation in OPERATIONS:
+            assert list(set_operation(operation, paths[:1], workers=1, run_size=50)) == sorted(first)
+
+    def test_runs_are_sorted_and_unique(self, sources):
+        """Deve gravar cada run ordenado e sem repetições."""
+        paths, _ = sources
+        with build_runs(paths[:1], workers=1, run_size=100) as runs:
+            assert len(runs.runs[0]) > 1
+            for path in runs.runs[0]:
+                keys = list(iter_run(path))
+                assert keys == sorted(set(keys))
+
+    def test_counts_lines_and_invalid(self, tmp_path):
+        """Deve contar as linhas lidas e as inválidas de cada entrada."""
+        path = _write(tmp_path / "a.txt", ["11222333000181", "", "11222333000182", "x"])
+        with build_runs([path], workers=1) as runs:
+            assert runs.lines == [3]
+            assert runs.invalid == [2]
+
+    def test_removes_temporary_files(self, sources, tmp_path):
+        """Deve remover o diretório dos runs ao final da operação."""
+        paths, _ = sources
+        temp_dir = tmp_path / "runs"
+        temp_dir.mkdir()
+        list(set_operation('intersect', paths, workers=1, run_size=100, temp_dir=str(temp_dir)))
+        assert os.listdir(temp_dir) == []
+
+    def test_empty_source(self, tmp_path):
+        """Deve aceitar arquivo vazio."""
+        path = _write(tmp_path / "a.txt", [])
+        assert list(set_operation('dedupe', [path], workers=1)) == []
+
+    def test_invalid_operation(self, sources):
+        """Deve rejeitar operação desconhecida."""
+        paths, _ = sources
+        with pytest.raises(ValueError):
+            list(set_operation('union', paths))
+
+    def test_requires_sources(self):
+        """Deve exigir ao menos uma entrada."""
+        with pytest.raises(ValueError):
+            build_runs([])
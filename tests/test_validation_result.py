@@ -0,0 +1,148 @@
+"""
+Testes do ValidationResult (resultado compacto de CNPJValidator.validate)
+Garante compatibilidade com o dicionário legado
+"""
+
+import json
+import pickle
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cnpj_validator import CNPJValidator, ValidationResult, ErrorCode, WarningCode
+
+
+class TestValidationResultCompatibility:
+    """Testes de compatibilidade com o dicionário legado"""
+
+    def setup_method(self):
+        self.validator = CNPJValidator()
+
+    def test_returns_validation_result(self):
+        """Deve retornar um ValidationResult"""
+        result = self.validator.validate("11.222.333/0001-81")
+        assert isinstance(result, ValidationResult)
+
+    def test_mapping_access(self):
+        """Deve permitir acesso por chave, get e 'in'"""
+        result = self.validator.validate("11.222.333/0001-81")
+        assert result['valid'] is True
+        assert result.get('cnpj_clean') == "11222333000181"
+        assert result.get('inexistente', 'padrao') == 'padrao'
+        assert 'numeric_validation' in result
+        with pytest.raises(KeyError):
+            result['inexistente']
+
+    def test_to_dict_valid_formatted(self):
+        """Deve reproduzir o dicionário legado para CNPJ formatado"""
+        result = self.validator.validate("11.222.333/0001-81").to_dict()
+        assert result == {
+            'valid': True,
+            'cnpj_input': "11.222.333/0001-81",
+            'cnpj_clean': "11222333000181",
+            'cnpj_formatted': "11.222.333/0001-81",
+            'numeric_validation': {
+                'valid': True, 'cnpj_clean': "11222333000181", 'errors': []
+            },
+            'alphanumeric_validation': {
+                'valid': True,
+                'errors': [],
+                'warnings': [],
+                'parts': {
+                    'valid': True, 'raiz': "11222333", 'ordem': "0001",
+                    'dv': "81", 'formatted': "11.222.333/0001-81",
+                },
+                'filial_info': {'type': 'matriz', 'code': "0001"},
+            },
+            'errors': [],
+            'warnings': [],
+        }
+
+    def test_to_dict_is_json_serializable(self):
+        """Deve ser serializável em JSON"""
+        result = self.validator.validate(" 11.222.333/0001-81").to_dict()
+        assert json.loads(json.dumps(result, ensure_ascii=False)) == result
+
+    def test_numeric_failure(self):
+        """Deve reportar erro numérico e deixar a validação de formato vazia"""
+        result = self.validator.validate("112223330001")
+        assert result['errors'] == ["CNPJ deve ter 14 dígitos, possui 12"]
+        assert result['alphanumeric_validation'] == {}
+        assert result['cnpj_formatted'] == ''
+        assert result.error_codes == (ErrorCode.INVALID_LENGTH,)
+
+    def test_special_characters_message(self):
+        """Deve montar a mensagem de caracteres inválidos a partir da entrada"""
+        result = self.validator.validate("11.222.333/0001-81a")
+        assert result['valid'] is False
+        assert result['errors'] == ["Caracteres inválidos encontrados: a"]
+        assert 'parts' not in result['alphanumeric_validation']
+
+    def test_unformatted_warning(self):
+        """Deve avisar quando o CNPJ é fornecido sem formatação"""
+        result = self.validator.validate("11222333000181")
+        assert result.warning_codes == (WarningCode.UNFORMATTED_INPUT,)
+        assert result['warnings'] == ["CNPJ fornecido sem formatação"]
+
+
+class TestValidationResultLazyFields:
+    """Testes dos campos calculados sob demanda"""
+
+    def test_filial_info(self):
+        """Deve identificar filial e número"""
+        result = CNPJValidator().validate("11.222.333/0002-62")
+        assert result.filial_info == {'type': 'filial', 'code': "0002", 'number': 2}
+        assert result.is_matriz is False
+
+    def test_info_matches_get_info(self):
+        """info() deve coincidir com get_info sem validar novamente"""
+        validator = CNPJValidator()
+        for cnpj in ["11.222.333/0001-81", "11222333000181", "00000000000000"]:
+            assert validator.validate(cnpj).info() == validator.get_info(cnpj)
+
+    def test_immutable(self):
+        """Não deve permitir alterar o resultado"""
+        result = CNPJValidator().validate("11.222.333/0001-81")
+        with pytest.raises(AttributeError):
+            result.cnpj_clean = "00000000000000"
+
+    def test_returned_lists_are_copies(self):
+        """Alterar listas retornadas não deve afetar o resultado"""
+        result = CNPJValidator().validate("11111111111111")
+        result['errors'].append("extra")
+        assert len(result['errors']) == 1
+
+    def test_pickle_roundtrip(self):
+        """Deve ser serializável com pickle"""
+        result = CNPJValidator().validate("11.222.333/0001-81")
+        assert pickle.loads(pickle.dumps(result)).to_dict() == result.to_dict()
+
+
+class TestValidateEndpointReuse:
+    """Testes dos endpoints que reutilizam um único resultado"""
+
+    def setup_method(self):
+        pytest.importorskip("fastapi")
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+        self.client = TestClient(app)
+
+    def test_validate_matriz(self):
+        """Deve identificar matriz a partir do resultado da validação"""
+        data = self.client.get("/api/v1/validate", params={"cnpj": "11222333000181"}).json()
+        assert data['valid'] is True
+        assert data['tipo'] == "matriz"
+
+    def test_validate_filial(self):
+        """Deve identificar filial a partir do resultado da validação"""
+        data = self.client.get("/api/v1/validate", params={"cnpj": "11.222.333/0002-62"}).json()
+        assert data['tipo'] == "filial"
+
+    def test_format_endpoint(self):
+        """Deve formatar CNPJ válido e rejeitar inválido"""
+        response = self.client.get("/api/v1/format", params={"cnpj": "11222333000181"})
+        assert response.json()['formatted'] == "11.222.333/0001-81"
+        response = self.client.get("/api/v1/format", params={"cnpj": "123"})
+        assert response.status_code == 400
@@ -0,0 +1,236 @@
+"""
+Testes da validação vetorizada em lote (validate_many)
+Compara o resultado vetorizado com os validadores escalares
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+np = pytest.importorskip("numpy")
+
+from src.cnpj_validator.validators.error_codes import ErrorCode
+from src.cnpj_validator.validators.vectorized import RowKind
+from src.cnpj_validator.validators.numeric_validator import NumericCNPJValidator
+from src.cnpj_validator.validators.new_alphanumeric_validator import (
+    NewAlphanumericCNPJValidator
+)
+
+
+SAMPLES = [
+    "11222333000181",
+    "11.222.333/0001-81",
+    "11-222-333-0001-81",
+    "11222333000182",
+    "11111111111111",
+    "112223330001",
+    "",
+    "   ",
+    "ab.cde.123/0001-45",
+    "AB.CDE.123/00A1-45",
+    "AB.CDE.123/0001-4X",
+    "AAAAAAAAAAAAAA",
+    "5I.P2X.AIJ/0001-84",
+    "5i.p2x.aij/0001-84",
+]
+
+
+def _as_array(values, width=18):
+    return np.array([v.encode() for v in values], dtype=f"S{width}")
+
+
+class TestNumericValidateMany:
+    """Testes de NumericCNPJValidator.validate_many"""
+
+    def test_matches_scalar_validate(self):
+        """Deve concordar com NumericCNPJValidator.validate linha a linha"""
+        mask, codes = NumericCNPJValidator.validate_many(_as_array(SAMPLES))
+        expected = [NumericCNPJValidator.validate(c)['valid'] for c in SAMPLES]
+        assert mask.tolist() == expected
+        assert codes.dtype == np.uint8
+
+    def test_error_codes(self):
+        """Deve reportar o primeiro erro de cada linha"""
+        values = ["11222333000181", "11222333000182", "11111111111111",
+                  "112223330001", "", "..."]
+        _, codes = NumericCNPJValidator.validate_many(_as_array(values))
+        assert codes.tolist() == [
+            ErrorCode.OK, ErrorCode.INVALID_CHECK_DIGITS, ErrorCode.ALL_SAME,
+            ErrorCode.INVALID_LENGTH, ErrorCode.EMPTY, ErrorCode.INVALID_CHARACTERS,
+        ]
+
+    def test_s14_input(self):
+        """Deve aceitar array S14 sem formatação"""
+        mask, _ = NumericCNPJValidator.validate_many(
+            _as_array(["11222333000181", "11222333000182"], width=14))
+        assert mask.tolist() == [True, False]
+
+    def test_uint8_matrix_input(self):
+        """Deve aceitar matriz 2-D uint8"""
+        matrix = np.frombuffer(b"11222333000181" * 3, dtype=np.uint8).reshape(3, 14)
+        mask, _ = NumericCNPJValidator.validate_many(matrix)
+        assert mask.all()
+
+    def test_chunked_processing(self):
+        """Deve produzir o mesmo resultado independente do tamanho do bloco"""
+        values = _as_array(SAMPLES * 10)
+        full = NumericCNPJValidator.validate_many(values)[1]
+        chunked = NumericCNPJValidator.validate_many(values, chunk_size=7)[1]
+        assert (full == chunked).all()
+
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    def test_non_positive_chunk_size(self, chunk_size):
+        """Deve tratar chunk_size menor que 1 como blocos de uma linha"""
+        values = _as_array(SAMPLES)
+        expected = NumericCNPJValidator.validate_many(values)[1]
+        _, codes = NumericCNPJValidator.validate_many(values, chunk_size=chunk_size)
+        assert codes.tolist() == expected.tolist()
+
+    def test_empty_array(self):
+        """Deve aceitar array vazio"""
+        mask, codes = NumericCNPJValidator.validate_many(np.array([], dtype="S14"))
+        assert mask.shape == (0,)
+        assert codes.shape == (0,)
+
+    def test_unsupported_dtype(self):
+        """Deve rejeitar arrays de outro tipo"""
+        with pytest.raises(TypeError):
+            NumericCNPJValidator.validate_many(np.array([1, 2, 3]))
+
+
+class TestAlphanumericValidateMany:
+    """Testes de NewAlphanumericCNPJValidator.validate_many"""
+
+    def test_matches_scalar_validate(self):
+        """Deve concordar com NewAlphanumericCNPJValidator.validate linha a linha"""
+        mask, _ = NewAlphanumericCNPJValidator.validate_many(_as_array(SAMPLES))
+        expected = [NewAlphanumericCNPJValidator.validate(c)['valid'] for c in SAMPLES]
+        assert mask.tolist() == expected
+
+    def test_generated_cnpjs_are_valid(self):
+        """Deve aceitar CNPJs gerados pelo validador escalar"""
+        roots = ["ABCD1234", "RAFAE123", "ZZZZ0000", "12345678"]
+        values = [NewAlphanumericCNPJValidator.generate_valid_cnpj(r) for r in roots]
+        mask, codes = NewAlphanumericCNPJValidator.validate_many(_as_array(values))
+        assert mask.all()
+        assert (codes == ErrorCode.OK).all()
+
+    def test_error_codes(self):
+        """Deve reportar ordem e DV não numéricos"""
+        values = ["AB.CDE.123/00A1-45", "AB.CDE.123/0001-4X", "ABCDE", ""]
+        _, codes = NewAlphanumericCNPJValidator.validate_many(_as_array(values))
+        assert codes.tolist() == [
+            ErrorCode.INVALID_ORDER, ErrorCode.INVALID_DV_FORMAT,
+            ErrorCode.INVALID_LENGTH, ErrorCode.EMPTY,
+        ]
+
+
+class TestMixedValidateMany:
+    """Testes de NewAlphanumericCNPJValidator.validate_mixed_many"""
+
+    @pytest.mark.parametrize("width", [14, 18, 22])
+    def test_matches_alphanumeric_kernel(self, width):
+        """Deve produzir os mesmos códigos de validate_many, em qualquer largura"""
+        values = _as_array([v for v in SAMPLES if len(v) <= width], width)
+        _, expected = NewAlphanumericCNPJValidator.validate_many(values)
+        _, codes, _ = NewAlphanumericCNPJValidator.validate_mixed_many(values, chunk_size=5)
+        assert codes.tolist() == expected.tolist()
+
+    def test_matches_scalar_validate(self):
+        """Deve concordar com NewAlphanumericCNPJValidator.validate linha a linha"""
+        mask, _, _ = NewAlphanumericCNPJValidator.validate_mixed_many(_as_array(SAMPLES))
+        expected = [NewAlphanumericCNPJValidator.validate(c)['valid'] for c in SAMPLES]
+        assert mask.tolist() == expected
+
+    def test_row_kinds(self):
+        """Deve classificar pelo tamanho, layout e presença de letras"""
+        values = [
+            "11222333000181", "11.222.333/0001-81", "5I.P2X.AIJ/0001-84",
+            "5ip2xaij000184", "11-222-333-0001-81", " 11222333000181", "",
+        ]
+        _, _, kinds = NewAlphanumericCNPJValidator.validate_mixed_many(_as_array(values))
+        assert kinds.tolist() == [
+            RowKind.NUMERIC, RowKind.NUMERIC_FORMATTED, RowKind.ALPHANUMERIC_FORMATTED,
+            RowKind.ALPHANUMERIC, RowKind.OTHER, RowKind.OTHER, RowKind.OTHER,
+        ]
+
+    def test_order_is_preserved(self):
+        """Resultados voltam na ordem da entrada após o roteamento por classe"""
+        valid = ["11222333000181", "5I.P2X.AIJ/0001-84"]
+        invalid = ["11.222.333/0001-82", "11 222 333 0001 82"]
+        values = [valid[0], invalid[0], valid[1], invalid[1]] * 3
+        mask, _, _ = NewAlphanumericCNPJValidator.validate_mixed_many(_as_array(values))
+        assert mask.tolist() == [True, False, True, False] * 3
+
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    def test_non_positive_chunk_size(self, chunk_size):
+        """Deve tratar chunk_size menor que 1 como blocos de uma linha"""
+        values = _as_array(SAMPLES)
+        mask, codes, kinds = NewAlphanumericCNPJValidator.validate_mixed_many(values)
+        result = NewAlphanumericCNPJValidator.validate_mixed_many(values, chunk_size=chunk_size)
+        assert result[0].tolist() == mask.tolist()
+        assert result[1].tolist() == codes.tolist()
+        assert result[2].tolist() == kinds.tolist()
+
+    def test_empty_input(self):
+        """Entrada vazia retorna arrays vazios"""
+        mask, codes, kinds = NewAlphanumericCNPJValidator.validate_mixed_many(
+            np.array([], dtype="S18"))
+        assert mask.size == codes.size == kinds.size == 0
+
+
+class TestGenerateMany:
+    """Testes da geração vetorizada (generate_many)"""
+
+    @pytest.mark.parametrize("alphanumeric", [False, True])
+    @pytest.mark.parametrize("formatted", [False, True])
+    def test_generated_are_valid(self, alphanumeric, formatted):
+        """Todos os CNPJs gerados devem passar na validação escalar"""
+        values = NewAlphanumericCNPJValidator.generate_many(
+            2000, seed=1, alphanumeric=alphanumeric, filial_ratio=0.5, formatted=formatted)
+        assert values.dtype == np.dtype("S18" if formatted else "S14")
+        for value in values.astype(str):
+            assert NewAlphanumericCNPJValidator.validate(value)['valid'], value
+
+    def test_numeric_roots_only_digits(self):
+        """Sem alphanumeric, a raiz usa apenas dígitos"""
+        values = NewAlphanumericCNPJValidator.generate_many(
+            500, seed=2, alphanumeric=False, formatted=False)
+        assert all(value.isdigit() for value in values.astype(str))
+
+    def test_filial_ratio(self):
+        """filial_ratio controla a fração de filiais"""
+        orders = lambda ratio: {
+            v[8:12] for v in NewAlphanumericCNPJValidator.generate_many(
+                1000, seed=3, filial_ratio=ratio, formatted=False).astype(str)
+        }
+        assert orders(0.0) == {"0001"}
+        assert "0001" not in orders(1.0)
+
+    def test_seed_is_reproducible(self):
+        """A mesma semente gera sempre a mesma sequência"""
+        a = NewAlphanumericCNPJValidator.generate_many(1000, seed=42)
+        b = NewAlphanumericCNPJValidator.generate_many(1000, seed=42)
+        c = NewAlphanumericCNPJValidator.generate_many(1000, seed=43)
+        assert a.tolist() == b.tolist()
+        assert a.tolist() != c.tolist()
+
+    def test_streams_are_independent(self):
+        """Fluxos da mesma semente são reprodutíveis e diferentes entre si"""
+        stream0 = NewAlphanumericCNPJValidator.generate_many(100, seed=7, stream=0)
+        stream1 = NewAlphanumericCNPJValidator.generate_many(100, seed=7, stream=1)
+        assert stream0.tolist() == NewAlphanumericCNPJValidator.generate_many(
+            100, seed=7, stream=0).tolist()
+        assert stream0.tolist() != stream1.tolist()
+
+    def test_zero_rows(self):
+        """n=0 retorna array vazio"""
+        assert NewAlphanumericCNPJValidator.generate_many(0).size == 0
+
+    @pytest.mark.parametrize("kwargs", [{"n": -1}, {"n": 1, "filial_ratio": 1.5}])
+    def test_invalid_arguments(self, kwargs):
+        """Deve rejeitar quantidade negativa e fração fora de [0, 1]"""
+        with pytest.raises(ValueError):
+            NewAlphanumericCNPJValidator.generate_many(**kwargs)